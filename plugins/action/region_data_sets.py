@@ -0,0 +1,86 @@
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.plugins.action import ActionBase
+from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils._module_action_plugin import (
+    REGION_DS_KEYS,
+    _DataSetStateCache,
+    _process_data_set_unit_args,
+    _process_libraries_args,
+    _process_region_data_set_args,
+    _remove_cics_data_set_args
+)
+
+MODULE_NAME = 'ibm.ibm_zos_cics.region_data_sets'
+DATA_SET_KEYS = ["dfhgcd", "dfhlcd", "dfhcsd", "dfhintra", "dfhlrq", "dfhtemp", "dfhauxt", "dfhbuxt", "dfhdmpa", "dfhdmpb"]
+# The data sets initialized by a utility in SDFHLOAD
+SDFHLOAD_DATA_SET_KEYS = ["dfhgcd", "dfhlcd", "dfhcsd"]
+
+
+class ActionModule(ActionBase):
+    def run(self, tmp=None, task_vars=None):
+        super(ActionModule, self).run(tmp, task_vars)
+        self.module_args = self._task.args.copy()
+
+        return_structure = {
+            "failed": False,
+            "changed": False,
+            "msg": "",
+            "executions": [],
+            "data_sets": {},
+        }
+
+        try:
+            _process_module_args(self.module_args)
+        except (KeyError, ValueError) as e:
+            return_structure.update({
+                "failed": True,
+                "msg": e.args[0],
+            })
+        else:
+            return_structure.update(
+                self._execute_module(
+                    module_name=MODULE_NAME,
+                    module_args=self.module_args,
+                    task_vars=task_vars,
+                    tmp=tmp,
+                )
+            )
+            # Keep the state the single data set modules use in step
+            _DataSetStateCache(self._task, task_vars).update(dict(
+                (data_set["dsn"], {
+                    "failed": return_structure.get("failed"),
+                    "end_state": return_structure["data_sets"].get(key, {}).get("end_state"),
+                })
+                for key, data_set in self.module_args["region_data_sets"].items()
+                if key in DATA_SET_KEYS
+            ))
+        return return_structure
+
+
+def _process_module_args(module_args):
+    data_sets = module_args.get("data_sets") or DATA_SET_KEYS
+    for region_ds in data_sets:
+        if region_ds in DATA_SET_KEYS:
+            _process_region_data_set_args(module_args, region_ds)
+    for region_key in list(module_args["region_data_sets"]):
+        if region_key in REGION_DS_KEYS and region_key not in data_sets:
+            del module_args["region_data_sets"][region_key]
+    _process_data_set_unit_args(module_args)
+
+    if module_args.get("state") == "initial" and any(ds in SDFHLOAD_DATA_SET_KEYS for ds in data_sets):
+        if not module_args.get("cics_data_sets"):
+            raise KeyError("Required argument cics_data_sets not found")
+        _process_libraries_args(module_args, "cics_data_sets", "sdfhload")
+        _remove_cics_data_set_args(module_args, "sdfhload")
+    elif module_args.get("cics_data_sets"):
+        del module_args["cics_data_sets"]
+
+    if module_args.get("le_data_sets"):
+        del module_args["le_data_sets"]
+
+    if module_args.get("cpsm_data_sets"):
+        del module_args["cpsm_data_sets"]
@@ -124,6 +124,157 @@ options:
     type: int
     required: false
     default: 30
+  connection_broker:
+    description:
+      - When set to C(true), sends the request through a local connection
+        broker that keeps connections to the CMCI server open between tasks,
+        so that each task doesn't have to establish a new TCP connection and
+        TLS handshake.
+      - The broker is started on the Ansible controller by the first task that
+        uses it, and listens on a Unix socket that is private to the current
+        user. A separate broker is used for each combination of I(scheme),
+        I(cmci_host), I(cmci_port), credentials, certificates and
+        I(insecure).
+      - The broker exits when it has not been used for
+        I(connection_broker_idle_timeout) seconds.
+    type: bool
+    required: false
+    default: false
+  connection_broker_idle_timeout:
+    description:
+      - The number of seconds that the connection broker keeps an unused
+        connection open, and after which an unused broker exits.
+      - Only applies when the broker is started. A broker that is already
+        running keeps the idle timeout it was started with.
+    type: int
+    required: false
+    default: 60
+  cache_ttl:
+    description:
+      - The number of seconds for which the results of a GET request are
+        cached on the host running the module. Later tasks that make exactly
+        the same request, with the same credentials, use the cached results
+        instead of querying the CMCI server again. Requests that fail with a
+        CICSPlex SM response aren't cached.
+      - The default of C(0) disables the cache.
+      - Requests that create, update, delete or perform an action on a
+        resource type in a context discard all cached results for that type
+        and context, whether or not they use I(cache_ttl) themselves, as long
+        as they use the same I(cache_dir).
+      - The number of requests answered from the cache and from the CMCI
+        server are returned in C(cache).
+    type: int
+    required: false
+    default: 0
+  cache_dir:
+    description:
+      - The directory in which cached results are stored. It must only be
+        accessible by the current user.
+      - Defaults to a directory private to the current user in the system
+        temporary directory.
+    type: path
+    required: false
+  cache_max_entries:
+    description:
+      - The maximum number of results kept in I(cache_dir). When there are more,
+        the least recently used results are discarded.
+    type: int
+    required: false
+    default: 256
+  retries:
+    description:
+      - The number of times to retry a CMCI request that failed with a
+        connection error, with one of the HTTP statuses in
+        I(retry_on_http_status), or with one of the CICSPlex SM responses in
+        I(retry_on_cpsm_response).
+      - Requests that create, update or delete resources or perform actions
+        are only retried after a connection error if the connection to the
+        CMCI server couldn't be made, because a request that failed after it
+        was sent might have been acted on by the CMCI server.
+      - Each retry is returned in C(retry_history).
+    type: int
+    required: false
+    default: 0
+  retry_delay:
+    description:
+      - The number of seconds to wait before the first retry. The delay
+        doubles for each further retry, up to I(retry_max_delay).
+    type: float
+    required: false
+    default: 1.0
+  retry_max_delay:
+    description:
+      - The maximum number of seconds to wait before a retry.
+    type: float
+    required: false
+    default: 30.0
+  retry_jitter:
+    description:
+      - When set to C(true), waits for a random time between zero and the
+        delay before each retry, so that tasks that failed at the same time
+        don't all retry at the same time.
+    type: bool
+    required: false
+    default: true
+  retry_on_http_status:
+    description:
+      - The HTTP status codes of responses that are retried.
+      - Requests that create, update or delete resources or perform actions
+        are only retried after C(503).
+    type: list
+    elements: int
+    required: false
+    default: [502, 503, 504]
+  retry_on_cpsm_response:
+    description:
+      - The CICSPlex SM API response names, such as C(BUSY) or C(SERVERGONE),
+        of responses that are retried.
+    type: list
+    elements: str
+    required: false
+    default: [BUSY, SERVERGONE]
+  circuit_breaker_threshold:
+    description:
+      - The number of consecutive failed requests to the CMCI server, counting
+        only failures that would be retried, after which requests to it are
+        failed immediately without being sent, for
+        I(circuit_breaker_reset_timeout) seconds.
+      - Requests from all tasks on the host running the module count towards
+        the threshold, for each combination of I(scheme), I(cmci_host) and
+        I(cmci_port).
+      - The default of C(0) disables the circuit breaker.
+    type: int
+    required: false
+    default: 0
+  circuit_breaker_reset_timeout:
+    description:
+      - The number of seconds for which requests are failed immediately once
+        the circuit breaker has opened. After this, the next request is sent,
+        and if it fails the circuit breaker opens again. Other requests are
+        failed immediately until it has finished.
+    type: int
+    required: false
+    default: 60
+  timings:
+    description:
+      - When set to C(true), returns how long each phase of each CMCI request
+        took, and the sizes of the request and response bodies, in
+        C(timings).
+    type: bool
+    required: false
+    default: false
+  metrics_file:
+    description:
+      - The path of a file on the host running the module to add the timings
+        and sizes of each CMCI request to, in the
+        L(OpenMetrics,https://openmetrics.io/) text format.
+      - Samples are labelled with I(cmci_host), I(cmci_port), the HTTP method,
+        I(type) and I(context), and timestamped, so that the same file can
+        collect the requests of many tasks and runs.
+      - The file is created if it doesn't exist. If it can't be written the
+        module warns rather than failing.
+    type: path
+    required: false
 '''
 
     RESOURCES = r'''
@@ -170,6 +321,11 @@ options:
           - Can contain one or more filters. Multiple filters must be combined
             using C(and) or C(or) logical operators.
           - Filters can be nested.
+          - The filter is simplified before it is sent. Nested C(and) and
+            C(or) expressions are merged into their parent where possible and
+            repeated expressions are removed. A filter that requires an
+            attribute to be equal to two different values fails, because no
+            resource can match it.
           - When supplying the C(attribute) option, you must also supply a
             C(value) for the filter. You can also override the default
             operator of C(=) with the C(operator) option.
@@ -210,8 +366,9 @@ options:
               These operators are accepted: C(<) or C(LT) (less than), C(<=) or
               C(LE) (less than or equal to), C(=) or C(EQ) (equal to), C(>) or
               C(GT) (greater than), C(>=) or C(GE) (greater than or equal to),
-              C(==) or C(IS) (is), C(¬=), C(!=), or C(NE) (not equal to). If
-              not supplied when C(attribute) is used, C(EQ) is assumed.
+              C(==) or C(IS) (is), C(¬=), C(!=), or C(NE) (not equal to), and
+              C(IN) (equal to any of a list of values). If not supplied when
+              C(attribute) is used, C(EQ) is assumed.
             type: str
             required: false
             choices:
@@ -230,13 +387,16 @@ options:
               - LE
               - NE
               - IS
+              - IN
           value:
             description:
               - The value by which you are to filter the resource attributes.
               - The value must be a valid one for the resource table attribute
                 as documented in the resource table reference, for example,
                 L(PROGDEF resource table reference,https://www.ibm.com/docs/en/cics-ts/latest?topic=tables-progdef-resource-table).
-            type: str
+              - With the C(IN) operator, a list of values, any of which the
+                attribute can be equal to.
+            type: raw
             required: false
       get_parameters:
         description: >
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r"""
+options:
+  known_state:
+    description:
+      - The state of the data set at the end of an earlier task in the same play, which the module
+        uses instead of checking the state of the data set before it creates or deletes it. When O(state=warm),
+        the module always checks the state of the data set.
+      - The action plugin only sets this option when the C(ibm_zos_cics_data_set_state_cache) variable is true,
+        from the state it keeps for each data set on each host during a play. The state is forgotten when a task
+        for the data set fails.
+      - The state isn't updated by changes made to the data set outside this collection's modules, for example
+        by another job or a task that runs another module, so don't enable the variable when the data set can be
+        changed that way during the play. If a task that used the state fails and a LISTDS shows that the data set
+        is no longer in that state, the module runs once more from the state that LISTDS found.
+      - Don't set this option yourself.
+    type: dict
+    required: false
+    suboptions:
+      exists:
+        description:
+          - True if the data set exists.
+        type: bool
+        required: true
+      data_set_organization:
+        description:
+          - The organization of the data set.
+        type: str
+        required: true
+"""
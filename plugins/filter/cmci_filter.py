@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+name: cmci_filter
+author:
+  - Stewart Francis (@stewartfrancis)
+  - Tom Latham (@Tom-Latham)
+  - Sophie Green (@sophiegreen)
+  - Ya Qing Chen (@vera-chan)
+version_added: 2.3.0
+short_description: Filter CMCI records locally
+description:
+  - Selects the records that match a CMCI filter from records that have
+    already been retrieved, such as the result of M(ibm.ibm_zos_cics.cmci_get)
+    or a file it wrote with its C(dest) option. One large query can then be
+    narrowed down many ways without sending more requests to CMCI.
+  - Filters use the same C(filter) and C(complex_filter) syntax as the
+    C(resources) option of the CMCI modules, and the same operators.
+  - C(*) matches any number of characters and C(+) matches exactly one
+    character in a value compared with C(=) or C(==).
+  - Values are compared as numbers if both the attribute and the filter
+    value are numbers, and as text otherwise.
+  - Attribute names in filters are matched to the lower case attribute names
+    in the records.
+  - A C(¬=) expression matches records that don't have the attribute.
+    Other expressions don't.
+positional: _input
+options:
+  _input:
+    description:
+      - A list of records, the registered result of
+        M(ibm.ibm_zos_cics.cmci_get), or the path of a JSON Lines file of
+        records written by its C(dest) option.
+      - A path is read on the Ansible control node.
+    type: raw
+    required: true
+  filter:
+    description:
+      - A dictionary of attribute names and values. Records match if each
+        attribute is equal to its value.
+    type: dict
+  complex_filter:
+    description:
+      - A complex filter expression, in the form of the C(complex_filter)
+        option of M(ibm.ibm_zos_cics.cmci_get).
+      - Records must match both C(filter) and C(complex_filter) if both are
+        supplied.
+    type: dict
+'''
+
+EXAMPLES = r'''
+- name: Get every program in a system
+  ibm.ibm_zos_cics.cmci_get:
+    cmci_host: winmvs2c.hursley.ibm.com
+    cmci_port: 10080
+    context: iyk3z0r9
+    scope: iyk3z0r8
+    type: CICSProgram
+  register: programs
+
+- name: Programs that are disabled
+  ansible.builtin.debug:
+    msg: "{{ programs | ibm.ibm_zos_cics.cmci_filter(filter={'status': 'DISABLED'}) }}"
+
+- name: Programs beginning with DFH that have been used more than 100 times
+  ansible.builtin.debug:
+    msg: >-
+      {{ programs.records | ibm.ibm_zos_cics.cmci_filter(complex_filter={
+           'and': [
+             {'attribute': 'PROGRAM', 'value': 'DFH*'},
+             {'attribute': 'USECOUNT', 'operator': '>', 'value': '100'}
+           ]
+         }) }}
+
+- name: Programs in one of two libraries, from a file written by cmci_get
+  ansible.builtin.debug:
+    msg: >-
+      {{ '/tmp/programs.jsonl' | ibm.ibm_zos_cics.cmci_filter(complex_filter={
+           'attribute': 'LIBRARY',
+           'operator': 'IN',
+           'value': ['DFHRPL', 'MYLIB']
+         }) }}
+'''
+
+RETURN = r'''
+_value:
+  description: The records that match the filter, in their original order.
+  type: list
+  elements: dict
+'''
+
+from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    AND, FilterError, Junction, parse, parse_basic, optimize, select
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_records import (
+    read_record_file
+)
+from collections.abc import Mapping
+
+
+def cmci_filter(records, filter=None, complex_filter=None):
+    # type: (list | dict | str, dict | None, dict | None) -> list[dict]
+    if isinstance(records, Mapping):
+        records = records.get('records') or []
+    elif isinstance(records, str):
+        try:
+            records = list(read_record_file(records))
+        except (OSError, ValueError) as e:
+            raise AnsibleFilterError(
+                'cmci_filter could not read records from {0}: {1}'
+                .format(records, to_native(e))
+            )
+    elif not isinstance(records, list):
+        raise AnsibleFilterError(
+            'cmci_filter expects a list of records, a cmci_get result or a '
+            'file path, was: {0}'.format(type(records))
+        )
+
+    try:
+        terms = []
+        if filter:
+            terms.append(parse_basic(filter))
+        if complex_filter:
+            terms.append(parse(complex_filter, 'complex_filter'))
+    except FilterError as e:
+        raise AnsibleFilterError('cmci_filter: {0}'.format(to_native(e)))
+
+    if not terms:
+        return list(records)
+
+    try:
+        tree = optimize(Junction(AND, terms))
+    except FilterError:
+        # The filter can never match
+        return []
+    return select(tree, records)
+
+
+class FilterModule(object):
+
+    def filters(self):
+        return {
+            'cmci_filter': cmci_filter,
+        }
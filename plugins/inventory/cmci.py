@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+name: cmci
+author:
+  - Stewart Francis (@stewartfrancis)
+  - Tom Latham (@Tom-Latham)
+  - Sophie Green (@sophiegreen)
+  - Ya Qing Chen (@vera-chan)
+version_added: 2.3.0
+short_description: CICS regions from the CMCI REST API
+description:
+  - Gets the CICS® regions that CICSPlex® SM knows about, from the CICSRGN
+    resource table via the CMCI REST API, and adds a host for each one.
+  - The CICSplexes in I(contexts) are queried concurrently.
+  - Each host is added to a group for its CICSplex, named C(cicsplex_)
+    followed by the name of the CICSplex, a group for its MVS system, named
+    C(mvs_) followed by the name of the system, and a group for its status,
+    named C(status_) followed by the status, for example, C(status_active).
+  - Every attribute of the region is available to I(compose), I(groups)
+    and I(keyed_groups), and as a host variable, with C(cicsrgn_) before
+    its name, for example, C(cicsrgn_jobname). The CICSplex the region is
+    in is the C(cmci_context) host variable.
+  - The configuration file must end in C(cmci.yml) or C(cmci.yaml).
+  - For information about the API, see
+    L(CMCI REST API,https://www.ibm.com/docs/en/cics-ts/latest?topic=programming-cmci-rest-api-reference).
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: The name of this plugin.
+    type: str
+    required: true
+    choices:
+      - ibm.ibm_zos_cics.cmci
+  cmci_host:
+    description:
+      - The TCP/IP host name of CMCI connection.
+    type: str
+    required: true
+  cmci_port:
+    description:
+      - The port number of the CMCI connection.
+    type: int
+    required: true
+  cmci_user:
+    description:
+      - The user ID under which the CMCI request will run.
+    type: str
+    env:
+      - name: CMCI_USER
+  cmci_password:
+    description:
+      - The password of I(cmci_user) to pass HTTP basic authentication.
+    type: str
+    env:
+      - name: CMCI_PASSWORD
+  cmci_cert:
+    description:
+      - Location of the PEM-formatted certificate chain file to be used for
+        HTTPS client authentication.
+    type: path
+    env:
+      - name: CMCI_CERT
+  cmci_key:
+    description:
+      - Location of the PEM-formatted file storing your private key to be
+        used for HTTPS client authentication.
+    type: path
+    env:
+      - name: CMCI_KEY
+  cmci_ca:
+    description:
+      - Location of the PEM-formatted file of CA certificates to verify the
+        CMCI server with, instead of the system's.
+    type: path
+  scheme:
+    description: The HTTP scheme to use when establishing a connection to the
+      CMCI REST API.
+    type: str
+    choices:
+      - http
+      - https
+    default: https
+  insecure:
+    description: When set to C(true), disables SSL certificate trust chain
+      verification when using HTTPS.
+    type: bool
+    default: false
+  timeout:
+    description: HTTP request timeout in seconds.
+    type: int
+    default: 30
+  contexts:
+    description:
+      - The CICSplexes to get the regions of.
+    type: list
+    elements: str
+    required: true
+  scope:
+    description:
+      - Only get the regions in this CICS system group in each CICSplex.
+    type: str
+  concurrency:
+    description:
+      - The maximum number of CICSplexes to query at the same time.
+    type: int
+    default: 10
+  hostname_attribute:
+    description:
+      - The attribute of a region to name its host after.
+    type: str
+    default: cicsname
+'''
+
+EXAMPLES = r'''
+# cmci.yml
+plugin: ibm.ibm_zos_cics.cmci
+cmci_host: example.com
+cmci_port: 12345
+cmci_cert: ./sec/ansible.pem
+cmci_key: ./sec/ansible.key
+contexts:
+  - PLEX1
+  - PLEX2
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/cmci_inventory
+cache_timeout: 600
+keyed_groups:
+  - key: cicsrgn_cicstslevel
+    prefix: cicsts
+'''
+
+from ansible.errors import AnsibleError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils._cmci_client import (
+    CMCIClient, CMCIClientError
+)
+from concurrent.futures import ThreadPoolExecutor
+
+_RESOURCE_TYPE = 'cicsrgn'
+_PREFIX = 'cicsrgn_'
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'ibm.ibm_zos_cics.cmci'
+
+    def verify_file(self, path):  # type: (str) -> bool
+        return super(InventoryModule, self).verify_file(path) and \
+            path.endswith(('cmci.yml', 'cmci.yaml'))
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+
+        regions = None
+        if use_cache:
+            try:
+                regions = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if regions is None:
+            regions = self.get_regions()
+        if update_cache:
+            self._cache[cache_key] = regions
+
+        self.populate(regions)
+
+    def get_regions(self):  # type: () -> dict[str, list[dict]]
+        # Returns the region records of each context
+        contexts = self.get_option('contexts')
+        concurrency = self.get_option('concurrency')
+        if concurrency < 1:
+            raise AnsibleError(
+                'concurrency must be greater than 0, was: {0}'
+                .format(concurrency)
+            )
+
+        client = self.init_client()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(
+                lambda context: self.get_context_regions(client, context),
+                contexts
+            ))
+
+        errors = [
+            '{0}: {1}'.format(context, error)
+            for context, (dummy, error) in zip(contexts, outcomes) if error
+        ]
+        if errors:
+            raise AnsibleError(
+                'Could not get CICS regions from CMCI. {0}'
+                .format('. '.join(errors))
+            )
+        return dict(
+            (context, records)
+            for context, (records, dummy) in zip(contexts, outcomes)
+        )
+
+    def init_client(self):  # type: () -> CMCIClient
+        return CMCIClient(
+            self.get_option('scheme'),
+            self.get_option('cmci_host'),
+            self.get_option('cmci_port'),
+            user=self.get_option('cmci_user'),
+            password=self.get_option('cmci_password'),
+            cert=self.get_option('cmci_cert'),
+            key=self.get_option('cmci_key'),
+            ca=self.get_option('cmci_ca'),
+            insecure=self.get_option('insecure')
+        )
+
+    def get_context_regions(self, client, context):
+        # type: (CMCIClient, str) -> tuple[list[dict], str | None]
+        # Runs on a worker thread, so returns errors rather than raising them
+        url = client.url(_RESOURCE_TYPE, context, self.get_option('scope'))
+        try:
+            return client.get(
+                url, _RESOURCE_TYPE, timeout=self.get_option('timeout')
+            ), None
+        except CMCIClientError as e:
+            return [], str(e)
+
+    def populate(self, regions):  # type: (dict[str, list[dict]]) -> None
+        strict = self.get_option('strict')
+        hostname_attribute = self.get_option('hostname_attribute')
+        for context in self.get_option('contexts'):
+            for record in regions.get(context, []):
+                hostname = record.get(hostname_attribute)
+                if not hostname:
+                    continue
+                self.inventory.add_host(hostname)
+
+                host_vars = dict(
+                    (_PREFIX + name, value) for name, value in record.items()
+                )
+                host_vars['cmci_context'] = context
+                for name, value in host_vars.items():
+                    self.inventory.set_variable(hostname, name, value)
+
+                for prefix, value in (
+                    ('cicsplex', context),
+                    ('mvs', record.get('mvssysname')),
+                    ('status', record.get('cicsstatus'))
+                ):
+                    if value:
+                        group = self.inventory.add_group(
+                            self._sanitize_group_name(
+                                '{0}_{1}'.format(prefix, value.lower())
+                            )
+                        )
+                        self.inventory.add_child(group, hostname)
+
+                self._set_composite_vars(
+                    self.get_option('compose'), host_vars, hostname, strict
+                )
+                self._add_host_to_composed_groups(
+                    self.get_option('groups'), host_vars, hostname, strict
+                )
+                self._add_host_to_keyed_groups(
+                    self.get_option('keyed_groups'), host_vars, hostname,
+                    strict
+                )
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+name: cmci
+author:
+  - Stewart Francis (@stewartfrancis)
+  - Tom Latham (@Tom-Latham)
+  - Sophie Green (@sophiegreen)
+  - Ya Qing Chen (@vera-chan)
+version_added: 2.3.0
+short_description: Get CICS and CICSPlex SM resources from the CMCI REST API
+description:
+  - Gets the records of CICS® or CICSPlex® SM resources or definitions of
+    each type in the terms, via the CMCI REST API, like
+    M(ibm.ibm_zos_cics.cmci_get). The request is made by the Ansible
+    controller process that is templating the lookup, instead of by a
+    module, so there's no module to build, copy or start.
+  - The records of each request are kept for I(cache_ttl) seconds, so that
+    the same lookup made again by the same task, for example in a loop or a
+    template, doesn't make another request. Each task is templated by a
+    separate process, so results aren't kept from one task to the next.
+  - Set I(connection_broker) to C(true) to keep connections to CMCI open
+    between requests and tasks.
+  - For information about the API, see
+    L(CMCI REST API,https://www.ibm.com/docs/en/cics-ts/latest?topic=programming-cmci-rest-api-reference).
+options:
+  _terms:
+    description:
+      - The CMCI external resource names of the types of resource to get,
+        for example, C(CICSProgram).
+    type: list
+    elements: str
+    required: true
+  cmci_host:
+    description:
+      - The TCP/IP host name of CMCI connection.
+    type: str
+    required: true
+  cmci_port:
+    description:
+      - The port number of the CMCI connection.
+    type: int
+    required: true
+  cmci_user:
+    description:
+      - The user ID under which the CMCI request will run.
+    type: str
+    env:
+      - name: CMCI_USER
+  cmci_password:
+    description:
+      - The password of I(cmci_user) to pass HTTP basic authentication.
+    type: str
+    env:
+      - name: CMCI_PASSWORD
+  cmci_cert:
+    description:
+      - Location of the PEM-formatted certificate chain file to be used for
+        HTTPS client authentication.
+    type: path
+    env:
+      - name: CMCI_CERT
+  cmci_key:
+    description:
+      - Location of the PEM-formatted file storing your private key to be
+        used for HTTPS client authentication.
+    type: path
+    env:
+      - name: CMCI_KEY
+  cmci_ca:
+    description:
+      - Location of the PEM-formatted file of CA certificates to verify the
+        CMCI server with, instead of the system's.
+    type: path
+  scheme:
+    description: The HTTP scheme to use when establishing a connection to the
+      CMCI REST API.
+    type: str
+    choices:
+      - http
+      - https
+    default: https
+  insecure:
+    description: When set to C(true), disables SSL certificate trust chain
+      verification when using HTTPS.
+    type: bool
+    default: false
+  timeout:
+    description: HTTP request timeout in seconds.
+    type: int
+    default: 30
+  context:
+    description:
+      - The name of the CICSplex or CMAS, or the APPLID of the CICS region
+        in a single region (SMSS) environment, associated with the request.
+    type: str
+    required: true
+  scope:
+    description:
+      - The name of a CICS system group or CICS system definition within
+        I(context) to get the resources of.
+    type: str
+  filter:
+    description:
+      - A dictionary of attribute names and values that the resources must
+        have, in the form of the C(filter) option of the C(resources) option
+        of M(ibm.ibm_zos_cics.cmci_get).
+    type: dict
+  complex_filter:
+    description:
+      - A filter expression, in the form of the C(complex_filter) option of
+        the C(resources) option of M(ibm.ibm_zos_cics.cmci_get).
+      - Can't be used with I(filter).
+    type: dict
+  cache_ttl:
+    description:
+      - The number of seconds for which the records of a request are kept.
+      - C(0) makes a request every time.
+    type: float
+    default: 60
+  connection_broker:
+    description:
+      - When set to C(true), sends requests through the local connection
+        broker that keeps connections to the CMCI server open, as for the
+        C(connection_broker) option of M(ibm.ibm_zos_cics.cmci_get).
+    type: bool
+    default: false
+'''
+
+EXAMPLES = r'''
+- name: Show the status of a program
+  ansible.builtin.debug:
+    msg: >-
+      {{ lookup('ibm.ibm_zos_cics.cmci', 'CICSProgram',
+                cmci_host='example.com', cmci_port=12345,
+                context='PLEX1', scope='REGION1',
+                filter={'program': 'MYPROG'}) | map(attribute='status') }}
+
+- name: Check several programs, making one request
+  ansible.builtin.assert:
+    that:
+      - >-
+        query('ibm.ibm_zos_cics.cmci', 'CICSProgram', cmci_host='example.com',
+              cmci_port=12345, context='PLEX1', scope='REGION1')
+        | selectattr('program', 'equalto', item)
+        | map(attribute='status') | list == ['ENABLED']
+  loop:
+    - PROG1
+    - PROG2
+    - PROG3
+'''
+
+RETURN = r'''
+_raw:
+  description:
+    - The records of every resource type in the terms, in order.
+  type: list
+  elements: dict
+'''
+
+from ansible.errors import AnsibleLookupError
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    FilterError, compile_filter, emit, parse_basic
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils._cmci_client import (
+    CMCIClientError, get_client
+)
+from collections import OrderedDict
+
+
+class LookupModule(LookupBase):
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        client = get_client(
+            self.get_option('scheme'),
+            self.get_option('cmci_host'),
+            self.get_option('cmci_port'),
+            user=self.get_option('cmci_user'),
+            password=self.get_option('cmci_password'),
+            cert=self.get_option('cmci_cert'),
+            key=self.get_option('cmci_key'),
+            ca=self.get_option('cmci_ca'),
+            insecure=self.get_option('insecure'),
+            connection_broker=self.get_option('connection_broker')
+        )
+        params = self.get_params()
+
+        records = []
+        for resource_type in terms:
+            url = client.url(
+                resource_type,
+                self.get_option('context'),
+                self.get_option('scope'),
+                params
+            )
+            try:
+                records.extend(client.get(
+                    url,
+                    resource_type,
+                    timeout=self.get_option('timeout'),
+                    cache_ttl=self.get_option('cache_ttl')
+                ))
+            except CMCIClientError as e:
+                raise AnsibleLookupError(
+                    'Could not get {0} from CMCI: {1}'.format(resource_type, e)
+                )
+        return records
+
+    def get_params(self):  # type: () -> OrderedDict
+        basic_filter = self.get_option('filter')
+        complex_filter = self.get_option('complex_filter')
+        if basic_filter and complex_filter:
+            raise AnsibleLookupError(
+                'filter and complex_filter are mutually exclusive'
+            )
+
+        params = OrderedDict()  # type: OrderedDict
+        try:
+            if basic_filter:
+                params['CRITERIA'] = emit(parse_basic(basic_filter))
+            elif complex_filter:
+                params['CRITERIA'] = compile_filter(
+                    complex_filter, 'complex_filter'
+                )
+        except FilterError as e:
+            raise AnsibleLookupError(str(e))
+        return params
@@ -29,6 +29,9 @@ def _build_seq_data_set_definition_aux_trace(data_set):  # type: (dict) -> Datas
     )
 
 
+SPACE_PRIMARY_DEFAULT = 20
+SPACE_SECONDARY_DEFAULT = 4
+SPACE_TYPE_DEFAULT = "m"
 BLOCK_SIZE_DEFAULT = 4096
 RECORD_LENGTH_DEFAULT = 4096
 RECORD_FORMAT = "FB"
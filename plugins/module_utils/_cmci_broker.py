@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# A local connection broker for CMCI requests.
+#
+# Each CMCI module invocation is a separate process, so without the broker
+# every task pays for a new TCP connection and TLS handshake to the CMCI
+# server. The broker is a small daemon, forked from the first module that
+# needs it, that holds keep-alive connections to one CMCI server for one set
+# of credentials. Modules send their requests to it over a Unix socket
+# and it relays the response back as it is read from the server.
+#
+# Everything the broker needs is imported up front, because the forked
+# daemon outlives the AnsiballZ payload it was loaded from.
+
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+import base64
+import email.message
+import fcntl
+import hashlib
+import hmac
+import http.client
+import json
+import os
+import socket
+import socketserver
+import ssl
+import struct
+import tempfile
+import threading
+import time
+
+_LENGTH = struct.Struct('>I')
+_CHUNK_SIZE = 64 * 1024
+_SPAWN_WAIT = 10
+_SECRET_SIZE = 32
+# Errors on a reused keep-alive connection that mean the server closed it
+# before our request reached it, so it's safe to send again on a new one
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError
+)
+
+
+def broker_directory():  # type: () -> str
+    return os.path.join(
+        tempfile.gettempdir(),
+        'ansible-cmci-broker-{0}'.format(os.getuid())
+    )
+
+
+def _private_directory():  # type: () -> str
+    directory = broker_directory()
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    status = os.lstat(directory)
+    if status.st_uid != os.getuid() or status.st_mode & 0o077:
+        raise PermissionError(
+            'CMCI connection broker directory {0} is not private to the '
+            'current user'.format(directory)
+        )
+    return directory
+
+
+def _broker_secret(directory):  # type: (str) -> bytes
+    # A random secret for the user, so that socket names can't be used to
+    # guess the credentials they were derived from
+    path = os.path.join(directory, 'secret')
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(os.urandom(_SECRET_SIZE))
+
+    # Another module may have created the file and not written it yet
+    deadline = time.monotonic() + _SPAWN_WAIT
+    while True:
+        with open(path, 'rb') as f:
+            secret = f.read()
+        if len(secret) == _SECRET_SIZE:
+            return secret
+        if time.monotonic() > deadline:
+            raise PermissionError(
+                'CMCI connection broker secret {0} is not valid'.format(path)
+            )
+        time.sleep(0.05)
+
+
+def broker_key(scheme, host, port, user=None, password=None, cert=None,
+               key=None, ca=None, insecure=False):
+    # type: (str, str, int, str, str, str, str, str, bool) -> str
+    # Connections are only shared between requests with identical endpoint,
+    # credentials and trust settings
+    identity = json.dumps(
+        [scheme, host, port, user, password, cert, key, ca, insecure]
+    )
+    return hmac.new(
+        _broker_secret(_private_directory()),
+        identity.encode(),
+        hashlib.sha256
+    ).hexdigest()
+
+
+def broker_socket_path(key):  # type: (str) -> str
+    return os.path.join(_private_directory(), key[:32] + '.sock')
+
+
+def _send_frame(sock, data):  # type: (socket.socket, bytes) -> None
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exact(sock, length):  # type: (socket.socket, int) -> bytes
+    data = bytearray()
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            raise ConnectionError('CMCI connection broker closed the connection')
+        data.extend(chunk)
+    return bytes(data)
+
+
+def _recv_frame(sock):  # type: (socket.socket) -> bytes
+    return _recv_exact(sock, _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))[0])
+
+
+def _send_json(sock, value):  # type: (socket.socket, dict) -> None
+    _send_frame(sock, json.dumps(value).encode())
+
+
+def _recv_json(sock):  # type: (socket.socket) -> dict
+    return json.loads(_recv_frame(sock).decode())
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    # Offers the TLS session from the broker's last handshake when opening a
+    # new connection, so that connections opened after idle eviction can
+    # resume the session rather than doing a full handshake
+    def __init__(self, host, port, timeout, context, broker):
+        super(_ResumingHTTPSConnection, self).__init__(
+            host, port, timeout=timeout, context=context
+        )
+        self._broker = broker
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        start = time.perf_counter()
+        self.sock = self._context.wrap_socket(
+            self.sock,
+            server_hostname=self.host,
+            session=self._broker.tls_session
+        )
+        self.tls_handshake_seconds = time.perf_counter() - start
+        self.tls_session_reused = self.sock.session_reused
+        self._broker.tls_session = self.sock.session
+
+
+class CMCIBroker(object):
+    # The broker daemon. Serves requests from a Unix socket using a pool of
+    # keep-alive connections, closing connections that have been idle for
+    # idle_timeout seconds and exiting once the broker itself has been idle
+    # that long.
+
+    def __init__(self, path, scheme, host, port, cert=None, key=None,
+                 ca=None, insecure=False, idle_timeout=60):
+        self.path = path
+        self.tls_session = None
+        self._scheme = scheme
+        self._host = host
+        self._port = port
+        self._idle_timeout = idle_timeout
+        self._idle = []  # type: list[tuple[http.client.HTTPConnection, float]]
+        self._active = 0
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = None  # type: socketserver.UnixStreamServer | None
+        self._context = None  # type: ssl.SSLContext | None
+
+        if scheme == 'https':
+            self._context = ssl.create_default_context(cafile=ca)
+            if insecure:
+                self._context.check_hostname = False
+                self._context.verify_mode = ssl.CERT_NONE
+            if cert and key:
+                self._context.load_cert_chain(cert, key)
+
+    def serve_forever(self):  # type: () -> None
+        lock = open(self.path + '.lock', 'w')
+        try:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another broker is already serving this socket
+                return
+
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = _BrokerServer(self.path, _BrokerHandler, self)
+            os.chmod(self.path, 0o600)
+
+            reaper = threading.Thread(target=self._reap)
+            reaper.daemon = True
+            reaper.start()
+
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            if self._server:
+                self._server.server_close()
+                if os.path.exists(self.path):
+                    os.unlink(self.path)
+            with self._lock:
+                for conn, dummy in self._idle:
+                    conn.close()
+                self._idle = []
+            lock.close()
+
+    def shutdown(self):  # type: () -> None
+        if self._server:
+            self._server.shutdown()
+
+    def _reap(self):
+        while True:
+            time.sleep(min(1.0, self._idle_timeout / 2.0))
+            now = time.monotonic()
+            with self._lock:
+                expired = [c for c, used in self._idle
+                           if now - used >= self._idle_timeout]
+                self._idle = [(c, used) for c, used in self._idle
+                              if now - used < self._idle_timeout]
+                stop = self._active == 0 and \
+                    now - self._last_used >= self._idle_timeout
+            for conn in expired:
+                conn.close()
+            if stop:
+                self.shutdown()
+                return
+
+    def _acquire(self, timeout):
+        # type: (int) -> tuple[http.client.HTTPConnection, bool]
+        with self._lock:
+            self._active += 1
+            self._last_used = time.monotonic()
+            if self._idle:
+                conn = self._idle.pop()[0]
+                conn.timeout = timeout
+                if conn.sock:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+
+        if self._context:
+            return _ResumingHTTPSConnection(
+                self._host, self._port, timeout, self._context, self
+            ), False
+        return http.client.HTTPConnection(
+            self._host, self._port, timeout=timeout
+        ), False
+
+    def _release(self, conn, reusable):
+        # type: (http.client.HTTPConnection, bool) -> None
+        with self._lock:
+            self._active -= 1
+            self._last_used = time.monotonic()
+            if reusable:
+                self._idle.append((conn, self._last_used))
+                return
+        conn.close()
+
+    def handle(self, sock):  # type: (socket.socket) -> None
+        request = _recv_json(sock)
+        body = _recv_frame(sock) or None
+        timeout = request.get('timeout')
+
+        conn, reused = self._acquire(timeout)
+        response = None
+        try:
+            while True:
+                # Timings of the connection and response, in seconds, for
+                # modules that report them
+                timings = {'reused_connection': reused, 'connect': 0.0}
+                try:
+                    start = time.perf_counter()
+                    if conn.sock is None:
+                        conn.connect()
+                        timings['connect'] = time.perf_counter() - start
+                        if hasattr(conn, 'tls_handshake_seconds'):
+                            timings['tls_handshake'] = \
+                                conn.tls_handshake_seconds
+                            timings['tls_session_reused'] = \
+                                conn.tls_session_reused
+                    sent = time.perf_counter()
+                    conn.request(
+                        request['method'],
+                        request['path'],
+                        body=body,
+                        headers=request.get('headers') or {}
+                    )
+                    response = conn.getresponse()
+                    timings['response'] = time.perf_counter() - sent
+                    break
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    conn.close()
+                    reused = False
+
+            _send_json(sock, {
+                'status': response.status,
+                'reason': response.reason,
+                'headers': response.getheaders(),
+                'timings': timings
+            })
+            while True:
+                chunk = response.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                _send_frame(sock, chunk)
+        except (http.client.HTTPException, OSError, ssl.SSLError) as e:
+            if response is None:
+                try:
+                    _send_json(sock, {'error': str(e)})
+                except OSError:
+                    pass
+            self._release(conn, False)
+            return
+
+        # The connection goes back to the pool before the module is told the
+        # response is complete, so that its next request can reuse it
+        self._release(conn, not response.will_close)
+        _send_frame(sock, b'')
+
+
+class _BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, handler, broker):
+        socketserver.UnixStreamServer.__init__(self, path, handler)
+        self.broker = broker
+
+
+class _BrokerHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            self.server.broker.handle(self.request)
+        except (OSError, ValueError):
+            # The module went away or sent a malformed request
+            pass
+
+
+def spawn_broker(path, config):  # type: (str, dict) -> None
+    # Start the broker as a detached daemon. It must not hold on to the
+    # module's stdout, otherwise Ansible would wait for the daemon to exit
+    # before reading the module result.
+    pid = os.fork()
+    if pid:
+        os.waitpid(pid, 0)
+        return
+
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        os.closerange(3, os.sysconf('SC_OPEN_MAX'))
+        CMCIBroker(path, **config).serve_forever()
+    finally:
+        os._exit(0)
+
+
+class BrokerResponse(object):
+    # The subset of http.client.HTTPResponse used by AnsibleCMCIModule. The
+    # body is read from the broker socket as it's relayed from the server.
+
+    def __init__(self, sock, header):  # type: (socket.socket, dict) -> None
+        self.status = header['status']
+        self.reason = header['reason']
+        self.headers = email.message.Message()
+        for name, value in header['headers']:
+            self.headers[name] = value
+        self.timings = header.get('timings')  # type: dict | None
+        self._sock = sock
+        self._buffer = b''
+        self._done = False
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def readable(self):  # type: () -> bool
+        return True
+
+    def read(self, amt=None):  # type: (int | None) -> bytes
+        while not self._done and (amt is None or len(self._buffer) < amt):
+            try:
+                chunk = _recv_frame(self._sock)
+            except OSError as e:
+                self.close()
+                raise URLError(e)
+            if not chunk:
+                self.close()
+            self._buffer += chunk
+        if amt is None:
+            amt = len(self._buffer)
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):  # type: () -> None
+        self._done = True
+        self._sock.close()
+
+
+class BrokerClient(object):
+    # Sends requests through the broker for one set of connection details,
+    # starting the broker if it isn't running yet
+
+    def __init__(self, scheme, host, port, user=None, password=None,
+                 cert=None, key=None, ca=None, insecure=False,
+                 idle_timeout=60, spawn=None):
+        self.path = broker_socket_path(broker_key(
+            scheme, host, port, user, password, cert, key, ca, insecure
+        ))
+        self._headers = {'User-Agent': 'ansible-httpget'}
+        if user and password:
+            credentials = '{0}:{1}'.format(user, password).encode()
+            self._headers['Authorization'] = \
+                'Basic ' + base64.b64encode(credentials).decode()
+        self._config = {
+            'scheme': scheme,
+            'host': host,
+            'port': port,
+            'cert': cert,
+            'key': key,
+            'ca': ca,
+            'insecure': insecure,
+            'idle_timeout': idle_timeout
+        }
+        self._spawn = spawn or spawn_broker
+
+    def open(self, method, url, data=None, timeout=30, headers=None):
+        # type: (str, str, str | None, int, dict | None) -> BrokerResponse
+        split = urlsplit(url)
+        path = split.path + ('?' + split.query if split.query else '')
+        request_headers = dict(self._headers, **(headers or {}))
+
+        sock = self._connect()
+        try:
+            sock.settimeout(timeout)
+            _send_json(sock, {
+                'method': method,
+                'path': path,
+                'headers': request_headers,
+                'timeout': timeout
+            })
+            _send_frame(sock, data.encode() if data else b'')
+            header = _recv_json(sock)
+        except (OSError, ValueError) as e:
+            sock.close()
+            raise URLError(e)
+
+        if 'error' in header:
+            sock.close()
+            raise URLError(header['error'])
+
+        response = BrokerResponse(sock, header)
+        if response.status >= 400:
+            response.close()
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        return response
+
+    def _connect(self):  # type: () -> socket.socket
+        try:
+            return self._try_connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+
+        self._spawn(self.path, self._config)
+        deadline = time.monotonic() + _SPAWN_WAIT
+        while True:
+            try:
+                return self._try_connect()
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                if time.monotonic() > deadline:
+                    raise URLError(
+                        'CMCI connection broker did not start: {0}'.format(e)
+                    )
+                time.sleep(0.05)
+
+    def _try_connect(self):  # type: () -> socket.socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
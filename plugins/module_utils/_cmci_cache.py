@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# A local cache of parsed CMCI GET responses.
+#
+# Each module invocation is a separate process, so the cache lives on disk
+# on the host running the module, as one JSON file per request. The file
+# name starts with a digest of the endpoint, resource type and context of
+# the request, so that a change made through any other request for the same
+# type and context can discard every entry it might have made stale without
+# reading them. Entries are evicted least recently used first, by the
+# modification time of their file, which is updated on every hit.
+
+from collections import OrderedDict
+from typing import Any
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+_SUFFIX = '.json'
+
+
+def default_cache_directory():  # type: () -> str
+    return os.path.join(
+        tempfile.gettempdir(),
+        'ansible-cmci-cache-{0}'.format(os.getuid())
+    )
+
+
+def cache_directory(directory=None):  # type: (str | None) -> str
+    # Creates the directory if needed, and checks nobody else can read it
+    directory = directory or default_cache_directory()
+    try:
+        os.makedirs(directory, 0o700)
+    except FileExistsError:
+        pass
+    status = os.stat(directory)
+    if status.st_uid != os.getuid() or status.st_mode & 0o077:
+        raise PermissionError(
+            'CMCI cache directory {0} is not private to the current user'
+            .format(directory)
+        )
+    return directory
+
+
+def cache_tag(scheme, host, port, resource_type, context):
+    # type: (str, str, int, str, str) -> str
+    # Requests that can affect each other's results share a tag
+    target = json.dumps(
+        [scheme, host.lower(), port, resource_type.lower(), context.lower()]
+    )
+    return hashlib.sha256(target.encode()).hexdigest()[:16]
+
+
+def cache_key(url, user=None, cert=None, variant=None):
+    # type: (str, str, str, Any) -> str
+    # Different credentials may be authorised to see different records, and
+    # the variant distinguishes responses to the same request that were
+    # parsed differently
+    identity = json.dumps([url, user, cert, variant])
+    return hashlib.sha256(identity.encode()).hexdigest()[:32]
+
+
+class CMCIResultCache(object):
+
+    def __init__(self, directory, ttl, max_entries):
+        # type: (str | None, int, int) -> None
+        self._directory = directory
+        self._ttl = ttl
+        self._max_entries = max_entries
+
+    def _path(self, tag, key):  # type: (str, str) -> str
+        return os.path.join(
+            cache_directory(self._directory),
+            '{0}-{1}{2}'.format(tag, key, _SUFFIX)
+        )
+
+    def get(self, tag, key):  # type: (str, str) -> dict | None
+        path = self._path(tag, key)
+        try:
+            with open(path) as f:
+                entry = json.load(f, object_pairs_hook=OrderedDict)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry['time'] >= self._ttl:
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, tag, key, entry):  # type: (str, str, dict) -> None
+        path = self._path(tag, key)
+        entry['time'] = time.time()
+
+        # Write to a temporary file and rename it into place, so concurrent
+        # readers never see a partial entry
+        fd, temp = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(temp, path)
+        except BaseException:
+            self._remove(temp)
+            raise
+
+        self._evict()
+
+    def invalidate(self, tag):  # type: (str) -> None
+        directory = self._directory or default_cache_directory()
+        if not os.path.isdir(directory):
+            return
+        for path in _entry_paths(directory, tag + '-'):
+            self._remove(path)
+
+    def _evict(self):  # type: () -> None
+        paths = _entry_paths(cache_directory(self._directory))
+        if len(paths) <= self._max_entries:
+            return
+
+        entries = []
+        for path in paths:
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except OSError:
+                pass
+        entries.sort()
+        for mtime, path in entries[:len(entries) - self._max_entries]:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):  # type: (str) -> None
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _entry_paths(directory, prefix=''):  # type: (str, str) -> list[str]
+    # Like glob, without importing it, which would slow down every module
+    # that uses the cache
+    return [
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.startswith(prefix) and name.endswith(_SUFFIX) and
+        not name.startswith('.')
+    ]
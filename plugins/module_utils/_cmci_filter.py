@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# Compiles complex_filter dictionaries into CMCI CRITERIA strings.
+#
+# A filter is parsed and validated into a tree of Predicate and Junction
+# nodes once, then optimised: nested junctions with the same operator are
+# flattened into their parent, duplicate terms are removed, IN predicates are
+# expanded into OR chains of equality tests, and AND junctions that can never
+# match, such as FOO='A' AND FOO='B', are rejected. The CRITERIA string is
+# built from the optimised tree in a single pass.
+#
+# The same tree can be evaluated against records held locally. Records are
+# read into one column per attribute the filter uses, and each term is
+# tested only against the records that every earlier term of its AND
+# junction matched, or that no earlier term of its OR junction matched.
+# Columns usually repeat a few values many times, so each term remembers
+# its result for every value it has seen.
+
+from typing import Any
+from operator import eq, ge, gt, le, lt
+import re
+
+ATTRIBUTE = 'attribute'
+AND = 'and'
+OR = 'or'
+OPERATOR = 'operator'
+VALUE = 'value'
+
+IN = 'IN'
+
+_JOINERS = {AND: ' AND ', OR: ' OR '}
+
+_OPERATORS = {
+    '<': '<', 'LT': '<',
+    '<=': '<=', 'LE': '<=',
+    '=': '=', 'EQ': '=', None: '=',
+    '>=': '>=', 'GE': '>=',
+    '>': '>', 'GT': '>',
+    '¬=': '¬=', '!=': '¬=', 'NE': '¬=',
+    '==': '==', 'IS': '==',
+    IN: IN,
+}
+
+OPERATORS = ['<', '<=', '=', '>', '>=', '¬=', '==', '!=', 'EQ', 'NE', 'LT',
+             'LE', 'GE', 'GT', 'IS', IN]
+
+# Operators that only match a single value when it has no wildcards
+_EQUALS = frozenset(['=', '=='])
+_WILDCARDS = re.compile(r'[*+]')
+
+_ALPHANUMERIC = re.compile(r'[A-Za-z0-9]{1,100}\Z')
+_NUMBER = re.compile(r'\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*\Z')
+
+_ORDERINGS = {'<': lt, '<=': le, '>': gt, '>=': ge}
+
+
+def escape_quotes(value):  # type: (str) -> str
+    return value.replace("'", "\\'")
+
+
+def is_alphanumeric(value):
+    return _ALPHANUMERIC.match(value)
+
+
+class FilterError(Exception):
+    pass
+
+
+class Predicate(object):
+    __slots__ = ('attribute', 'operator', 'value')
+
+    def __init__(self, attribute, operator, value):
+        # type: (str, str, str) -> None
+        self.attribute = attribute
+        self.operator = operator
+        self.value = value
+
+    def key(self):  # type: () -> tuple
+        return (self.attribute, self.operator, self.value)
+
+
+class Junction(object):
+    __slots__ = ('joiner', 'children')
+
+    def __init__(self, joiner, children):  # type: (str, list) -> None
+        self.joiner = joiner
+        self.children = children
+
+    def key(self):  # type: () -> tuple
+        return (self.joiner, tuple(c.key() for c in self.children))
+
+
+class Criteria(object):
+    # CRITERIA text that has already been built, so it can be combined with
+    # further terms
+    __slots__ = ('text',)
+
+    def __init__(self, text):  # type: (str) -> None
+        self.text = text
+
+    def key(self):  # type: () -> tuple
+        return ('criteria', self.text)
+
+
+def parse_basic(basic_filter):  # type: (dict) -> Junction
+    # The basic filter ANDs together an = test for each attribute
+    predicates = []
+    for key, value in basic_filter.items():
+        if not is_alphanumeric(key):
+            raise FilterError(
+                "Filter key with value {0} was not valid. Valid characters are A-Z a-z 0-9."
+                .format(key)
+            )
+        predicates.append(Predicate(key, '=', str(value)))
+    return Junction(AND, predicates)
+
+
+def parse(complex_filter, path):  # type: (dict, str) -> Predicate | Junction
+    # Validates the filter in the same order, and with the same messages, as
+    # Ansible's own argument spec validation of the top level
+    if not isinstance(complex_filter, dict):
+        raise FilterError(
+            "nested filter must be of type dict, was: %s found in %s"
+            % (type(complex_filter), path)
+        )
+
+    valid_keys = [AND, ATTRIBUTE, OPERATOR, OR, VALUE]
+    diff = set(complex_filter.keys()) - set(valid_keys)
+    if len(diff) != 0:
+        raise FilterError(
+            "Unsupported parameters for (basic.py) module: %s found"
+            " in %s. Supported parameters include: %s"
+            % (", ".join(diff), path, ", ".join(valid_keys))
+        )
+
+    and_item = complex_filter.get(AND)
+    or_item = complex_filter.get(OR)
+    attribute = complex_filter.get(ATTRIBUTE)
+
+    if not and_item and not or_item and not attribute:
+        raise FilterError(
+            "one of the following is required: %s found in %s"
+            % (", ".join([ATTRIBUTE, AND, OR]), path)
+        )
+
+    op = complex_filter.get(OPERATOR)
+
+    if op and not attribute:
+        raise FilterError(
+            "missing parameter(s) required by '%s': %s"
+            % (OPERATOR, ATTRIBUTE)
+        )
+
+    value = complex_filter.get(VALUE)
+
+    if (value and not attribute) or (attribute and not value):
+        raise FilterError(
+            'parameters are required together: %s, %s found in %s'
+            % (ATTRIBUTE, VALUE, path)
+        )
+
+    if (and_item and or_item) or (and_item and attribute) or \
+            (or_item and attribute):
+        raise FilterError(
+            'parameters are mutually exclusive: %s|%s|%s found in %s'
+            % (ATTRIBUTE, AND, OR, path)
+        )
+
+    if and_item is not None:
+        return _parse_list(and_item, AND, '%s -> %s' % (path, AND))
+    if or_item is not None:
+        return _parse_list(or_item, OR, '%s -> %s' % (path, OR))
+    return _parse_predicate(attribute, op, value, path)
+
+
+def _parse_list(list_of_filters, joiner, path):
+    # type: (list[dict], str, str) -> Junction
+    if not isinstance(list_of_filters, list):
+        raise FilterError(
+            "nested filters must be a list, was: %s found in %s"
+            % (type(list_of_filters), path)
+        )
+    return Junction(joiner, [parse(f, path) for f in list_of_filters])
+
+
+def _parse_predicate(attribute, op, value, path):
+    # type: (str, str, Any, str) -> Predicate
+    operator = _OPERATORS.get(op) if op is None or isinstance(op, str) \
+        else None
+    if operator is None:
+        raise FilterError(
+            'value of operator must be one of: %s, got: %s found in %s'
+            % (", ".join(OPERATORS), op, path)
+        )
+
+    if not isinstance(attribute, str):
+        raise FilterError(
+            "%s must be of type str, was: %s found in %s"
+            % (ATTRIBUTE, type(attribute), path)
+        )
+
+    if operator == IN:
+        if not isinstance(value, list) or \
+                not all(isinstance(v, str) for v in value):
+            raise FilterError(
+                "%s must be a list of str for operator %s, was: %s found in %s"
+                % (VALUE, IN, value, path)
+            )
+    elif not isinstance(value, str):
+        raise FilterError(
+            "%s must be of type str, was: %s found in %s"
+            % (VALUE, type(value), path)
+        )
+
+    if not is_alphanumeric(attribute):
+        raise FilterError(
+            "Filter attribute with value {0} was not valid. Valid characters are A-Z a-z 0-9."
+            .format(attribute)
+        )
+
+    if operator == IN:
+        return Junction(OR, [Predicate(attribute, '=', v) for v in value])
+    return Predicate(attribute, operator, value)
+
+
+def optimize(node):  # type: (Predicate | Junction) -> Predicate | Junction
+    if isinstance(node, Predicate):
+        return node
+
+    children = []
+    seen = set()
+    for child in node.children:
+        child = optimize(child)
+        # A junction inside one with the same operator adds nothing
+        if isinstance(child, Junction) and child.joiner == node.joiner:
+            flattened = child.children
+        else:
+            flattened = [child]
+        for c in flattened:
+            key = c.key()
+            if key not in seen:
+                seen.add(key)
+                children.append(c)
+
+    if node.joiner == AND:
+        _check_satisfiable(children)
+
+    if len(children) == 1:
+        return children[0]
+    return Junction(node.joiner, children)
+
+
+def _check_satisfiable(children):  # type: (list) -> None
+    # Only terms that match a single exact value are compared, anything
+    # that involves wildcards or ordering is left to CMCI
+    equals = {}
+    not_equals = []
+    for c in children:
+        if not isinstance(c, Predicate) or _WILDCARDS.search(c.value):
+            continue
+        if c.operator in _EQUALS:
+            other = equals.setdefault(c.attribute, c)
+            if other.value != c.value:
+                raise _contradiction(other, c)
+        elif c.operator == '¬=':
+            not_equals.append(c)
+    for c in not_equals:
+        other = equals.get(c.attribute)
+        if other is not None and other.value == c.value:
+            raise _contradiction(other, c)
+
+
+def _contradiction(first, second):  # type: (Predicate, Predicate) -> FilterError
+    return FilterError(
+        "complex_filter can never match, it requires both {0} and {1}"
+        .format(emit(first), emit(second))
+    )
+
+
+def emit(node):  # type: (Predicate | Junction) -> str
+    parts = []
+    _emit(node, parts)
+    return ''.join(parts)
+
+
+def _emit(node, parts):  # type: (Predicate | Junction, list[str]) -> None
+    if isinstance(node, Criteria):
+        parts.append(node.text)
+        return
+    if isinstance(node, Predicate):
+        value = escape_quotes(node.value)
+        if node.operator == '¬=':
+            # Provides a filter string in the format NOT(FOO=='BAR')
+            parts.extend(('NOT(', node.attribute, "=='", value, "')"))
+        else:
+            parts.extend((node.attribute, node.operator, "'", value, "'"))
+        return
+
+    joiner = _JOINERS[node.joiner]
+    for i, child in enumerate(node.children):
+        if i:
+            parts.append(joiner)
+        parts.append('(')
+        _emit(child, parts)
+        parts.append(')')
+
+
+def compile_filter(complex_filter, path):  # type: (dict, str) -> str
+    return emit(optimize(parse(complex_filter, path)))
+
+
+def narrow(criteria, predicates):
+    # type: (str | None, list[Predicate]) -> str
+    # ANDs terms onto existing CRITERIA
+    terms = [Criteria(criteria)] if criteria else []
+    return emit(Junction(AND, terms + predicates))
+
+
+def exclude(criteria, condition):
+    # type: (str | None, str) -> str
+    # ANDs the negation of a filter onto existing CRITERIA, so that only the
+    # resources that don't meet the condition are selected
+    negation = Criteria('NOT(' + condition + ')')
+    if not criteria:
+        return emit(negation)
+    return emit(Junction(AND, [Criteria(criteria), negation]))
+
+
+def select(node, records):
+    # type: (Predicate | Junction, list[dict]) -> list[dict]
+    # Returns the records the filter matches, in their original order
+    columns = {}
+    _read_columns(node, records, columns)
+    matched = _select(node, columns, range(len(records)))
+    return [records[i] for i in matched]
+
+
+def _read_columns(node, records, columns):
+    # type: (Predicate | Junction, list[dict], dict) -> None
+    if isinstance(node, Junction):
+        for child in node.children:
+            _read_columns(child, records, columns)
+    elif node.attribute not in columns:
+        # Records from CMCI have lower case attribute names
+        name = node.attribute
+        lower = name.lower()
+        columns[name] = [
+            r.get(lower, r.get(name)) if isinstance(r, dict) else None
+            for r in records
+        ]
+
+
+def _select(node, columns, candidates):
+    # type: (Predicate | Junction, dict, Any) -> list[int]
+    if isinstance(node, Predicate):
+        column = columns[node.attribute]
+        matches = _matcher(node)
+        results = {}
+        selected = []
+        for i in candidates:
+            value = column[i]
+            try:
+                matched = results[value]
+            except KeyError:
+                matched = results[value] = matches(value)
+            except TypeError:
+                # Unhashable values, like lists, aren't remembered
+                matched = matches(value)
+            if matched:
+                selected.append(i)
+        return selected
+
+    if node.joiner == AND:
+        for child in node.children:
+            if not candidates:
+                break
+            candidates = _select(child, columns, candidates)
+        return list(candidates)
+
+    remaining = list(candidates)
+    selected = set()
+    for child in node.children:
+        if not remaining:
+            break
+        selected.update(_select(child, columns, remaining))
+        remaining = [i for i in remaining if i not in selected]
+    return [i for i in candidates if i in selected]
+
+
+def _matcher(predicate):  # type: (Predicate) -> Any
+    if predicate.operator == '¬=':
+        equals = _matcher(Predicate(predicate.attribute, '==', predicate.value))
+        return lambda value: not equals(value)
+
+    expected = predicate.value
+    expected_number = _number(expected)
+
+    if predicate.operator in _EQUALS:
+        if _WILDCARDS.search(expected):
+            # * matches any number of characters, and + exactly one
+            pattern = re.compile(''.join(
+                '.*' if c == '*' else '.' if c == '+' else re.escape(c)
+                for c in expected
+            ) + r'\Z', re.DOTALL)
+            return lambda value: value is not None and \
+                pattern.match(_text(value)) is not None
+        compare = eq
+    else:
+        compare = _ORDERINGS[predicate.operator]
+
+    def matches(value):  # type: (Any) -> bool
+        if value is None:
+            return False
+        if expected_number is not None:
+            number = _number(value)
+            if number is not None:
+                return compare(number, expected_number)
+        return compare(_text(value), expected)
+    return matches
+
+
+def _number(value):  # type: (Any) -> float | None
+    # Numeric attributes are compared as numbers, so that 9 < 10
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and _NUMBER.match(value):
+        return float(value)
+    return None
+
+
+def _text(value):  # type: (Any) -> str
+    return value if isinstance(value, str) else str(value)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# Appends CMCI request timings to a local file in the OpenMetrics text
+# format, so they can be collected over many runs.
+#
+# OpenMetrics needs the samples of each metric family to be together, after
+# its metadata, and the file to end with # EOF. New samples are therefore
+# added to the end of their family rather than the end of the file, which
+# means rewriting it. The file is locked while that happens, because every
+# task on the host may be appending to it.
+
+import fcntl
+import os
+
+DURATION = 'cmci_request_duration_seconds'
+SIZE = 'cmci_request_size_bytes'
+
+FAMILIES = [
+    (DURATION, 'gauge', 'Duration of a phase of a CMCI request.'),
+    (SIZE, 'gauge', 'Size of a CMCI request or response body.'),
+]
+
+_EOF = '# EOF'
+
+
+def format_sample(family, labels, value, timestamp):
+    # type: (str, dict, float, float) -> str
+    label_text = ','.join(
+        '{0}="{1}"'.format(name, _escape(str(labels[name])))
+        for name in sorted(labels)
+    )
+    return '{0}{{{1}}} {2} {3:.3f}'.format(
+        family, label_text, repr(float(value)), timestamp
+    )
+
+
+def _escape(value):  # type: (str) -> str
+    return value.replace('\\', '\\\\').replace('"', '\\"')\
+        .replace('\n', '\\n')
+
+
+def append_metrics(path, samples):  # type: (str, list[tuple]) -> None
+    # samples are (family, labels, value, timestamp)
+    with open(path, 'a+') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.seek(0)
+            families = _read_families(f.read())
+            for family, labels, value, timestamp in samples:
+                families[family].append(
+                    format_sample(family, labels, value, timestamp)
+                )
+
+            lines = []
+            for family, metric_type, description in FAMILIES:
+                lines.append('# TYPE {0} {1}'.format(family, metric_type))
+                lines.append('# HELP {0} {1}'.format(family, description))
+                lines.extend(families[family])
+            lines.append(_EOF)
+
+            # Rewrite in place, the lock is on this file
+            f.seek(0)
+            f.truncate()
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_families(text):  # type: (str) -> dict[str, list[str]]
+    families = dict((family, []) for family, dummy, dummy in FAMILIES)
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        family = line.split('{', 1)[0].split(' ', 1)[0]
+        if family in families:
+            families[family].append(line)
+    return families
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# Files of CMCI records, written as JSON Lines (one JSON object per line),
+# optionally gzip-compressed.
+
+from typing import Any
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+GZIP = 'gzip'
+NONE = 'none'
+COMPRESSIONS = [NONE, GZIP]
+
+
+class _HashingWriter(object):
+    # Hashes the bytes written through it, so the file never has to be read
+    # back to compute its checksum
+
+    def __init__(self, f):  # type: (Any) -> None
+        self._f = f
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data):  # type: (bytes) -> int
+        self.sha256.update(data)
+        self.size += len(data)
+        return self._f.write(data)
+
+    def flush(self):  # type: () -> None
+        self._f.flush()
+
+
+class RecordFileWriter(object):
+    # Writes records to a temporary file next to the destination as they
+    # arrive, and only moves it into place once every record is written.
+
+    def __init__(self, dest, compression=NONE):  # type: (str, str) -> None
+        self.dest = dest
+        self.count = 0
+        fd, self._temp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(dest)),
+            prefix='.' + os.path.basename(dest) + '.',
+            suffix='.tmp'
+        )
+        # mkstemp creates the file readable by its owner only, give it the
+        # same permissions as any other new file instead
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(self._temp, 0o666 & ~umask)
+
+        self._file = os.fdopen(fd, 'wb')
+        self._hashing = _HashingWriter(self._file)
+        if compression == GZIP:
+            self._out = gzip.GzipFile(
+                filename='', mode='wb', fileobj=self._hashing, mtime=0
+            )
+        else:
+            self._out = self._hashing
+
+    def write(self, record):  # type: (dict) -> None
+        self._out.write((json.dumps(record) + '\n').encode())
+        self.count += 1
+
+    def write_all(self, records):  # type: (list[dict]) -> None
+        for record in records:
+            self.write(record)
+
+    def commit(self):  # type: () -> dict
+        # Returns the details of the finished file for the module result
+        if self._out is not self._hashing:
+            self._out.close()
+        self._file.close()
+        os.replace(self._temp, self.dest)
+        return {
+            'dest': self.dest,
+            'size': self._hashing.size,
+            'checksum': self._hashing.sha256.hexdigest()
+        }
+
+    def discard(self):  # type: () -> None
+        try:
+            if self._out is not self._hashing:
+                self._out.close()
+            self._file.close()
+        except OSError:
+            pass
+        try:
+            os.remove(self._temp)
+        except OSError:
+            pass
+
+
+def read_record_file(path):  # type: (str) -> Any
+    # Yields the records of a file written by RecordFileWriter, compressed
+    # or not
+    with open(path, 'rb') as f:
+        compressed = f.read(2) == b'\x1f\x8b'
+    opener = gzip.open if compressed else open
+    with opener(path, 'rt') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
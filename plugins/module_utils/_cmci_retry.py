@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# Retrying CMCI requests that failed for reasons that are likely to pass,
+# like a WUI region restarting, and a circuit breaker that stops sending
+# requests to a CMCI server that keeps failing.
+#
+# Each module invocation is a separate process, so the circuit breaker keeps
+# its state in a file per CMCI server that every task on the host shares.
+# Updates to it aren't locked, so concurrent tasks may miscount a failure,
+# which only changes how soon the breaker opens. The trial request of a
+# half-open breaker is claimed by creating a file next to it exclusively,
+# so only one task sends it.
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+
+class RetryPolicy(object):
+
+    def __init__(self, retries=0, delay=1.0, max_delay=30.0, jitter=True,
+                 http_statuses=(), cpsm_responses=()):
+        # type: (int, float, float, bool, list[int], list[str]) -> None
+        self.attempts = retries + 1
+        self._delay = delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._http_statuses = frozenset(http_statuses)
+        self._cpsm_responses = frozenset(r.upper() for r in cpsm_responses)
+
+    def retries_http_status(self, status):  # type: (int) -> bool
+        return status in self._http_statuses
+
+    def retries_cpsm_response(self, response):  # type: (str | None) -> bool
+        return bool(response) and response.upper() in self._cpsm_responses
+
+    def delay(self, attempt):  # type: (int) -> float
+        # Exponential backoff from the attempt that just failed, with full
+        # jitter so that tasks that failed together don't retry together
+        delay = min(self._max_delay, self._delay * 2 ** (attempt - 1))
+        if self._jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def breaker_directory():  # type: () -> str
+    return os.path.join(
+        tempfile.gettempdir(),
+        'ansible-cmci-breaker-{0}'.format(os.getuid())
+    )
+
+
+class CircuitBreakerOpen(Exception):
+    pass
+
+
+class CircuitBreaker(object):
+    # Opens after threshold consecutive failed requests to a CMCI server, and
+    # rejects requests until reset_timeout seconds have passed. A single
+    # trial request is then let through, and closes the breaker if it
+    # succeeds or opens it again if it fails. Other requests are rejected
+    # until it has finished, or for reset_timeout seconds if it never does.
+
+    def __init__(self, scheme, host, port, threshold, reset_timeout):
+        # type: (str, str, int, int, int) -> None
+        self._target = '{0}://{1}:{2}'.format(scheme, host, port)
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        digest = hashlib.sha256(self._target.encode()).hexdigest()[:32]
+        self._path = os.path.join(breaker_directory(), digest + '.json')
+        self._trial_path = os.path.join(breaker_directory(), digest + '.trial')
+        # The thread sending the trial request, as modules send requests
+        # from several threads with one breaker
+        self._trial = None  # type: int | None
+
+    @property
+    def enabled(self):  # type: () -> bool
+        return self._threshold > 0
+
+    def check(self):  # type: () -> None
+        if not self.enabled:
+            return
+        state = self._read()
+        if state['failures'] < self._threshold:
+            return
+        remaining = state['opened'] + self._reset_timeout - time.time()
+        if remaining > 0:
+            raise CircuitBreakerOpen(
+                'CMCI requests to {0} are suspended for {1:.0f} more seconds '
+                'after {2} consecutive failures'
+                .format(self._target, remaining, state['failures'])
+            )
+        if not self._start_trial():
+            raise CircuitBreakerOpen(
+                'CMCI requests to {0} are suspended while another request '
+                'checks whether it has recovered after {1} consecutive '
+                'failures'
+                .format(self._target, state['failures'])
+            )
+
+    def record_success(self):  # type: () -> None
+        if self.enabled and self._read()['failures']:
+            self._write({'failures': 0, 'opened': 0})
+        self.release()
+
+    def record_failure(self):  # type: () -> None
+        if not self.enabled:
+            return
+        state = self._read()
+        state['failures'] += 1
+        if state['failures'] >= self._threshold:
+            state['opened'] = time.time()
+        self._write(state)
+        self.release()
+
+    def _start_trial(self):  # type: () -> bool
+        # Returns whether this thread may send the trial request
+        try:
+            # A trial that never finished, because its task was killed
+            if time.time() - os.stat(self._trial_path).st_mtime > \
+                    self._reset_timeout:
+                os.remove(self._trial_path)
+        except OSError:
+            pass
+        try:
+            fd = os.open(
+                self._trial_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600
+            )
+        except FileExistsError:
+            return False
+        except OSError:
+            # Best effort, as for the state
+            return True
+        os.close(fd)
+        self._trial = threading.get_ident()
+        return True
+
+    def release(self):  # type: () -> None
+        # Ends the trial request, if this thread is sending it, without
+        # counting it as a success or failure
+        if self._trial != threading.get_ident():
+            return
+        self._trial = None
+        try:
+            os.remove(self._trial_path)
+        except OSError:
+            pass
+
+    def _read(self):  # type: () -> dict
+        try:
+            # Ignore state anyone else could have written
+            status = os.stat(os.path.dirname(self._path))
+            if status.st_uid != os.getuid() or status.st_mode & 0o022:
+                return {'failures': 0, 'opened': 0}
+            with open(self._path) as f:
+                state = json.load(f)
+            return {
+                'failures': int(state['failures']),
+                'opened': float(state['opened'])
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {'failures': 0, 'opened': 0}
+
+    def _write(self, state):  # type: (dict) -> None
+        # Best effort, a breaker that can't save its state stays closed
+        directory = os.path.dirname(self._path)
+        try:
+            os.makedirs(directory, 0o700)
+        except FileExistsError:
+            pass
+        except OSError:
+            return
+        try:
+            fd, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f)
+            os.replace(temp, self._path)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
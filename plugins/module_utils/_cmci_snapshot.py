@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+# Snapshots of CMCI records, so a later query can return only the records
+# that were added, changed or removed since.
+#
+# A snapshot only keeps the key of each record and a digest of its
+# attributes, not the records themselves. Records are keyed by their
+# _keydata attribute, which CMCI returns for every record, together with the
+# context and scope the record came from when cmci_get queried several, and
+# the CICS region it's in. _keydata only identifies a resource within a
+# region, so the same resource in several regions of a scope has the same
+# _keydata in each. A record without _keydata is keyed by its digest instead, so a change to it
+# looks like one record being removed and another added.
+
+from collections import OrderedDict
+from typing import Any
+import hashlib
+import json
+import os
+import tempfile
+
+KEYDATA = '_keydata'
+_TARGET_ATTRIBUTES = ('_context', '_scope', 'eyu_cicsname')
+_VERSION = 1
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def record_digest(record):  # type: (dict) -> str
+    text = json.dumps(record, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def record_key(record, digest):  # type: (dict, str) -> str
+    keydata = record.get(KEYDATA)
+    if keydata is None:
+        return digest
+    target = [record.get(name) or '' for name in _TARGET_ATTRIBUTES]
+    return '/'.join(target + [keydata])
+
+
+def diff(snapshot, records):
+    # type: (dict[str, str], list[dict]) -> tuple[dict, OrderedDict]
+    # Compares records with a snapshot in a single pass over each, and
+    # returns the delta and the index of the records for the next snapshot
+    index = OrderedDict()  # type: OrderedDict
+    added = []
+    changed = []
+    for record in records:
+        digest = record_digest(record)
+        key = record_key(record, digest)
+        index[key] = digest
+        previous = snapshot.get(key)
+        if previous is None:
+            added.append(record)
+        elif previous != digest:
+            changed.append(record)
+    removed = [key for key in snapshot if key not in index]
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed
+    }, index
+
+
+def read_snapshot(path):  # type: (str) -> dict[str, str] | None
+    # Returns None if there's no snapshot yet
+    try:
+        with open(path) as f:
+            content = json.load(f)  # type: Any
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        raise SnapshotError('{0} is not a snapshot: {1}'.format(path, e))
+    if not isinstance(content, dict) or content.get('version') != _VERSION:
+        raise SnapshotError('{0} is not a snapshot'.format(path))
+    return content['records']
+
+
+def write_snapshot(path, index):  # type: (str, dict[str, str]) -> None
+    # Write to a temporary file and rename it into place, so an interrupted
+    # run leaves the previous snapshot intact
+    fd, temp = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix='.' + os.path.basename(path) + '.',
+        suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': _VERSION, 'records': index}, f,
+                      separators=(',', ':'))
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
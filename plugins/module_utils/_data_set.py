@@ -15,11 +15,19 @@ __metaclass__ = type
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import (
     _build_idcams_define_cmd,
+    _get_idcams_define_attributes,
     _run_idcams,
+    _run_idcams_reset,
     _run_listds,
     _run_iefbr14
 )
-from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._icetool import _run_icetool
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._icetool import (
+    VSAM,
+    _get_catalog_attributes,
+    _run_has_records,
+    _run_icetool,
+    _run_listcat
+)
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import MVSExecutionException
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import BetterArgParser
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement import DatasetDefinition
@@ -42,11 +50,20 @@ WARM = "warm"
 STATE_OPTIONS = [ABSENT, INITIAL, WARM]
 CICS_DATA_SETS = "cics_data_sets"
 REGION_DATA_SETS = "region_data_sets"
+KNOWN_STATE = "known_state"
 DESTINATION = "destination"
 DESTINATION_OPTIONS = ["A", "B"]
 DESTINATION_DEFAULT_VALUE = "A"
 
 
+class _KnownStateChanged(Exception):
+    """
+    Raised instead of failing when the data set turns out not to be in the
+    state that known_state said it was in
+    """
+    pass
+
+
 class DataSet():
     def __init__(self, primary, secondary):
         self.name = ""
@@ -60,6 +77,8 @@ class DataSet():
         self.volumes = None
         self.sdfhload = ""
         self.destination = ""
+        self.known_state = None
+        self.assumed_state = None
 
         self.changed = False
         self.failed = False
@@ -115,6 +134,8 @@ class DataSet():
         )
 
     def _fail(self, msg):  # type: (str) -> None
+        if self.assumed_state and self.known_state_changed():
+            raise _KnownStateChanged()
         self.failed = True
         self.msg = msg
         self.set_end_state()
@@ -158,7 +179,21 @@ class DataSet():
                         "required": False,
                     }
                 },
-            }
+            },
+            KNOWN_STATE: {
+                "type": "dict",
+                "required": False,
+                "options": {
+                    "exists": {
+                        "type": "bool",
+                        "required": True,
+                    },
+                    "data_set_organization": {
+                        "type": "str",
+                        "required": True,
+                    },
+                },
+            },
         }
 
     def get_arg_defs(self):  # type: () -> dict
@@ -217,9 +252,17 @@ class DataSet():
             self.volumes = params[VOLUMES]
         if params.get(DESTINATION):
             self.destination = params[DESTINATION]
+        if params.get(KNOWN_STATE):
+            self.known_state = params[KNOWN_STATE]
+
+    def get_idcams_define(self):  # type: () -> dict
+        """
+        The IDCAMS definition of a VSAM data set, for the modules that define one
+        """
+        return {}
 
     def create_data_set(self):  # type: () -> None
-        _build_idcams_define_cmd({})
+        _build_idcams_define_cmd(self.get_idcams_define())
 
     def build_vsam_data_set(self, create_cmd):  # type: (str) -> None
         try:
@@ -230,6 +273,7 @@ class DataSet():
                 location=self.name,
                 delete=False)
             self.executions.extend(idcams_executions)
+            self.check_assumed_state(idcams_executions)
 
             self.changed = True
         except MVSExecutionException as e:
@@ -259,6 +303,7 @@ class DataSet():
                     location=self.name,
                     delete=True)
                 self.executions.extend(idcams_executions)
+                self.check_assumed_state(idcams_executions)
                 self.changed = True
             except MVSExecutionException as e:
                 self.executions.extend(e.executions)
@@ -267,12 +312,20 @@ class DataSet():
     def init_data_set(self):   # type: () -> None
         if self.exists:
             try:
-                icetool_executions, record_count = _run_icetool(self.name)
-                self.executions.extend(icetool_executions)
-                if record_count > 0:
-                    self.delete_data_set()
-                    self.update_data_set_state()
-                    self.create_data_set()
+                reusable = self.is_reusable()
+                listcat_stdout = None
+                if reusable:
+                    listcat_executions, listcat_stdout = _run_listcat(self.name)
+                    self.executions.extend(listcat_executions)
+
+                probe_executions, has_records = _run_has_records(
+                    self.name, self.data_set_organization, listcat_stdout)
+                self.executions.extend(probe_executions)
+                if has_records:
+                    if not (reusable and self.matches_definition(listcat_stdout) and self.reset_data_set()):
+                        self.delete_data_set()
+                        self.update_data_set_state()
+                        self.create_data_set()
 
             except MVSExecutionException as e:
                 self.executions.extend(e.executions)
@@ -280,6 +333,40 @@ class DataSet():
         else:
             self.create_data_set()
 
+    def is_reusable(self):  # type: () -> bool
+        return self.data_set_organization == VSAM and \
+            "REUSE" in (self.get_idcams_define().get("CLUSTER") or {})
+
+    def matches_definition(self, listcat_stdout):  # type: (str | None) -> bool
+        """
+        Whether the catalog entry of the data set has the attributes it would
+        be defined with, so it can be reset rather than defined again
+        """
+        attributes = _get_catalog_attributes(listcat_stdout) if listcat_stdout else None
+        if not attributes:
+            return False
+        expected = _get_idcams_define_attributes(self.get_idcams_define())
+        return all(attributes.get(key) == value for key, value in expected.items())
+
+    def reset_data_set(self):  # type: () -> bool
+        """
+        Empty a REUSE cluster in place. Returns False if it still has records,
+        for the caller to delete and define it instead.
+        """
+        try:
+            reset_executions = _run_idcams_reset(self.name)
+            self.executions.extend(reset_executions)
+            icetool_executions, record_count = _run_icetool(self.name, first_record=True)
+            self.executions.extend(icetool_executions)
+        except MVSExecutionException as e:
+            self.executions.extend(e.executions)
+            return False
+
+        if record_count != 0:
+            return False
+        self.changed = True
+        return True
+
     def warm_data_set(self):  # type: () -> None
         if not self.exists:
             self._fail("Data set {0} does not exist.".format(self.name))
@@ -287,9 +374,9 @@ class DataSet():
     def warm_with_records(self):
         if self.exists:
             try:
-                icetool_executions, record_count = _run_icetool(self.name)
-                self.executions.extend(icetool_executions)
-                if record_count <= 0:
+                probe_executions, has_records = _run_has_records(self.name, self.data_set_organization)
+                self.executions.extend(probe_executions)
+                if not has_records:
                     self._fail("Data set {0} is empty.".format(self.name))
             except MVSExecutionException as e:
                 self.executions.extend(e.executions)
@@ -312,6 +399,18 @@ class DataSet():
             self.invalid_target_state()
 
     def update_data_set_state(self):   # type: () -> None
+        if self.known_state and self.target_state != WARM:
+            # The state at the end of an earlier task in the play, passed in
+            # by the action plugin. It only stands in for the first LISTDS
+            # when the task creates or deletes the data set, as warm only
+            # checks that it's there and a stale state would hide that it isn't.
+            self.exists = self.known_state["exists"]
+            self.data_set_organization = self.known_state["data_set_organization"]
+            self.assumed_state = self.known_state
+            self.known_state = None
+            return
+
+        self.assumed_state = None
         try:
             listds_executions, self.exists, self.data_set_organization = _run_listds(self.name)
 
@@ -320,7 +419,31 @@ class DataSet():
             self.executions.extend(e.executions)
             self._fail(e.message)
 
-    def main(self):  # type: () -> None
+    def known_state_changed(self):  # type: () -> bool
+        """
+        Whether the data set has been changed outside the modules since
+        known_state was recorded, checked with a LISTDS when a task that
+        relied on known_state fails
+        """
+        assumed_state = self.assumed_state
+        self.assumed_state = None
+        try:
+            listds_executions, exists, data_set_organization = _run_listds(self.name)
+            self.executions.extend(listds_executions)
+        except MVSExecutionException as e:
+            self.executions.extend(e.executions)
+            return False
+        return (exists, data_set_organization) != \
+            (assumed_state["exists"], assumed_state["data_set_organization"])
+
+    def check_assumed_state(self, idcams_executions):  # type: (list[dict]) -> None
+        # IDCAMS defining a data set that's already there, or deleting one
+        # that's already gone, ends with a non-zero return code that
+        # _run_idcams accepts, so it isn't passed to _fail
+        if self.assumed_state and idcams_executions[-1]["rc"] != 0 and self.known_state_changed():
+            raise _KnownStateChanged()
+
+    def reach_target_state(self):  # type: () -> None
         self.update_data_set_state()
         self.set_start_state()
 
@@ -331,6 +454,13 @@ class DataSet():
 
         self.execute_target_state()
 
+    def main(self):  # type: () -> None
+        try:
+            self.reach_target_state()
+        except _KnownStateChanged:
+            # Try once more from the state LISTDS finds
+            self.reach_target_state()
+
         self.update_data_set_state()
 
         self._exit()
@@ -12,10 +12,21 @@ import re
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import AnsibleModuleHelper
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import _execution, MVSExecutionException
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmd
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement import DDStatement, StdoutDefinition, DatasetDefinition, StdinDefinition
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement import (
+    DDStatement,
+    StdoutDefinition,
+    DatasetDefinition,
+    DummyDefinition,
+    StdinDefinition
+)
 
 MVS_CMD_RETRY_ATTEMPTS = 10
 
+CATALOG_SPACE_TYPES = {
+    "CYL": "CYLINDER",
+    "TRK": "TRACK",
+}
+
 
 DSORG = {
     "PS": "Sequential",
@@ -71,6 +82,49 @@ def _run_idcams(cmd, name, location, delete=False):  # type: (str, str, str, boo
     return executions
 
 
+def _run_idcams_reset(location):  # type: (str) -> list[dict[str, str| int]]
+    executions = []
+
+    for x in range(MVS_CMD_RETRY_ATTEMPTS):
+        idcams_response = _execute_idcams_reset(location)
+        executions.append(
+            _execution(
+                name="IDCAMS - Reset data set - Run {0}".format(x + 1),
+                rc=idcams_response.rc,
+                stdout=idcams_response.stdout,
+                stderr=idcams_response.stderr))
+        if location.upper() in idcams_response.stdout.upper():
+            break
+
+    if location.upper() not in idcams_response.stdout.upper():
+        raise MVSExecutionException("IDCAMS Command output not recognised", executions)
+
+    # RC 4 is the warning that no records were copied
+    if idcams_response.rc > 4:
+        raise MVSExecutionException("RC {0} when resetting data set".format(idcams_response.rc), executions)
+
+    return executions
+
+
+def _get_idcams_reset_dds(location):  # type: (str) -> list[DDStatement]
+    # Copying nothing into a REUSE cluster with REUSE opens it for output
+    # with its high used RBA set back to 0, which empties it in place
+    return [
+        DDStatement('sysin', StdinDefinition(content="  REPRO INFILE(EMPTY) OUTDATASET({0}) REUSE".format(location))),
+        DDStatement('sysprint', StdoutDefinition()),
+        DDStatement('empty', DummyDefinition()),
+    ]
+
+
+def _execute_idcams_reset(location):
+    return MVSCmd.execute_authorized(
+        pgm="IDCAMS",
+        dds=_get_idcams_reset_dds(location),
+        verbose=True,
+        debug=False
+    )
+
+
 def _get_idcams_dds(cmd):
     return [
         DDStatement('sysin', StdinDefinition(content=cmd)),
@@ -165,6 +219,32 @@ def _build_idcams_define_parms(dataset, parm):  # type: (dict, str) -> str
     return parmsStr
 
 
+def _get_idcams_define_attributes(dataset):  # type: (dict) -> dict
+    """
+    The attributes a cluster defined from dataset would have, as
+    _get_catalog_attributes reads them from LISTCAT. Space in megabytes,
+    kilobytes or records is left out, as the catalog holds it converted to
+    tracks or cylinders.
+    """
+    cluster = dataset.get("CLUSTER") or {}
+    data = dataset.get("DATA") or {}
+
+    attributes = {"reuse": "REUSE" in cluster}
+    if cluster.get("KEYS"):
+        attributes["keylen"], attributes["rkp"] = [int(value) for value in cluster["KEYS"].split()]
+    if cluster.get("RECORDSIZE"):
+        attributes["avglrecl"], attributes["maxlrecl"] = [int(value) for value in cluster["RECORDSIZE"].split()]
+    if data.get("CONTROLINTERVALSIZE"):
+        attributes["cisize"] = int(data["CONTROLINTERVALSIZE"])
+    if (dataset.get("unit") or "").upper() in CATALOG_SPACE_TYPES:
+        attributes["space_type"] = CATALOG_SPACE_TYPES[dataset["unit"].upper()]
+        attributes["space_pri"] = int(dataset["primary"])
+        attributes["space_sec"] = int(dataset["secondary"])
+    if dataset.get("volumes"):
+        attributes["volumes"] = sorted(volume.upper() for volume in dataset["volumes"])
+    return attributes
+
+
 def _build_idcams_volumes(volumes):  # type: (list[str]) -> str
     volumes_cmd = ""
     if len(volumes) > 1:
@@ -227,6 +307,84 @@ def _run_listds(location):  # type: (str) -> tuple[list[_execution], bool, str]
     return executions, True, data_set_organization
 
 
+def _get_data_set_volumes(listds_stdout):  # type: (str) -> list[str]
+    # The volumes are on the line after the --VOLUMES-- heading. When the
+    # heading has other columns, the volume is the first of them.
+    lines = listds_stdout.splitlines()
+    for index, line in enumerate(lines[:-1]):
+        heading = line.strip()
+        if heading.startswith("--VOLUMES"):
+            volumes = lines[index + 1].split()
+            if heading.rstrip("-") != "--VOLUMES":
+                volumes = volumes[:1]
+            return [volume for volume in volumes if volume != "**"]
+    return []
+
+
+def _get_listds_sections(stdout, locations):  # type: (str, list[str]) -> dict[str, str]
+    # IKJEFT01 echoes each LISTDS command before its output, so the output of
+    # a data set runs from its command to the next one
+    starts = []
+    for location in locations:
+        match = re.search(r"LISTDS\s+'{0}'".format(re.escape(location)), stdout, re.IGNORECASE)
+        if match:
+            starts.append((match.start(), location))
+        elif len(locations) == 1 and location.upper() in stdout.upper():
+            return {location: stdout}
+    starts.sort()
+    ends = [start for start, location in starts[1:]] + [len(stdout)]
+    return dict(
+        (location, stdout[start:end]) for (start, location), end in zip(starts, ends)
+    )
+
+
+def _run_listds_batch(locations):  # type: (list[str]) -> tuple[list[_execution], dict[str, dict]]
+    # The same as _run_listds for many data sets at once, in a single
+    # IKJEFT01 execution. Returns the exists, data_set_organization and
+    # volumes of each location.
+    cmd = "\n".join(" LISTDS '{0}'".format(location) for location in locations)
+    executions = []
+
+    for x in range(MVS_CMD_RETRY_ATTEMPTS):
+        listds_response = _execute_listds(cmd=cmd)
+        executions.append(
+            _execution(
+                name="IKJEFT01 - Get Data Set Status - Run {0}".format(
+                    x + 1),
+                rc=listds_response.rc,
+                stdout=listds_response.stdout,
+                stderr=listds_response.stderr))
+        sections = _get_listds_sections(listds_response.stdout, locations)
+        if len(sections) == len(locations):
+            break
+
+    if len(sections) != len(locations):
+        raise MVSExecutionException("LISTDS Command output not recognised", executions)
+
+    states = {}
+    unrecognised = []
+    for location in locations:
+        section = sections[location]
+        if "NOT IN CATALOG" in section or "MEMBER NAME NOT FOUND" in section:
+            states[location] = dict(exists=False, data_set_organization="NONE", volumes=[])
+        elif listds_response.rc == 0 or "DSORG" in section:
+            # A non-zero RC is from another data set in the batch, as long as
+            # this one has its attributes listed
+            states[location] = dict(
+                exists=True,
+                data_set_organization=_get_data_set_type(section),
+                volumes=_get_data_set_volumes(section))
+        else:
+            unrecognised.append(location)
+
+    if unrecognised:
+        raise MVSExecutionException(
+            "RC {0} running LISTDS Command for {1}".format(
+                listds_response.rc, ", ".join(unrecognised)), executions)
+
+    return executions, states
+
+
 def _run_iefbr14(ddname, definition):  # type: (str, DatasetDefinition) -> list[dict[str, str| int]]
 
     executions = []
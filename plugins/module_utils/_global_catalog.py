@@ -170,6 +170,9 @@ def _get_idcams_cmd_gcd(dataset):   # type: (dict) -> dict
     return defaults
 
 
+SPACE_PRIMARY_DEFAULT = 5
+SPACE_SECONDARY_DEFAULT = 1
+SPACE_TYPE_DEFAULT = "m"
 RECORD_COUNT_DEFAULT = 4089
 RECORD_SIZE_DEFAULT = 32760
 CONTROL_INTERVAL_SIZE_DEFAULT = 32768
@@ -8,21 +8,47 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import re
+
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmd, MVSCmdResponse
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement import StdoutDefinition, DatasetDefinition, DDStatement, InputDefinition
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import _execution, MVSExecutionException
-from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import MVS_CMD_RETRY_ATTEMPTS
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import MVS_CMD_RETRY_ATTEMPTS, _get_idcams_dds
+
+VSAM = "VSAM"
+
+_CATALOG_STATISTICS = {
+    "rec_total": re.compile(r"REC-TOTAL-*(\d+)"),
+    "hi_u_rba": re.compile(r"HI-U-RBA-*(\d+)"),
+}
 
+_CATALOG_ATTRIBUTES = {
+    "keylen": re.compile(r"KEYLEN-*(\d+)"),
+    "rkp": re.compile(r"RKP-*(\d+)"),
+    "avglrecl": re.compile(r"AVGLRECL-*(\d+)"),
+    "maxlrecl": re.compile(r"MAXLRECL-*(\d+)"),
+    "cisize": re.compile(r"CISIZE-*(\d+)"),
+    "space_pri": re.compile(r"SPACE-PRI-*(\d+)"),
+    "space_sec": re.compile(r"SPACE-SEC-*(\d+)"),
+}
 
-def _get_icetool_dds(location):  # type: (str) -> list[DDStatement]
-    return [
+
+def _get_icetool_dds(location, first_record=False):  # type: (str, bool) -> list[DDStatement]
+    dds = [
         DDStatement('sysprint', StdoutDefinition()),
         DDStatement('dd1', DatasetDefinition(dataset_name=location, disposition="SHR")),
         DDStatement('toolmsg', StdoutDefinition()),
         DDStatement('dfsmsg', StdoutDefinition()),
         DDStatement('showdef', StdoutDefinition()),
-        DDStatement('toolin', InputDefinition(content="COUNT FROM(DD1)")),
     ]
+    if first_record:
+        # DFSORT stops reading DD1 after the first record, so the count is
+        # 0 or 1 however big the data set is
+        dds.append(DDStatement('toolin', InputDefinition(content="COUNT FROM(DD1) USING(CTL1)")))
+        dds.append(DDStatement('ctl1cntl', InputDefinition(content=" OPTION STOPAFT=1")))
+    else:
+        dds.append(DDStatement('toolin', InputDefinition(content="COUNT FROM(DD1)")))
+    return dds
 
 
 def _get_reason_code(filtered):  # type: (list[str]) -> str
@@ -51,15 +77,17 @@ def _get_record_count(stdout):  # type: (str) -> int
     return record_count
 
 
-def _run_icetool(location):  # type: (str) -> tuple[list[_execution], int]
+def _run_icetool(location, first_record=False):  # type: (str, bool) -> tuple[list[_execution], int]
     executions = []
 
     for x in range(MVS_CMD_RETRY_ATTEMPTS):
-        icetool_response = _execute_icetool(location)
+        icetool_response = _execute_icetool(location, first_record)
 
         executions.append(
             _execution(
-                name="ICETOOL - Get record count - Run {0}".format(x + 1),
+                name="ICETOOL - {0} - Run {1}".format(
+                    "Get first record" if first_record else "Get record count",
+                    x + 1),
                 rc=icetool_response.rc,
                 stdout=icetool_response.stdout,
                 stderr=icetool_response.stderr))
@@ -85,9 +113,125 @@ def _run_icetool(location):  # type: (str) -> tuple[list[_execution], int]
     return executions, _get_record_count(icetool_response.stdout)
 
 
-def _execute_icetool(location):  # type: (str) -> MVSCmdResponse
+def _execute_icetool(location, first_record=False):  # type: (str, bool) -> MVSCmdResponse
     return MVSCmd.execute(
         pgm="ICETOOL",
-        dds=_get_icetool_dds(location=location),
+        dds=_get_icetool_dds(location=location, first_record=first_record),
         verbose=True,
         debug=False)
+
+
+def _get_data_component(stdout):  # type: (str) -> str | None
+    # The data component of a VSAM cluster from the output of LISTCAT ALL.
+    # The index component has its own statistics and volumes, which come
+    # after it.
+    upper = stdout.upper()
+    start = upper.find("DATA -")
+    if start == -1:
+        return None
+    end = upper.find("INDEX -", start)
+    return upper[start:end if end != -1 else len(upper)]
+
+
+def _get_catalog_statistics(stdout):  # type: (str) -> dict[str, int] | None
+    data_component = _get_data_component(stdout)
+    if data_component is None:
+        return None
+
+    statistics = {}
+    for key, pattern in _CATALOG_STATISTICS.items():
+        match = pattern.search(data_component)
+        if not match:
+            return None
+        statistics[key] = int(match.group(1))
+    return statistics
+
+
+def _get_catalog_attributes(stdout):  # type: (str) -> dict | None
+    # Attributes that aren't in the output are left out, so they never match
+    # the ones from a definition
+    data_component = _get_data_component(stdout)
+    if data_component is None:
+        return None
+
+    attributes = {"reuse": bool(re.search(r"\bREUSE\b", data_component))}
+    for key, pattern in _CATALOG_ATTRIBUTES.items():
+        match = pattern.search(data_component)
+        if match:
+            attributes[key] = int(match.group(1))
+    space_type = re.search(r"SPACE-TYPE-*(\w+)", data_component)
+    if space_type:
+        attributes["space_type"] = space_type.group(1)
+    volumes = re.findall(r"VOLSER-*(\S+)", data_component)
+    if volumes:
+        attributes["volumes"] = sorted(volumes)
+    return attributes
+
+
+def _run_listcat(location):  # type: (str) -> tuple[list[_execution], str | None]
+    # Returns None for output that can't be used, rather than failing, as
+    # the records can still be counted
+    executions = []
+
+    for x in range(MVS_CMD_RETRY_ATTEMPTS):
+        listcat_response = _execute_listcat(location)
+        executions.append(
+            _execution(
+                name="IDCAMS - Get catalog statistics - Run {0}".format(x + 1),
+                rc=listcat_response.rc,
+                stdout=listcat_response.stdout,
+                stderr=listcat_response.stderr))
+        if listcat_response.rc != 0 or location.upper() in listcat_response.stdout.upper():
+            break
+
+    if listcat_response.rc != 0:
+        return executions, None
+    return executions, listcat_response.stdout
+
+
+def _execute_listcat(location):  # type: (str) -> MVSCmdResponse
+    return MVSCmd.execute_authorized(
+        pgm="IDCAMS",
+        dds=_get_idcams_dds("  LISTCAT ENTRIES('{0}') ALL".format(location)),
+        verbose=True,
+        debug=False)
+
+
+def _run_has_records(location, data_set_organization, listcat_stdout=None):  # type: (str, str, str | None) -> tuple[list[_execution], bool]
+    """
+    Find out whether a data set has any records, without reading all of them.
+
+    For VSAM, a REC-TOTAL above 0 in the catalog is enough. The catalog is
+    only brought up to date when the data set is closed, so after CICS stops
+    without closing it, 0 can be out of date; that case, and every other
+    data set, is checked by reading up to the first record with ICETOOL. A
+    full ICETOOL COUNT is the fallback when that doesn't give a count.
+
+    The output of a LISTCAT the caller has already run can be passed in, to
+    save running it again.
+    """
+    executions = []
+
+    if data_set_organization == VSAM:
+        if listcat_stdout is None:
+            listcat_executions, listcat_stdout = _run_listcat(location)
+            executions.extend(listcat_executions)
+        statistics = _get_catalog_statistics(listcat_stdout) if listcat_stdout else None
+        if statistics and statistics["rec_total"] > 0:
+            return executions, True
+
+    try:
+        icetool_executions, record_count = _run_icetool(location, first_record=True)
+        executions.extend(icetool_executions)
+    except MVSExecutionException as e:
+        executions.extend(e.executions)
+        record_count = -1
+
+    if record_count < 0:
+        try:
+            icetool_executions, record_count = _run_icetool(location)
+        except MVSExecutionException as e:
+            raise MVSExecutionException(e.message, executions + e.executions)
+        executions.extend(icetool_executions)
+
+    return executions, record_count > 0
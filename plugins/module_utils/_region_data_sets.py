@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+# FOR INTERNAL USE IN THE COLLECTION ONLY.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+from collections import OrderedDict
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement import DatasetDefinition, DDStatement
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmd, MVSCmdResponse
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import MVSExecutionException, _execution
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import (
+    MVS_CMD_RETRY_ATTEMPTS,
+    _build_idcams_define_cmd,
+    _execute_idcams
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _aux_temp_storage
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _aux_trace
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _csd
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _global_catalog
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _local_catalog
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _local_request_queue
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _td_intrapartition
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _transaction_dump
+
+VSAM = "VSAM"
+SEQUENTIAL = "Sequential"
+DELETE = "DELETE"
+DEFINE = "DEFINE"
+
+
+# The organization, default space and builder of each region data set, from
+# the module_utils of the module that manages that data set on its own. VSAM
+# data sets are defined by IDCAMS and sequential ones are allocated by IEFBR14.
+def _data_set(dsorg, module_utils, build):  # type: (str, object, object) -> dict
+    return dict(
+        dsorg=dsorg,
+        primary=module_utils.SPACE_PRIMARY_DEFAULT,
+        secondary=module_utils.SPACE_SECONDARY_DEFAULT,
+        unit=module_utils.SPACE_TYPE_DEFAULT,
+        build=build
+    )
+
+
+DATA_SETS = OrderedDict([
+    ("dfhgcd", _data_set(VSAM, _global_catalog, _global_catalog._get_idcams_cmd_gcd)),
+    ("dfhlcd", _data_set(VSAM, _local_catalog, _local_catalog._get_idcams_cmd_lcd)),
+    ("dfhcsd", _data_set(VSAM, _csd, _csd._get_idcams_cmd_csd)),
+    ("dfhintra", _data_set(VSAM, _td_intrapartition, _td_intrapartition._get_idcams_cmd_intra)),
+    ("dfhlrq", _data_set(VSAM, _local_request_queue, _local_request_queue._get_idcams_cmd_lrq)),
+    ("dfhtemp", _data_set(VSAM, _aux_temp_storage, _aux_temp_storage._get_idcams_cmd_temp)),
+    ("dfhauxt", _data_set(SEQUENTIAL, _aux_trace, _aux_trace._build_seq_data_set_definition_aux_trace)),
+    ("dfhbuxt", _data_set(SEQUENTIAL, _aux_trace, _aux_trace._build_seq_data_set_definition_aux_trace)),
+    ("dfhdmpa", _data_set(SEQUENTIAL, _transaction_dump, _transaction_dump._build_seq_data_set_definition_transaction_dump)),
+    ("dfhdmpb", _data_set(SEQUENTIAL, _transaction_dump, _transaction_dump._build_seq_data_set_definition_transaction_dump)),
+])
+
+_FUNCTION_END = re.compile(
+    r"IDC(?:0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS|3003I FUNCTION TERMINATED\. CONDITION CODE IS)\s+(\d+)"
+)
+
+
+def _get_delete_cmd(name):  # type: (str) -> str
+    return '''
+    DELETE {0}
+    '''.format(name)
+
+
+def _get_define_cmd(key, data_set):  # type: (str, dict) -> str
+    return _build_idcams_define_cmd(DATA_SETS[key]["build"](data_set))
+
+
+def _get_seq_definition(key, data_set):  # type: (str, dict) -> DatasetDefinition
+    return DATA_SETS[key]["build"](data_set)
+
+
+def _get_idcams_function_results(stdout):  # type: (str) -> list[tuple[int, str]]
+    # IDCAMS ends the output of each command with the condition code it
+    # finished with, so the output of the nth command is the text up to the
+    # nth of these messages
+    results = []
+    start = 0
+    for match in _FUNCTION_END.finditer(stdout.upper()):
+        results.append((int(match.group(1)), stdout[start:match.end()]))
+        start = match.end()
+    return results
+
+
+def _check_idcams_function(verb, name, condition_code, output):  # type: (str, str, int, str) -> str | None
+    # Returns why the command failed, in the same terms as _run_idcams
+    compressed = output.upper().replace(" ", "").replace("\n", "")
+    if verb == DELETE:
+        if condition_code == 0 or (
+                condition_code == 8 and "ENTRY{0}NOTFOUND".format(name.upper()) in compressed):
+            return None
+        return "RC {0} when deleting data set {1}".format(condition_code, name)
+
+    if condition_code == 0 or (
+            condition_code == 12 and "NOTDEFINEDBECAUSEDUPLICATENAMEEXISTSINCATALOG" in compressed):
+        return None
+    return "RC {0} when creating data set {1}".format(condition_code, name)
+
+
+def _run_idcams_commands(commands):  # type: (list[tuple[str, str, str]]) -> list[dict[str, str| int]]
+    # Runs (verb, data set name, command) tuples in a single IDCAMS step and
+    # checks the output of each command
+    cmd = "".join(command for verb, name, command in commands)
+    executions = []
+
+    # Only a step with no output is run again: once IDCAMS has run any of
+    # the commands, running them all again could repeat a DELETE or DEFINE
+    for x in range(MVS_CMD_RETRY_ATTEMPTS):
+        idcams_response = _execute_idcams(cmd=cmd)
+        executions.append(
+            _execution(
+                name="IDCAMS - Region data sets - Run {0}".format(x + 1),
+                rc=idcams_response.rc,
+                stdout=idcams_response.stdout,
+                stderr=idcams_response.stderr))
+        if idcams_response.stdout != "":
+            break
+
+    if idcams_response.stdout == "":
+        raise MVSExecutionException("IDCAMS Command output not recognised", executions)
+
+    results = _get_idcams_function_results(idcams_response.stdout)
+    failures = [
+        failure for failure in (
+            _check_idcams_function(verb, name, condition_code, output)
+            for (verb, name, command), (condition_code, output) in zip(commands, results)
+        ) if failure
+    ]
+    # IDCAMS stops at a condition code of 16, before the rest of the commands
+    not_run = commands[len(results):]
+    if not_run:
+        failures.append("RC {0} from IDCAMS before running {1}".format(
+            idcams_response.rc,
+            ", ".join("{0} {1}".format(verb, name) for verb, name, command in not_run)))
+    if failures:
+        raise MVSExecutionException(". ".join(failures), executions)
+
+    return executions
+
+
+def _run_iefbr14_data_sets(definitions):  # type: (list[tuple[str, DatasetDefinition]]) -> list[dict[str, str| int]]
+    # Allocates every (ddname, definition) in a single IEFBR14 step
+    executions = []
+
+    for x in range(MVS_CMD_RETRY_ATTEMPTS):
+        iefbr14_response = _execute_iefbr14_data_sets(definitions)
+        executions.append(
+            _execution(
+                name="IEFBR14 - Region data sets - Run {0}".format(x + 1),
+                rc=iefbr14_response.rc,
+                stdout=iefbr14_response.stdout,
+                stderr=iefbr14_response.stderr))
+        if iefbr14_response.stdout != "" or iefbr14_response.stderr != "":
+            break
+
+    if iefbr14_response.stdout == "" and iefbr14_response.stderr == "":
+        raise MVSExecutionException("IEFBR14 Command output not recognised", executions)
+
+    if iefbr14_response.rc != 0:
+        raise MVSExecutionException(
+            "RC {0} when creating sequential data sets".format(
+                iefbr14_response.rc), executions)
+
+    return executions
+
+
+def _execute_iefbr14_data_sets(definitions):  # type: (list[tuple[str, DatasetDefinition]]) -> MVSCmdResponse
+    return MVSCmd.execute(
+        pgm="IEFBR14",
+        dds=[DDStatement(ddname, definition) for ddname, definition in definitions],
+        verbose=True,
+        debug=False
+    )
@@ -30,6 +30,9 @@ def _build_seq_data_set_definition_transaction_dump(data_set):   # type: (dict)
     return definition
 
 
+SPACE_PRIMARY_DEFAULT = 20
+SPACE_SECONDARY_DEFAULT = 4
+SPACE_TYPE_DEFAULT = "m"
 BLOCK_SIZE_DEFAULT = 4096
 RECORD_LENGTH_DEFAULT = 4092
 RECORD_FORMAT = "VB"
@@ -4,7 +4,7 @@
 # Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
 from __future__ import (absolute_import, division, print_function)
 from http.client import HTTPResponse, RemoteDisconnected
-from typing import Any
+from typing import Any, Callable
 from urllib.error import HTTPError, URLError
 
 __metaclass__ = type
@@ -12,18 +12,22 @@ __metaclass__ = type
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib, \
     env_fallback
 from ansible.module_utils.urls import Request
+# The filter operators are part of the argument spec, so the filter helpers
+# are needed by every module. socket, threading and zlib are already imported
+# by ansible.module_utils.urls. The cache and retry helpers are only imported
+# when a module uses them.
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    OPERATORS, FilterError, compile_filter, emit, is_alphanumeric, parse_basic
+)
 from collections import OrderedDict
+from xml.parsers import expat
 import re
+import socket
+import threading
+import time
 import traceback
 import urllib
-
-XMLTODICT_IMP_ERR = ""
-
-try:
-    import xmltodict
-except ImportError:
-    xmltodict = None
-    XMLTODICT_IMP_ERR = traceback.format_exc()
+import zlib
 
 CMCI_HOST = 'cmci_host'
 CMCI_PORT = 'cmci_port'
@@ -47,6 +51,24 @@ FEEDBACK = 'feedback'
 TIMEOUT = 'timeout'
 GET_PARAMETERS = 'get_parameters'
 CONTENT_TYPE = 'content-type'
+CONNECTION_BROKER = 'connection_broker'
+CONNECTION_BROKER_IDLE_TIMEOUT = 'connection_broker_idle_timeout'
+RETRIES = 'retries'
+RETRY_DELAY = 'retry_delay'
+RETRY_MAX_DELAY = 'retry_max_delay'
+RETRY_JITTER = 'retry_jitter'
+RETRY_ON_HTTP_STATUS = 'retry_on_http_status'
+RETRY_ON_CPSM_RESPONSE = 'retry_on_cpsm_response'
+RETRY_HISTORY = 'retry_history'
+CIRCUIT_BREAKER_THRESHOLD = 'circuit_breaker_threshold'
+CIRCUIT_BREAKER_RESET_TIMEOUT = 'circuit_breaker_reset_timeout'
+TIMINGS = 'timings'
+METRICS_FILE = 'metrics_file'
+CACHE = 'cache'
+RESPONSE_SIZE = 'response_size'
+CACHE_TTL = 'cache_ttl'
+CACHE_DIR = 'cache_dir'
+CACHE_MAX_ENTRIES = 'cache_max_entries'
 
 
 def parameters_argument(name: str) -> dict[str, Any]:
@@ -69,8 +91,12 @@ def parameters_argument(name: str) -> dict[str, Any]:
     }
 
 
-OPERATORS = ['<', '<=', '=', '>', '>=', '¬=', '==', '!=', 'EQ', 'NE', 'LT',
-             'LE', 'GE', 'GT', 'IS']
+CONTEXT_REGEX = '^([A-Za-z0-9$@#]{1,8})$'
+CONTEXT_MESSAGE = 'a CPSM context name.  CPSM context names are max 8 ' \
+    'characters. Valid characters are A-Z a-z 0-9 $ @ #.'
+SCOPE_REGEX = '^([A-Za-z0-9$@#]{1,8})$'
+SCOPE_MESSAGE = 'a CPSM scope name. CPSM scope names are max 8 characters. ' \
+    'Valid characters are A-Z a-z 0-9 $ @ #.'
 
 ATTRIBUTE = 'attribute'
 AND = 'and'
@@ -112,7 +138,7 @@ RESOURCES_ARGUMENT = {
                         'choices': OPERATORS
                     },
                     VALUE: {
-                        'type': 'str',
+                        'type': 'raw',
                         'required': False
                     },
                     AND: {
@@ -142,27 +168,6 @@ ATTRIBUTES_ARGUMENT = {
 }
 
 
-def escape_quotes(value):
-    # Escape all single quotes ' found in values
-    v = re.compile(r"\'", flags=0)
-    return v.sub(r"\'", value)
-
-
-def is_alphanumeric(value):
-    return re.match('^([A-Za-z0-9]{1,100})$', value, flags=0)
-
-
-def read_node(node):  # type: (OrderedDict) -> list[OrderedDict]
-    # Reads a record node that can contain multiple lists of attributes
-    result = [
-        OrderedDict(
-            [get_attribute(k, v)
-             for k, v in n.items()]
-        ) for n in node
-    ]
-    return result
-
-
 def read_error_node(node):  # type: (OrderedDict) -> list[OrderedDict]
     # Reads an error node than can contain multiple lists of attributes that
     # themselves contain multiple lists of attributes
@@ -198,6 +203,223 @@ def get_attribute(k, v):
     return (k[1:], v)
 
 
+class CMCIRequestError(Exception):
+    # A CMCI response that can't be handled, for example one that isn't XML
+    pass
+
+
+# Size of each read from the CMCI response when feeding the XML parser
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Content codings the CMCI response can be compressed with. The XML is
+# repetitive enough that this is many times smaller on the wire.
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# Guards totals in the module result that concurrent requests add to
+_RESULT_LOCK = threading.Lock()
+
+
+class CMCIResponseReader(object):
+    # Reads the body of a response, decompressing it as it's read if the
+    # server compressed it, and counts the bytes before and after.
+
+    def __init__(self, response, content_encoding=None):
+        # type: (Any, str | None) -> None
+        self._response = response
+        self.content_encoding = (content_encoding or 'identity').lower()
+        if self.content_encoding not in ('gzip', 'deflate', 'identity'):
+            raise CMCIRequestError(
+                'CMCI response has an unsupported content encoding: {0}'
+                .format(content_encoding)
+            )
+        self._decompressor = None
+        if self.content_encoding != 'identity':
+            # Accepts both gzip and zlib wrapped deflate streams
+            self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        self._started = False
+        self.received_bytes = 0
+        self.uncompressed_bytes = 0
+        # Time spent waiting for the body to arrive
+        self.read_seconds = 0.0
+
+    def read(self, amt=RESPONSE_CHUNK_SIZE):  # type: (int) -> bytes
+        if self._decompressor is None:
+            data = self._read_response(amt)
+            self.uncompressed_bytes += len(data)
+            return data
+
+        # Keep reading until some output is produced, or the body ends. The
+        # output of each read is limited to amt, with the rest of the input
+        # held back until the next one.
+        while True:
+            data = self._decompressor.unconsumed_tail
+            if not data:
+                data = self._read_response(amt)
+                if not data:
+                    tail = self._decompressor.flush()
+                    self.uncompressed_bytes += len(tail)
+                    return tail
+            output = self._decompress(data, amt)
+            if output:
+                self._started = True
+                self.uncompressed_bytes += len(output)
+                return output
+
+    def _read_response(self, amt):  # type: (int) -> bytes
+        start = time.perf_counter()
+        data = self._response.read(amt)
+        self.read_seconds += time.perf_counter() - start
+        self.received_bytes += len(data)
+        return data
+
+    def _decompress(self, data, amt):  # type: (bytes, int) -> bytes
+        try:
+            output = self._decompressor.decompress(data, amt)
+        except zlib.error as e:
+            # Some servers send deflate without the zlib wrapper
+            if self._started or self.content_encoding != 'deflate':
+                raise CMCIRequestError(
+                    'CMCI response could not be decompressed: {0}'.format(e)
+                )
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            self._started = True
+            return self._decompress(data, amt)
+        return output
+
+
+class CMCIResponseParser(object):
+    # Incrementally parses a CMCI response document using expat callbacks.
+    #
+    # Non-record elements are built into the same dict shape that
+    # xmltodict.parse would produce (attributes prefixed with @, namespaces
+    # stripped, repeated elements as lists), so handle_response can navigate
+    # the document as before. Records of the requested resource type are
+    # built directly into OrderedDicts with the @ prefix already stripped and
+    # appended to a single list as they arrive, so neither the raw body nor
+    # an intermediate tree of the records is ever held in memory. With a
+    # projection, only the named attributes of each record are kept. With a
+    # record sink, each record is passed to it instead of being kept at all.
+
+    def __init__(self, resource_type, force_list=(FEEDBACK,), projection=None,
+                 record_sink=None):
+        # type: (str, tuple[str, ...], list[str] | None, Callable[[OrderedDict], None] | None) -> None
+        self.records = []  # type: list[OrderedDict]
+        self._resource_type = resource_type
+        self._projection = frozenset(projection) \
+            if projection is not None else None
+        self._record_sink = record_sink or self.records.append
+        self._force_list = force_list
+        self._document = OrderedDict()  # type: OrderedDict
+        # Stack of (name, node, text) for the elements currently open. A node
+        # of None marks a record element, or an element inside one.
+        self._stack = [(None, self._document, [])]
+        self._parser = expat.ParserCreate(namespace_separator=' ')
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start_element
+        self._parser.EndElementHandler = self._end_element
+        self._parser.CharacterDataHandler = self._character_data
+
+    def feed(self, data, final=False):  # type: (bytes, bool) -> None
+        self._parser.Parse(data, final)
+
+    def parse(self, stream, chunk_size=RESPONSE_CHUNK_SIZE):
+        # type: (Any, int) -> OrderedDict
+        # Read the stream a chunk at a time, so the whole body is never
+        # held in memory at once
+        while True:
+            data = stream.read(chunk_size)
+            if not data:
+                break
+            self.feed(data)
+        self.feed(b'', True)
+        return self._document
+
+    def _start_element(self, name, attributes):
+        name = _local_name(name)
+        parent_name, parent, dummy = self._stack[-1]
+
+        if parent is None:
+            # Records only carry attributes, ignore anything nested in them
+            self._stack.append((name, None, []))
+            return
+
+        if parent_name == 'records' and name == self._resource_type:
+            record = OrderedDict(
+                (_local_name(k), v) for k, v in attributes.items()
+            )
+            if self._projection is not None:
+                record = OrderedDict(
+                    (k, v) for k, v in record.items() if k in self._projection
+                )
+            self._record_sink(record)
+            parent[name] = self.records
+            self._stack.append((name, None, []))
+            return
+
+        node = OrderedDict(
+            ('@' + _local_name(k), v) for k, v in attributes.items()
+        )
+        self._stack.append((name, node, []))
+
+    def _end_element(self, name):
+        name, node, text = self._stack.pop()
+        if node is None:
+            return
+
+        text = ''.join(text).strip()
+        if text:
+            if node:
+                node['#text'] = text
+            else:
+                node = text
+        elif not node:
+            node = None
+
+        parent = self._stack[-1][1]
+        if name in parent:
+            existing = parent[name]
+            if isinstance(existing, list):
+                existing.append(node)
+            else:
+                parent[name] = [existing, node]
+        elif name in self._force_list:
+            parent[name] = [node]
+        else:
+            parent[name] = node
+
+    def _character_data(self, data):
+        if self._stack[-1][1] is not None:
+            self._stack[-1][2].append(data)
+
+
+def open_response(response):  # type: (Any) -> CMCIResponseReader
+    # Checks a response is a CMCI XML document, and returns a reader for its
+    # body to parse
+    content_type = response.getheader('content-type')
+    # Content type header may include the encoding.
+    # Just look at the first segment if so
+    content_type = content_type.split(';')[0]
+    if content_type != 'application/xml':
+        raise CMCIRequestError(
+            'CMCI request returned a non application/xml content type:'
+            ' {0}'
+            .format(content_type)
+        )
+
+    # Missing content
+    if not response.readable():
+        raise CMCIRequestError('CMCI response did not contain any data')
+
+    return CMCIResponseReader(
+        response, response.getheader('content-encoding')
+    )
+
+
+def _local_name(name):  # type: (str) -> str
+    # Strip the namespace URI expat prefixes qualified names with
+    return name.rsplit(' ', 1)[-1]
+
+
 class AnsibleCMCIModule(object):
 
     def __init__(self, method):
@@ -210,18 +432,19 @@ class AnsibleCMCIModule(object):
         )  # type: AnsibleModule
         self.result = dict(changed=False)  # type: dict
 
-        if not xmltodict:
-            self._fail_tb(missing_required_lib('xmltodict'), XMLTODICT_IMP_ERR)
-
         self._method = method  # type: str
         self._p = self.init_p()  # type: dict
         self._session = self.init_session()  # type: Request
+        self._broker = self.init_broker()  # type: BrokerClient | None
+        self._cache = self.init_cache()  # type: CMCIResultCache | None
+        self._retry_policy = self.init_retry_policy()  # type: RetryPolicy | None
+        self._circuit_breaker = self.init_circuit_breaker()  # type: CircuitBreaker | None
+        self.init_request()
+
+    def init_request(self):  # type: () -> None
         self._url = self.init_url()  # type: str
 
-        # full_document=False suppresses the xml prolog, which CMCI doesn't like
-        body_dict = self.init_body()
-        self._body = xmltodict.unparse(self.init_body(), full_document=False)\
-            if body_dict else None  # type: str
+        self._body = self.encode_body(self.init_body())  # type: str
 
         request_params = self.init_request_params()
 
@@ -290,6 +513,66 @@ class AnsibleCMCIModule(object):
             TIMEOUT: {
                 'type': 'int',
                 'default': 30
+            },
+            CONNECTION_BROKER: {
+                'type': 'bool',
+                'default': False
+            },
+            CONNECTION_BROKER_IDLE_TIMEOUT: {
+                'type': 'int',
+                'default': 60
+            },
+            CACHE_TTL: {
+                'type': 'int',
+                'default': 0
+            },
+            CACHE_DIR: {
+                'type': 'path'
+            },
+            CACHE_MAX_ENTRIES: {
+                'type': 'int',
+                'default': 256
+            },
+            RETRIES: {
+                'type': 'int',
+                'default': 0
+            },
+            RETRY_DELAY: {
+                'type': 'float',
+                'default': 1.0
+            },
+            RETRY_MAX_DELAY: {
+                'type': 'float',
+                'default': 30.0
+            },
+            RETRY_JITTER: {
+                'type': 'bool',
+                'default': True
+            },
+            RETRY_ON_HTTP_STATUS: {
+                'type': 'list',
+                'elements': 'int',
+                'default': [502, 503, 504]
+            },
+            RETRY_ON_CPSM_RESPONSE: {
+                'type': 'list',
+                'elements': 'str',
+                'default': ['BUSY', 'SERVERGONE']
+            },
+            CIRCUIT_BREAKER_THRESHOLD: {
+                'type': 'int',
+                'default': 0
+            },
+            CIRCUIT_BREAKER_RESET_TIMEOUT: {
+                'type': 'int',
+                'default': 60
+            },
+            TIMINGS: {
+                'type': 'bool',
+                'default': False
+            },
+            METRICS_FILE: {
+                'type': 'path'
             }
         }
 
@@ -318,19 +601,13 @@ class AnsibleCMCIModule(object):
                 .format(CMCI_PORT, str(port))
             )
 
-        self.validate(
-            CONTEXT,
-            '^([A-Za-z0-9$@#]{1,8})$',
-            'a CPSM context name.  CPSM context names are max 8 characters. '
-            'Valid characters are A-Z a-z 0-9 $ @ #.'
-        )
+        self.validate_target()
 
-        self.validate(
-            SCOPE,
-            '^([A-Za-z0-9$@#]{1,8})$',
-            'a CPSM scope name. CPSM scope names are max 8 characters. '
-            'Valid characters are A-Z a-z 0-9 $ @ #.'
-        )
+        return self._module.params
+
+    def validate_target(self):  # type: () -> None
+        self.validate(CONTEXT, CONTEXT_REGEX, CONTEXT_MESSAGE)
+        self.validate(SCOPE, SCOPE_REGEX, SCOPE_MESSAGE)
 
         self.validate(
             TYPE,
@@ -339,10 +616,13 @@ class AnsibleCMCIModule(object):
             'Valid characters are A-Z a-z 0-9.'
         )
 
-        return self._module.params
-
     def validate(self, name, regex, message):  # type: (str, str, str) -> None
-        value = self._module.params.get(name)
+        self.validate_value(
+            name, self._module.params.get(name), regex, message
+        )
+
+    def validate_value(self, name, value, regex, message):
+        # type: (str, str, str, str) -> None
         if value:
 
             # Emulate python-3.4 re.fullmatch()
@@ -356,6 +636,22 @@ class AnsibleCMCIModule(object):
     def init_body(self):  # type: () -> dict | None
         return None
 
+    def encode_body(self, body_dict):  # type: (dict | None) -> str | None
+        if not body_dict:
+            return None
+
+        # Responses are parsed with expat, so only requests with a body need
+        # xmltodict, and GETs don't pay to import it
+        try:
+            import xmltodict
+        except ImportError:
+            self._fail_tb(
+                missing_required_lib('xmltodict'), traceback.format_exc()
+            )
+
+        # full_document=False suppresses the xml prolog, which CMCI doesn't like
+        return xmltodict.unparse(body_dict, full_document=False)
+
     def handle_response(self, response_dict):  # type: (dict) -> None
         try:
             response_node = response_dict['response']
@@ -388,7 +684,8 @@ class AnsibleCMCIModule(object):
                 records_node = response_node['records']
                 resource_type = self._p[TYPE].lower()
                 if resource_type in records_node:
-                    self.result['records'] = read_node(records_node[resource_type])
+                    # Records are already read into OrderedDicts by the parser
+                    self.result['records'] = records_node[resource_type]
 
             if 'errors' in response_node:
                 errors_node = response_node['errors']
@@ -419,6 +716,9 @@ class AnsibleCMCIModule(object):
         return [1024]
 
     def init_url(self):  # type: () -> str
+        return self.get_target_url(self._p.get(CONTEXT), self._p.get(SCOPE))
+
+    def get_target_url(self, context, scope):  # type: (str, str | None) -> str
         t = self._p.get(TYPE).lower()
         url = self._p.get(SCHEME) + \
             '://' + \
@@ -428,9 +728,9 @@ class AnsibleCMCIModule(object):
             '/CICSSystemManagement/' + \
             t + \
             '/' + \
-            _url_encode_string(self._p.get(CONTEXT)) + '/'
-        if self._p.get(SCOPE):
-            url = url + _url_encode_string(self._p.get(SCOPE))
+            _url_encode_string(context) + '/'
+        if scope:
+            url = url + _url_encode_string(scope)
 
         return url
 
@@ -445,22 +745,10 @@ class AnsibleCMCIModule(object):
             f = resources.get(FILTER)
             if f:
                 # AND basic filters together and use the = operator for each one
-                filter_string = ''
-                for key, value in f.items():
-                    value = escape_quotes(value)
-
-                    if not is_alphanumeric(key):
-                        self._fail(
-                            "Filter key with value {0} was not valid. Valid characters are A-Z a-z 0-9."
-                            .format(key)
-                        )
-
-                    filter_string = _append_filter_string(
-                        filter_string,
-                        key + '=' + '\'' + value + '\'',
-                        joiner=' AND '
-                    )
-                request_params['CRITERIA'] = filter_string
+                try:
+                    request_params['CRITERIA'] = emit(parse_basic(f))
+                except FilterError as e:
+                    self._fail(str(e))
 
             complex_filter = resources.get(COMPLEX_FILTER)
             if complex_filter:
@@ -520,76 +808,411 @@ class AnsibleCMCIModule(object):
 
         return session
 
-    def _do_request(self):  # type: () -> dict
+    def init_broker(self):  # type: () -> BrokerClient | None
+        if not self._p.get(CONNECTION_BROKER):
+            return None
+
+        idle_timeout = self._p.get(CONNECTION_BROKER_IDLE_TIMEOUT)
+        if idle_timeout < 1:
+            self._fail(
+                'Parameter "{0}" with value "{1}" was not valid.  Expected a '
+                'number of seconds greater than 0.'
+                .format(CONNECTION_BROKER_IDLE_TIMEOUT, str(idle_timeout))
+            )
+
+        # Only imported when it's used, because it imports a lot
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_broker import (
+            BrokerClient
+        )
+
+        # The broker authenticates with the same credentials that
+        # init_session chose
         try:
-            response: HTTPResponse = self._session.open(
-                self._method,
-                self._url,
-                validate_certs=not self._p[INSECURE],
-                timeout=self._p[TIMEOUT],
-                data=self._body
+            return BrokerClient(
+                self._p.get(SCHEME),
+                self._p.get(CMCI_HOST),
+                self._p.get(CMCI_PORT),
+                user=self._session.url_username,
+                password=self._session.url_password,
+                cert=self._session.client_cert,
+                key=self._session.client_key,
+                ca=self._session.ca_path,
+                insecure=self._p[INSECURE],
+                idle_timeout=idle_timeout
+            )
+        except OSError as e:
+            self._fail(
+                'Could not use the CMCI connection broker: {0}'.format(e)
             )
 
-            self.result['http_status_code'] = response.status
-            self.result['http_status'] = response.reason \
-                if response.reason else str(response.status)
+    def init_cache(self):  # type: () -> CMCIResultCache | None
+        for name, minimum in ((CACHE_TTL, 0), (CACHE_MAX_ENTRIES, 1)):
+            if self._p.get(name) < minimum:
+                self._fail(
+                    'Parameter "{0}" with value "{1}" was not valid.  '
+                    'Expected a number greater than or equal to {2}.'
+                    .format(name, str(self._p.get(name)), minimum)
+                )
+
+        # Requests that change resources discard cached results for them even
+        # when they don't use the cache, so get_cache creates it for them
+        return self._new_cache() if self.is_cacheable() else None
+
+    def _new_cache(self):  # type: () -> CMCIResultCache
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_cache import CMCIResultCache
+        return CMCIResultCache(
+            self._p.get(CACHE_DIR),
+            self._p.get(CACHE_TTL),
+            self._p.get(CACHE_MAX_ENTRIES)
+        )
+
+    def get_cache(self):  # type: () -> CMCIResultCache
+        if self._cache is None:
+            self._cache = self._new_cache()
+        return self._cache
 
-            # Try and parse the XML response body into a dict
-            content_type = response.getheader('content-type')
-            # Content type header may include the encoding.
-            # Just look at the first segment if so
-            content_type = content_type.split(';')[0]
-            if content_type != 'application/xml':
+    def init_retry_policy(self):  # type: () -> RetryPolicy | None
+        for name in (RETRIES, RETRY_DELAY, RETRY_MAX_DELAY):
+            if self._p.get(name) < 0:
                 self._fail(
-                    'CMCI request returned a non application/xml content type:'
-                    ' {0}'
-                    .format(content_type)
+                    'Parameter "{0}" with value "{1}" was not valid.  '
+                    'Expected a number greater than or equal to 0.'
+                    .format(name, str(self._p.get(name)))
                 )
 
-            # Missing content
-            if not response.readable():
-                self._fail('CMCI response did not contain any data')
-
-            namespaces = {
-                'http://www.ibm.com/xmlns/prod/CICS/smw2int': None,
-                'http://www.w3.org/2001/XMLSchema-instance': None
-            }  # namespace information
-
-            r = xmltodict.parse(
-                str(response.read().decode()),
-                process_namespaces=True,
-                namespaces=namespaces,
-                # Make sure we always return a list for the resource node
-                force_list=(
-                    self._p.get(TYPE).lower(),
-                    FEEDBACK
+        # Without retries or a circuit breaker, requests are made once
+        if self._p.get(RETRIES) == 0 and self._p.get(CIRCUIT_BREAKER_THRESHOLD) <= 0:
+            return None
+
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_retry import RetryPolicy
+        return RetryPolicy(
+            retries=self._p.get(RETRIES),
+            delay=self._p.get(RETRY_DELAY),
+            max_delay=self._p.get(RETRY_MAX_DELAY),
+            jitter=self._p.get(RETRY_JITTER),
+            http_statuses=self._p.get(RETRY_ON_HTTP_STATUS) or [],
+            cpsm_responses=self._p.get(RETRY_ON_CPSM_RESPONSE) or []
+        )
+
+    def init_circuit_breaker(self):  # type: () -> CircuitBreaker | None
+        for name, minimum in ((CIRCUIT_BREAKER_THRESHOLD, 0),
+                              (CIRCUIT_BREAKER_RESET_TIMEOUT, 1)):
+            if self._p.get(name) < minimum:
+                self._fail(
+                    'Parameter "{0}" with value "{1}" was not valid.  '
+                    'Expected a number greater than or equal to {2}.'
+                    .format(name, str(self._p.get(name)), minimum)
                 )
+
+        if self._retry_policy is None:
+            return None
+
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_retry import CircuitBreaker
+        return CircuitBreaker(
+            self._p.get(SCHEME),
+            self._p.get(CMCI_HOST),
+            self._p.get(CMCI_PORT),
+            self._p.get(CIRCUIT_BREAKER_THRESHOLD),
+            self._p.get(CIRCUIT_BREAKER_RESET_TIMEOUT)
+        )
+
+    def is_cacheable(self):  # type: () -> bool
+        return self._method == 'GET' and self._p.get(CACHE_TTL) > 0
+
+    def get_cache_variant(self):  # type: () -> Any
+        # Anything besides the request that changes the parsed response
+        return None
+
+    def _do_request(self, method=None, url=None, body=None):
+        # type: (str | None, str | None, str | None) -> dict
+        # Makes the module's own request, unless another one is given
+        if method is None:
+            if self.is_cacheable():
+                return self._handle_request_errors(self._cached_request)
+            method, url, body = self._method, self._url, self._body
+
+        try:
+            return self._handle_request_errors(
+                lambda: self._request_with_retry(method, url, body)
             )
+        finally:
+            if method != 'GET':
+                self.get_cache().invalidate(self._get_cache_tag())
+
+    def _get_cache_tag(self):  # type: () -> str
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_cache import cache_tag
+        return cache_tag(
+            self._p.get(SCHEME),
+            self._p.get(CMCI_HOST),
+            self._p.get(CMCI_PORT),
+            self._p.get(TYPE),
+            self._p.get(CONTEXT)
+        )
+
+    def _cached_request(self):  # type: () -> dict
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_cache import cache_key
+        tag = self._get_cache_tag()
+        key = cache_key(
+            self._url,
+            user=self._session.url_username,
+            cert=self._session.client_cert,
+            variant=self.get_cache_variant()
+        )
+        stats = self.result.setdefault(CACHE, {'hits': 0, 'misses': 0})
+
+        try:
+            entry = self.get_cache().get(tag, key)
+        except OSError as e:
+            raise CMCIRequestError(
+                'Could not use the CMCI cache: {0}'.format(e)
+            )
+        if entry:
+            stats['hits'] += 1
+            self.result['http_status_code'] = entry['http_status_code']
+            self.result['http_status'] = entry['http_status']
+            return entry['response']
+
+        stats['misses'] += 1
+        response = self._request_with_retry(
+            self._method, self._url, self._body
+        )
+        # A failed request, like one the CMCI server was too busy for, would
+        # fail every task that reads it from the cache until it expires
+        if not self.is_ok_cpsm_response(response):
+            return response
+        try:
+            self.get_cache().put(tag, key, {
+                'http_status_code': self.result['http_status_code'],
+                'http_status': self.result['http_status'],
+                'response': response
+            })
+        except OSError as e:
+            raise CMCIRequestError(
+                'Could not use the CMCI cache: {0}'.format(e)
+            )
+        return response
+
+    def is_ok_cpsm_response(self, response):  # type: (dict) -> bool
+        result_summary = (response.get('response') or {}).get('resultsummary') or {}
+        try:
+            cpsm_response_code = int(result_summary.get('@api_response1'))
+        except (TypeError, ValueError):
+            return False
+        return cpsm_response_code in self.get_ok_cpsm_response_codes()
+
+    def _request_with_retry(self, method, url, body=None):
+        # type: (str, str, str | None) -> dict
+        # Makes a request like _request, retrying the failures the retry
+        # policy allows, and recording each retry in the result
+        if self._retry_policy is None:
+            return self._request(method, url, body)
+        try:
+            return self._attempt_request(method, url, body)
+        finally:
+            self._circuit_breaker.release()
+
+    def _attempt_request(self, method, url, body=None):
+        # type: (str, str, str | None) -> dict
+        from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_retry import CircuitBreakerOpen
+        attempts = self._retry_policy.attempts
+        for attempt in range(1, attempts + 1):
+            try:
+                self._circuit_breaker.check()
+            except CircuitBreakerOpen as e:
+                raise CMCIRequestError(str(e))
+
+            start = time.monotonic()
+            try:
+                response = self._request(method, url, body)
+            except HTTPError as e:
+                # A gateway that answered 502 or 504 might have passed the
+                # request on, so only a GET is safe to send again then. 503
+                # means the server didn't act on it.
+                if not self._retry_policy.retries_http_status(e.code) or \
+                        (method != 'GET' and e.code != 503):
+                    raise
+                self._circuit_breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                reason = 'HTTP status {0}'.format(e.code)
+            except (URLError, RemoteDisconnected) as e:
+                self._circuit_breaker.record_failure()
+                # The server might have acted on a request that failed after
+                # it was sent, so only a GET is safe to send again then
+                if attempt == attempts or \
+                        (method != 'GET' and not _request_not_sent(e)):
+                    raise
+                reason = 'Connection error: {0}'.format(
+                    e.reason if isinstance(e, URLError) else e
+                )
+            else:
+                cpsm_response = (response.get('response') or {})\
+                    .get('resultsummary', {}).get('@api_response1_alt')
+                if not self._retry_policy.retries_cpsm_response(cpsm_response):
+                    self._circuit_breaker.record_success()
+                    return response
+                self._circuit_breaker.record_failure()
+                if attempt == attempts:
+                    # Let handle_response report the failure
+                    return response
+                reason = 'CPSM response {0}'.format(cpsm_response)
+
+            delay = self._retry_policy.delay(attempt)
+            with _RESULT_LOCK:
+                self.result.setdefault(RETRY_HISTORY, []).append({
+                    'attempt': attempt,
+                    'reason': reason,
+                    'elapsed': round(time.monotonic() - start, 3),
+                    'delay': round(delay, 3)
+                })
+            time.sleep(delay)
+
+    def _request(self, method, url, body=None):
+        # type: (str, str, str | None) -> dict
+        # Makes a request and parses the response. Errors are raised rather
+        # than failing the module, so this can be called off the main thread
+        # with the errors handled by _handle_request_errors afterwards.
+        timed = self._p.get(TIMINGS) or self._p.get(METRICS_FILE)
+        timings = OrderedDict()  # type: OrderedDict
+        start = time.perf_counter()
+        if timed and not self._broker:
+            # The broker resolves the host itself, and reports it as part of
+            # connecting
+            timings['dns'] = self._time_name_resolution()
+
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        request_start = time.perf_counter()
+        if self._broker:
+            response = self._broker.open(
+                method,
+                url,
+                timeout=self._p[TIMEOUT],
+                data=body,
+                headers=headers
+            )
+        else:
+            # The response is decompressed as it's parsed instead
+            response: HTTPResponse = self._session.open(
+                method,
+                url,
+                validate_certs=not self._p[INSECURE],
+                timeout=self._p[TIMEOUT],
+                data=body,
+                headers=headers,
+                decompress=False
+            )
+        responded = time.perf_counter()
+
+        self.result['http_status_code'] = response.status
+        self.result['http_status'] = response.reason \
+            if response.reason else str(response.status)
+
+        # Parse the records off the response as they arrive
+        reader = open_response(response)
+        parse_start = time.perf_counter()
+        document = self.init_response_parser().parse(reader)
+        end = time.perf_counter()
+        self._add_response_size(reader)
+
+        if timed:
+            # Reading the body is interleaved with parsing it, so the time
+            # spent waiting for the body is taken out of the parse time
+            timings['request'] = responded - request_start
+            timings['transfer'] = reader.read_seconds
+            timings['parse'] = end - parse_start - reader.read_seconds
+            timings['total'] = end - start
+            broker_timings = getattr(response, 'timings', None)
+            self._add_timings(method, OrderedDict([
+                ('method', method),
+                ('url', url),
+                ('seconds', OrderedDict(
+                    (k, round(v, 6)) for k, v in timings.items()
+                )),
+                ('bytes', OrderedDict([
+                    ('sent', len(body.encode()) if body else 0),
+                    ('received', reader.received_bytes),
+                    ('uncompressed', reader.uncompressed_bytes)
+                ]))
+            ] + ([('broker', broker_timings)] if broker_timings else [])))
+        return document
+
+    def _time_name_resolution(self):  # type: () -> float
+        start = time.perf_counter()
+        try:
+            socket.getaddrinfo(
+                self._p.get(CMCI_HOST),
+                self._p.get(CMCI_PORT),
+                proto=socket.IPPROTO_TCP
+            )
+        except OSError:
+            # The request reports the failure
+            pass
+        return time.perf_counter() - start
+
+    def _add_timings(self, method, timing):  # type: (str, OrderedDict) -> None
+        if self._p.get(TIMINGS):
+            with _RESULT_LOCK:
+                self.result.setdefault(TIMINGS, []).append(timing)
+
+        metrics_file = self._p.get(METRICS_FILE)
+        if metrics_file:
+            from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_metrics import (
+                DURATION, SIZE, append_metrics
+            )
+            labels = {
+                'host': self._p.get(CMCI_HOST),
+                'port': self._p.get(CMCI_PORT),
+                'method': method,
+                'type': self._p.get(TYPE).lower(),
+                'context': self._p.get(CONTEXT)
+            }
+            now = time.time()
+            samples = [
+                (DURATION, dict(labels, phase=phase), value, now)
+                for phase, value in timing['seconds'].items()
+            ] + [
+                (SIZE, dict(labels, body=body), value, now)
+                for body, value in timing['bytes'].items()
+            ]
+            try:
+                append_metrics(metrics_file, samples)
+            except OSError as e:
+                self._module.warn(
+                    'Could not write CMCI metrics to {0}: {1}'
+                    .format(metrics_file, e)
+                )
 
-            return r
+    def _add_response_size(self, reader):  # type: (CMCIResponseReader) -> None
+        # Results stay as they were for servers that don't compress
+        if reader.content_encoding == 'identity':
+            return
+        with _RESULT_LOCK:
+            size = self.result.setdefault(RESPONSE_SIZE, {
+                'content_encoding': reader.content_encoding,
+                'received': 0,
+                'uncompressed': 0
+            })
+            size['received'] += reader.received_bytes
+            size['uncompressed'] += reader.uncompressed_bytes
+
+    def init_response_parser(self):  # type: () -> CMCIResponseParser
+        return CMCIResponseParser(self._p.get(TYPE).lower())
+
+    def _handle_request_errors(self, request):
+        # type: (Callable[[], dict]) -> dict
+        try:
+            return request()
+        except CMCIRequestError as e:
+            self._fail(str(e))
         except HTTPError as e:
             self.result['http_status_code'] = e.code
             self.result['http_status'] = e.reason \
                 if e.reason else str(e.code)
-            self._fail(
-                'CMCI request returned non-OK status: {0}'
-                .format(self.result.get('http_status'))
-            )
+            self._fail(request_error_message(e))
         except (URLError, RemoteDisconnected) as e:
-            cause = e
-            if isinstance(e, URLError):
-                cause = e.reason
-            elif isinstance(e, RemoteDisconnected):
-                cause = e.args[0]
-            self._fail('Error performing CMCI request: {0}'.format(cause))
-        except xmltodict.expat.ExpatError as e:
-            # Content couldn't be parsed as XML
-            self._fail_tb(
-                'CMCI response XML document could not be successfully parsed: '
-                '{0}'
-                .format(e),
-                traceback.format_exc()
-            )
+            self._fail(request_error_message(e))
+        except expat.ExpatError as e:
+            self._fail_tb(request_error_message(e), traceback.format_exc())
 
     def append_parameters(self, name, element):
         # type: (str, OrderedDict) -> None
@@ -614,129 +1237,18 @@ class AnsibleCMCIModule(object):
                 {'@' + key: value for key, value in items}
             )
 
-    def _get_filter(self, list_of_filters, joiner, path):
-        #  type: (list[dict], str, str) -> str
-
-        if not isinstance(list_of_filters, list):
-            self._fail(
-                "nested filters must be a list, was: %s found in %s"
-                % (type(list_of_filters), path)
-            )
-        complex_filter_string = ''
-        for i in list_of_filters:
-            complex_filter_string = _append_filter_string(
-                complex_filter_string,
-                self._get_complex_filter(i, path),
-                joiner
-            )
-        return complex_filter_string
-
-    def _get_complex_filter(self, i, path):
-        if not isinstance(i, dict):
-            self._fail(
-                "nested filter must be of type dict, was: %s found in %s"
-                % (type(i), path)
-            )
-
-        valid_keys = [AND, ATTRIBUTE, OPERATOR, OR, VALUE]
-        diff = set(i.keys()) - set(valid_keys)
-        if len(diff) != 0:
-            self._fail(
-                "Unsupported parameters for (basic.py) module: %s found"
-                " in %s. Supported parameters include: %s"
-                % (", ".join(diff), path, ", ".join(valid_keys))
-            )
-
-        # Validate required_one_of
-        and_item = i.get(AND)
-        or_item = i.get(OR)
-        attribute = i.get(ATTRIBUTE)
-
-        if not and_item and not or_item and not attribute:
-            self._fail(
-                "one of the following is required: %s found in %s"
-                % (", ".join([ATTRIBUTE, AND, OR]), path)
-            )
-
-        # Validate required_by
-        op = i.get(OPERATOR)
-
-        if op and not attribute:
-            self._fail(
-                "missing parameter(s) required by '%s': %s"
-                % (OPERATOR, ATTRIBUTE)
-            )
-
-        value = i.get(VALUE)
-
-        if (value and not attribute) or (attribute and not value):
-            self._fail(
-                'parameters are required together: %s, %s found in %s'
-                % (ATTRIBUTE, VALUE, path)
-            )
-
-        # Validate mutually exclusive parameters
-        if (and_item and or_item) or (and_item and attribute) or \
-                (or_item and attribute):
-            self._fail(
-                'parameters are mutually exclusive: %s|%s|%s found in %s'
-                % (ATTRIBUTE, AND, OR, path)
-            )
-
-        if and_item is not None:
-            return self._get_filter(and_item, ' AND ', '%s -> %s' % (path, AND))
-        if or_item is not None:
-            return self._get_filter(or_item, ' OR ', '%s -> %s' % (path, OR))
-        if attribute is not None:
-            operator = self._convert_filter_operator(op, path)
-
-            # Validate attribute type
-            if not isinstance(attribute, str):
-                self._fail(
-                    "%s must be of type str, was: %s found in %s"
-                    % (ATTRIBUTE, type(attribute), path)
-                )
-
-            # Validate value type
-            if not isinstance(value, str):
-                self._fail(
-                    "%s must be of type str, was: %s found in %s"
-                    % (VALUE, type(value), path)
-                )
-
-            if not is_alphanumeric(attribute):
-                self._fail(
-                    "Filter attribute with value {0} was not valid. Valid characters are A-Z a-z 0-9."
-                    .format(attribute)
-                )
-
-            value = escape_quotes(value)
-
-            if operator == '¬=':
-                # Provides a filter string in the format NOT(FOO=='BAR')
-                return 'NOT(' + attribute + '==' + '\'' + value + '\'' + ')'
-            else:
-                return attribute + operator + '\'' + value + '\''
-
-    def _convert_filter_operator(self, operator, path):
-        if operator in ['<', 'LT']:
-            return '<'
-        if operator in ['<=', 'LE']:
-            return '<='
-        if operator in ['=', 'EQ', None]:
-            return '='
-        if operator in ['>=', 'GE']:
-            return '>='
-        if operator in ['>', 'GT']:
-            return '>'
-        if operator in ['¬=', '!=', 'NE']:
-            return '¬='
-        if operator in ['==', 'IS']:
-            return '=='
-        self._fail(
-            'value of operator must be one of: %s, got: %s found in %s'
-            % (", ".join(OPERATORS), operator, path)
-        )
+    def _get_complex_filter(self, complex_filter, path):
+        # type: (dict, str) -> str
+        value = complex_filter.get(VALUE)
+        if isinstance(value, (int, float)) and \
+                complex_filter.get(OPERATOR) != 'IN':
+            # The top level value accepts lists for IN, so isn't converted to
+            # a string by the argument spec like it used to be
+            complex_filter = dict(complex_filter, **{VALUE: str(value)})
+        try:
+            return compile_filter(complex_filter, path)
+        except FilterError as e:
+            self._fail(str(e))
 
     def _fail(self, msg):  # type: (str) -> None
         self._module.fail_json(msg=msg, **self.result)
@@ -745,23 +1257,37 @@ class AnsibleCMCIModule(object):
         self._module.fail_json(msg=msg, exception=tb, **self.result)
 
 
-def _append_filter_string(existing, to_append, joiner=' AND '):
-    # joiner is ' AND ' or ' OR '
-    if not existing:
-        # if the existing string is empty, just return the new filter string
-        return '(' + to_append + ')'
-    if existing.endswith(joiner):
-        return existing + '(' + to_append + ')'
-    else:
-        return existing + joiner + '(' + to_append + ')'
+def _request_not_sent(e):  # type: (Exception) -> bool
+    # Errors connecting to the CMCI server, before any of the request was sent
+    return isinstance(e, URLError) and \
+        isinstance(e.reason, (ConnectionRefusedError, socket.gaierror))
+
+
+def request_error_message(e):  # type: (Exception) -> str
+    # Describes the errors a CMCI request can raise
+    if isinstance(e, HTTPError):
+        return 'CMCI request returned non-OK status: {0}'\
+            .format(e.reason if e.reason else str(e.code))
+    if isinstance(e, URLError):
+        return 'Error performing CMCI request: {0}'.format(e.reason)
+    if isinstance(e, RemoteDisconnected):
+        return 'Error performing CMCI request: {0}'.format(e.args[0])
+    if isinstance(e, expat.ExpatError):
+        # Content couldn't be parsed as XML
+        return 'CMCI response XML document could not be successfully ' \
+            'parsed: {0}'.format(e)
+    return str(e)
 
 
-def _url_encode_params(url, params: dict[str, str]):
+def _url_encode_params(url, params: dict[str, str | None]):
+    # Parameters with a value of None are flags, like NODISCARD, that are
+    # sent without a value
     return url + \
         "?" + \
-        urllib.parse.urlencode(
-            params,
-            quote_via=urllib.parse.quote
+        "&".join(
+            urllib.parse.quote(k) if v is None
+            else urllib.parse.urlencode({k: v}, quote_via=urllib.parse.quote)
+            for k, v in params.items()
         )
 
 
@@ -23,6 +23,7 @@ author: Andrew Twydell (@andrewtwydell)
 version_added: 2.1.0
 extends_documentation_fragment:
   - ibm.ibm_zos_cics.aux_temp_storage
+  - ibm.ibm_zos_cics.known_state
 """
 
 
@@ -158,13 +159,14 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DataSet
 )
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._aux_temp_storage import (
+    SPACE_PRIMARY_DEFAULT,
+    SPACE_SECONDARY_DEFAULT,
+    SPACE_TYPE_DEFAULT,
     _get_idcams_cmd_temp
 )
 
 
 DSN = "dfhtemp"
-SPACE_PRIMARY_DEFAULT = 200
-SPACE_SECONDARY_DEFAULT = 10
 SPACE_OPTIONS = [KILOBYTES, MEGABYTES, RECORDS, CYLINDERS, TRACKS]
 
 
@@ -184,7 +186,7 @@ class AnsibleAuxiliaryTempModule(DataSet):
             "default": SPACE_SECONDARY_DEFAULT
         })
         arg_spec[SPACE_TYPE].update({
-            "default": RECORDS,
+            "default": SPACE_TYPE_DEFAULT,
             "choices": SPACE_OPTIONS,
         })
         arg_spec[REGION_DATA_SETS]["options"].update({
@@ -136,6 +136,92 @@ cpsm_response_code:
       https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-response-in-numerical-order.
   returned: success
   type: str
+retry_history:
+  description:
+    - The failed attempts that were retried, when I(retries) is greater than 0.
+  returned: when a request was retried
+  type: list
+  elements: dict
+  contains:
+    attempt:
+      description: The number of the attempt that failed, starting from 1.
+      returned: always
+      type: int
+    reason:
+      description: Why the attempt failed.
+      returned: always
+      type: str
+    elapsed:
+      description: The number of seconds the attempt took.
+      returned: always
+      type: float
+    delay:
+      description: The number of seconds waited before the next attempt.
+      returned: always
+      type: float
+timings:
+  description:
+    - The timings and sizes of each CMCI request, when I(timings) is C(true).
+  returned: when I(timings) is C(true)
+  type: list
+  elements: dict
+  contains:
+    method:
+      description: The HTTP method of the request.
+      returned: always
+      type: str
+    url:
+      description: The URL of the request.
+      returned: always
+      type: str
+    seconds:
+      description:
+        - How long each phase of the request took, in seconds.
+        - C(dns) is the time to resolve I(cmci_host), measured separately
+          before the request. It is not returned when I(connection_broker) is
+          C(true).
+        - C(request) is from sending the request until the response headers
+          arrived, which includes connecting, the TLS handshake and the time
+          the CMCI server took to respond.
+        - C(transfer) is the time spent waiting for the response body, and
+          C(parse) the time spent decompressing and parsing it.
+        - C(total) covers every phase.
+      returned: always
+      type: dict
+    bytes:
+      description:
+        - The number of bytes C(sent) in the request body, C(received) in the
+          response body, and in the response body once C(uncompressed).
+      returned: always
+      type: dict
+    broker:
+      description:
+        - The connection broker's own timings of the request, in seconds.
+        - C(connect) is the time to connect to the CMCI server, including the
+          C(tls_handshake), or 0 when an open connection was reused, which is
+          shown by C(reused_connection). C(response) is from sending the
+          request until the response headers arrived.
+      returned: when I(connection_broker) is C(true)
+      type: dict
+response_size:
+  description:
+    - The size of the CMCI response as it was received and once decompressed,
+      when the CMCI server compressed it.
+  returned: when the response was compressed
+  type: dict
+  contains:
+    content_encoding:
+      description: The compression the CMCI server used, C(gzip) or C(deflate).
+      returned: when the response was compressed
+      type: str
+    received:
+      description: The number of bytes received.
+      returned: when the response was compressed
+      type: int
+    uncompressed:
+      description: The number of bytes once decompressed.
+      returned: when the response was compressed
+      type: int
 http_status:
   description:
     - The message associated with HTTP status code that is returned by CMCI.
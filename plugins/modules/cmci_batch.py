@@ -0,0 +1,631 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: cmci_batch
+short_description: Run many CMCI operations in a single task
+description:
+  - Run a list of GET, create, update, delete and action operations against
+    CICS® and CICSPlex® SM resources and definitions via the CMCI REST API, in
+    one module invocation. Operations are sent concurrently on a bounded pool
+    of threads that share one set of connection details, instead of paying
+    the overhead of a separate Ansible task for each request.
+  - Each operation returns the same result as the equivalent
+    M(ibm.ibm_zos_cics.cmci_get), M(ibm.ibm_zos_cics.cmci_create),
+    M(ibm.ibm_zos_cics.cmci_update), M(ibm.ibm_zos_cics.cmci_delete) or
+    M(ibm.ibm_zos_cics.cmci_action) module.
+  - For information about the API, see
+    L(CMCI REST API,https://www.ibm.com/docs/en/cics-ts/latest?topic=programming-cmci-rest-api-reference).
+version_added: 2.3.0
+author:
+  - Stewart Francis (@stewartfrancis)
+  - Tom Latham (@Tom-Latham)
+  - Sophie Green (@sophiegreen)
+  - Ya Qing Chen (@vera-chan)
+extends_documentation_fragment:
+  - ibm.ibm_zos_cics.cmci.COMMON
+options:
+  context:
+    description:
+      - The default I(context) for operations that don't specify their own.
+      - If CMCI is installed in a CICSPlex® SM environment, I(context) is the
+        name of the CICSplex or CMAS associated with the request. If CMCI is
+        installed in a single region (SMSS), I(context) is the APPLID of the
+        CICS region associated with the request.
+    type: str
+    required: false
+  scope:
+    description:
+      - The default I(scope) for operations that don't specify their own.
+    type: str
+    required: false
+  type:
+    description:
+      - The default CMCI external resource name for operations that don't
+        specify their own.
+    type: str
+    required: false
+  concurrency:
+    description:
+      - The maximum number of operations that are sent to CMCI at the same
+        time.
+      - Operations are started in the order they are listed, and their results
+        are always returned in that order.
+    type: int
+    required: false
+    default: 10
+  operations:
+    description:
+      - The operations to run.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      operation:
+        description:
+          - The kind of CMCI request to make. C(get) queries resources,
+            C(create) creates a resource or definition, C(update) updates
+            resources, C(delete) deletes resources, and C(action) performs an
+            action on resources.
+        type: str
+        required: true
+        choices:
+          - get
+          - create
+          - update
+          - delete
+          - action
+      type:
+        description:
+          - The CMCI external resource name that maps to the target CICS or
+            CICSPlex SM resource type. Defaults to the top level I(type).
+        type: str
+        required: false
+      context:
+        description:
+          - The context of the request. Defaults to the top level I(context).
+        type: str
+        required: false
+      scope:
+        description:
+          - The scope of the request. Defaults to the top level I(scope).
+        type: str
+        required: false
+      resources:
+        description:
+          - Options that specify the target resources of a C(get), C(update),
+            C(delete) or C(action) operation, as for the I(resources) option of
+            M(ibm.ibm_zos_cics.cmci_get).
+        type: dict
+        required: false
+        suboptions:
+          filter:
+            description:
+              - A dictionary with attribute names as keys, and target values,
+                to be used as criteria to filter the set of resources.
+            type: dict
+            required: false
+          complex_filter:
+            description:
+              - A dictionary representing a complex filter expression, as for
+                the I(complex_filter) option of M(ibm.ibm_zos_cics.cmci_get).
+            type: dict
+            required: false
+            suboptions:
+              and:
+                description: A list of filter expressions to be combined with
+                  an C(and) operation.
+                type: list
+                elements: dict
+                required: false
+              or:
+                description: A list of filter expressions to be combined with
+                  an C(or) operation.
+                type: list
+                elements: dict
+                required: false
+              attribute:
+                description: The name of a resource table attribute on which
+                  to filter.
+                type: str
+                required: false
+              operator:
+                description: The operator used to compare I(attribute) with
+                  I(value). If not supplied, C(EQ) is assumed.
+                type: str
+                required: false
+                choices:
+                  - "<"
+                  - ">"
+                  - "<="
+                  - ">="
+                  - "="
+                  - "=="
+                  - "!="
+                  - "¬="
+                  - EQ
+                  - GT
+                  - GE
+                  - LT
+                  - LE
+                  - NE
+                  - IS
+              value:
+                description: The value by which to filter the resource
+                  attributes.
+                type: str
+                required: false
+          get_parameters:
+            description: A list of one or more parameters with optional values
+              used to identify the resources for this request.
+            type: list
+            elements: dict
+            required: false
+            suboptions:
+              name:
+                description: Parameter name available for the GET operation.
+                required: true
+                type: str
+              value:
+                description: Parameter value if any.
+                required: false
+                type: str
+      attributes:
+        description:
+          - The resource attributes of a C(create) or C(update) operation.
+        type: dict
+        required: false
+      create_parameters:
+        description:
+          - The parameters of a C(create) operation, as for
+            M(ibm.ibm_zos_cics.cmci_create).
+        type: list
+        elements: dict
+        required: false
+        suboptions:
+          name:
+            description: Parameter name available for the CREATE operation.
+            required: true
+            type: str
+          value:
+            description: Parameter value if any.
+            required: false
+            type: str
+      update_parameters:
+        description:
+          - The parameters of an C(update) operation, as for
+            M(ibm.ibm_zos_cics.cmci_update).
+        type: list
+        elements: dict
+        required: false
+        suboptions:
+          name:
+            description: Parameter name available for the UPDATE operation.
+            required: true
+            type: str
+          value:
+            description: Parameter value if any.
+            required: false
+            type: str
+      action_name:
+        description:
+          - The name of the target action of an C(action) operation.
+        type: str
+        required: false
+      action_parameters:
+        description:
+          - The parameters of an C(action) operation, as for
+            M(ibm.ibm_zos_cics.cmci_action).
+        type: list
+        elements: dict
+        required: false
+        suboptions:
+          name:
+            description: Parameter name for the PERFORM SET operation.
+            required: true
+            type: str
+          value:
+            description: Parameter value if any.
+            required: false
+            type: str
+      record_count:
+        description:
+          - For a C(get) operation, the number of records to return, as for
+            M(ibm.ibm_zos_cics.cmci_get).
+        type: int
+        required: false
+      fail_on_nodata:
+        description:
+          - For a C(get) operation, whether the operation fails if no data is
+            returned.
+        type: bool
+        required: false
+        default: true
+notes:
+  - Operations are independent of each other and may complete in any order,
+    so an operation can't rely on the effect of an earlier one in the same
+    task.
+  - Combine with I(connection_broker) to also reuse connections between
+    operations.
+'''
+
+
+EXAMPLES = r"""
+- name: Install a list of bundles from the CSD
+  cmci_batch:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    context: ABCDEFGH
+    scope: IJKLMNOP
+    type: CICSDefinitionBundle
+    concurrency: 20
+    operations:
+      - operation: action
+        action_name: CSDINSTALL
+        resources:
+          filter:
+            name: BUNDLE1
+          get_parameters:
+            - name: csdgroup
+              value: MYGRP
+      - operation: action
+        action_name: CSDINSTALL
+        resources:
+          filter:
+            name: BUNDLE2
+          get_parameters:
+            - name: csdgroup
+              value: MYGRP
+
+- name: Disable two programs and query a third
+  cmci_batch:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    context: ABCDEFGH
+    type: CICSProgram
+    operations:
+      - operation: update
+        resources:
+          filter:
+            program: PROG1
+        attributes:
+          status: DISABLED
+      - operation: update
+        resources:
+          filter:
+            program: PROG2
+        attributes:
+          status: DISABLED
+      - operation: get
+        resources:
+          filter:
+            program: PROG3
+"""
+
+
+RETURN = r"""
+changed:
+  description: True if any operation changed state, otherwise False.
+  returned: always
+  type: bool
+failed:
+  description: True if any operation failed, otherwise False.
+  returned: always
+  type: bool
+operations:
+  description:
+    - The result of each operation, in the order the operations were listed.
+    - Each result has the same keys as the result of the module for the
+      operation, for example M(ibm.ibm_zos_cics.cmci_get) for C(get).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    changed:
+      description: True if the operation changed state, otherwise False.
+      returned: always
+      type: bool
+    failed:
+      description: True if the operation failed, otherwise False.
+      returned: always
+      type: bool
+    msg:
+      description: The reason the operation failed.
+      returned: failure
+      type: str
+    request:
+      description: Information about the request that was made to CMCI.
+      returned: always
+      type: dict
+    records:
+      description: A list of the returned records.
+      returned: success
+      type: list
+      elements: dict
+    record_count:
+      description: The number of records returned.
+      returned: success
+      type: int
+    success_count:
+      description: The number of resources the operation succeeded on.
+      returned: success
+      type: int
+    cpsm_response:
+      description: The character value of the RESPONSE code returned by CMCI.
+      returned: success
+      type: str
+    cpsm_response_code:
+      description: The numeric value of the RESPONSE code returned by CMCI.
+      returned: success
+      type: int
+    cpsm_reason:
+      description: The character value of the REASON code returned by CMCI.
+      returned: success
+      type: str
+    cpsm_reason_code:
+      description: The numeric value of the REASON code returned by CMCI.
+      returned: success
+      type: int
+    http_status:
+      description: The message associated with the HTTP status code.
+      returned: success
+      type: str
+    http_status_code:
+      description: The HTTP status code returned by CMCI.
+      returned: success
+      type: int
+    feedback:
+      description: Diagnostic data from FEEDBACK records associated with the
+        request.
+      returned: cmci error
+      type: list
+      elements: dict
+"""
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
+    AnsibleCMCIModule, RESOURCES_ARGUMENT, ATTRIBUTES_ARGUMENT,
+    parameters_argument, CONTEXT, SCOPE, TYPE, RESOURCES, ATTRIBUTES
+)
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+_CONCURRENCY = 'concurrency'
+_OPERATIONS = 'operations'
+_OPERATION = 'operation'
+_ACTION_NAME = 'action_name'
+_ACTION_PARAMETERS = 'action_parameters'
+_CREATE_PARAMETERS = 'create_parameters'
+_UPDATE_PARAMETERS = 'update_parameters'
+_RECORD_COUNT = 'record_count'
+_FAIL_ON_NODATA = 'fail_on_nodata'
+
+_METHODS = {
+    'get': 'GET',
+    'create': 'POST',
+    'update': 'PUT',
+    'delete': 'DELETE',
+    'action': 'PUT'
+}
+
+
+class _OperationFailed(Exception):
+    pass
+
+
+class _CMCIBatchOperation(AnsibleCMCIModule):
+    # One operation of the batch. Builds and handles its request like the
+    # individual CMCI modules do, but shares the batch's session and records
+    # failures in its own result instead of failing the module.
+
+    def __init__(self, batch, params):
+        # type: (AnsibleCMCIBatchModule, Dict) -> None
+        self._module = batch._module
+        self.result = dict(changed=False)  # type: Dict
+        self._operation = params[_OPERATION]  # type: str
+        self._method = _METHODS[self._operation]  # type: str
+        self._params = params
+        self._session = batch._session
+        self._broker = batch._broker
+        self._cache = batch._cache
+        self._retry_policy = batch._retry_policy
+        self._circuit_breaker = batch._circuit_breaker
+
+        try:
+            self._p = self.init_p()
+            self.init_request()
+            self._error = None  # type: Optional[str]
+        except _OperationFailed as e:
+            self._error = str(e)
+
+    def init_p(self):  # type: () -> Dict
+        self.validate_target()
+        if not self._params.get(TYPE):
+            self._fail('Parameter "{0}" is required'.format(TYPE))
+        if not self._params.get(CONTEXT):
+            self._fail('Parameter "{0}" is required'.format(CONTEXT))
+        if self._operation == 'action' and not self._params.get(_ACTION_NAME):
+            self._fail('Parameter "{0}" is required'.format(_ACTION_NAME))
+        return self._params
+
+    def validate(self, name, regex, message):  # type: (str, str, str) -> None
+        # Validate the operation's own value rather than the module's
+        self.validate_value(name, self._params.get(name), regex, message)
+
+    def init_url(self):  # type: () -> str
+        url = super(_CMCIBatchOperation, self).init_url()
+
+        if self._operation == 'get' and self._p.get(_RECORD_COUNT):
+            url = url + '//' + str(self._p.get(_RECORD_COUNT))
+
+        return url
+
+    def init_body(self):  # type: () -> Optional[Dict]
+        if self._operation == 'action':
+            action = OrderedDict({'@name': self._p.get(_ACTION_NAME)})
+            self.append_parameters(_ACTION_PARAMETERS, action)
+            return {'request': {'action': action}}
+
+        if self._operation in ('create', 'update'):
+            element = OrderedDict({})
+            self.append_parameters(
+                _CREATE_PARAMETERS if self._operation == 'create'
+                else _UPDATE_PARAMETERS,
+                element
+            )
+            self.append_attributes(element)
+            return {'request': {self._operation: element}}
+
+        return None
+
+    def init_request_params(self):  # type: () -> Optional[Dict[str, str]]
+        if self._operation == 'create':
+            return None
+        return self.get_resources_request_params()
+
+    def get_ok_cpsm_response_codes(self):
+        ok_codes = super(_CMCIBatchOperation, self).get_ok_cpsm_response_codes()
+
+        if self._operation == 'get' and not self._p.get(_FAIL_ON_NODATA):
+            ok_codes.append(1027)
+
+        return ok_codes
+
+    def run(self):  # type: () -> Dict
+        if self._error is None:
+            try:
+                self.handle_response(self._do_request())
+            except _OperationFailed as e:
+                self._error = str(e)
+
+        self.result['failed'] = self._error is not None
+        if self._error is not None:
+            self.result['msg'] = self._error
+        return self.result
+
+    def _fail(self, msg):  # type: (str) -> None
+        raise _OperationFailed(msg)
+
+    def _fail_tb(self, msg, tb):  # type: (str, str) -> None
+        raise _OperationFailed(msg)
+
+
+class AnsibleCMCIBatchModule(AnsibleCMCIModule):
+    def __init__(self):
+        super(AnsibleCMCIBatchModule, self).__init__(None)
+
+    def init_argument_spec(self):  # type: () -> Dict
+        argument_spec = super(AnsibleCMCIBatchModule, self).init_argument_spec()
+        # context and type are defaults for the operations
+        argument_spec.update({
+            CONTEXT: {
+                'type': 'str'
+            },
+            TYPE: {
+                'type': 'str'
+            },
+            _CONCURRENCY: {
+                'type': 'int',
+                'default': 10
+            },
+            _OPERATIONS: {
+                'type': 'list',
+                'elements': 'dict',
+                'required': True,
+                'options': self.init_operation_argument_spec()
+            }
+        })
+        return argument_spec
+
+    def init_operation_argument_spec(self):  # type: () -> Dict
+        operation_spec = {
+            _OPERATION: {
+                'type': 'str',
+                'required': True,
+                'choices': list(_METHODS.keys())
+            },
+            TYPE: {
+                'type': 'str'
+            },
+            CONTEXT: {
+                'type': 'str'
+            },
+            SCOPE: {
+                'type': 'str'
+            },
+            _ACTION_NAME: {
+                'type': 'str'
+            },
+            _RECORD_COUNT: {
+                'type': 'int'
+            },
+            _FAIL_ON_NODATA: {
+                'type': 'bool',
+                'default': True
+            }
+        }
+        operation_spec.update(RESOURCES_ARGUMENT)
+        operation_spec.update(ATTRIBUTES_ARGUMENT)
+        operation_spec.update(parameters_argument(_ACTION_PARAMETERS))
+        operation_spec.update(parameters_argument(_CREATE_PARAMETERS))
+        operation_spec.update(parameters_argument(_UPDATE_PARAMETERS))
+        return operation_spec
+
+    def init_request(self):  # type: () -> None
+        concurrency = self._p.get(_CONCURRENCY)
+        if concurrency < 1:
+            self._fail(
+                'Parameter "{0}" with value "{1}" was not valid.  Expected a '
+                'number greater than 0.'
+                .format(_CONCURRENCY, str(concurrency))
+            )
+
+        self._operations = [
+            _CMCIBatchOperation(self, self.init_operation_params(o))
+            for o in self._p.get(_OPERATIONS)
+        ]  # type: List[_CMCIBatchOperation]
+
+    def init_operation_params(self, operation):  # type: (Dict) -> Dict
+        # Operations inherit the connection details, and any target they
+        # don't specify themselves
+        params = dict(self._p)
+        params.update(
+            (k, v) for k, v in operation.items()
+            if v is not None or k not in (TYPE, CONTEXT, SCOPE)
+        )
+        params[ATTRIBUTES] = operation.get(ATTRIBUTES)
+        params[RESOURCES] = operation.get(RESOURCES)
+        return params
+
+    def main(self):
+        with ThreadPoolExecutor(max_workers=self._p.get(_CONCURRENCY)) as pool:
+            results = list(pool.map(lambda o: o.run(), self._operations))
+
+        self.result[_OPERATIONS] = results
+        self.result['changed'] = any(r['changed'] for r in results)
+
+        failed = len([r for r in results if r['failed']])
+        if failed:
+            self._fail(
+                '{0} of {1} CMCI operations failed'.format(failed, len(results))
+            )
+        self._module.exit_json(**self.result)
+
+
+def main():
+    AnsibleCMCIBatchModule().main()
+
+
+if __name__ == '__main__':
+    main()
@@ -53,6 +53,46 @@ options:
         required: false
         type: str
     required: false
+  definitions:
+    description:
+      - A list of definitions to create, each a dictionary of attributes. The
+        attributes in I(attributes) are common to every definition, and each
+        definition's own attributes are added to them.
+      - The definitions are created concurrently, up to I(concurrency) at a
+        time. If one fails, the definitions that haven't started to be
+        created yet are not created, and the module fails once the others
+        have finished.
+      - Only the first definition of each C(name) and C(csdgroup) is
+        created.
+      - If not supplied, a single definition with the attributes in
+        I(attributes) is created.
+    type: list
+    elements: dict
+    required: false
+    version_added: 2.3.0
+  ensure:
+    description:
+      - When C(present), definitions are only created if they don't already
+        exist.
+      - The existing definitions are retrieved first with a GET request for
+        every 50 names. A definition exists if one with the same C(name) is found,
+        in the same C(csdgroup) if the definition specifies one. Only the
+        missing definitions are created.
+      - Every definition must have a C(name) attribute.
+      - If not supplied, every definition is created, and creating a
+        definition that already exists fails.
+    type: str
+    required: false
+    choices:
+      - present
+    version_added: 2.3.0
+  concurrency:
+    description:
+      - The maximum number of definitions that are created at the same time.
+    type: int
+    required: false
+    default: 10
+    version_added: 2.3.0
 '''
 
 
@@ -70,6 +110,25 @@ EXAMPLES = r"""
       csdgroup: JVMGRP
     create_parameters:
       - name: csd
+
+- name: Define any programs that are missing from a CSD group
+  cmci_create:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    context: ABCDEFGH
+    scope: IJKLMNOP
+    type: CICSDefinitionProgram
+    attributes:
+      csdgroup: MYGRP
+      language: COBOL
+    definitions:
+      - name: PROGA
+      - name: PROGB
+      - name: PROGC
+        language: PLI
+    create_parameters:
+      - name: csd
+    ensure: present
 """
 
 
@@ -114,6 +173,92 @@ cpsm_response_code:
       https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-response-in-numerical-order.
   returned: success
   type: str
+retry_history:
+  description:
+    - The failed attempts that were retried, when I(retries) is greater than 0.
+  returned: when a request was retried
+  type: list
+  elements: dict
+  contains:
+    attempt:
+      description: The number of the attempt that failed, starting from 1.
+      returned: always
+      type: int
+    reason:
+      description: Why the attempt failed.
+      returned: always
+      type: str
+    elapsed:
+      description: The number of seconds the attempt took.
+      returned: always
+      type: float
+    delay:
+      description: The number of seconds waited before the next attempt.
+      returned: always
+      type: float
+timings:
+  description:
+    - The timings and sizes of each CMCI request, when I(timings) is C(true).
+  returned: when I(timings) is C(true)
+  type: list
+  elements: dict
+  contains:
+    method:
+      description: The HTTP method of the request.
+      returned: always
+      type: str
+    url:
+      description: The URL of the request.
+      returned: always
+      type: str
+    seconds:
+      description:
+        - How long each phase of the request took, in seconds.
+        - C(dns) is the time to resolve I(cmci_host), measured separately
+          before the request. It is not returned when I(connection_broker) is
+          C(true).
+        - C(request) is from sending the request until the response headers
+          arrived, which includes connecting, the TLS handshake and the time
+          the CMCI server took to respond.
+        - C(transfer) is the time spent waiting for the response body, and
+          C(parse) the time spent decompressing and parsing it.
+        - C(total) covers every phase.
+      returned: always
+      type: dict
+    bytes:
+      description:
+        - The number of bytes C(sent) in the request body, C(received) in the
+          response body, and in the response body once C(uncompressed).
+      returned: always
+      type: dict
+    broker:
+      description:
+        - The connection broker's own timings of the request, in seconds.
+        - C(connect) is the time to connect to the CMCI server, including the
+          C(tls_handshake), or 0 when an open connection was reused, which is
+          shown by C(reused_connection). C(response) is from sending the
+          request until the response headers arrived.
+      returned: when I(connection_broker) is C(true)
+      type: dict
+response_size:
+  description:
+    - The size of the CMCI response as it was received and once decompressed,
+      when the CMCI server compressed it.
+  returned: when the response was compressed
+  type: dict
+  contains:
+    content_encoding:
+      description: The compression the CMCI server used, C(gzip) or C(deflate).
+      returned: when the response was compressed
+      type: str
+    received:
+      description: The number of bytes received.
+      returned: when the response was compressed
+      type: int
+    uncompressed:
+      description: The number of bytes once decompressed.
+      returned: when the response was compressed
+      type: int
 http_status:
   description:
     - The message associated with HTTP status code that is returned by CMCI.
@@ -129,6 +274,17 @@ record_count:
     - The number of records returned.
   returned: success
   type: int
+created:
+  description:
+    - The number of definitions that were created.
+    - When a definition fails to be created, the number of definitions that
+      were created before the module failed.
+  returned: when I(ensure) or I(definitions) is supplied
+  type: int
+present:
+  description: The number of definitions that already existed.
+  returned: success and I(ensure) is C(present)
+  type: int
 records:
   description:
     - A list of the returned records.
@@ -453,16 +609,32 @@ feedback:
 
 
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
-    AnsibleCMCIModule, parameters_argument, ATTRIBUTES_ARGUMENT
+    AnsibleCMCIModule, CMCIResponseParser, parameters_argument,
+    ATTRIBUTES_ARGUMENT, ATTRIBUTES, TYPE, _url_encode_params
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    OR, Junction, Predicate, emit
 )
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List
 from collections import OrderedDict
 
 CREATE_PARAMETERS = 'create_parameters'
+DEFINITIONS = 'definitions'
+ENSURE = 'ensure'
+PRESENT = 'present'
+CONCURRENCY = 'concurrency'
+CREATED = 'created'
+
+_NAME = 'name'
+_CSDGROUP = 'csdgroup'
+
+# The most names filtered on by one request, so the URL isn't too long
+_MAX_FILTER_NAMES = 50
 
 
 class AnsibleCMCICreateModule(AnsibleCMCIModule):
     def __init__(self):
+        self._checking = False
         super(AnsibleCMCICreateModule, self).__init__('POST')
 
     def init_argument_spec(self):  # type: () -> Dict
@@ -470,12 +642,57 @@ class AnsibleCMCICreateModule(AnsibleCMCIModule):
             .init_argument_spec()
         argument_spec.update(parameters_argument(CREATE_PARAMETERS))
         argument_spec.update(ATTRIBUTES_ARGUMENT)
+        argument_spec.update({
+            DEFINITIONS: {
+                'type': 'list',
+                'elements': 'dict',
+                'required': False
+            },
+            ENSURE: {
+                'type': 'str',
+                'required': False,
+                'choices': [PRESENT]
+            },
+            CONCURRENCY: {
+                'type': 'int',
+                'required': False,
+                'default': 10
+            }
+        })
         return argument_spec
 
+    def init_p(self):  # type: () -> Dict
+        p = super(AnsibleCMCICreateModule, self).init_p()
+
+        concurrency = p.get(CONCURRENCY)
+        if concurrency < 1:
+            self._fail(
+                'Parameter "{0}" with value "{1}" was not valid.  Expected a '
+                'number greater than 0.'
+                .format(CONCURRENCY, str(concurrency))
+            )
+
+        if p.get(ENSURE) == PRESENT:
+            for definition in self.get_definitions(p):
+                if not definition.get(_NAME):
+                    self._fail(
+                        'Every definition needs a "{0}" attribute when "{1}" '
+                        'is "{2}"'.format(_NAME, ENSURE, PRESENT)
+                    )
+
+        return p
+
     def init_body(self):  # type: () -> Optional[OrderedDict]
+        return self.get_create_body(self._p.get(ATTRIBUTES))
+
+    def get_create_body(self, attributes):
+        # type: (Optional[Dict]) -> OrderedDict
         create = OrderedDict({})
         self.append_parameters(CREATE_PARAMETERS, create)
-        self.append_attributes(create)
+        if attributes:
+            create['attributes'] = OrderedDict(
+                {'@' + key: value for key, value in attributes.items()}
+            )
 
         return OrderedDict({
             'request': {
@@ -483,6 +700,175 @@ class AnsibleCMCICreateModule(AnsibleCMCIModule):
             }
         })
 
+    def init_response_parser(self):  # type: () -> CMCIResponseParser
+        if not self._checking:
+            return super(AnsibleCMCICreateModule, self).init_response_parser()
+        # Only the attributes that identify a definition are needed
+        return CMCIResponseParser(
+            self._p[TYPE].lower(), projection=[_NAME, _CSDGROUP]
+        )
+
+    def get_ok_cpsm_response_codes(self):
+        ok_codes = super(AnsibleCMCICreateModule, self)\
+            .get_ok_cpsm_response_codes()
+
+        if self._checking:
+            # NODATA, none of the definitions exist
+            ok_codes.append(1027)
+
+        return ok_codes
+
+    @staticmethod
+    def get_definitions(p):  # type: (Dict) -> List[Dict]
+        common = p.get(ATTRIBUTES) or {}
+        definitions = p.get(DEFINITIONS)
+        if definitions is None:
+            return [common]
+        return [dict(common, **definition) for definition in definitions]
+
+    def main(self):
+        if self._p.get(DEFINITIONS) is None and not self._p.get(ENSURE):
+            super(AnsibleCMCICreateModule, self).main()
+            return
+
+        definitions = self.unique(self.get_definitions(self._p))
+        if self._p.get(ENSURE) == PRESENT and definitions:
+            existing = self.get_existing(definitions)
+            missing = [d for d in definitions if self.key(d) not in existing]
+            self.result[PRESENT] = len(definitions) - len(missing)
+        else:
+            missing = definitions
+            if self._p.get(ENSURE) == PRESENT:
+                self.result[PRESENT] = 0
+
+        self.create_all(missing)
+        self._module.exit_json(**self.result)
+
+    @staticmethod
+    def key(record):  # type: (Dict) -> tuple
+        # CICS upper cases definition names
+        return (
+            str(record.get(_NAME) or '').upper(),
+            str(record.get(_CSDGROUP) or '').upper()
+        )
+
+    @classmethod
+    def unique(cls, definitions):  # type: (List[Dict]) -> List[Dict]
+        # The first definition of each name in a group, as a second create
+        # of the same name would fail
+        keys = set()
+        unique = []
+        for definition in definitions:
+            key = cls.key(definition)
+            if key[0]:
+                if key in keys:
+                    continue
+                keys.add(key)
+            unique.append(definition)
+        return unique
+
+    def get_existing(self, definitions):  # type: (List[Dict]) -> set
+        # Gets the definitions that already exist, with a request for each
+        # _MAX_FILTER_NAMES names
+        names = sorted(set(self.key(d)[0] for d in definitions))
+        group_parameter = self.get_group_parameter(definitions)
+        records = []  # type: List[Dict]
+        for start in range(0, len(names), _MAX_FILTER_NAMES):
+            request_params = OrderedDict()  # type: OrderedDict
+            request_params['CRITERIA'] = emit(Junction(OR, [
+                Predicate(_NAME.upper(), '=', name)
+                for name in names[start:start + _MAX_FILTER_NAMES]
+            ]))
+            if group_parameter:
+                request_params['PARAMETER'] = group_parameter
+            url = _url_encode_params(self.init_url(), request_params)
+            self.result['request'] = {'url': url, 'method': 'GET', 'body': None}
+
+            self._checking = True
+            try:
+                self.handle_response(self._do_request('GET', url))
+            finally:
+                self._checking = False
+            records.extend(self.result.pop('records', None) or [])
+
+        self.result['changed'] = False
+        self.result.pop('record_count', None)
+        existing = set(self.key(r) for r in records)
+        # Definitions without a CSD group match one in any group
+        existing.update((name, '') for name, group in list(existing))
+        return existing
+
+    def get_group_parameter(self, definitions):
+        # type: (List[Dict]) -> Optional[str]
+        # CSD and BAS definitions are only found by asking for their group
+        parameters = dict(
+            (p.get('name').upper(), p.get('value'))
+            for p in self._p.get(CREATE_PARAMETERS) or []
+        )
+        if 'CSD' in parameters:
+            groups = set(self.key(d)[1] for d in definitions)
+            return 'CSDGROUP({0})'.format(
+                groups.pop() if len(groups) == 1 and '' not in groups else '*'
+            )
+        if parameters.get('RESGROUP'):
+            return 'RESGROUP({0})'.format(parameters.get('RESGROUP'))
+        return None
+
+    def create_all(self, definitions):  # type: (List[Dict]) -> None
+        # Imported here, so creating a single definition starts quicker
+        from concurrent.futures import ThreadPoolExecutor
+
+        records = []  # type: List[Dict]
+        self.result[CREATED] = 0
+        failed = None
+        try:
+            with ThreadPoolExecutor(
+                    max_workers=self._p.get(CONCURRENCY)) as pool:
+                futures = [
+                    pool.submit(
+                        self._request_with_retry, self._method, self._url,
+                        self.encode_body(self.get_create_body(d))
+                    ) for d in definitions
+                ]
+                # Results are checked in order, and after the first failure
+                # the creates that haven't started yet are cancelled
+                for i, future in enumerate(futures):
+                    if not self.is_created(future):
+                        failed = future
+                        for pending in futures[i + 1:]:
+                            pending.cancel()
+                        break
+
+            # Every create that started has now finished, so the failure is
+            # reported with every definition that was created
+            for future in futures:
+                if future is failed or future.cancelled() or \
+                        not self.is_created(future):
+                    continue
+                self.handle_response(future.result())
+                records.extend(self.result.pop('records', []))
+                self.result[CREATED] += 1
+            if failed is not None:
+                self.result['records'] = records
+                self.handle_response(
+                    self._handle_request_errors(failed.result)
+                )
+        finally:
+            if definitions:
+                self.get_cache().invalidate(self._get_cache_tag())
+
+        self.result['records'] = records
+        self.result['record_count'] = len(records)
+
+    def is_created(self, future):  # type: (Any) -> bool
+        if future.exception() is not None:
+            return False
+        result_summary = (future.result().get('response') or {})\
+            .get('resultsummary') or {}
+        return result_summary.get('@api_response1') in [
+            str(code) for code in self.get_ok_cpsm_response_codes()
+        ]
+
 
 def main():
     AnsibleCMCICreateModule().main()
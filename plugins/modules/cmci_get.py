@@ -50,6 +50,124 @@ options:
     type: bool
     required: false
     default: true
+  projection:
+    description:
+      - The names of the attributes to return for each record. Other attributes
+        are discarded as the response is read, which reduces the size of the
+        module result for resource types with many attributes.
+      - Attributes that a record doesn't have are omitted from it.
+      - If not specified, all the attributes are returned.
+    type: list
+    elements: str
+    required: false
+  page_size:
+    description:
+      - Retrieves the records through the CMCI result cache, this many records
+        at a time, instead of in a single response.
+      - The module first requests only a summary of the query, which leaves the
+        records in a result cache on the CMCI server, then fetches them in
+        pages of I(page_size) records and discards the result cache
+        afterwards. This bounds the size of each response for queries that
+        return a very large number of records.
+      - Can't be used with I(record_count).
+    type: int
+    required: false
+  page_concurrency:
+    description:
+      - The number of pages to request from the result cache at the same time
+        when I(page_size) is specified.
+      - Records are always returned in the order of the result cache.
+    type: int
+    required: false
+    default: 1
+  dest:
+    description:
+      - The path of a file to write the records to, instead of returning them
+        in C(records).
+      - Records are written as they are read from the response, in
+        L(JSON Lines,https://jsonlines.org/) format, one JSON object per
+        record. The file is written on the host running the module, which is
+        usually the Ansible controller.
+      - The file only replaces any existing file at I(dest) once every record
+        has been written.
+    type: path
+    required: false
+  dest_compression:
+    description:
+      - The compression of the file written to I(dest).
+    type: str
+    required: false
+    choices:
+      - none
+      - gzip
+    default: none
+  since_snapshot:
+    description:
+      - The path of a snapshot file to compare the records with. Only the
+        records that were added, changed or removed since the snapshot was
+        written are returned, in C(delta), instead of every record.
+      - The snapshot is then replaced with one of the records that were just
+        returned, ready for the next comparison. If there's no file at
+        I(since_snapshot) yet, every record is returned as added.
+      - A snapshot keeps only the C(_keydata) attribute of each record and a
+        digest of its other attributes, not the records themselves, so
+        removed records are identified by their C(_keydata) only.
+      - The file is written on the host running the module, which is usually
+        the Ansible controller. The snapshot is left as it was if the module
+        fails.
+      - Can't be used with I(dest).
+    type: path
+    required: false
+    version_added: 2.3.0
+  context:
+    description:
+      - If CMCI is installed in a CICSPlex® SM environment, I(context) is the
+        name of the CICSplex or CMAS associated with the request, for example,
+        C(PLEX1). To determine whether a CMAS can be specified as I(context),
+        see the B(CMAS context) entry in the CICSPlex SM resource table
+        reference of a resource. For example, according to the
+        L(PROGRAM resource table,https://www.ibm.com/docs/en/cics-ts/latest?topic=tables-program-resource-table),
+        CMAS context is not supported for PROGRAM.
+      - If CMCI is installed in a single region (SMSS), I(context) is the
+        APPLID of the CICS region associate with the request.
+      - The value of I(context) must contain no spaces. I(context) is not
+        case-sensitive.
+      - One of I(context) or I(contexts) is required.
+    type: str
+    required: false
+  contexts:
+    description:
+      - A list of contexts to query, instead of the single I(context).
+      - The query is made in every combination of the contexts and the
+        I(scopes), or I(scope), concurrently. The records of every query are
+        returned together, in the order of the contexts and then the scopes,
+        and each record has C(_context) and C(_scope) attributes that give
+        the context and scope it came from.
+      - A query that fails doesn't stop the others. Each query's outcome is
+        returned in C(targets), and the module fails after every query has
+        finished if any of them failed.
+      - Can't be used with I(context) or I(page_size).
+    type: list
+    elements: str
+    required: false
+    version_added: 2.3.0
+  scopes:
+    description:
+      - A list of scopes to query, instead of the single I(scope), as for
+        I(contexts).
+      - Can't be used with I(scope) or I(page_size).
+    type: list
+    elements: str
+    required: false
+    version_added: 2.3.0
+  target_concurrency:
+    description:
+      - The maximum number of queries that are sent to the CMCI server at the
+        same time when I(contexts) or I(scopes) are specified.
+    type: int
+    required: false
+    default: 10
+    version_added: 2.3.0
 '''
 
 
@@ -131,6 +249,63 @@ EXAMPLES = r"""
             { attribute: "currtasks", value: "100", operator: ">" },
           ]
     record_count: 1
+
+- name: Get all programs in a CICSplex, 1000 records at a time
+  cmci_get:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    context: ABCDEFGH # context is the name of your CICSplex in a CPSM environment or the applid of your region in an SMSS environment
+    type: CICSProgram
+    page_size: 1000
+    page_concurrency: 4
+
+- name: Write all programs in a CICSplex to a compressed file
+  cmci_get:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    context: ABCDEFGH # context is the name of your CICSplex in a CPSM environment or the applid of your region in an SMSS environment
+    type: CICSProgram
+    dest: /tmp/programs.jsonl.gz
+    dest_compression: gzip
+
+- name: Get the programs that were added, changed or removed since the last run
+  cmci_get:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    context: ABCDEFGH # context is the name of your CICSplex in a CPSM environment or the applid of your region in an SMSS environment
+    type: CICSProgram
+    since_snapshot: /var/tmp/programs.snapshot
+
+- name: Get only the name and status of programs
+  cmci_get:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    context: ABCDEFGH # context is the name of your CICSplex in a CPSM environment or the applid of your region in an SMSS environment
+    type: CICSProgram
+    projection:
+      - program
+      - status
+
+- name: Get the regions of several CICSplexes at once
+  cmci_get:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    cmci_cert: "./sec/ansible.pem"
+    cmci_key: "./sec/ansible.key"
+    contexts:
+      - PLEX1
+      - PLEX2
+      - PLEX3
+    type: CICSRegion
+    target_concurrency: 3
 """
 
 
@@ -143,6 +318,21 @@ failed:
   description: True if the query job failed, otherwise False.
   returned: always
   type: bool
+cache:
+  description:
+    - The number of requests that were answered from the cache and from the
+      CMCI server.
+  returned: when I(cache_ttl) is greater than 0
+  type: dict
+  contains:
+    hits:
+      description: The number of requests answered from the cache.
+      returned: when I(cache_ttl) is greater than 0
+      type: int
+    misses:
+      description: The number of requests sent to the CMCI server.
+      returned: when I(cache_ttl) is greater than 0
+      type: int
 connect_version:
   description: Version of the CMCI API
   returned: success
@@ -175,6 +365,92 @@ cpsm_response_code:
       https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-response-in-numerical-order.
   returned: success
   type: str
+retry_history:
+  description:
+    - The failed attempts that were retried, when I(retries) is greater than 0.
+  returned: when a request was retried
+  type: list
+  elements: dict
+  contains:
+    attempt:
+      description: The number of the attempt that failed, starting from 1.
+      returned: always
+      type: int
+    reason:
+      description: Why the attempt failed.
+      returned: always
+      type: str
+    elapsed:
+      description: The number of seconds the attempt took.
+      returned: always
+      type: float
+    delay:
+      description: The number of seconds waited before the next attempt.
+      returned: always
+      type: float
+timings:
+  description:
+    - The timings and sizes of each CMCI request, when I(timings) is C(true).
+  returned: when I(timings) is C(true)
+  type: list
+  elements: dict
+  contains:
+    method:
+      description: The HTTP method of the request.
+      returned: always
+      type: str
+    url:
+      description: The URL of the request.
+      returned: always
+      type: str
+    seconds:
+      description:
+        - How long each phase of the request took, in seconds.
+        - C(dns) is the time to resolve I(cmci_host), measured separately
+          before the request. It is not returned when I(connection_broker) is
+          C(true).
+        - C(request) is from sending the request until the response headers
+          arrived, which includes connecting, the TLS handshake and the time
+          the CMCI server took to respond.
+        - C(transfer) is the time spent waiting for the response body, and
+          C(parse) the time spent decompressing and parsing it.
+        - C(total) covers every phase.
+      returned: always
+      type: dict
+    bytes:
+      description:
+        - The number of bytes C(sent) in the request body, C(received) in the
+          response body, and in the response body once C(uncompressed).
+      returned: always
+      type: dict
+    broker:
+      description:
+        - The connection broker's own timings of the request, in seconds.
+        - C(connect) is the time to connect to the CMCI server, including the
+          C(tls_handshake), or 0 when an open connection was reused, which is
+          shown by C(reused_connection). C(response) is from sending the
+          request until the response headers arrived.
+      returned: when I(connection_broker) is C(true)
+      type: dict
+response_size:
+  description:
+    - The size of the CMCI response as it was received and once decompressed,
+      when the CMCI server compressed it.
+  returned: when the response was compressed
+  type: dict
+  contains:
+    content_encoding:
+      description: The compression the CMCI server used, C(gzip) or C(deflate).
+      returned: when the response was compressed
+      type: str
+    received:
+      description: The number of bytes received.
+      returned: when the response was compressed
+      type: int
+    uncompressed:
+      description: The number of bytes once decompressed.
+      returned: when the response was compressed
+      type: int
 http_status:
   description:
     - The message associated with HTTP status code that is returned by CMCI.
@@ -188,14 +464,55 @@ http_status_code:
 record_count:
   description:
     - The number of records returned.
+    - When I(dest) is specified, the number of records written to I(dest).
   returned: success
   type: int
+dest:
+  description: The path of the file the records were written to.
+  returned: success, when I(dest) is specified
+  type: str
+size:
+  description: The size in bytes of the file the records were written to.
+  returned: success, when I(dest) is specified
+  type: int
+checksum:
+  description: The SHA-256 checksum of the file the records were written to.
+  returned: success, when I(dest) is specified
+  type: str
 records:
   description:
     - A list of the returned records.
+    - Not returned when I(dest) or I(since_snapshot) is specified.
   returned: success
   type: list
   elements: dict
+delta:
+  description:
+    - The records that were added, changed or removed since the snapshot at
+      I(since_snapshot) was written.
+  returned: success, when I(since_snapshot) is specified
+  type: dict
+  contains:
+    added:
+      description: The records that weren't in the snapshot.
+      returned: always
+      type: list
+      elements: dict
+    changed:
+      description: The records whose attributes are different.
+      returned: always
+      type: list
+      elements: dict
+    removed:
+      description:
+        - The keys of the records that were in the snapshot but weren't
+          returned.
+        - A key is the context, scope and C(eyu_cicsname) of the record
+          and its C(_keydata), separated by C(/). The context and scope are
+          empty unless I(contexts) or I(scopes) is specified.
+      returned: always
+      type: list
+      elements: str
   sample:
     - _keydata: "C1D5E2C9E3C5E2E3"
       aloadtime: "00:00:00.000000"
@@ -260,6 +577,56 @@ records:
       useagelstat: "0"
       usecount: "0"
       usefetch: "0.000"
+targets:
+  description:
+    - The outcome of the query in each context and scope, when I(contexts)
+      or I(scopes) is specified.
+    - C(records), C(record_count) and C(request) then describe all of the
+      queries, and the first query, together.
+  returned: when I(contexts) or I(scopes) is specified
+  type: list
+  elements: dict
+  contains:
+    context:
+      description: The context of the query.
+      returned: always
+      type: str
+    scope:
+      description: The scope of the query, if any.
+      returned: always
+      type: str
+    url:
+      description: The URL of the query.
+      returned: always
+      type: str
+    failed:
+      description: True if the query failed, otherwise False.
+      returned: always
+      type: bool
+    msg:
+      description: Why the query failed.
+      returned: when the query failed
+      type: str
+    record_count:
+      description: The number of records the query returned.
+      returned: when the query returned a response
+      type: int
+    cpsm_response:
+      description: The character value of the CPSM RESPONSE code.
+      returned: when the query returned a response
+      type: str
+    cpsm_response_code:
+      description: The numeric value of the CPSM RESPONSE code.
+      returned: when the query returned a response
+      type: int
+    cpsm_reason:
+      description: The character value of the CPSM REASON code.
+      returned: when the query returned a response
+      type: str
+    cpsm_reason_code:
+      description: The numeric value of the CPSM REASON code.
+      returned: when the query returned a response
+      type: int
 request:
   description: Information about the request that was made to CMCI.
   returned: success
@@ -513,17 +880,42 @@ feedback:
 """
 
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
-    AnsibleCMCIModule, RESOURCES_ARGUMENT
+    AnsibleCMCIModule, RESOURCES_ARGUMENT, SCHEME, CMCI_HOST, CMCI_PORT, TYPE,
+    CONTEXT, SCOPE, CONTEXT_REGEX, CONTEXT_MESSAGE, SCOPE_REGEX, SCOPE_MESSAGE,
+    CMCIRequestError, CMCIResponseParser, request_error_message,
+    _url_encode_params, _url_encode_string
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_records import (
+    COMPRESSIONS, NONE, RecordFileWriter
 )
 
-from typing import Dict, Optional
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_snapshot import (
+    KEYDATA, SnapshotError, diff, read_snapshot, write_snapshot
+)
+from collections import OrderedDict, deque
+from http.client import RemoteDisconnected
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.error import URLError
+from xml.parsers import expat
 
 _RECORD_COUNT = 'record_count'
 _FAIL_ON_NODATA = 'fail_on_nodata'
+_PROJECTION = 'projection'
+_PAGE_SIZE = 'page_size'
+_PAGE_CONCURRENCY = 'page_concurrency'
+_DEST = 'dest'
+_DEST_COMPRESSION = 'dest_compression'
+_SINCE_SNAPSHOT = 'since_snapshot'
+_DELTA = 'delta'
+_CONTEXTS = 'contexts'
+_SCOPES = 'scopes'
+_TARGET_CONCURRENCY = 'target_concurrency'
+_TARGETS = 'targets'
 
 
 class AnsibleCMCIGetModule(AnsibleCMCIModule):
     def __init__(self):
+        self._writer = None  # type: Optional[RecordFileWriter]
         super(AnsibleCMCIGetModule, self).__init__('GET')
 
     def init_argument_spec(self):  # type: () -> Dict
@@ -535,16 +927,393 @@ class AnsibleCMCIGetModule(AnsibleCMCIModule):
             _FAIL_ON_NODATA: {
                 'type': 'bool',
                 'default': True
+            },
+            _PROJECTION: {
+                'type': 'list',
+                'elements': 'str'
+            },
+            _PAGE_SIZE: {
+                'type': 'int'
+            },
+            _DEST: {
+                'type': 'path'
+            },
+            _DEST_COMPRESSION: {
+                'type': 'str',
+                'choices': COMPRESSIONS,
+                'default': NONE
+            },
+            _SINCE_SNAPSHOT: {
+                'type': 'path'
+            },
+            _PAGE_CONCURRENCY: {
+                'type': 'int',
+                'default': 1
+            },
+            # One of context or contexts is required
+            CONTEXT: {
+                'type': 'str'
+            },
+            _CONTEXTS: {
+                'type': 'list',
+                'elements': 'str'
+            },
+            _SCOPES: {
+                'type': 'list',
+                'elements': 'str'
+            },
+            _TARGET_CONCURRENCY: {
+                'type': 'int',
+                'default': 10
             }
         })
         argument_spec.update(RESOURCES_ARGUMENT)
         return argument_spec
 
+    def init_p(self):  # type: () -> Dict
+        p = super(AnsibleCMCIGetModule, self).init_p()
+
+        for single, multiple in ((CONTEXT, _CONTEXTS), (SCOPE, _SCOPES)):
+            if p.get(single) is not None and p.get(multiple) is not None:
+                self._fail(
+                    'parameters are mutually exclusive: {0}|{1}'
+                    .format(single, multiple)
+                )
+            if p.get(multiple) == []:
+                self._fail(
+                    'Parameter "{0}" must not be empty'.format(multiple)
+                )
+        if p.get(CONTEXT) is None and p.get(_CONTEXTS) is None:
+            self._fail(
+                'one of the following is required: {0}, {1}'
+                .format(CONTEXT, _CONTEXTS)
+            )
+
+        if self.is_fan_out(p):
+            if p.get(_PAGE_SIZE) is not None:
+                self._fail(
+                    'parameters are mutually exclusive: {0}|{1}'
+                    .format('|'.join((_CONTEXTS, _SCOPES)), _PAGE_SIZE)
+                )
+            if p.get(_TARGET_CONCURRENCY) < 1:
+                self._fail(
+                    'Parameter "{0}" with value "{1}" was not valid.  '
+                    'Expected a number greater than 0.'
+                    .format(
+                        _TARGET_CONCURRENCY, str(p.get(_TARGET_CONCURRENCY))
+                    )
+                )
+
+        if p.get(_DEST) and p.get(_SINCE_SNAPSHOT):
+            self._fail(
+                'parameters are mutually exclusive: {0}|{1}'
+                .format(_DEST, _SINCE_SNAPSHOT)
+            )
+
+        if p.get(_PAGE_SIZE) is not None:
+            if p.get(_RECORD_COUNT):
+                self._fail(
+                    'parameters are mutually exclusive: {0}|{1}'
+                    .format(_RECORD_COUNT, _PAGE_SIZE)
+                )
+            for name in (_PAGE_SIZE, _PAGE_CONCURRENCY):
+                if p.get(name) < 1:
+                    self._fail(
+                        'Parameter "{0}" with value "{1}" was not valid.  '
+                        'Expected a number greater than 0.'
+                        .format(name, str(p.get(name)))
+                    )
+
+        return p
+
+    def validate_target(self):  # type: () -> None
+        super(AnsibleCMCIGetModule, self).validate_target()
+
+        params = self._module.params
+        for context in params.get(_CONTEXTS) or []:
+            self.validate_value(
+                _CONTEXTS, context, CONTEXT_REGEX, CONTEXT_MESSAGE
+            )
+        for scope in params.get(_SCOPES) or []:
+            self.validate_value(_SCOPES, scope, SCOPE_REGEX, SCOPE_MESSAGE)
+
+    @staticmethod
+    def is_fan_out(p):  # type: (Dict) -> bool
+        return p.get(_CONTEXTS) is not None or p.get(_SCOPES) is not None
+
+    def get_targets(self):  # type: () -> List[Tuple[str, Optional[str]]]
+        # Every combination of context and scope, in order
+        return [
+            (context, scope)
+            for context in self._p.get(_CONTEXTS) or [self._p.get(CONTEXT)]
+            for scope in self._p.get(_SCOPES) or [self._p.get(SCOPE)]
+        ]
+
     def init_request_params(self):  # type: () -> Optional[Dict[str, str]]
-        return self.get_resources_request_params()
+        request_params = self.get_resources_request_params()
+
+        if self._p.get(_PAGE_SIZE):
+            # Only ask for the summary, and keep the records in the result
+            # cache to be fetched a page at a time
+            request_params['SUMMONLY'] = None
+            request_params['NODISCARD'] = None
+
+        return request_params
+
+    def init_response_parser(self):  # type: () -> CMCIResponseParser
+        record_sink = None
+        if self._writer and not self._p.get(_PAGE_SIZE) and \
+                not self.is_fan_out(self._p):
+            # Write records out as they're parsed rather than keeping them.
+            # Pages and targets are parsed concurrently, so main writes those
+            # in order.
+            record_sink = self._writer.write
+
+        return CMCIResponseParser(
+            self._p[TYPE].lower(),
+            projection=self.get_projection(),
+            record_sink=record_sink
+        )
+
+    def get_projection(self):  # type: () -> Optional[List[str]]
+        projection = self._p.get(_PROJECTION)
+        if projection is None:
+            return None
+
+        # CMCI attribute names are always lower case
+        projection = [name.lower() for name in projection]
+        if self._p.get(_SINCE_SNAPSHOT) and KEYDATA not in projection:
+            # Snapshots identify records by their key
+            projection.append(KEYDATA)
+        return projection
+
+    def get_cache_variant(self):  # type: () -> Optional[List[str]]
+        return self.get_projection()
+
+    def is_cacheable(self):  # type: () -> bool
+        # The result cache token of a paged query is only good once, and
+        # records written to dest aren't kept in the response
+        return super(AnsibleCMCIGetModule, self).is_cacheable() and \
+            not self._p.get(_PAGE_SIZE) and \
+            not self._p.get(_DEST) and \
+            not self.is_fan_out(self._p)
+
+    def main(self):
+        dest = self._p.get(_DEST)
+        if dest:
+            try:
+                self._writer = RecordFileWriter(
+                    dest, self._p.get(_DEST_COMPRESSION)
+                )
+            except OSError as e:
+                self._fail(
+                    'Could not write records to {0}: {1}'.format(dest, e)
+                )
+
+        try:
+            if self._p.get(_PAGE_SIZE):
+                self.get_paged()
+            elif self.is_fan_out(self._p):
+                self.get_fan_out()
+            else:
+                self.handle_response(self._do_request())
+
+            if self._p.get(_SINCE_SNAPSHOT):
+                self.compare_snapshot()
+
+            if self._writer:
+                # Only the details of the file are returned, not the records
+                self.result.pop('records', None)
+                self.result['record_count'] = self._writer.count
+                self.result.update(self._writer.commit())
+                self._writer = None
+        except OSError as e:
+            self._fail('Could not write records to {0}: {1}'.format(dest, e))
+        finally:
+            if self._writer:
+                self._writer.discard()
+
+        self._module.exit_json(**self.result)
+
+    def compare_snapshot(self):  # type: () -> None
+        path = self._p.get(_SINCE_SNAPSHOT)
+        try:
+            snapshot = read_snapshot(path)
+        except (OSError, SnapshotError) as e:
+            self._fail('Could not read snapshot {0}: {1}'.format(path, e))
+
+        # Only the delta is returned, not the records
+        records = self.result.pop('records', None) or []
+        self.result[_DELTA], index = diff(snapshot or {}, records)
+
+        try:
+            write_snapshot(path, index)
+        except OSError as e:
+            self.result.pop(_DELTA)
+            self._fail('Could not write snapshot {0}: {1}'.format(path, e))
+
+    def get_paged(self):  # type: () -> None
+        response = self._do_request()  # type: dict
+        cache_token = (response.get('response') or {})\
+            .get('resultsummary', {}).get('@cachetoken')
+        try:
+            self.handle_response(response)
+            if cache_token:
+                records = []  # type: List[Dict]
+                for page in self.iter_cached_pages(cache_token):
+                    if self._writer:
+                        self._writer.write_all(page)
+                    else:
+                        records.extend(page)
+                self.result['records'] = records
+        finally:
+            if cache_token:
+                self.discard_cache(cache_token)
+
+    def get_fan_out(self):  # type: () -> None
+        request_params = self.init_request_params()
+        targets = []
+        for context, scope in self.get_targets():
+            url = self.get_target_url(context, scope)
+            if request_params:
+                url = _url_encode_params(url, request_params)
+            targets.append((context, scope, url))
+
+        # Imported here, so queries of a single target start quicker
+        from concurrent.futures import ThreadPoolExecutor
+
+        concurrency = self._p.get(_TARGET_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(self.get_target, targets))
+
+        records = []  # type: List[Dict]
+        self.result[_TARGETS] = []
+        for (context, scope, url), (outcome, target_records) in \
+                zip(targets, outcomes):
+            for record in target_records:
+                record['_context'] = context
+                record['_scope'] = scope
+            if self._writer:
+                self._writer.write_all(target_records)
+            else:
+                records.extend(target_records)
+            self.result[_TARGETS].append(outcome)
+
+        self.result['records'] = records
+        self.result['record_count'] = sum(
+            o.get('record_count', 0) for o in self.result[_TARGETS]
+        )
+
+        failed = len([o for o in self.result[_TARGETS] if o['failed']])
+        if failed:
+            self._fail(
+                '{0} of {1} CMCI queries failed'.format(failed, len(targets))
+            )
+
+    def get_target(self, target):
+        # type: (Tuple[str, Optional[str], str]) -> Tuple[Dict, List[Dict]]
+        # Runs on a worker thread, so reports failures rather than failing
+        context, scope, url = target
+        outcome = OrderedDict([
+            ('context', context), ('scope', scope), ('url', url)
+        ])
+        records = []  # type: List[Dict]
+        try:
+            response_node = self._request_with_retry('GET', url)['response']
+            result_summary = response_node['resultsummary']
+            cpsm_response_code = int(result_summary['@api_response1'])
+            outcome['cpsm_response'] = result_summary['@api_response1_alt']
+            outcome['cpsm_response_code'] = cpsm_response_code
+            outcome['cpsm_reason'] = result_summary['@api_response2_alt']
+            outcome['cpsm_reason_code'] = int(result_summary['@api_response2'])
+            records = (response_node.get('records') or {})\
+                .get(self._p[TYPE].lower(), [])
+            outcome['record_count'] = len(records)
+            if cpsm_response_code not in self.get_ok_cpsm_response_codes():
+                outcome['msg'] = \
+                    'CMCI request failed with response "{0}" reason "{1}"'\
+                    .format(
+                        outcome['cpsm_response'],
+                        outcome['cpsm_reason'] or cpsm_response_code
+                    )
+        except KeyError as e:
+            outcome['msg'] = 'Could not parse CMCI response: missing node ' \
+                '"{0}"'.format(e.args[0])
+        except (CMCIRequestError, URLError, RemoteDisconnected,
+                expat.ExpatError) as e:
+            outcome['msg'] = request_error_message(e)
+        outcome['failed'] = 'msg' in outcome
+        return outcome, records
+
+    def get_cache_url(self, cache_token):  # type: (str) -> str
+        return self._p.get(SCHEME) + \
+            '://' + \
+            self._p.get(CMCI_HOST) + \
+            ':' + \
+            str(self._p.get(CMCI_PORT)) + \
+            '/CICSSystemManagement/CICSResultCache/' + \
+            _url_encode_string(cache_token)
+
+    def iter_cached_pages(self, cache_token):
+        # type: (str) -> Iterator[List[Dict]]
+        # Yields the records of each page in order. No more than
+        # page_concurrency pages are being requested, or waiting to be read,
+        # at any time.
+        record_count = self.result.get('record_count', 0)
+        page_size = self._p.get(_PAGE_SIZE)
+        concurrency = self._p.get(_PAGE_CONCURRENCY)
+        cache_url = self.get_cache_url(cache_token)
+        urls = [
+            '{0}/{1}/{2}?NODISCARD'.format(
+                cache_url, index, min(page_size, record_count - index + 1)
+            ) for index in range(1, record_count + 1, page_size)
+        ]
+
+        # Imported here, so queries that aren't paged start quicker
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pending = deque()
+            for url in urls:
+                pending.append(pool.submit(self._request_with_retry, 'GET', url))
+                if len(pending) >= concurrency:
+                    yield self.read_page(pending.popleft())
+            while pending:
+                yield self.read_page(pending.popleft())
+
+    def read_page(self, future):  # type: (...) -> List[Dict]
+        response_node = self._handle_request_errors(future.result)['response']
+        result_summary = response_node['resultsummary']
+        if int(result_summary['@api_response1']) != 1024:
+            self._fail(
+                'CMCI request failed with response "{0}" reason "{1}"'
+                .format(
+                    result_summary['@api_response1_alt'],
+                    result_summary['@api_response2_alt'] or
+                    result_summary['@api_response1']
+                )
+            )
+        return (response_node.get('records') or {})\
+            .get(self._p[TYPE].lower(), [])
+
+    def discard_cache(self, cache_token):  # type: (str) -> None
+        # Best effort, the cache expires on the server if this fails. The
+        # HTTP status of the module's result stays that of the query.
+        status = self.result.get('http_status'), \
+            self.result.get('http_status_code')
+        try:
+            self._request('DELETE', self.get_cache_url(cache_token))
+        except (CMCIRequestError, URLError, RemoteDisconnected, OSError,
+                expat.ExpatError):
+            pass
+        self.result['http_status'], self.result['http_status_code'] = status
 
     def init_url(self):  # type: () -> str
-        url = super(AnsibleCMCIGetModule, self).init_url()
+        # The request in the result is the first target's
+        return self.get_target_url(*self.get_targets()[0])
+
+    def get_target_url(self, context, scope):  # type: (str, Optional[str]) -> str
+        url = super(AnsibleCMCIGetModule, self).get_target_url(context, scope)
 
         if self._p.get(_RECORD_COUNT):
             url = url + '//' + str(self._p.get(_RECORD_COUNT))
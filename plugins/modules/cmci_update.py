@@ -54,6 +54,29 @@ options:
         required: false
         type: str
     required: false
+  skip_unchanged:
+    description:
+      - Only update the resources whose attributes differ from
+        I(attributes), and only update the attributes that differ.
+      - The resources that match I(resources) are first retrieved with a
+        single GET request. Resources that need the same attributes changed
+        are then updated together with one PUT request, whose filter is
+        narrowed to select only those resources. Resources that don't need
+        any change aren't updated, and C(changed) is only true if a resource
+        was updated.
+      - Values are compared with the values CMCI returns after removing
+        leading and trailing blanks. Numbers are compared by value, so
+        C(0010) is the same as C(10), and single words, such as CVDA values,
+        are compared in upper case, so C(enabled) is the same as C(ENABLED).
+        Other values are compared as text.
+      - The filter of each PUT request compares values as text, so it lists
+        every form of a value that the GET request returned, such as both
+        C(0100) and C(100).
+      - Names in I(attributes) can only contain the characters A-Z a-z 0-9.
+    type: bool
+    required: false
+    default: false
+    version_added: 2.3.0
 '''
 
 
@@ -75,6 +98,25 @@ EXAMPLES = r"""
       get_parameters:
         - name: csdgroup
           value: JVMGRP
+
+- name: Make sure every program definition in a group is enabled and
+    resident, only updating the ones that aren't
+  cmci_update:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    context: ABCDEFGH
+    scope: IJKLMNOP
+    type: CICSDefinitionProgram
+    attributes:
+      status: ENABLED
+      resident: "YES"
+    update_parameters:
+      - name: csd
+    skip_unchanged: true
+    resources:
+      get_parameters:
+        - name: csdgroup
+          value: MYGRP
 """
 
 
@@ -119,6 +161,92 @@ cpsm_response_code:
       https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-response-in-numerical-order.
   returned: success
   type: str
+retry_history:
+  description:
+    - The failed attempts that were retried, when I(retries) is greater than 0.
+  returned: when a request was retried
+  type: list
+  elements: dict
+  contains:
+    attempt:
+      description: The number of the attempt that failed, starting from 1.
+      returned: always
+      type: int
+    reason:
+      description: Why the attempt failed.
+      returned: always
+      type: str
+    elapsed:
+      description: The number of seconds the attempt took.
+      returned: always
+      type: float
+    delay:
+      description: The number of seconds waited before the next attempt.
+      returned: always
+      type: float
+timings:
+  description:
+    - The timings and sizes of each CMCI request, when I(timings) is C(true).
+  returned: when I(timings) is C(true)
+  type: list
+  elements: dict
+  contains:
+    method:
+      description: The HTTP method of the request.
+      returned: always
+      type: str
+    url:
+      description: The URL of the request.
+      returned: always
+      type: str
+    seconds:
+      description:
+        - How long each phase of the request took, in seconds.
+        - C(dns) is the time to resolve I(cmci_host), measured separately
+          before the request. It is not returned when I(connection_broker) is
+          C(true).
+        - C(request) is from sending the request until the response headers
+          arrived, which includes connecting, the TLS handshake and the time
+          the CMCI server took to respond.
+        - C(transfer) is the time spent waiting for the response body, and
+          C(parse) the time spent decompressing and parsing it.
+        - C(total) covers every phase.
+      returned: always
+      type: dict
+    bytes:
+      description:
+        - The number of bytes C(sent) in the request body, C(received) in the
+          response body, and in the response body once C(uncompressed).
+      returned: always
+      type: dict
+    broker:
+      description:
+        - The connection broker's own timings of the request, in seconds.
+        - C(connect) is the time to connect to the CMCI server, including the
+          C(tls_handshake), or 0 when an open connection was reused, which is
+          shown by C(reused_connection). C(response) is from sending the
+          request until the response headers arrived.
+      returned: when I(connection_broker) is C(true)
+      type: dict
+response_size:
+  description:
+    - The size of the CMCI response as it was received and once decompressed,
+      when the CMCI server compressed it.
+  returned: when the response was compressed
+  type: dict
+  contains:
+    content_encoding:
+      description: The compression the CMCI server used, C(gzip) or C(deflate).
+      returned: when the response was compressed
+      type: str
+    received:
+      description: The number of bytes received.
+      returned: when the response was compressed
+      type: int
+    uncompressed:
+      description: The number of bytes once decompressed.
+      returned: when the response was compressed
+      type: int
 http_status:
   description:
     - The message associated with HTTP status code that is returned by CMCI.
@@ -221,6 +349,41 @@ request:
       description: The URL used for the request.
       returned: success
       type: str
+updates:
+  description:
+    - The updates made when C(skip_unchanged) is true, one for each set of
+      attributes that differed.
+    - C(request) is then the GET request that retrieved the resources.
+  returned: success and skip_unchanged is true
+  type: list
+  elements: dict
+  contains:
+    attributes:
+      description: The names of the attributes that were updated.
+      returned: success
+      type: list
+      elements: str
+    record_count:
+      description: The number of resources that needed the update.
+      returned: success
+      type: int
+    request:
+      description: Information about the PUT request that made the update.
+      returned: success
+      type: dict
+      contains:
+        body:
+          description: The XML body sent with the request.
+          returned: success
+          type: str
+        method:
+          description: The HTTP method used for the request.
+          returned: success
+          type: str
+        url:
+          description: The URL used for the request.
+          returned: success
+          type: str
 feedback:
   description: Diagnostic data from FEEDBACK records associated with the request
   returned: cmci error
@@ -458,17 +621,38 @@ feedback:
 
 
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
-    AnsibleCMCIModule, RESOURCES_ARGUMENT, parameters_argument,
-    ATTRIBUTES_ARGUMENT
+    AnsibleCMCIModule, CMCIResponseParser, RESOURCES_ARGUMENT,
+    parameters_argument, ATTRIBUTES_ARGUMENT, ATTRIBUTES, TYPE,
+    _url_encode_params
 )
-from typing import Optional, Dict
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    OR, Junction, Predicate, is_alphanumeric, narrow
+)
+from typing import Optional, Dict, List, Tuple
 from collections import OrderedDict
+from decimal import Decimal
+import re
 
 UPDATE_PARAMETERS = 'update_parameters'
+SKIP_UNCHANGED = 'skip_unchanged'
+UPDATES = 'updates'
+_NUMBER = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)$')
+_WORD = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+
+
+def _normalise(value):  # type: (str) -> object
+    # The form skip_unchanged compares values in
+    value = value.strip()
+    if _NUMBER.match(value):
+        return Decimal(value)
+    if _WORD.match(value):
+        return value.upper()
+    return value
 
 
 class AnsibleCMCIUpdateModule(AnsibleCMCIModule):
     def __init__(self):
+        self._comparing = False
         super(AnsibleCMCIUpdateModule, self).__init__('PUT')
 
     def init_argument_spec(self):  # type: () -> Dict
@@ -477,12 +661,45 @@ class AnsibleCMCIUpdateModule(AnsibleCMCIModule):
         argument_spec.update(RESOURCES_ARGUMENT)
         argument_spec.update(parameters_argument(UPDATE_PARAMETERS))
         argument_spec.update(ATTRIBUTES_ARGUMENT)
+        argument_spec.update({
+            SKIP_UNCHANGED: {
+                'type': 'bool',
+                'required': False,
+                'default': False
+            }
+        })
         return argument_spec
 
+    def init_p(self):  # type: () -> Dict
+        p = super(AnsibleCMCIUpdateModule, self).init_p()
+
+        if p.get(SKIP_UNCHANGED):
+            if not p.get(ATTRIBUTES):
+                self._fail(
+                    "missing parameter(s) required by '{0}': {1}"
+                    .format(SKIP_UNCHANGED, ATTRIBUTES)
+                )
+            for name in p.get(ATTRIBUTES):
+                # Attribute names are used in filters
+                if not is_alphanumeric(name):
+                    self._fail(
+                        "Attribute with value {0} was not valid. Valid "
+                        "characters are A-Z a-z 0-9."
+                        .format(name)
+                    )
+
+        return p
+
     def init_body(self):  # type: () -> Optional[Dict]
+        return self.get_update_body(self._p.get(ATTRIBUTES))
+
+    def get_update_body(self, attributes):  # type: (Optional[Dict]) -> Dict
         update = OrderedDict({})
         self.append_parameters(UPDATE_PARAMETERS, update)
-        self.append_attributes(update)
+        if attributes:
+            update['attributes'] = OrderedDict(
+                {'@' + key: value for key, value in attributes.items()}
+            )
 
         return {
             'request': {
@@ -493,6 +710,129 @@ class AnsibleCMCIUpdateModule(AnsibleCMCIModule):
     def init_request_params(self):  # type: () -> Optional[Dict[str, str]]
         return self.get_resources_request_params()
 
+    def init_response_parser(self):  # type: () -> CMCIResponseParser
+        if not self._comparing:
+            return super(AnsibleCMCIUpdateModule, self).init_response_parser()
+        # Only the attributes being updated are needed for the comparison
+        return CMCIResponseParser(
+            self._p[TYPE].lower(),
+            projection=[name.lower() for name in self._p.get(ATTRIBUTES)]
+        )
+
+    def main(self):
+        if self._p.get(SKIP_UNCHANGED):
+            self.update_changed()
+        else:
+            self.handle_response(self._do_request())
+        self._module.exit_json(**self.result)
+
+    def update_changed(self):  # type: () -> None
+        self._comparing = True
+        try:
+            response = self._do_request('GET', self._url)
+        finally:
+            self._comparing = False
+        self.result['request'] = {
+            'url': self._url,
+            'method': 'GET',
+            'body': None
+        }
+        self.handle_response(response)
+
+        current = self.result.pop('records', [])
+        groups = self.group_by_differences(current)
+        filter_values = self.get_filter_values(current)
+
+        records = []  # type: List[Dict]
+        self.result['changed'] = False
+        self.result[UPDATES] = []
+        for differences, count in groups:
+            url, body = self.get_update_request(differences, filter_values)
+            update = {
+                'attributes': list(differences),
+                'record_count': count,
+                'request': {'url': url, 'method': self._method, 'body': body}
+            }
+            self.handle_response(self._do_request(self._method, url, body))
+            records.extend(self.result.pop('records', []))
+            self.result[UPDATES].append(update)
+
+        self.result['records'] = records
+        self.result['record_count'] = len(records)
+
+    def get_desired_values(self):  # type: () -> OrderedDict
+        # CMCI returns every value as a string
+        return OrderedDict(
+            (name, '' if value is None else str(value))
+            for name, value in self._p.get(ATTRIBUTES).items()
+        )
+
+    def group_by_differences(self, records):
+        # type: (List[Dict]) -> List[Tuple[Tuple[str, ...], int]]
+        # Counts the records that differ in each set of attributes
+        desired = OrderedDict(
+            (name, _normalise(value))
+            for name, value in self.get_desired_values().items()
+        )
+        groups = OrderedDict()  # type: OrderedDict
+        for record in records:
+            differences = tuple(
+                name for name, value in desired.items()
+                if record.get(name.lower()) is None or
+                _normalise(record[name.lower()]) != value
+            )
+            if differences:
+                groups[differences] = groups.get(differences, 0) + 1
+        return list(groups.items())
+
+    def get_filter_values(self, records):
+        # type: (List[Dict]) -> OrderedDict
+        # Every form CMCI returned each desired value in, like 0100 and 100,
+        # or the desired value if no record has it. CRITERIA compares values
+        # as strings, so the filters need every form to select the same
+        # records as the comparison did.
+        values = OrderedDict()  # type: OrderedDict
+        for name, value in self.get_desired_values().items():
+            desired = _normalise(value)
+            forms = []  # type: List[str]
+            seen = set()
+            for record in records:
+                current = record.get(name.lower())
+                if current is None or current in seen:
+                    continue
+                seen.add(current)
+                if _normalise(current) == desired:
+                    forms.append(current)
+            values[name] = forms or [value]
+        return values
+
+    def get_update_request(self, differences, filter_values):
+        # type: (Tuple[str, ...], OrderedDict) -> Tuple[str, str]
+        # Narrows the filter to the records that differ in exactly these
+        # attributes, so each update only changes its own group of records
+        predicates = []  # type: List[object]
+        for name, forms in filter_values.items():
+            if name in differences:
+                predicates.extend(Predicate(name, '¬=', form) for form in forms)
+            elif len(forms) == 1:
+                predicates.append(Predicate(name, '==', forms[0]))
+            else:
+                predicates.append(Junction(OR, [
+                    Predicate(name, '==', form) for form in forms
+                ]))
+        resource_params = self.init_request_params() or {}
+        request_params = OrderedDict([
+            ('CRITERIA', narrow(resource_params.get('CRITERIA'), predicates))
+        ])
+        for key, value in resource_params.items():
+            request_params.setdefault(key, value)
+
+        attributes = self._p.get(ATTRIBUTES)
+        body = self.encode_body(self.get_update_body(OrderedDict(
+            (name, attributes[name]) for name in differences
+        )))
+        return _url_encode_params(self.init_url(), request_params), body
+
 
 def main():
     AnsibleCMCIUpdateModule().main()
@@ -0,0 +1,535 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: cmci_wait
+short_description: Wait for CICS and CICSPlex SM resources to reach a state
+description:
+  - Wait until every CICS® or CICSPlex® SM resource of a type that matches a
+    filter meets a condition, for example, until the programs that were just
+    newcopied with M(ibm.ibm_zos_cics.cmci_action) are enabled, by polling
+    with GET requests via the CMCI REST API. For information about the API,
+    see
+    L(CMCI REST API,https://www.ibm.com/docs/en/cics-ts/latest?topic=programming-cmci-rest-api-reference).
+  - The condition is sent to CMCI with each request, negated, so that CMCI
+    only returns the resources that don't meet it yet. The wait is over when
+    CMCI returns no resources.
+  - Polls start I(poll_delay) seconds apart and the delay doubles after each
+    poll, up to I(poll_max_delay) seconds, so that a quick change is noticed
+    quickly and a slow one doesn't load the CMCI server. Set
+    I(connection_broker) to C(true) to keep the connection to CMCI open
+    between polls.
+  - CMCI also returns no resources when none match I(resources) at all, for
+    example, when waiting for a resource that is still being installed. So
+    before the wait is over, the resources that match I(resources) are
+    counted with another request, and the wait goes on until there are at
+    least I(min_count) of them.
+version_added: 2.3.0
+author:
+  - Stewart Francis (@stewartfrancis)
+  - Tom Latham (@Tom-Latham)
+  - Sophie Green (@sophiegreen)
+  - Ya Qing Chen (@vera-chan)
+extends_documentation_fragment:
+  - ibm.ibm_zos_cics.cmci.COMMON
+  - ibm.ibm_zos_cics.cmci.RESOURCES
+options:
+  condition:
+    description:
+      - The condition that every resource must meet, as a filter expression
+        with the same form as the C(complex_filter) option of I(resources).
+      - For examples, see "Examples" in M(ibm.ibm_zos_cics.cmci_get).
+    type: dict
+    required: true
+    suboptions:
+      and:
+        description:
+          - A list of filter expressions to be combined with an C(and)
+            operation.
+        type: list
+        elements: dict
+        required: false
+      or:
+        description:
+          - A list of filter expressions to be combined with an C(or)
+            operation.
+        type: list
+        elements: dict
+        required: false
+      attribute:
+        description:
+          - The name of a resource table attribute on which to filter.
+        type: str
+        required: false
+      operator:
+        description: >
+          The operator used to compare the attribute with the value, as for
+          the C(operator) option of C(complex_filter). If not supplied, C(EQ)
+          is assumed.
+        type: str
+        required: false
+        choices:
+          - "<"
+          - ">"
+          - "<="
+          - ">="
+          - "="
+          - "=="
+          - "!="
+          - "¬="
+          - EQ
+          - GT
+          - GE
+          - LT
+          - LE
+          - NE
+          - IS
+          - IN
+      value:
+        description:
+          - The value the attribute is compared with.
+          - With the C(IN) operator, a list of values.
+        type: raw
+        required: false
+  wait_timeout:
+    description:
+      - The number of seconds to wait for the resources to meet the
+        I(condition) before failing.
+    type: int
+    required: false
+    default: 300
+  poll_delay:
+    description:
+      - The number of seconds to wait after the first poll that finds
+        resources that don't meet the I(condition).
+      - Must be greater than C(0).
+    type: float
+    required: false
+    default: 0.5
+  poll_max_delay:
+    description:
+      - The maximum number of seconds to wait between polls.
+      - Must be greater than C(0).
+    type: float
+    required: false
+    default: 15
+  min_count:
+    description:
+      - The number of resources that must match I(resources) for the wait to
+        be over, as well as meeting the I(condition).
+      - C(0) ends the wait as soon as no resources fail to meet the
+        I(condition), even if none match I(resources), without counting
+        them.
+    type: int
+    required: false
+    default: 1
+'''
+
+
+EXAMPLES = r"""
+- name: Newcopy a program
+  cmci_action:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    context: ABCDEFGH
+    scope: IJKLMNOP
+    type: CICSProgram
+    action_name: NEWCOPY
+    resources:
+      filter:
+        program: MYPROG
+
+- name: Wait for the program to be enabled in every region
+  cmci_wait:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    context: ABCDEFGH
+    scope: IJKLMNOP
+    type: CICSProgram
+    resources:
+      filter:
+        program: MYPROG
+    condition:
+      attribute: STATUS
+      value: ENABLED
+    wait_timeout: 120
+
+- name: Wait for bundles to be enabled or disabled, polling at most every 5 seconds
+  cmci_wait:
+    cmci_host: "example.com"
+    cmci_port: 12345
+    context: ABCDEFGH
+    type: CICSBundle
+    resources:
+      filter:
+        name: MYBUND*
+    condition:
+      attribute: ENABLESTATUS
+      operator: IN
+      value:
+        - ENABLED
+        - DISABLED
+    poll_max_delay: 5
+    connection_broker: true
+"""
+
+
+RETURN = r"""
+changed:
+  description: True if the state was changed, otherwise False.
+  returned: always
+  type: bool
+failed:
+  description: True if the query job failed, otherwise False.
+  returned: always
+  type: bool
+connect_version:
+  description: Version of the CMCI REST API.
+  returned: success
+  type: str
+cpsm_reason:
+  description:
+    - The character value of the REASON code returned by each CICSPlex SM API
+      command. For a list of REASON character values, see
+      https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-reason-in-alphabetical-order.
+  returned: success
+  type: str
+cpsm_reason_code:
+  description:
+    - The numeric value of the REASON code returned by each CICSPlex SM API
+      command. For a list of REASON numeric values, see
+      https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-reason-in-numerical-order.
+  returned: success
+  type: int
+cpsm_response:
+  description:
+    - The character value of the RESPONSE code returned by each CICSPlex SM API
+      command. For a list of RESPONSE character values, see
+      https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-response-in-alphabetical-order.
+  returned: success
+  type: str
+cpsm_response_code:
+  description:
+    - The numeric value of the RESPONSE code returned by each CICSPlex SM API
+      command. For a list of RESPONSE numeric values, see
+      https://www.ibm.com/docs/en/cics-ts/latest?topic=values-eyuda-response-in-numerical-order.
+  returned: success
+  type: str
+retry_history:
+  description:
+    - The failed attempts that were retried, when I(retries) is greater than 0.
+  returned: when a request was retried
+  type: list
+  elements: dict
+  contains:
+    attempt:
+      description: The number of the attempt that failed, starting from 1.
+      returned: always
+      type: int
+    reason:
+      description: Why the attempt failed.
+      returned: always
+      type: str
+    elapsed:
+      description: The number of seconds the attempt took.
+      returned: always
+      type: float
+    delay:
+      description: The number of seconds waited before the next attempt.
+      returned: always
+      type: float
+timings:
+  description:
+    - The timings and sizes of each CMCI request, when I(timings) is C(true).
+  returned: when I(timings) is C(true)
+  type: list
+  elements: dict
+  contains:
+    method:
+      description: The HTTP method of the request.
+      returned: always
+      type: str
+    url:
+      description: The URL of the request.
+      returned: always
+      type: str
+    seconds:
+      description:
+        - How long each phase of the request took, in seconds.
+        - C(dns) is the time to resolve I(cmci_host), measured separately
+          before the request. It is not returned when I(connection_broker) is
+          C(true).
+        - C(request) is from sending the request until the response headers
+          arrived, which includes connecting, the TLS handshake and the time
+          the CMCI server took to respond.
+        - C(transfer) is the time spent waiting for the response body, and
+          C(parse) the time spent decompressing and parsing it.
+        - C(total) covers every phase.
+      returned: always
+      type: dict
+    bytes:
+      description:
+        - The number of bytes C(sent) in the request body, C(received) in the
+          response body, and in the response body once C(uncompressed).
+      returned: always
+      type: dict
+    broker:
+      description:
+        - The connection broker's own timings of the request, in seconds.
+        - C(connect) is the time to connect to the CMCI server, including the
+          C(tls_handshake), or 0 when an open connection was reused, which is
+          shown by C(reused_connection). C(response) is from sending the
+          request until the response headers arrived.
+      returned: when I(connection_broker) is C(true)
+      type: dict
+response_size:
+  description:
+    - The size of the CMCI response as it was received and once decompressed,
+      when the CMCI server compressed it.
+  returned: when the response was compressed
+  type: dict
+  contains:
+    content_encoding:
+      description: The compression the CMCI server used, C(gzip) or C(deflate).
+      returned: when the response was compressed
+      type: str
+    received:
+      description: The number of bytes received.
+      returned: when the response was compressed
+      type: int
+    uncompressed:
+      description: The number of bytes once decompressed.
+      returned: when the response was compressed
+      type: int
+http_status:
+  description:
+    - The message associated with HTTP status code that is returned by CMCI.
+  returned: success
+  type: str
+http_status_code:
+  description:
+    - The HTTP status code returned by CMCI.
+  returned: success
+  type: int
+record_count:
+  description:
+    - The number of resources that didn't meet the I(condition) at the last
+      poll.
+  returned: success
+  type: int
+records:
+  description:
+    - The resources that didn't meet the I(condition) at the last poll. Empty
+      when the wait succeeded.
+  returned: success
+  type: list
+polls:
+  description:
+    - The number of polls that were made.
+  returned: always
+  type: int
+elapsed:
+  description:
+    - The number of seconds the wait took.
+  returned: always
+  type: float
+request:
+  description: Information about the request that was made to CMCI.
+  returned: success
+  type: dict
+  contains:
+    body:
+      description: The XML body sent with the request, if any.
+      returned: success
+      type: str
+    method:
+      description: The HTTP method used for the request.
+      returned: success
+      type: str
+    url:
+      description: The URL used for the request.
+      returned: success
+      type: str
+"""
+
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
+    AnsibleCMCIModule, RESOURCES_ARGUMENT, COMPLEX_FILTER, RESOURCES,
+    _url_encode_params
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    exclude
+)
+
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import time
+
+
+_CONDITION = 'condition'
+_WAIT_TIMEOUT = 'wait_timeout'
+_POLL_DELAY = 'poll_delay'
+_POLL_MAX_DELAY = 'poll_max_delay'
+_MIN_COUNT = 'min_count'
+
+
+class AnsibleCMCIWaitModule(AnsibleCMCIModule):
+    def __init__(self):
+        super(AnsibleCMCIWaitModule, self).__init__('GET')
+
+    def init_argument_spec(self):  # type: () -> Dict
+        argument_spec = super(AnsibleCMCIWaitModule, self).init_argument_spec()
+        argument_spec.update(RESOURCES_ARGUMENT)
+        # The condition is a complex filter in its own right
+        condition = dict(
+            RESOURCES_ARGUMENT[RESOURCES]['options'][COMPLEX_FILTER],
+            required=True
+        )
+        argument_spec.update({
+            _CONDITION: condition,
+            _WAIT_TIMEOUT: {
+                'type': 'int',
+                'default': 300
+            },
+            _POLL_DELAY: {
+                'type': 'float',
+                'default': 0.5
+            },
+            _POLL_MAX_DELAY: {
+                'type': 'float',
+                'default': 15.0
+            },
+            _MIN_COUNT: {
+                'type': 'int',
+                'default': 1
+            }
+        })
+        return argument_spec
+
+    def init_p(self):  # type: () -> Dict
+        p = super(AnsibleCMCIWaitModule, self).init_p()
+
+        for name in (_WAIT_TIMEOUT, _MIN_COUNT):
+            if p.get(name) < 0:
+                self._fail(
+                    'Parameter "{0}" with value "{1}" was not valid.  '
+                    'Expected a number greater than or equal to 0.'
+                    .format(name, str(p.get(name)))
+                )
+        # A delay of 0 would poll CMCI as fast as it can answer
+        for name in (_POLL_DELAY, _POLL_MAX_DELAY):
+            if p.get(name) <= 0:
+                self._fail(
+                    'Parameter "{0}" with value "{1}" was not valid.  '
+                    'Expected a number greater than 0.'
+                    .format(name, str(p.get(name)))
+                )
+
+        return p
+
+    def init_request(self):  # type: () -> None
+        super(AnsibleCMCIWaitModule, self).init_request()
+        # Counts the resources that match the filter, whatever their state
+        request_params = self.get_resources_request_params()
+        request_params['SUMMONLY'] = None
+        self._count_url = _url_encode_params(self.init_url(), request_params)
+
+    def init_request_params(self):  # type: () -> Optional[Dict[str, str]]
+        request_params = self.get_resources_request_params()
+        criteria = exclude(
+            request_params.pop('CRITERIA', None),
+            self._get_complex_filter(self._p[_CONDITION], _CONDITION)
+        )
+        return OrderedDict(
+            [('CRITERIA', criteria)] + list(request_params.items())
+        )
+
+    def get_ok_cpsm_response_codes(self):
+        # NODATA means every resource meets the condition, or that none
+        # match the filter
+        ok_codes = super(AnsibleCMCIWaitModule, self)\
+            .get_ok_cpsm_response_codes()
+        ok_codes.append(1027)
+        return ok_codes
+
+    def is_cacheable(self):  # type: () -> bool
+        # Every poll has to see the resources as they are now
+        return False
+
+    def main(self):
+        start = time.monotonic()
+        deadline = start + self._p.get(_WAIT_TIMEOUT)
+        polls = 0
+        delay = None  # type: Optional[float]
+        while True:
+            # Only the last poll's records are returned
+            self.result.pop('records', None)
+            self.result['record_count'] = 0
+
+            response = self._do_request()  # type: dict
+            polls += 1
+            self.result['polls'] = polls
+            self.handle_response(response)
+            self.result['elapsed'] = round(time.monotonic() - start, 3)
+
+            count = None
+            if not self.result.get('records'):
+                count = self.count_resources()
+                self.result['records'] = []
+                self.result['record_count'] = 0
+                if count >= self._p.get(_MIN_COUNT):
+                    break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if count is None:
+                    self._fail(
+                        'Timed out after {0} seconds waiting for {1} '
+                        'resources to meet the condition'
+                        .format(
+                            self._p.get(_WAIT_TIMEOUT),
+                            self.result['record_count']
+                        )
+                    )
+                self._fail(
+                    'Timed out after {0} seconds waiting for at least {1} '
+                    'resources to match, found {2}'
+                    .format(
+                        self._p.get(_WAIT_TIMEOUT),
+                        self._p.get(_MIN_COUNT),
+                        count
+                    )
+                )
+            delay = self.get_poll_delay(delay)
+            time.sleep(min(delay, remaining))
+
+        self._module.exit_json(**self.result)
+
+    def count_resources(self):  # type: () -> int
+        if not self._p.get(_MIN_COUNT):
+            return 0
+        self.handle_response(self._do_request('GET', self._count_url))
+        return self.result.pop('record_count', 0)
+
+    def get_poll_delay(self, previous):  # type: (Optional[float]) -> float
+        # Poll quickly at first, when a change is most likely to have just
+        # finished, then back off
+        if previous is None:
+            return min(self._p.get(_POLL_MAX_DELAY), self._p.get(_POLL_DELAY))
+        return min(self._p.get(_POLL_MAX_DELAY), previous * 2)
+
+
+def main():
+    AnsibleCMCIWaitModule().main()
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,7 @@ author: Thomas Latham (@Thomas-Latham3)
 version_added: 2.1.0
 extends_documentation_fragment:
   - ibm.ibm_zos_cics.csd
+  - ibm.ibm_zos_cics.known_state
 '''
 
 
@@ -224,14 +225,15 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DataSet
 )
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._csd import (
+    SPACE_PRIMARY_DEFAULT,
+    SPACE_SECONDARY_DEFAULT,
+    SPACE_TYPE_DEFAULT,
     _get_csdup_initilize_cmd,
     _get_idcams_cmd_csd,
     _run_dfhcsdup
 )
 
 DSN = "dfhcsd"
-SPACE_PRIMARY_DEFAULT = 4
-SPACE_SECONDARY_DEFAULT = 1
 SPACE_OPTIONS = [KILOBYTES, MEGABYTES, RECORDS, CYLINDERS, TRACKS]
 CHANGED = "changed"
 STATE_OPTIONS = [ABSENT, INITIAL, WARM, CHANGED]
@@ -268,7 +270,7 @@ class AnsibleCSDModule(DataSet):
             "default": SPACE_SECONDARY_DEFAULT
         })
         arg_spec[SPACE_TYPE].update({
-            "default": MEGABYTES,
+            "default": SPACE_TYPE_DEFAULT,
             "choices": SPACE_OPTIONS,
         })
         arg_spec[STATE].update({
@@ -374,8 +376,11 @@ class AnsibleCSDModule(DataSet):
         })
         return data_set
 
+    def get_idcams_define(self):  # type: () -> dict
+        return _get_idcams_cmd_csd(self.get_data_set())
+
     def create_data_set(self):  # type: () -> None
-        create_cmd = _build_idcams_define_cmd(_get_idcams_cmd_csd(self.get_data_set()))
+        create_cmd = _build_idcams_define_cmd(self.get_idcams_define())
         super().build_vsam_data_set(create_cmd)
 
     def init_data_set(self):  # type: () -> None
@@ -27,6 +27,7 @@ seealso:
   - module: local_catalog
 extends_documentation_fragment:
   - ibm.ibm_zos_cics.global_catalog
+  - ibm.ibm_zos_cics.known_state
 '''
 
 
@@ -217,6 +218,9 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DataSet
 )
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._global_catalog import (
+    SPACE_PRIMARY_DEFAULT,
+    SPACE_SECONDARY_DEFAULT,
+    SPACE_TYPE_DEFAULT,
     _get_idcams_cmd_gcd,
     _run_dfhrmutl
 )
@@ -232,8 +236,6 @@ NEXT_START_EMERGENCY = "EMERGENCY"
 NEXT_START_WARM = "WARM"
 NEXT_START_COLD = "COLD"
 NEXT_START_UNKNOWN = "UNKNOWN"
-SPACE_PRIMARY_DEFAULT = 5
-SPACE_SECONDARY_DEFAULT = 1
 
 
 class AnsibleGlobalCatalogModule(DataSet):
@@ -290,7 +292,7 @@ class AnsibleGlobalCatalogModule(DataSet):
             "default": SPACE_SECONDARY_DEFAULT
         })
         arg_spec[SPACE_TYPE].update({
-            "default": MEGABYTES,
+            "default": SPACE_TYPE_DEFAULT,
             "choices": SPACE_OPTIONS,
         })
         arg_spec[STATE].update({
@@ -333,8 +335,11 @@ class AnsibleGlobalCatalogModule(DataSet):
         defs[REGION_DATA_SETS]["options"][DSN]["options"]["dsn"].pop("type")
         return defs
 
+    def get_idcams_define(self):  # type: () -> dict
+        return _get_idcams_cmd_gcd(self.get_data_set())
+
     def create_data_set(self):  # type: () -> None
-        create_cmd = _build_idcams_define_cmd(_get_idcams_cmd_gcd(self.get_data_set()))
+        create_cmd = _build_idcams_define_cmd(self.get_idcams_define())
         super().build_vsam_data_set(create_cmd)
 
     def init_data_set(self):  # type: () -> None
@@ -26,6 +26,7 @@ seealso:
   - module: global_catalog
 extends_documentation_fragment:
   - ibm.ibm_zos_cics.local_catalog
+  - ibm.ibm_zos_cics.known_state
 '''
 
 
@@ -180,14 +181,15 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DataSet
 )
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._local_catalog import (
+    SPACE_PRIMARY_DEFAULT,
+    SPACE_SECONDARY_DEFAULT,
+    SPACE_TYPE_DEFAULT,
     _get_idcams_cmd_lcd,
     _run_dfhccutl
 )
 
 
 DSN = "dfhlcd"
-SPACE_PRIMARY_DEFAULT = 200
-SPACE_SECONDARY_DEFAULT = 5
 SPACE_OPTIONS = [KILOBYTES, MEGABYTES, RECORDS, CYLINDERS, TRACKS]
 
 
@@ -207,7 +209,7 @@ class AnsibleLocalCatalogModule(DataSet):
             "default": SPACE_SECONDARY_DEFAULT
         })
         arg_spec[SPACE_TYPE].update({
-            "default": RECORDS,
+            "default": SPACE_TYPE_DEFAULT,
             "choices": SPACE_OPTIONS,
         })
         arg_spec[REGION_DATA_SETS]["options"].update({
@@ -257,8 +259,11 @@ class AnsibleLocalCatalogModule(DataSet):
         else:
             self.invalid_target_state()
 
+    def get_idcams_define(self):  # type: () -> dict
+        return _get_idcams_cmd_lcd(self.get_data_set())
+
     def create_data_set(self):  # type: () -> None
-        create_cmd = _build_idcams_define_cmd(_get_idcams_cmd_lcd(self.get_data_set()))
+        create_cmd = _build_idcams_define_cmd(self.get_idcams_define())
         super().build_vsam_data_set(create_cmd)
 
     def init_data_set(self):  # type: () -> None
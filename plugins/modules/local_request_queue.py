@@ -22,6 +22,7 @@ author: Drew Hughes (@andrewhughes101)
 version_added: 2.1.0
 extends_documentation_fragment:
   - ibm.ibm_zos_cics.local_request_queue
+  - ibm.ibm_zos_cics.known_state
 '''
 
 
@@ -157,13 +158,14 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DataSet
 )
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._local_request_queue import (
+    SPACE_PRIMARY_DEFAULT,
+    SPACE_SECONDARY_DEFAULT,
+    SPACE_TYPE_DEFAULT,
     _get_idcams_cmd_lrq
 )
 
 
 DSN = "dfhlrq"
-SPACE_PRIMARY_DEFAULT = 4
-SPACE_SECONDARY_DEFAULT = 1
 SPACE_OPTIONS = [KILOBYTES, MEGABYTES, RECORDS, CYLINDERS, TRACKS]
 
 
@@ -183,7 +185,7 @@ class AnsibleLocalRequestQueueModule(DataSet):
             "default": SPACE_SECONDARY_DEFAULT
         })
         arg_spec[SPACE_TYPE].update({
-            "default": MEGABYTES,
+            "default": SPACE_TYPE_DEFAULT,
             "choices": SPACE_OPTIONS,
         })
         arg_spec[REGION_DATA_SETS]["options"].update({
@@ -209,8 +211,11 @@ class AnsibleLocalRequestQueueModule(DataSet):
         defs[REGION_DATA_SETS]["options"][DSN]["options"]["dsn"].pop("type")
         return defs
 
+    def get_idcams_define(self):  # type: () -> dict
+        return _get_idcams_cmd_lrq(self.get_data_set())
+
     def create_data_set(self):  # type: () -> None
-        create_cmd = _build_idcams_define_cmd(_get_idcams_cmd_lrq(self.get_data_set()))
+        create_cmd = _build_idcams_define_cmd(self.get_idcams_define())
         super().build_vsam_data_set(create_cmd)
 
 
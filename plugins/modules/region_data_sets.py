@@ -0,0 +1,655 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: region_data_sets
+short_description: Create or remove all the data sets of a CICS region at once
+description:
+  - Create and initialize, or remove, the region data sets used by a CICS® region, in as few program executions as possible.
+  - The module manages the same data sets as the M(ibm.ibm_zos_cics.global_catalog), M(ibm.ibm_zos_cics.local_catalog),
+    M(ibm.ibm_zos_cics.csd), M(ibm.ibm_zos_cics.td_intrapartition), M(ibm.ibm_zos_cics.local_request_queue),
+    M(ibm.ibm_zos_cics.aux_temp_storage), M(ibm.ibm_zos_cics.aux_trace) and M(ibm.ibm_zos_cics.transaction_dump) modules,
+    with the same attributes and default sizes.
+  - Every VSAM data set that has to be replaced is deleted and defined in a single IDCAMS execution, and every sequential
+    data set that has to be created is allocated in a single IEFBR14 execution. The local catalog, CSD and global catalog are then initialized.
+  - Use the O(state) option to specify the intended state for the data sets.
+author:
+  - Stewart Francis (@stewartfrancis)
+  - Tom Latham (@Tom-Latham)
+  - Sophie Green (@sophiegreen)
+  - Ya Qing Chen (@vera-chan)
+version_added: 2.3.0
+seealso:
+  - module: global_catalog
+  - module: local_catalog
+  - module: csd
+options:
+  data_sets:
+    description:
+      - The region data sets to manage.
+    type: list
+    elements: str
+    required: false
+    choices:
+      - dfhgcd
+      - dfhlcd
+      - dfhcsd
+      - dfhintra
+      - dfhlrq
+      - dfhtemp
+      - dfhauxt
+      - dfhbuxt
+      - dfhdmpa
+      - dfhdmpb
+    default:
+      - dfhgcd
+      - dfhlcd
+      - dfhcsd
+      - dfhintra
+      - dfhlrq
+      - dfhtemp
+      - dfhauxt
+      - dfhbuxt
+      - dfhdmpa
+      - dfhdmpb
+  volumes:
+    description:
+      - The volume(s) where the data sets are created. Use a string to define a singular volume or a list of strings for multiple volumes.
+    type: raw
+    required: false
+  region_data_sets:
+    description:
+      - The location of the region data sets to be created by using a template, for example,
+        C(REGIONS.ABCD0001.<< data_set_name >>).
+    type: dict
+    required: true
+    suboptions:
+      template:
+        description:
+          - The base location of the region data sets with a template.
+        required: false
+        type: str
+      dfhgcd:
+        description:
+          - Overrides the templated location for the global catalog data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the global catalog to override the template.
+            type: str
+            required: false
+      dfhlcd:
+        description:
+          - Overrides the templated location for the local catalog data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the local catalog to override the template.
+            type: str
+            required: false
+      dfhcsd:
+        description:
+          - Overrides the templated location for the CSD.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the CSD to override the template.
+            type: str
+            required: false
+      dfhintra:
+        description:
+          - Overrides the templated location for the intrapartition data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the intrapartition data set to override the template.
+            type: str
+            required: false
+      dfhlrq:
+        description:
+          - Overrides the templated location for the local request queue data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the local request queue to override the template.
+            type: str
+            required: false
+      dfhtemp:
+        description:
+          - Overrides the templated location for the auxiliary temporary storage data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the auxiliary temporary storage to override the template.
+            type: str
+            required: false
+      dfhauxt:
+        description:
+          - Overrides the templated location for the auxiliary trace A data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the auxiliary trace A to override the template.
+            type: str
+            required: false
+      dfhbuxt:
+        description:
+          - Overrides the templated location for the auxiliary trace B data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the auxiliary trace B to override the template.
+            type: str
+            required: false
+      dfhdmpa:
+        description:
+          - Overrides the templated location for the transaction dump A data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the transaction dump A to override the template.
+            type: str
+            required: false
+      dfhdmpb:
+        description:
+          - Overrides the templated location for the transaction dump B data set.
+        required: false
+        type: dict
+        suboptions:
+          dsn:
+            description:
+              - The data set name of the transaction dump B to override the template.
+            type: str
+            required: false
+  cics_data_sets:
+    description:
+      - The name of the C(SDFHLOAD) library of the CICS installation, for example, C(CICSTS61.CICS.SDFHLOAD).
+      - Required when O(state=initial) and O(data_sets) includes V(dfhgcd), V(dfhlcd) or V(dfhcsd),
+        which are initialized with the C(DFHRMUTL), C(DFHCCUTL) and C(DFHCSDUP) utilities in the C(SDFHLOAD) library.
+    type: dict
+    required: false
+    suboptions:
+      template:
+        description:
+          - The templated location of the C(SDFHLOAD) library.
+        required: false
+        type: str
+      sdfhload:
+        description:
+          - The location of the C(SDFHLOAD) library. If O(cics_data_sets.template) is provided, this value overrides the template.
+        type: str
+        required: false
+  state:
+    description:
+      - The intended state for the data sets, which the module aims to achieve.
+      - Specify V(absent) to remove the data sets entirely, if they exist.
+      - Specify V(initial) to create the data sets, or to replace existing data sets that have records with empty ones.
+        Existing empty data sets are left as they are, as by the modules that manage each data set.
+        The global catalog isn't replaced; it is created if it doesn't exist, and is set to make the next start of CICS an initial start.
+        The local catalog and CSD are initialized.
+    choices:
+      - "initial"
+      - "absent"
+    required: true
+    type: str
+'''
+
+
+EXAMPLES = r"""
+- name: Initialize all the data sets of a region
+  ibm.ibm_zos_cics.region_data_sets:
+    region_data_sets:
+      template: "REGIONS.ABCD0001.<< data_set_name >>"
+    cics_data_sets:
+      template: "CICSTS61.CICS.<< lib_name >>"
+    state: "initial"
+
+- name: Initialize the catalogs only, on a specific volume
+  ibm.ibm_zos_cics.region_data_sets:
+    region_data_sets:
+      template: "REGIONS.ABCD0001.<< data_set_name >>"
+    cics_data_sets:
+      template: "CICSTS61.CICS.<< lib_name >>"
+    data_sets:
+      - dfhgcd
+      - dfhlcd
+    volumes: "vserv1"
+    state: "initial"
+
+- name: Delete all the data sets of a region
+  ibm.ibm_zos_cics.region_data_sets:
+    region_data_sets:
+      template: "REGIONS.ABCD0001.<< data_set_name >>"
+    state: "absent"
+"""
+
+
+RETURN = r"""
+changed:
+  description: True if the state was changed, otherwise False.
+  returned: always
+  type: bool
+failed:
+  description: True if the Ansible task failed, otherwise False.
+  returned: always
+  type: bool
+data_sets:
+  description: The state of each data set, keyed by the names in O(data_sets).
+  returned: always
+  type: dict
+  contains:
+    name:
+      description: The name of the data set.
+      returned: always
+      type: str
+    start_state:
+      description:
+        - The state of the data set before the Ansible task runs.
+      returned: always
+      type: dict
+      contains:
+        data_set_organization:
+          description: The organization of the data set at the start of the Ansible task.
+          returned: always
+          type: str
+          sample: "VSAM"
+        exists:
+          description: True if the data set exists.
+          type: bool
+          returned: always
+    end_state:
+      description: The state of the data set at the end of the Ansible task.
+      returned: always
+      type: dict
+      contains:
+        data_set_organization:
+          description: The organization of the data set at the end of the Ansible task.
+          returned: always
+          type: str
+          sample: "VSAM"
+        exists:
+          description: True if the data set exists.
+          type: bool
+          returned: always
+executions:
+  description: A list of program executions performed during the Ansible task.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: A human-readable name for the program execution.
+      type: str
+      returned: always
+    rc:
+      description: The return code for the program execution.
+      type: int
+      returned: always
+    stdout:
+      description: The standard output stream returned from the program execution.
+      type: str
+      returned: always
+    stderr:
+      description: The standard error stream returned from the program execution.
+      type: str
+      returned: always
+msg:
+  description: A string containing an error message if applicable
+  returned: always
+  type: str
+"""
+
+from collections import OrderedDict
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import MVSExecutionException
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import (
+    ABSENT,
+    CICS_DATA_SETS,
+    INITIAL,
+    REGION_DATA_SETS,
+    SDFHLOAD,
+    STATE,
+    VOLUMES
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import _run_listds_batch
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._csd import (
+    _get_csdup_initilize_cmd,
+    _run_dfhcsdup
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._global_catalog import _run_dfhrmutl
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._icetool import _run_has_records
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._local_catalog import _run_dfhccutl
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._region_data_sets import (
+    DATA_SETS,
+    DEFINE,
+    DELETE,
+    SEQUENTIAL,
+    _get_define_cmd,
+    _get_delete_cmd,
+    _get_seq_definition,
+    _run_iefbr14_data_sets,
+    _run_idcams_commands
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._zoau_version_checker import _check_zoau_version
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import BetterArgParser
+
+DATA_SETS_OPTION = "data_sets"
+DSN = "dsn"
+STATE_OPTIONS = [ABSENT, INITIAL]
+GCD = "dfhgcd"
+LCD = "dfhlcd"
+CSD = "dfhcsd"
+AUTO_START_INIT = "AUTOINIT"
+NEXT_START_EMERGENCY = "EMERGENCY"
+
+
+class AnsibleRegionDataSetsModule(object):
+    def __init__(self):
+        self.changed = False
+        self.failed = False
+        self.msg = ""
+        self.executions = list()
+        self.names = OrderedDict()
+        self.start_states = dict()
+        self.states = dict()
+        self.target_state = ""
+        self.volumes = None
+        self.sdfhload = ""
+        self.autostart_override = ""
+        self.next_start = ""
+
+        self._module = AnsibleModule(
+            argument_spec=self._get_arg_spec(),
+        )
+        self.process_volume_arg()
+        self.validate_parameters()
+        try:
+            _check_zoau_version()
+        except ImportError as e:
+            self._fail(e.msg)
+
+    def get_result(self):  # type: () -> dict
+        return {
+            "changed": self.changed,
+            "failed": self.failed,
+            "executions": self.executions,
+            "data_sets": dict(
+                (key, {
+                    "name": name,
+                    "start_state": self.start_states.get(key, self._get_state(key)),
+                    "end_state": self._get_state(key),
+                }) for key, name in self.names.items()
+            ),
+            "msg": self.msg,
+        }
+
+    def _get_state(self, key):  # type: (str) -> dict
+        return dict(self.states.get(key) or dict(exists=False, data_set_organization="NONE"))
+
+    def get_data_set(self, key):  # type: (str) -> dict
+        # The same fields as DataSet.get_data_set, which the builders expect
+        return {
+            "name": self.names[key],
+            "unit": DATA_SETS[key]["unit"],
+            "primary": DATA_SETS[key]["primary"],
+            "secondary": DATA_SETS[key]["secondary"],
+            "volumes": self.volumes,
+            "sdfhload": self.sdfhload,
+        }
+
+    def _fail(self, msg):  # type: (str) -> None
+        self.failed = True
+        self.msg = msg
+        self._module.fail_json(**self.get_result())
+
+    def _exit(self):  # type: () -> None
+        self._module.exit_json(**self.get_result())
+
+    def _get_arg_spec(self):  # type: () -> dict
+        region_data_sets = {
+            "template": {
+                "type": "str",
+                "required": False,
+            },
+        }
+        for key in DATA_SETS:
+            region_data_sets[key] = {
+                "type": "dict",
+                "required": False,
+                "options": {
+                    DSN: {
+                        "type": "str",
+                        "required": False,
+                    },
+                },
+            }
+
+        return {
+            DATA_SETS_OPTION: {
+                "type": "list",
+                "elements": "str",
+                "choices": list(DATA_SETS),
+                "default": list(DATA_SETS),
+            },
+            VOLUMES: {
+                "type": "raw"
+            },
+            STATE: {
+                "type": "str",
+                "required": True,
+                "choices": STATE_OPTIONS
+            },
+            REGION_DATA_SETS: {
+                "type": "dict",
+                "required": True,
+                "options": region_data_sets,
+            },
+            CICS_DATA_SETS: {
+                "type": "dict",
+                "required": False,
+                "options": {
+                    "template": {
+                        "type": "str",
+                        "required": False,
+                    },
+                    SDFHLOAD: {
+                        "type": "str",
+                        "required": False,
+                    },
+                },
+            },
+        }
+
+    def get_arg_defs(self):  # type: () -> dict
+        """
+        Get the arg defs, which is a copy of the arg spec, but with certain types changed to the ones used by BetterArgParser
+        """
+        defs = self._get_arg_spec()
+        for key in DATA_SETS:
+            defs[REGION_DATA_SETS]["options"][key]["options"][DSN].update({
+                "arg_type": "data_set_base"
+            })
+            defs[REGION_DATA_SETS]["options"][key]["options"][DSN].pop("type")
+        defs[CICS_DATA_SETS]["options"][SDFHLOAD].update({
+            "arg_type": "data_set_base"
+        })
+        defs[CICS_DATA_SETS]["options"][SDFHLOAD].pop("type")
+
+        defs[VOLUMES].pop("type")
+        defs[VOLUMES]["arg_type"] = "list"
+        defs[VOLUMES]["elements"] = "volume"
+        return defs
+
+    def process_volume_arg(self):
+        """
+        Ensure Volumes is a string or list of strings
+        """
+        if self._module.params.get(VOLUMES):
+            volumes_param = self._module.params[VOLUMES]
+            if isinstance(volumes_param, str):
+                self._module.params[VOLUMES] = volumes_param.split()
+
+    def validate_parameters(self):  # type: () -> None
+        """
+        Use BetterArgParser to parse the parameters passed in, which also does some validation
+        """
+        try:
+            params = BetterArgParser(self.get_arg_defs()).parse_args(self._module.params)
+        except ValueError as e:
+            self._fail(str(e))
+        self.assign_parameters(params)
+
+    def assign_parameters(self, params):  # type: (dict) -> None
+        self.target_state = params[STATE]
+        if params.get(VOLUMES):
+            self.volumes = params[VOLUMES]
+
+        # In the order of DATA_SETS, whatever order they were given in
+        region_param = params[REGION_DATA_SETS]
+        for key in DATA_SETS:
+            if key not in params[DATA_SETS_OPTION]:
+                continue
+            dsn = (region_param.get(key) or {}).get(DSN)
+            if not dsn:
+                self._fail("No template or data set override found for {0}".format(key))
+            self.names[key] = dsn.upper()
+
+        sdfhload = (params.get(CICS_DATA_SETS) or {}).get(SDFHLOAD)
+        if sdfhload:
+            self.sdfhload = sdfhload.upper()
+        elif self.target_state == INITIAL and any(key in self.names for key in (GCD, LCD, CSD)):
+            self._fail("No template or library override found for {0}".format(SDFHLOAD))
+
+    def _run(self, function, *args, **kwargs):
+        # Runs a program, recording its executions and failing the module if
+        # it fails
+        try:
+            result = function(*args, **kwargs)
+        except MVSExecutionException as e:
+            self.executions.extend(e.executions)
+            self._fail(e.message)
+        if isinstance(result, tuple):
+            self.executions.extend(result[0])
+            return result[1:]
+        self.executions.extend(result)
+
+    def update_data_set_states(self):  # type: () -> None
+        states, = self._run(_run_listds_batch, list(self.names.values()))
+        for key, name in self.names.items():
+            self.states[key] = dict(
+                exists=states[name]["exists"],
+                data_set_organization=states[name]["data_set_organization"])
+
+    def exists(self, key):  # type: (str) -> bool
+        return self.states[key]["exists"]
+
+    def check_data_set_organizations(self):  # type: () -> None
+        for key, name in self.names.items():
+            expected = DATA_SETS[key]["dsorg"]
+            if self.exists(key) and self.states[key]["data_set_organization"] != expected:
+                self._fail("Data set {0} is not in expected format {1}.".format(name, expected))
+
+    def delete_data_sets(self):  # type: () -> None
+        commands = [
+            (DELETE, name, _get_delete_cmd(name))
+            for key, name in self.names.items() if self.exists(key)
+        ]
+        if commands:
+            self._run(_run_idcams_commands, commands)
+            self.changed = True
+
+    def init_data_sets(self):  # type: () -> None
+        if GCD in self.names and self.exists(GCD):
+            (self.autostart_override, self.next_start), = self._run(
+                _run_dfhrmutl, self.names[GCD], self.sdfhload)
+            self.check_emergency()
+
+        commands = []
+        definitions = []
+        for key, name in self.names.items():
+            # The global catalog is set to start CICS initially rather than
+            # replaced, as by global_catalog
+            if key == GCD and self.exists(key):
+                continue
+            if self.exists(key):
+                # An empty data set is left as it is, as by the module that
+                # manages it on its own
+                if not self.has_records(key):
+                    continue
+                commands.append((DELETE, name, _get_delete_cmd(name)))
+            if DATA_SETS[key]["dsorg"] == SEQUENTIAL:
+                definitions.append((key, _get_seq_definition(key, self.get_data_set(key))))
+            else:
+                commands.append((DEFINE, name, _get_define_cmd(key, self.get_data_set(key))))
+
+        if commands:
+            self._run(_run_idcams_commands, commands)
+            self.changed = True
+        if definitions:
+            self._run(_run_iefbr14_data_sets, definitions)
+            self.changed = True
+
+        if LCD in self.names:
+            self._run(_run_dfhccutl, self.get_data_set(LCD))
+        if CSD in self.names:
+            self._run(_run_dfhcsdup, self.get_data_set(CSD), _get_csdup_initilize_cmd())
+        if GCD in self.names and not (self.exists(GCD) and self.autostart_override == AUTO_START_INIT):
+            self._run(_run_dfhrmutl, self.names[GCD], self.sdfhload, cmd="SET_AUTO_START=AUTOINIT")
+            self.changed = True
+
+    def has_records(self, key):  # type: (str) -> bool
+        has_records, = self._run(_run_has_records, self.names[key], DATA_SETS[key]["dsorg"])
+        return has_records
+
+    def check_emergency(self):  # type: () -> None
+        if self.next_start and self.next_start.upper() == NEXT_START_EMERGENCY:
+            self._fail(
+                "Next start type is {0}. Potential data loss prevented."
+                .format(NEXT_START_EMERGENCY))
+
+    def main(self):  # type: () -> None
+        self.update_data_set_states()
+        self.start_states = dict((key, self._get_state(key)) for key in self.names)
+        self.check_data_set_organizations()
+
+        if self.target_state == ABSENT:
+            self.delete_data_sets()
+        else:
+            self.init_data_sets()
+
+        self.update_data_set_states()
+        self._exit()
+
+
+def main():
+    AnsibleRegionDataSetsModule().main()
+
+
+if __name__ == '__main__':
+    main()
@@ -189,6 +189,7 @@ import traceback
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import is_member
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import (
+    KNOWN_STATE,
     MEGABYTES,
     REGION_DATA_SETS,
     CICS_DATA_SETS,
@@ -207,7 +208,7 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import
     MVSExecutionException,
     _execution
 )
-from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import _run_listds
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set_utils import _run_listds, _run_listds_batch
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     ZOAUImportError
@@ -301,6 +302,8 @@ class AnsibleRegionJCLModule(DataSet):
         arg_spec[SPACE_TYPE].update({
             "default": MEGABYTES
         })
+        # The region_jcl action plugin doesn't cache data set state
+        arg_spec.pop(KNOWN_STATE)
         # Add all the unique arguments for the module
         arg_spec.update(self.init_argument_spec())
         return arg_spec
@@ -440,13 +443,18 @@ class AnsibleRegionJCLModule(DataSet):
     def update_data_set_state(self):   # type: () -> None
         try:
             if self.member:
+                # The base and the member are probed by the same IKJEFT01
                 self.base_data_set_name = self.name.split("(")[0]
 
-                listds_executions, self.base_exists, self.base_data_set_organization = _run_listds(self.base_data_set_name)
+                listds_executions, states = _run_listds_batch([self.base_data_set_name, self.name])
+                self.executions.extend(listds_executions)
+                self.base_exists = states[self.base_data_set_name]["exists"]
+                self.base_data_set_organization = states[self.base_data_set_name]["data_set_organization"]
+                self.exists = states[self.name]["exists"]
+                self.data_set_organization = states[self.name]["data_set_organization"]
+            else:
+                listds_executions, self.exists, self.data_set_organization = _run_listds(self.name)
                 self.executions.extend(listds_executions)
-
-            listds_executions, self.exists, self.data_set_organization = _run_listds(self.name)
-            self.executions.extend(listds_executions)
         except MVSExecutionException as e:
             self.executions.extend(e.executions)
             self._fail(e.message)
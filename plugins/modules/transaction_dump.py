@@ -19,6 +19,7 @@ author: Thomas Foyle (@tom-foyle)
 version_added: 2.1.0
 extends_documentation_fragment:
   - ibm.ibm_zos_cics.transaction_dump
+  - ibm.ibm_zos_cics.known_state
 '''
 
 
@@ -194,7 +195,6 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DESTINATION,
     DESTINATION_OPTIONS,
     DESTINATION_DEFAULT_VALUE,
-    MEGABYTES,
     REGION_DATA_SETS,
     SPACE_PRIMARY,
     SPACE_SECONDARY,
@@ -202,14 +202,15 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._data_set import
     DataSet
 )
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._transaction_dump import (
+    SPACE_PRIMARY_DEFAULT,
+    SPACE_SECONDARY_DEFAULT,
+    SPACE_TYPE_DEFAULT,
     _build_seq_data_set_definition_transaction_dump
 )
 
 
 DSN_A = "dfhdmpa"
 DSN_B = "dfhdmpb"
-SPACE_PRIMARY_DEFAULT = 20
-SPACE_SECONDARY_DEFAULT = 4
 
 
 class AnsibleTransactionDumpModule(DataSet):
@@ -238,7 +239,7 @@ class AnsibleTransactionDumpModule(DataSet):
             "default": SPACE_SECONDARY_DEFAULT
         })
         arg_spec[SPACE_TYPE].update({
-            "default": MEGABYTES
+            "default": SPACE_TYPE_DEFAULT
         })
         arg_spec[REGION_DATA_SETS]["options"].update({
             DSN_A: {
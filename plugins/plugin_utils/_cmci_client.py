@@ -0,0 +1,173 @@
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+# FOR INTERNAL USE IN THE COLLECTION ONLY.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# CMCI GET requests for plugins that run in the controller process, like the
+# cmci inventory and lookup plugins. AnsibleCMCIModule builds an
+# AnsibleModule, so they share its URL building and response parsing
+# instead.
+#
+# Clients are kept for the life of the process, one for each set of
+# connection details, together with the results of the requests they made.
+# Ansible templates lookups in a worker process for each task, so results
+# are shared by every lookup in a task, like one in a loop or a template.
+
+from ansible.module_utils.urls import Request
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
+    ACCEPT_ENCODING, CMCIRequestError, CMCIResponseParser, open_response,
+    request_error_message, _url_encode_params, _url_encode_string
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_broker import (
+    BrokerClient
+)
+from http.client import RemoteDisconnected
+from urllib.error import URLError
+from xml.parsers import expat
+import threading
+import time
+
+_OK = 1024
+_NODATA = 1027
+
+_CLIENTS = {}  # type: dict[tuple, CMCIClient]
+_CLIENTS_LOCK = threading.Lock()
+
+
+class CMCIClientError(Exception):
+    pass
+
+
+def get_client(scheme, host, port, user=None, password=None, cert=None,
+               key=None, ca=None, insecure=False, connection_broker=False):
+    # type: (str, str, int, str, str, str, str, str, bool, bool) -> CMCIClient
+    # Returns the process's client for these connection details
+    identity = (
+        scheme, host, port, user, password, cert, key, ca, insecure,
+        connection_broker
+    )
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(identity)
+        if client is None:
+            client = CMCIClient(
+                scheme, host, port, user=user, password=password, cert=cert,
+                key=key, ca=ca, insecure=insecure,
+                connection_broker=connection_broker
+            )
+            _CLIENTS[identity] = client
+        return client
+
+
+def clear_clients():  # type: () -> None
+    with _CLIENTS_LOCK:
+        _CLIENTS.clear()
+
+
+class CMCIClient(object):
+
+    def __init__(self, scheme, host, port, user=None, password=None,
+                 cert=None, key=None, ca=None, insecure=False,
+                 connection_broker=False):
+        # type: (str, str, int, str, str, str, str, str, bool, bool) -> None
+        self._base_url = '{0}://{1}:{2}/CICSSystemManagement/'.format(
+            scheme, host, port
+        )
+        self._insecure = insecure
+        self._results = {}  # type: dict[str, tuple[float, list[dict]]]
+        self._lock = threading.Lock()
+        self.requests = 0
+
+        # Certificates are preferred to basic authentication, as in
+        # AnsibleCMCIModule.init_session
+        if not (cert and key):
+            cert = key = None
+        if cert or not (user and password):
+            user = password = None
+
+        if connection_broker:
+            self._opener = BrokerClient(
+                scheme, host, port, user=user, password=password, cert=cert,
+                key=key, ca=ca, insecure=insecure
+            )
+        else:
+            self._opener = Request(
+                url_username=user, url_password=password, client_cert=cert,
+                client_key=key, ca_path=ca
+            )
+
+    def url(self, resource_type, context, scope=None, params=None):
+        # type: (str, str, str | None, dict[str, str | None] | None) -> str
+        url = self._base_url + resource_type.lower() + '/' + \
+            _url_encode_string(context) + '/'
+        if scope:
+            url = url + _url_encode_string(scope)
+        if params:
+            url = _url_encode_params(url, params)
+        return url
+
+    def get(self, url, resource_type, timeout=30, cache_ttl=0):
+        # type: (str, str, int, float) -> list[dict]
+        # Returns the records from a GET request, using a result of the same
+        # request up to cache_ttl seconds old
+        if cache_ttl > 0:
+            with self._lock:
+                cached = self._results.get(url)
+            if cached and time.monotonic() - cached[0] < cache_ttl:
+                return list(cached[1])
+
+        records = self._get(url, resource_type.lower(), timeout)
+        if cache_ttl > 0:
+            with self._lock:
+                self._results[url] = (time.monotonic(), list(records))
+        return records
+
+    def _get(self, url, resource_type, timeout):
+        # type: (str, str, int) -> list[dict]
+        with self._lock:
+            self.requests += 1
+        try:
+            if isinstance(self._opener, BrokerClient):
+                response = self._opener.open(
+                    'GET', url, timeout=timeout,
+                    headers={'Accept-Encoding': ACCEPT_ENCODING}
+                )
+            else:
+                response = self._opener.open(
+                    'GET', url,
+                    validate_certs=not self._insecure,
+                    timeout=timeout,
+                    headers={'Accept-Encoding': ACCEPT_ENCODING},
+                    decompress=False
+                )
+            document = CMCIResponseParser(resource_type)\
+                .parse(open_response(response))
+            response_node = document['response']
+            result_summary = response_node['resultsummary']
+            cpsm_response_code = int(result_summary['@api_response1'])
+        except KeyError as e:
+            raise CMCIClientError(
+                'Could not parse CMCI response: missing node "{0}"'
+                .format(e.args[0])
+            )
+        except (CMCIRequestError, URLError, RemoteDisconnected,
+                expat.ExpatError) as e:
+            raise CMCIClientError(request_error_message(e))
+
+        if cpsm_response_code == _NODATA:
+            return []
+        if cpsm_response_code != _OK:
+            raise CMCIClientError(
+                'CMCI request failed with response "{0}" reason "{1}"'
+                .format(
+                    result_summary['@api_response1_alt'],
+                    result_summary['@api_response2_alt'] or
+                    cpsm_response_code
+                )
+            )
+        records = (response_node.get('records') or {})\
+            .get(resource_type, [])
+        return [dict(record) for record in records]
@@ -7,8 +7,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ansible import constants as C
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
+from contextlib import contextmanager
+import fcntl
+import hashlib
+import json
+import os
 import re
+import tempfile
 
 REGION_DS_KEYS = ["dfhgcd", "dfhlcd", "dfhintra", "dfhlrq", "dfhtemp", "dfhauxt", "dfhbuxt", "dfhdmpa", "dfhdmpb", "dfhcsd", "dfhstart"]
 CICS_DS_KEYS = ["sdfhload", "sdfhauth", "sdfhlic"]
@@ -16,6 +24,10 @@ LE_DS_KEYS = ["sceecics", "sceerun", "sceerun2"]
 CPSM_DS_KEYS = ["seyuauth", "seyuload"]
 LIBRARY_KEYS = ["steplib", "dfhrpl"]
 
+DATA_SET_STATE_CACHE = "ibm_zos_cics_data_set_state"
+DATA_SET_STATE_CACHE_VAR = "ibm_zos_cics_data_set_state_cache"
+KNOWN_STATE = "known_state"
+
 
 class _DataSetActionPlugin(ActionBase):
     def _run(self, ds_name, module_name, cics_data_sets_required, tmp=None, task_vars=None):
@@ -44,6 +56,12 @@ class _DataSetActionPlugin(ActionBase):
                 "msg": e.args[0],
             })
         else:
+            cache = _DataSetStateCache(self._task, task_vars)
+            data_set_name = self.module_args["region_data_sets"][ds_name]["dsn"]
+            known_state = cache.get(data_set_name)
+            if known_state and self.module_args.get(KNOWN_STATE) is None:
+                self.module_args[KNOWN_STATE] = known_state
+
             return_structure.update(
                 self._execute_module(
                     module_name="ibm.ibm_zos_cics.{0}".format(module_name),
@@ -52,6 +70,7 @@ class _DataSetActionPlugin(ActionBase):
                     tmp=tmp,
                 )
             )
+            cache.update({data_set_name: return_structure})
 
         return return_structure
 
@@ -59,6 +78,92 @@ class _DataSetActionPlugin(ActionBase):
         _process_module_args(module_args, ds_name, cics_data_sets_required)
 
 
+class _DataSetStateCache(object):
+    """
+    The exists and data set organization of the data sets the modules have
+    seen on a host in this play, so that a module can skip its first LISTDS.
+    Only kept when the DATA_SET_STATE_CACHE_VAR variable is true, as nothing
+    here notices a data set changed outside the modules. Task results are run
+    in forked workers, so the cache is a file in the controller's local
+    temporary directory, which is removed at the end of the run, and every
+    read and update of it is made under a lock.
+    """
+
+    def __init__(self, task, task_vars):
+        task_vars = task_vars or {}
+        self.enabled = boolean(task_vars.get(DATA_SET_STATE_CACHE_VAR, False), strict=False)
+        play = task.get_play()
+        play_id = play._uuid if play else ""
+        # Tasks delegated to the same host share its data sets
+        host = task.delegate_to or task_vars.get("inventory_hostname", "")
+        digest = hashlib.sha256(json.dumps([play_id, host]).encode("utf-8")).hexdigest()
+        self.path = os.path.join(
+            C.DEFAULT_LOCAL_TMP,
+            "{0}_{1}.json".format(DATA_SET_STATE_CACHE, digest)
+        )
+
+    @contextmanager
+    def _locked(self, operation):
+        with open(self.path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self):  # type: () -> dict
+        try:
+            with open(self.path, "r") as cache_file:
+                data_sets = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        return data_sets if isinstance(data_sets, dict) else {}
+
+    def _save(self, data_sets):  # type: (dict) -> None
+        # Replaced rather than rewritten, so a reader never sees half a file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path))
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump(data_sets, cache_file)
+        os.rename(tmp_path, self.path)
+
+    def get(self, name):  # type: (str) -> dict | None
+        if not self.enabled:
+            return None
+        try:
+            with self._locked(fcntl.LOCK_SH):
+                state = self._load().get(name.upper())
+        except (IOError, OSError):
+            return None
+        if not isinstance(state, dict) or set(state) != {"exists", "data_set_organization"}:
+            return None
+        return state
+
+    def update(self, results):  # type: (dict) -> None
+        # Records the state at the end of each data set's task, from a dict
+        # of data set name to task result. The file is read again under the
+        # lock, so the entries written by other workers since are kept.
+        if not self.enabled and not os.path.exists(self.path):
+            return
+        try:
+            with self._locked(fcntl.LOCK_EX):
+                data_sets = self._load()
+                for name, result in results.items():
+                    name = name.upper()
+                    end_state = result.get("end_state") or {}
+                    # A failed task might have left the data set in any state,
+                    # and a task run without the cache might have changed it
+                    if not self.enabled or result.get("failed") or "exists" not in end_state:
+                        data_sets.pop(name, None)
+                    else:
+                        data_sets[name] = {
+                            "exists": end_state["exists"],
+                            "data_set_organization": end_state.get("data_set_organization", "NONE"),
+                        }
+                self._save(data_sets)
+        except (IOError, OSError):
+            pass
+
+
 def _process_module_args(module_args, ds_name, cics_data_sets_required):
     _process_region_data_set_args(module_args, ds_name)
     _process_data_set_unit_args(module_args)
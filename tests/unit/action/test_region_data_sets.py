@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.action.region_data_sets import _process_module_args
+import pytest
+
+
+def test_process_args_with_only_template():
+    module_args = {
+        "region_data_sets": {"template": "TEST.CICSPY1.RDEV.<< data_set_name >>"},
+        "cics_data_sets": {"template": "TEST.CICS.<< lib_name >>"},
+        "le_data_sets": {"template": "TEST.LE.<< lib_name >>"},
+        "state": "initial",
+    }
+    _process_module_args(module_args)
+    assert module_args == {
+        "region_data_sets": {
+            "template": "TEST.CICSPY1.RDEV.<< data_set_name >>",
+            "dfhauxt": {"dsn": "TEST.CICSPY1.RDEV.DFHAUXT"},
+            "dfhbuxt": {"dsn": "TEST.CICSPY1.RDEV.DFHBUXT"},
+            "dfhcsd": {"dsn": "TEST.CICSPY1.RDEV.DFHCSD"},
+            "dfhgcd": {"dsn": "TEST.CICSPY1.RDEV.DFHGCD"},
+            "dfhintra": {"dsn": "TEST.CICSPY1.RDEV.DFHINTRA"},
+            "dfhlcd": {"dsn": "TEST.CICSPY1.RDEV.DFHLCD"},
+            "dfhlrq": {"dsn": "TEST.CICSPY1.RDEV.DFHLRQ"},
+            "dfhtemp": {"dsn": "TEST.CICSPY1.RDEV.DFHTEMP"},
+            "dfhdmpa": {"dsn": "TEST.CICSPY1.RDEV.DFHDMPA"},
+            "dfhdmpb": {"dsn": "TEST.CICSPY1.RDEV.DFHDMPB"},
+        },
+        "cics_data_sets": {
+            "sdfhload": "TEST.CICS.SDFHLOAD",
+            "template": "TEST.CICS.<< lib_name >>"
+        },
+        "state": "initial",
+    }
+
+
+def test_process_args_with_selected_data_sets():
+    module_args = {
+        "region_data_sets": {
+            "template": "TEST.CICSPY1.RDEV.<< data_set_name >>",
+            "dfhtemp": {"dsn": "TEST.CICSPY1.TEMP"},
+            "dfhstart": {"dsn": "TEST.CICSPY1.START"},
+        },
+        "cics_data_sets": {"template": "TEST.CICS.<< lib_name >>"},
+        "data_sets": ["dfhtemp", "dfhauxt"],
+        "state": "initial",
+    }
+    _process_module_args(module_args)
+    assert module_args == {
+        "region_data_sets": {
+            "template": "TEST.CICSPY1.RDEV.<< data_set_name >>",
+            "dfhtemp": {"dsn": "TEST.CICSPY1.TEMP"},
+            "dfhauxt": {"dsn": "TEST.CICSPY1.RDEV.DFHAUXT"},
+        },
+        "data_sets": ["dfhtemp", "dfhauxt"],
+        "state": "initial",
+    }
+
+
+def test_process_args_absent_without_cics_data_sets():
+    module_args = {
+        "region_data_sets": {"template": "TEST.CICSPY1.RDEV.<< data_set_name >>"},
+        "data_sets": ["dfhgcd"],
+        "state": "absent",
+    }
+    _process_module_args(module_args)
+    assert module_args["region_data_sets"]["dfhgcd"] == {"dsn": "TEST.CICSPY1.RDEV.DFHGCD"}
+    assert "cics_data_sets" not in module_args
+
+
+def test_process_args_initial_without_cics_data_sets():
+    module_args = {
+        "region_data_sets": {"template": "TEST.CICSPY1.RDEV.<< data_set_name >>"},
+        "state": "initial",
+    }
+    with pytest.raises(KeyError) as e:
+        _process_module_args(module_args)
+    assert e.value.args[0] == "Required argument cics_data_sets not found"
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.errors import AnsibleFilterError
+from ansible_collections.ibm.ibm_zos_cics.plugins.filter.cmci_filter import (
+    FilterModule, cmci_filter
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_records import (
+    GZIP, NONE, RecordFileWriter
+)
+
+import pytest
+
+RECORDS = [
+    {'name': 'PROGA', 'status': 'ENABLED'},
+    {'name': 'PROGB', 'status': 'DISABLED'},
+    {'name': 'OTHER', 'status': 'ENABLED'},
+]
+
+
+def test_registered():
+    assert FilterModule().filters()['cmci_filter'] is cmci_filter
+
+
+def test_basic_filter():
+    assert cmci_filter(RECORDS, filter={'status': 'ENABLED'}) == \
+        [RECORDS[0], RECORDS[2]]
+
+
+def test_complex_filter():
+    assert cmci_filter(RECORDS, complex_filter={
+        'attribute': 'NAME', 'value': 'PROG*'
+    }) == [RECORDS[0], RECORDS[1]]
+
+
+def test_filter_and_complex_filter():
+    assert cmci_filter(RECORDS, filter={'status': 'ENABLED'}, complex_filter={
+        'attribute': 'NAME', 'value': 'PROG*'
+    }) == [RECORDS[0]]
+
+
+def test_no_filter():
+    assert cmci_filter(RECORDS) == RECORDS
+
+
+def test_cmci_get_result():
+    result = {'changed': False, 'records': RECORDS}
+
+    assert cmci_filter(result, filter={'name': 'OTHER'}) == [RECORDS[2]]
+
+
+def test_cmci_get_result_without_records():
+    assert cmci_filter({'changed': False}, filter={'name': 'OTHER'}) == []
+
+
+@pytest.mark.parametrize('compression', [NONE, GZIP])
+def test_record_file(tmp_path, compression):
+    dest = str(tmp_path / 'records.jsonl')
+    writer = RecordFileWriter(dest, compression)
+    writer.write_all(RECORDS)
+    writer.commit()
+
+    assert cmci_filter(dest, filter={'status': 'DISABLED'}) == [RECORDS[1]]
+
+
+def test_missing_record_file(tmp_path):
+    with pytest.raises(AnsibleFilterError) as e:
+        cmci_filter(str(tmp_path / 'missing.jsonl'))
+
+    assert 'could not read records' in str(e.value)
+
+
+def test_invalid_input():
+    with pytest.raises(AnsibleFilterError):
+        cmci_filter(42)
+
+
+def test_invalid_filter():
+    with pytest.raises(AnsibleFilterError) as e:
+        cmci_filter(RECORDS, complex_filter={'attribute': 'NAME'})
+
+    assert str(e.value) == 'cmci_filter: parameters are required together: ' \
+                           'attribute, value found in complex_filter'
+
+
+def test_filter_that_never_matches():
+    assert cmci_filter(RECORDS, filter={'name': 'PROGA'}, complex_filter={
+        'attribute': 'NAME', 'value': 'PROGB'
+    }) == []
@@ -14,6 +14,7 @@ from ansible.module_utils.common.text.converters import to_bytes
 from ansible.module_utils import basic
 from collections import OrderedDict
 from typing import List, Tuple
+import io
 import urllib
 import json
 import pytest
@@ -31,12 +32,27 @@ class CMCITestHelper:
     def __init__(self):
         self.expected = {}
         self.expected_list = False
+        self.stubs = {}
+        self.last_stub = None
 
     def stub_request(self, method, url, **kwargs):
-        if kwargs['status_code'] == 401:
-            Request.open = Mock(side_effect=HTTPError(url, kwargs['status_code'], kwargs['reason'], kwargs['headers'], fp=None))
+        # Requests are matched to stubs by method and URL, with the most recent
+        # stub answering any request that doesn't match. Stubbing the same
+        # request more than once answers with each stub in turn, repeating
+        # the last.
+        self.stubs.setdefault((method, url), []).append(kwargs)
+        self.last_stub = (method, url, kwargs)
+        Request.open = Mock(side_effect=self.open)
+
+    def open(self, method, url, *args, **kwargs):
+        stubs = self.stubs.get((method, url))
+        if stubs:
+            stub = stubs.pop(0) if len(stubs) > 1 else stubs[0]
         else:
-            Request.open = Mock(return_value=ResponseMock(method, url, **kwargs))
+            method, url, stub = self.last_stub
+        if stub['status_code'] >= 400:
+            raise HTTPError(url, stub['status_code'], stub['reason'], stub['headers'], fp=None)
+        return ResponseMock(method, url, **stub)
 
     def stub_delete(self, resource_type, success_count, *args, **kwargs):
         return self.stub_cmci(
@@ -344,12 +360,16 @@ class ResponseMock:
         self.reason = reason
         self.headers = headers
         self.text = text
+        # Bodies that are already bytes, like compressed ones, are sent as is
+        if isinstance(text, str):
+            text = text.encode()
+        self._body = io.BytesIO(text or b'')
 
     def readable(self) -> bool:
         return bool(self.text)
 
-    def read(self) -> bytes:
-        return self.text.encode()
+    def read(self, amt=None) -> bytes:
+        return self._body.read(amt)
 
     def getheader(self, name) -> str:
         return self.headers.get(name)
@@ -114,6 +114,22 @@ def IDCAMS_delete_run_name(run, data_set_name):
     return "IDCAMS - {0} - Run {1}".format(data_set_name, run)
 
 
+def IDCAMS_reset_run_name(run):
+    return "IDCAMS - Reset data set - Run {0}".format(run)
+
+
+def IDCAMS_reset_stdout(data_set_name):
+    return """
+        1IDCAMS  SYSTEM SERVICES                                           TIME: 10:04:57        01/29/24     PAGE      1
+        0
+          REPRO INFILE(EMPTY) OUTDATASET({0}) REUSE
+        0IDC0005I NUMBER OF RECORDS PROCESSED WAS 0
+        0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 0
+        0
+        0IDC0002I IDCAMS PROCESSING COMPLETE. MAXIMUM CONDITION CODE WAS 0
+    """.format(data_set_name)
+
+
 def IDCAMS_create_stdout(data_set_name):
     return """
         1IDCAMS  SYSTEM SERVICES                                           TIME: 10:04:57
@@ -205,6 +221,57 @@ def ICETOOL_name(count):
     return "ICETOOL - Get record count - Run {0}".format(count)
 
 
+def ICETOOL_first_record_name(count):
+    return "ICETOOL - Get first record - Run {0}".format(count)
+
+
+def LISTCAT_name(count):
+    return "IDCAMS - Get catalog statistics - Run {0}".format(count)
+
+
+def LISTCAT_stdout(data_set_name, rec_total, hi_u_rba=None, keylen=52, avglrecl=2041, maxlrecl=2041, cisize=2048, reuse=False):
+    if hi_u_rba is None:
+        hi_u_rba = rec_total * 2048
+    return """
+        1IDCAMS  SYSTEM SERVICES                                           TIME: 10:04:57        01/29/24     PAGE      1
+        0
+          LISTCAT ENTRIES('{0}') ALL
+        0CLUSTER ------- {0}
+              IN-CAT --- CATALOG.USER
+              HISTORY
+                DATASET-OWNER-----(NULL)     CREATION--------2024.029
+                RELEASE----------------2     EXPIRATION------0000.000
+        0   DATA ------- {0}.DATA
+              IN-CAT --- CATALOG.USER
+              ATTRIBUTES
+                KEYLEN{3:->16}     AVGLRECL{4:->12}     BUFSPACE------------4608     CISIZE{6:->14}
+                RKP--------------------0     MAXLRECL{5:->12}     EXCPEXIT----------(NULL)     CI/CA----------------360
+                SHROPTNS(2,3)   RECOVERY   UNIQUE   NOERASE   INDEXED   NOWRITECHK   UNORDERED   {7}   NONSPANNED
+              STATISTICS
+                REC-TOTAL{1:->16}     SPLITS-CI--------------0     EXCPS------------------0
+                REC-DELETED------------0     SPLITS-CA--------------0     EXTENTS----------------1
+                REC-INSERTED-----------0     FREESPACE-%CI---------10     SYSTEM-TIMESTAMP:
+                REC-UPDATED------------0     FREESPACE-%CA---------10          X'0000000000000000'
+              ALLOCATION
+                SPACE-TYPE---------TRACK     HI-A-RBA----------737280
+                SPACE-PRI-------------30     HI-U-RBA{2:->17}
+                SPACE-SEC--------------5
+              VOLUME
+                VOLSER------------VOL001     PHYREC-SIZE---------2048
+        0   INDEX ------ {0}.INDEX
+              IN-CAT --- CATALOG.USER
+              STATISTICS
+                REC-TOTAL--------------1     SPLITS-CI--------------0     EXCPS------------------0
+              ALLOCATION
+                SPACE-TYPE---------TRACK     HI-A-RBA-----------49152
+                SPACE-PRI--------------1     HI-U-RBA------------2048
+        1IDCAMS  SYSTEM SERVICES                                           TIME: 10:04:57        01/29/24     PAGE      2
+        0IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 0
+        0
+        0IDC0002I IDCAMS PROCESSING COMPLETE. MAXIMUM CONDITION CODE WAS 0
+    """.format(data_set_name, rec_total, hi_u_rba, keylen, avglrecl, maxlrecl, cisize, "REUSE" if reuse else "NOREUSE")
+
+
 def ICETOOL_stdout(count):
     return """
         1ICE200I 0 IDENTIFIER FROM CALLING PROGRAM IS 0001
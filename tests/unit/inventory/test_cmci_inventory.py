@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.module_utils.urls import Request
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from ansible_collections.ibm.ibm_zos_cics.plugins.inventory.cmci import InventoryModule
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
+    HOST, PORT, cmci_module, CMCITestHelper
+)
+
+from unittest.mock import Mock
+
+import pytest
+
+OPTIONS = {
+    'cmci_host': HOST,
+    'cmci_port': PORT,
+    'cmci_user': None,
+    'cmci_password': None,
+    'cmci_cert': None,
+    'cmci_key': None,
+    'cmci_ca': None,
+    'scheme': 'https',
+    'insecure': False,
+    'timeout': 30,
+    'contexts': ['PLEX1', 'PLEX2'],
+    'scope': None,
+    'concurrency': 10,
+    'hostname_attribute': 'cicsname',
+    'compose': {},
+    'groups': {},
+    'keyed_groups': [],
+    'strict': False
+}
+
+
+def region(name, mvs='MV2C', status='ACTIVE'):
+    return {'cicsname': name, 'jobname': name + 'J', 'mvssysname': mvs, 'cicsstatus': status}
+
+
+@pytest.fixture
+def plugin():
+    plugin = InventoryModule()
+    plugin.inventory = InventoryData()
+    plugin.templar = Templar(loader=DataLoader())
+    options = dict(OPTIONS)
+    plugin.get_option = options.get
+    plugin.options = options
+    return plugin
+
+
+def test_verify_file(plugin, tmp_path):
+    for name in ('cmci.yml', 'prod.cmci.yaml', 'hosts.yml'):
+        (tmp_path / name).write_text('plugin: ibm.ibm_zos_cics.cmci\n')
+
+    assert plugin.verify_file(str(tmp_path / 'cmci.yml'))
+    assert plugin.verify_file(str(tmp_path / 'prod.cmci.yaml'))
+    assert not plugin.verify_file(str(tmp_path / 'hosts.yml'))
+
+
+def test_get_regions(plugin, cmci_module):  # type: (InventoryModule, CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsrgn', [region('REGION1'), region('REGION2', 'MV2D')], context='PLEX1')
+    cmci_module.stub_records('GET', 'cicsrgn', [region('REGION3', status='INACTIVE')], context='PLEX2')
+
+    regions = plugin.get_regions()
+
+    assert regions == {
+        'PLEX1': [region('REGION1'), region('REGION2', 'MV2D')],
+        'PLEX2': [region('REGION3', status='INACTIVE')]
+    }
+    assert sorted(call.args[1] for call in Request.open.call_args_list) == [
+        'https://example.com:12345/CICSSystemManagement/cicsrgn/PLEX1/',
+        'https://example.com:12345/CICSSystemManagement/cicsrgn/PLEX2/'
+    ]
+
+
+def test_get_regions_nodata(plugin, cmci_module):  # type: (InventoryModule, CMCITestHelper) -> None
+    plugin.options['contexts'] = ['PLEX1']
+    cmci_module.stub_nodata('GET', 'cicsrgn', context='PLEX1')
+
+    assert plugin.get_regions() == {'PLEX1': []}
+
+
+def test_get_regions_failure(plugin, cmci_module):  # type: (InventoryModule, CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsrgn', [region('REGION1')], context='PLEX1')
+    cmci_module.stub_request(
+        'GET',
+        'https://example.com:12345/CICSSystemManagement/cicsrgn/PLEX2/',
+        text='Not authorized',
+        headers={'content-type': 'text/html'},
+        status_code=401,
+        reason='Not authorized'
+    )
+
+    with pytest.raises(AnsibleError) as e:
+        plugin.get_regions()
+
+    assert str(e.value) == \
+        'Could not get CICS regions from CMCI. PLEX2: CMCI request returned non-OK status: Not authorized'
+
+
+def test_populate(plugin):  # type: (InventoryModule) -> None
+    plugin.options['keyed_groups'] = [{'key': 'cicsrgn_jobname', 'prefix': 'job'}]
+
+    plugin.populate({
+        'PLEX1': [region('REGION1'), region('REGION2', 'MV2D')],
+        'PLEX2': [region('REGION3', status='INACTIVE'), {'jobname': 'NONAME'}]
+    })
+
+    groups = plugin.inventory.groups
+    assert sorted(plugin.inventory.hosts) == ['REGION1', 'REGION2', 'REGION3']
+    assert sorted(h.name for h in groups['cicsplex_plex1'].hosts) == ['REGION1', 'REGION2']
+    assert sorted(h.name for h in groups['mvs_mv2c'].hosts) == ['REGION1', 'REGION3']
+    assert sorted(h.name for h in groups['status_active'].hosts) == ['REGION1', 'REGION2']
+    assert [h.name for h in groups['status_inactive'].hosts] == ['REGION3']
+    assert [h.name for h in groups['job_REGION2J'].hosts] == ['REGION2']
+
+    host_vars = plugin.inventory.get_host('REGION3').vars
+    assert host_vars['cmci_context'] == 'PLEX2'
+    assert host_vars['cicsrgn_jobname'] == 'REGION3J'
+    assert host_vars['cicsrgn_cicsstatus'] == 'INACTIVE'
+
+
+def test_parse_uses_cache(plugin, cmci_module, tmp_path):  # type: (InventoryModule, CMCITestHelper, object) -> None
+    plugin.options['cache'] = True
+    plugin._read_config_data = Mock()
+    plugin._cache = {}
+    path = str(tmp_path / 'cmci.yml')
+    cmci_module.stub_records('GET', 'cicsrgn', [region('REGION1')])
+
+    plugin.parse(InventoryData(), None, path, cache=False)
+    plugin.parse(InventoryData(), None, path, cache=True)
+
+    assert Request.open.call_count == 2
+    assert plugin._cache[plugin.get_cache_key(path)] == {'PLEX1': [region('REGION1')], 'PLEX2': [region('REGION1')]}
+    assert sorted(plugin.inventory.hosts) == ['REGION1']
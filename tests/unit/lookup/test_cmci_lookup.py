@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils.urls import Request
+from ansible_collections.ibm.ibm_zos_cics.plugins.lookup.cmci import LookupModule
+from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils._cmci_client import clear_clients
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
+    HOST, PORT, cmci_module, create_delete_bad_response, CMCITestHelper
+)
+
+import pytest
+
+OPTIONS = {
+    'cmci_host': HOST,
+    'cmci_port': PORT,
+    'cmci_user': None,
+    'cmci_password': None,
+    'cmci_cert': None,
+    'cmci_key': None,
+    'cmci_ca': None,
+    'scheme': 'https',
+    'insecure': False,
+    'timeout': 30,
+    'context': 'CICSEX56',
+    'scope': 'IYCWEMW2',
+    'filter': None,
+    'complex_filter': None,
+    'cache_ttl': 60,
+    'connection_broker': False
+}
+
+PROGRAMS = [{'program': 'PROG1', 'status': 'ENABLED'}, {'program': 'PROG2', 'status': 'DISABLED'}]
+
+
+def lookup(terms, **kwargs):
+    plugin = LookupModule()
+    options = dict(OPTIONS, **kwargs)
+    plugin.set_options = lambda var_options=None, direct=None: None
+    plugin.get_option = options.get
+    return plugin.run(terms)
+
+
+@pytest.fixture(autouse=True)
+def clients():
+    clear_clients()
+    yield
+    clear_clients()
+
+
+def test_lookup(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', PROGRAMS, scope='IYCWEMW2')
+
+    assert lookup(['CICSProgram']) == PROGRAMS
+    assert Request.open.call_count == 1
+
+
+def test_lookup_cached(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', PROGRAMS, scope='IYCWEMW2')
+
+    for dummy in range(3):
+        assert lookup(['CICSProgram']) == PROGRAMS
+
+    assert Request.open.call_count == 1
+
+
+def test_lookup_not_cached(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', PROGRAMS, scope='IYCWEMW2')
+
+    for dummy in range(3):
+        assert lookup(['CICSProgram'], cache_ttl=0) == PROGRAMS
+
+    assert Request.open.call_count == 3
+
+
+def test_lookup_cached_records_are_copies(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', PROGRAMS, scope='IYCWEMW2')
+
+    lookup(['CICSProgram']).append({'program': 'PROG3'})
+
+    assert lookup(['CICSProgram']) == PROGRAMS
+
+
+def test_lookup_several_types(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', PROGRAMS, scope='IYCWEMW2')
+    cmci_module.stub_records('GET', 'cicslocaltransaction', [{'tranid': 'TRN1'}], scope='IYCWEMW2')
+
+    assert lookup(['CICSProgram', 'CICSLocalTransaction']) == PROGRAMS + [{'tranid': 'TRN1'}]
+
+
+def test_lookup_filter(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records(
+        'GET', 'cicsprogram', PROGRAMS[:1], scope='IYCWEMW2',
+        parameters='?CRITERIA=%28PROGRAM%3D%27PROG1%27%29'
+    )
+
+    assert lookup(['CICSProgram'], filter={'PROGRAM': 'PROG1'}) == PROGRAMS[:1]
+    assert Request.open.call_args.args[1].endswith('/IYCWEMW2?CRITERIA=%28PROGRAM%3D%27PROG1%27%29')
+
+
+def test_lookup_complex_filter(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records(
+        'GET', 'cicsprogram', PROGRAMS[:1], scope='IYCWEMW2',
+        parameters='?CRITERIA=PROGRAM%3D%27PROG1%27'
+    )
+
+    assert lookup(['CICSProgram'], complex_filter={'attribute': 'PROGRAM', 'value': 'PROG1'}) == PROGRAMS[:1]
+    assert Request.open.call_args.args[1].endswith('/IYCWEMW2?CRITERIA=PROGRAM%3D%27PROG1%27')
+
+
+def test_lookup_filters_mutually_exclusive(cmci_module):  # type: (CMCITestHelper) -> None
+    with pytest.raises(AnsibleLookupError, match='filter and complex_filter are mutually exclusive'):
+        lookup(
+            ['CICSProgram'],
+            filter={'PROGRAM': 'PROG1'},
+            complex_filter={'attribute': 'PROGRAM', 'value': 'PROG1'}
+        )
+
+
+def test_lookup_nodata(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_nodata('GET', 'cicsprogram', scope='IYCWEMW2')
+
+    assert lookup(['CICSProgram']) == []
+
+
+def test_lookup_error(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_cmci('GET', 'cicsprogram', scope='IYCWEMW2', response_dict=create_delete_bad_response(0))
+
+    with pytest.raises(AnsibleLookupError, match='Could not get CICSProgram from CMCI: CMCI request failed with response "TABLEERROR" reason "DATAERROR"'):
+        lookup(['CICSProgram'])
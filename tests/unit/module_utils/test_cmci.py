@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import (
+    CMCIRequestError, CMCIResponseParser, CMCIResponseReader, read_error_node
+)
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
+    create_records_response, create_feedback_response
+)
+from collections import OrderedDict
+from xml.parsers import expat
+
+import gzip
+import io
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+import pytest
+import xmltodict
+import zlib
+
+NAMESPACES = {
+    'http://www.ibm.com/xmlns/prod/CICS/smw2int': None,
+    'http://www.w3.org/2001/XMLSchema-instance': None
+}
+
+
+def program_records(count):
+    return [
+        OrderedDict([
+            ('_keydata', 'C1D5E2C9{0:08X}'.format(i)),
+            ('program', 'PROG{0:04d}'.format(i)),
+            ('status', 'ENABLED' if i % 2 else 'DISABLED'),
+            ('language', 'COBOL'),
+            ('usecount', str(i)),
+            ('eyu_cicsname', 'IYCWEMW2'),
+            ('librarydsn', 'ANSIBLE.PROGRAM.LIB'),
+            ('changetime', '2020-12-15T02:34:31.000000+00:00'),
+        ]) for i in range(count)
+    ]
+
+
+def xmltodict_records(body, resource_type):
+    # The previous whole-document path, used as the reference for the parser
+    document = xmltodict.parse(
+        str(body.decode()),
+        process_namespaces=True,
+        namespaces=NAMESPACES,
+        force_list=(resource_type, 'feedback')
+    )
+    return [
+        OrderedDict([(k[1:], v) for k, v in n.items()])
+        for n in document['response']['records'][resource_type]
+    ]
+
+
+def records_body(records):
+    return xmltodict.unparse(
+        create_records_response('cicsprogram', records)
+    ).encode()
+
+
+def test_parser_matches_xmltodict_records():
+    records = program_records(50)
+    body = records_body(records)
+
+    document = CMCIResponseParser('cicsprogram').parse(io.BytesIO(body))
+
+    actual = document['response']['records']['cicsprogram']
+    assert actual == xmltodict_records(body, 'cicsprogram')
+    assert actual == records
+    assert all(isinstance(r, OrderedDict) for r in actual)
+    assert [list(r.keys()) for r in actual] == [list(r.keys()) for r in records]
+
+
+def test_parser_single_record_is_a_list():
+    body = records_body(program_records(1))
+
+    document = CMCIResponseParser('cicsprogram').parse(io.BytesIO(body))
+
+    assert document['response']['records']['cicsprogram'] == program_records(1)
+
+
+def test_parser_reads_result_summary_with_prefixes():
+    body = records_body(program_records(2))
+
+    document = CMCIResponseParser('cicsprogram').parse(io.BytesIO(body))
+
+    assert document['response']['@connect_version'] == '0560'
+    assert document['response']['resultsummary'] == OrderedDict([
+        ('@api_response1', '1024'),
+        ('@api_response2', '0'),
+        ('@api_response1_alt', 'OK'),
+        ('@api_response2_alt', ''),
+        ('@recordcount', '2'),
+        ('@displayed_recordcount', '2')
+    ])
+
+
+def test_parser_feedback_matches_xmltodict():
+    body = xmltodict.unparse(create_feedback_response([
+        {
+            'action': 'INSTALL',
+            'eibfn_alt': 'CREATE',
+            'installerror': [
+                {'cresp1': '16', 'ressname': 'ONE'},
+                {'cresp1': '16', 'ressname': 'TWO'}
+            ]
+        },
+        {
+            'action': 'INSTALL',
+            'inconsistentscope': [{'targetassignment': 'A'}]
+        }
+    ])).encode()
+
+    document = CMCIResponseParser('cicsprogram').parse(io.BytesIO(body))
+    expected = xmltodict.parse(
+        body.decode(),
+        process_namespaces=True,
+        namespaces=NAMESPACES,
+        force_list=('cicsprogram', 'feedback')
+    )
+
+    assert read_error_node(document['response']['errors']['feedback']) == \
+        read_error_node(expected['response']['errors']['feedback'])
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_parser_handles_any_chunk_boundary(chunk_size):
+    records = program_records(20)
+    body = records_body(records)
+
+    document = CMCIResponseParser('cicsprogram')\
+        .parse(io.BytesIO(body), chunk_size=chunk_size)
+
+    assert document['response']['records']['cicsprogram'] == records
+
+
+def test_parser_invalid_document():
+    with pytest.raises(expat.ExpatError):
+        CMCIResponseParser('cicsprogram').parse(io.BytesIO(b'<response><x></response>'))
+
+
+def test_parser_empty_document():
+    with pytest.raises(expat.ExpatError):
+        CMCIResponseParser('cicsprogram').parse(io.BytesIO(b''))
+
+
+# Benchmarks against large responses, which take several seconds, only run
+# when CMCI_BENCHMARKS is set
+benchmark = pytest.mark.skipif(
+    not os.environ.get('CMCI_BENCHMARKS'), reason='Set CMCI_BENCHMARKS to run the benchmarks'
+)
+
+
+def measure(fn):
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+@benchmark
+def test_parser_benchmark_against_xmltodict():
+    # Peak memory of the streaming parser against the previous
+    # decode + xmltodict.parse + read_node path for a large PROGRAM response
+    count = 10000
+    body = records_body(program_records(count))
+
+    old, old_peak = measure(
+        lambda: xmltodict_records(io.BytesIO(body).read(), 'cicsprogram')
+    )
+    new, new_peak = measure(
+        lambda: CMCIResponseParser('cicsprogram')
+        .parse(io.BytesIO(body))['response']['records']['cicsprogram']
+    )
+
+    assert new == old
+    # The records list is the only copy the streaming parser keeps
+    assert new_peak < old_peak
+
+
+def wide_program_records(count):
+    # CICSProgram has dozens of attributes, most of which are rarely needed
+    extra = [('attribute{0:02d}'.format(i), 'VALUE{0:02d}'.format(i)) for i in range(32)]
+    return [OrderedDict(list(record.items()) + extra) for record in program_records(count)]
+
+
+def test_parser_projection():
+    body = records_body(program_records(3))
+
+    records = CMCIResponseParser('cicsprogram', projection=['program', 'status', 'nosuchattribute'])\
+        .parse(io.BytesIO(body))['response']['records']['cicsprogram']
+
+    assert records == [
+        OrderedDict([('program', 'PROG0000'), ('status', 'DISABLED')]),
+        OrderedDict([('program', 'PROG0001'), ('status', 'ENABLED')]),
+        OrderedDict([('program', 'PROG0002'), ('status', 'DISABLED')])
+    ]
+
+
+def test_parser_projection_namespaced_attributes():
+    body = (
+        '<response xmlns="http://www.ibm.com/xmlns/prod/CICS/smw2int" xmlns:x="urn:example">'
+        '<resultsummary api_response1="1024" api_response2="0" api_response1_alt="OK" '
+        'api_response2_alt="" recordcount="1"/>'
+        '<records><cicsprogram x:program="PROG1" x:status="ENABLED" language="COBOL"/></records>'
+        '</response>'
+    ).encode()
+
+    records = CMCIResponseParser('cicsprogram', projection=['program', 'status'])\
+        .parse(io.BytesIO(body))['response']['records']['cicsprogram']
+
+    assert records == [OrderedDict([('program', 'PROG1'), ('status', 'ENABLED')])]
+
+
+@pytest.mark.parametrize('count', [200, pytest.param(50000, marks=benchmark)])
+def test_parser_projection_result_size(count):
+    # Result size for a PROGRAM response, with and without a projection of
+    # two attributes
+    body = records_body(wide_program_records(count))
+
+    def parse(projection):
+        return CMCIResponseParser('cicsprogram', projection=projection)\
+            .parse(io.BytesIO(body))['response']['records']['cicsprogram']
+
+    full = parse(None)
+    projected = parse(['program', 'status'])
+    full_size = len(json.dumps(full))
+    projected_size = len(json.dumps(projected))
+
+    assert len(projected) == count
+    assert projected[1] == OrderedDict([('program', 'PROG0001'), ('status', 'ENABLED')])
+    assert projected_size * 10 < full_size
+
+
+def compress(body, content_encoding):
+    if content_encoding == 'gzip':
+        return gzip.compress(body)
+    if content_encoding == 'raw-deflate':
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        return compressor.compress(body) + compressor.flush()
+    return zlib.compress(body)
+
+
+@pytest.mark.parametrize('content_encoding, header', [
+    ('gzip', 'gzip'),
+    ('deflate', 'deflate'),
+    ('raw-deflate', 'deflate'),
+    ('identity', None)
+])
+def test_reader_decompresses(content_encoding, header):
+    body = records_body(program_records(500))
+    sent = body if content_encoding == 'identity' else compress(body, content_encoding)
+
+    reader = CMCIResponseReader(io.BytesIO(sent), header)
+    records = CMCIResponseParser('cicsprogram').parse(reader)['response']['records']['cicsprogram']
+
+    assert records == xmltodict_records(body, 'cicsprogram')
+    assert reader.received_bytes == len(sent)
+    assert reader.uncompressed_bytes == len(body)
+
+
+def test_reader_bounds_each_read():
+    body = records_body(program_records(2000))
+    reader = CMCIResponseReader(io.BytesIO(gzip.compress(body)), 'gzip')
+
+    chunks = []
+    while True:
+        chunk = reader.read(1024)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    assert b''.join(chunks) == body
+    assert max(len(chunk) for chunk in chunks) <= 1024
+
+
+def test_reader_invalid_compressed_data():
+    reader = CMCIResponseReader(io.BytesIO(b'<response>not compressed</response>'), 'gzip')
+
+    with pytest.raises(CMCIRequestError):
+        reader.read()
+
+
+def test_reader_unsupported_encoding():
+    with pytest.raises(CMCIRequestError) as exc_info:
+        CMCIResponseReader(io.BytesIO(b''), 'br')
+
+    assert str(exc_info.value) == 'CMCI response has an unsupported content encoding: br'
+
+
+# Modules that only the paths that need them import, so every other CMCI
+# module invocation starts without them
+LAZY_IMPORTS = [
+    'xmltodict',
+    'glob',
+    'concurrent.futures',
+    'ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_broker',
+    'ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_cache',
+    'ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_metrics',
+    'ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_retry'
+]
+
+# Import time a CMCI module may add, as a fraction of the time taken to import
+# the Ansible module_utils every module needs. Measured against that rather
+# than a fixed time, so a loaded worker slows both. The collection's own
+# imports take a fifth of it.
+IMPORT_TIME_RATIO = 0.5
+
+
+def import_cmci_module(name):  # type: (str) -> tuple[float, float, list[str]]
+    # A new interpreter, so nothing has been imported yet, as in AnsiballZ
+    code = (
+        'import sys, time\n'
+        'start = time.perf_counter()\n'
+        'import ansible.module_utils.basic, ansible.module_utils.urls\n'
+        'print(time.perf_counter() - start)\n'
+        'start = time.perf_counter()\n'
+        'import ansible_collections.ibm.ibm_zos_cics.plugins.modules.{0}\n'
+        'print(time.perf_counter() - start)\n'
+        'print(" ".join(sys.modules))\n'
+    ).format(name)
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True
+    ).stdout.splitlines()
+    return float(output[0]), float(output[1]), output[2].split()
+
+
+@pytest.mark.parametrize('name', ['cmci_get', 'cmci_create', 'cmci_wait'])
+def test_cmci_module_lazy_imports(name):
+    dummy, dummy, modules = import_cmci_module(name)
+
+    assert [module for module in LAZY_IMPORTS if module in modules] == []
+
+
+@pytest.mark.parametrize('name', ['cmci_get', 'cmci_create', 'cmci_wait'])
+def test_cmci_module_import_time(name):
+    baseline, elapsed, dummy = import_cmci_module(name)
+
+    assert elapsed < baseline * IMPORT_TIME_RATIO
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _cmci_broker
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_broker import (
+    BrokerClient, CMCIBroker
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_get
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
+    CONTEXT, AnsibleExitJson, set_module_args, exit_json, fail_json, create_records_response
+)
+from ansible.module_utils import basic
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import pytest
+import xmltodict
+
+RECORDS = [{'program': 'PROG1', 'status': 'ENABLED'}, {'program': 'PROG2', 'status': 'DISABLED'}]
+
+
+class CMCIStandIn(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.client_address[1], self.path, self.headers.get('Authorization')))
+        if self.path.startswith('/missing'):
+            self.send_response(404, 'Not found')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = xmltodict.unparse(create_records_response('cicsprogram', RECORDS)).encode()
+        compressed = 'gzip' in (self.headers.get('Accept-Encoding') or '')
+        if compressed:
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml; charset=utf-8')
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), CMCIStandIn)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def broker_directory(monkeypatch):
+    # Each test has its own brokers, secret and sockets. The directory is
+    # short, as Unix socket paths are limited to about 100 characters.
+    directory = tempfile.mkdtemp(prefix='cmci')
+    monkeypatch.setattr(_cmci_broker, 'broker_directory', lambda: directory)
+    yield directory
+    shutil.rmtree(directory)
+
+
+@pytest.fixture(autouse=True)
+def brokers(monkeypatch):
+    # Brokers run as threads of the test process, never as daemons
+    started = []
+
+    def spawn(path, config):
+        broker = CMCIBroker(path, **config)
+        thread = threading.Thread(target=broker.serve_forever)
+        thread.daemon = True
+        thread.start()
+        started.append((broker, thread))
+
+    monkeypatch.setattr(_cmci_broker, 'spawn_broker', spawn)
+    yield spawn, started
+    for broker, thread in started:
+        broker.shutdown()
+        thread.join(5)
+
+
+def client(server, spawn, **kwargs):
+    return BrokerClient('http', '127.0.0.1', server.server_address[1], spawn=spawn, **kwargs)
+
+
+def test_broker_relays_response(server, brokers):
+    spawn, started = brokers
+    response = client(server, spawn).open('GET', 'http://127.0.0.1/CICSSystemManagement/cicsprogram/PLEX/?CRITERIA=X')
+
+    assert response.status == 200
+    assert response.getheader('content-type') == 'application/xml; charset=utf-8'
+    assert xmltodict.parse(response.read()) == xmltodict.parse(
+        xmltodict.unparse(create_records_response('cicsprogram', RECORDS))
+    )
+    assert server.requests[0][1] == '/CICSSystemManagement/cicsprogram/PLEX/?CRITERIA=X'
+    assert len(started) == 1
+
+
+def test_broker_reuses_connection(server, brokers):
+    spawn, started = brokers
+    broker_client = client(server, spawn)
+
+    for i in range(5):
+        response = broker_client.open('GET', 'http://127.0.0.1/CICSSystemManagement/cicsprogram/PLEX/')
+        response.read()
+
+    # One broker, and every request arrived on the same client port
+    assert len(started) == 1
+    assert len(server.requests) == 5
+    assert len(set(port for port, path, auth in server.requests)) == 1
+
+
+def test_broker_sends_basic_auth(server, brokers):
+    spawn, started = brokers
+    client(server, spawn, user='user', password='pass').open('GET', 'http://127.0.0.1/').read()
+
+    assert server.requests[0][2] == 'Basic dXNlcjpwYXNz'
+
+
+def test_broker_keyed_by_credentials(server, brokers):
+    spawn, started = brokers
+    first = client(server, spawn, user='user', password='one')
+    second = client(server, spawn, user='user', password='two')
+
+    first.open('GET', 'http://127.0.0.1/').read()
+    second.open('GET', 'http://127.0.0.1/').read()
+
+    assert first.path != second.path
+    assert len(started) == 2
+
+
+def test_broker_key_is_keyed_by_secret(broker_directory):
+    identity = json.dumps(['http', 'host', 1, 'user', 'pass', None, None, None, False])
+    key = _cmci_broker.broker_key('http', 'host', 1, 'user', 'pass')
+
+    # The socket name can't be checked against guessed credentials
+    assert key != hashlib.sha256(identity.encode()).hexdigest()
+    assert key == _cmci_broker.broker_key('http', 'host', 1, 'user', 'pass')
+    secret = os.path.join(broker_directory, 'secret')
+    assert os.stat(secret).st_mode & 0o777 == 0o600
+
+    os.unlink(secret)
+    assert _cmci_broker.broker_key('http', 'host', 1, 'user', 'pass') != key
+
+
+def test_broker_directory_must_be_private(broker_directory):
+    os.chmod(broker_directory, 0o755)
+
+    with pytest.raises(PermissionError):
+        _cmci_broker.broker_key('http', 'host', 1)
+
+
+def test_broker_http_error(server, brokers):
+    spawn, started = brokers
+    with pytest.raises(HTTPError) as exc_info:
+        client(server, spawn).open('GET', 'http://127.0.0.1/missing')
+
+    assert exc_info.value.code == 404
+    assert exc_info.value.reason == 'Not found'
+
+
+def test_broker_connection_error(brokers):
+    spawn, started = brokers
+    broker_client = BrokerClient('http', '127.0.0.1', 1, spawn=spawn)
+
+    with pytest.raises(URLError):
+        broker_client.open('GET', 'http://127.0.0.1:1/')
+
+
+def test_broker_idle_eviction(server, brokers):
+    spawn, started = brokers
+    broker_client = client(server, spawn, idle_timeout=1)
+    broker_client.open('GET', 'http://127.0.0.1/').read()
+
+    # The broker shuts down once idle, and the next request starts another
+    started[0][1].join(5)
+    assert not started[0][1].is_alive()
+    assert not os.path.exists(broker_client.path)
+
+    broker_client.open('GET', 'http://127.0.0.1/').read()
+    assert len(started) == 2
+    assert len(set(port for port, path, auth in server.requests)) == 2
+
+
+def test_cmci_get_through_broker(server, brokers, monkeypatch):
+    spawn, started = brokers
+    monkeypatch.setattr(basic.AnsibleModule, 'exit_json', exit_json)
+    monkeypatch.setattr(basic.AnsibleModule, 'fail_json', fail_json)
+
+    set_module_args({
+        'cmci_host': '127.0.0.1',
+        'cmci_port': server.server_address[1],
+        'scheme': 'http',
+        'context': CONTEXT,
+        'type': 'CICSProgram',
+        'connection_broker': True,
+        'timings': True
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    result = exc_info.value.args[0]
+    assert result['records'] == RECORDS
+    assert result['record_count'] == 2
+    assert result['response_size']['content_encoding'] == 'gzip'
+    assert result['response_size']['received'] < result['response_size']['uncompressed']
+    timings, = result['timings']
+    assert 'dns' not in timings['seconds']
+    assert timings['broker']['reused_connection'] is False
+    assert timings['broker']['connect'] > 0
+    assert timings['broker']['response'] > 0
+    assert len(started) == 1
+
+
+def test_broker_concurrent_requests(server, brokers):
+    spawn, started = brokers
+    broker_client = client(server, spawn)
+    broker_client.open('GET', 'http://127.0.0.1/').read()
+    errors = []
+
+    def get():
+        try:
+            broker_client.open('GET', 'http://127.0.0.1/').read()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=get) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert errors == []
+    assert len(server.requests) == 9
+    assert len(started) == 1
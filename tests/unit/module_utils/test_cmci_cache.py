@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_cache import (
+    CMCIResultCache, cache_key, cache_tag
+)
+from collections import OrderedDict
+
+import os
+import pytest
+import time
+
+TAG = cache_tag('https', 'example.com', 12345, 'cicsprogram', 'CICSEX56')
+
+
+def entry(name):
+    return {
+        'http_status_code': 200,
+        'http_status': 'OK',
+        'response': OrderedDict([('response', OrderedDict([('@name', name)]))])
+    }
+
+
+def test_cache_round_trip(tmp_path):
+    cache = CMCIResultCache(str(tmp_path), 60, 10)
+    key = cache_key('https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/')
+
+    assert cache.get(TAG, key) is None
+    cache.put(TAG, key, entry('PROG1'))
+
+    cached = cache.get(TAG, key)
+    assert cached['response'] == entry('PROG1')['response']
+    assert isinstance(cached['response']['response'], OrderedDict)
+
+
+def test_cache_expires(tmp_path, monkeypatch):
+    cache = CMCIResultCache(str(tmp_path), 60, 10)
+    cache.put(TAG, 'a', entry('PROG1'))
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    assert cache.get(TAG, 'a') is None
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = CMCIResultCache(str(tmp_path), 60, 2)
+    cache.put(TAG, 'a', entry('A'))
+    cache.put(TAG, 'b', entry('B'))
+    os.utime(os.path.join(str(tmp_path), TAG + '-a.json'), (1, 1))
+    os.utime(os.path.join(str(tmp_path), TAG + '-b.json'), (2, 2))
+
+    # Reading a makes b the least recently used
+    assert cache.get(TAG, 'a')
+    cache.put(TAG, 'c', entry('C'))
+
+    assert cache.get(TAG, 'b') is None
+    assert cache.get(TAG, 'a')
+    assert cache.get(TAG, 'c')
+
+
+def test_cache_invalidate_by_tag(tmp_path):
+    other = cache_tag('https', 'example.com', 12345, 'cicslocalfile', 'CICSEX56')
+    cache = CMCIResultCache(str(tmp_path), 60, 10)
+    cache.put(TAG, 'a', entry('A'))
+    cache.put(TAG, 'b', entry('B'))
+    cache.put(other, 'a', entry('C'))
+
+    cache.invalidate(cache_tag('https', 'EXAMPLE.COM', 12345, 'CICSProgram', 'cicsex56'))
+
+    assert cache.get(TAG, 'a') is None
+    assert cache.get(TAG, 'b') is None
+    assert cache.get(other, 'a')
+
+
+def test_cache_invalidate_missing_directory(tmp_path):
+    CMCIResultCache(str(tmp_path / 'missing'), 60, 10).invalidate(TAG)
+
+    assert not os.path.exists(str(tmp_path / 'missing'))
+
+
+def test_cache_key_includes_credentials():
+    url = 'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/'
+
+    assert cache_key(url, user='one') != cache_key(url, user='two')
+    assert cache_key(url, cert='a.pem') != cache_key(url)
+
+
+def test_cache_directory_must_be_private(tmp_path):
+    os.chmod(str(tmp_path), 0o755)
+    cache = CMCIResultCache(str(tmp_path), 60, 10)
+
+    with pytest.raises(PermissionError):
+        cache.put(TAG, 'a', entry('A'))
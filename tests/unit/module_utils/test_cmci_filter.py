@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_filter import (
+    FilterError, compile_filter, escape_quotes, is_alphanumeric, optimize,
+    parse, parse_basic, select
+)
+
+import pytest
+import time
+
+PATH = 'resources -> complex_filter'
+
+
+def leaf(attribute, value, operator=None):
+    f = {'attribute': attribute, 'value': value}
+    if operator:
+        f['operator'] = operator
+    return f
+
+
+def test_single_predicate_has_no_parentheses():
+    assert compile_filter(leaf('FOO', 'BAR', 'GE'), PATH) == "FOO>='BAR'"
+
+
+def test_not_equals():
+    assert compile_filter(leaf('FOO', 'BAR', '!='), PATH) == "NOT(FOO=='BAR')"
+
+
+def test_flattens_nested_junctions_with_the_same_operator():
+    f = {'and': [
+        leaf('A', '1'),
+        {'and': [leaf('B', '2'), {'and': [leaf('C', '3')]}]},
+        {'or': [leaf('D', '4'), {'or': [leaf('E', '5')]}]}
+    ]}
+
+    assert compile_filter(f, PATH) == \
+        "(A='1') AND (B='2') AND (C='3') AND ((D='4') OR (E='5'))"
+
+
+def test_removes_duplicates():
+    f = {'or': [
+        leaf('A', '1'),
+        {'and': [leaf('B', '2'), leaf('C', '3')]},
+        leaf('A', '1', 'EQ'),
+        {'and': [leaf('B', '2'), leaf('C', '3'), leaf('B', '2')]}
+    ]}
+
+    assert compile_filter(f, PATH) == "(A='1') OR ((B='2') AND (C='3'))"
+
+
+def test_in_folds_into_or():
+    f = {'or': [leaf('A', ['1', '2'], 'IN'), leaf('A', '3')]}
+
+    assert compile_filter(f, PATH) == "(A='1') OR (A='2') OR (A='3')"
+
+
+def test_in_with_one_value():
+    assert compile_filter(leaf('A', ['1'], 'IN'), PATH) == "A='1'"
+
+
+def test_in_requires_a_list_of_strings():
+    with pytest.raises(FilterError) as e:
+        compile_filter(leaf('A', ['1', 2], 'IN'), PATH)
+
+    assert str(e.value) == \
+        "value must be a list of str for operator IN, was: ['1', 2] found " \
+        "in resources -> complex_filter"
+
+
+@pytest.mark.parametrize('second', [
+    leaf('A', '2'),
+    leaf('A', '2', '=='),
+    leaf('A', '1', 'NE'),
+])
+def test_rejects_contradictions(second):
+    with pytest.raises(FilterError) as e:
+        compile_filter({'and': [leaf('A', '1'), {'and': [second]}]}, PATH)
+
+    assert str(e.value).startswith(
+        "complex_filter can never match, it requires both A='1' and "
+    )
+
+
+@pytest.mark.parametrize('second', [
+    leaf('A', '2*'),
+    leaf('A', '+'),
+    leaf('A', '2', '>'),
+    leaf('A', '2', 'NE'),
+    leaf('B', '2'),
+    {'or': [leaf('A', '2'), leaf('A', '3')]},
+])
+def test_allows_satisfiable_filters(second):
+    compile_filter({'and': [leaf('A', '1'), second]}, PATH)
+
+
+def test_contradictions_in_or_branches():
+    f = {'or': [
+        {'and': [leaf('A', '1'), leaf('B', '1')]},
+        {'and': [leaf('A', '1'), leaf('A', '2')]}
+    ]}
+
+    with pytest.raises(FilterError):
+        compile_filter(f, PATH)
+
+
+def test_escapes_quotes():
+    assert escape_quotes("it's") == "it\\'s"
+    assert compile_filter(leaf('A', "'x'"), PATH) == "A='\\'x\\''"
+
+
+def test_is_alphanumeric():
+    assert is_alphanumeric('ABC123')
+    assert not is_alphanumeric('ABC!')
+    assert not is_alphanumeric('ABC\n')
+    assert not is_alphanumeric('A' * 101)
+
+
+def test_thousands_of_terms_compile_in_linear_time():
+    def run(n):
+        f = {'or': [
+            {'and': [leaf('NAME', 'P{0}'.format(i)), leaf('STATUS', 'ENABLED')]}
+            for i in range(n)
+        ]}
+        start = time.perf_counter()
+        criteria = compile_filter(f, PATH)
+        return criteria, time.perf_counter() - start
+
+    criteria, small = run(2000)
+    assert criteria.count(' OR ') == 1999
+    dummy, large = run(20000)
+
+    # Ten times the terms, allowing generously for timing noise
+    assert large < max(small, 0.01) * 40
+
+
+RECORDS = [
+    {'program': 'DFHPGM1', 'status': 'ENABLED', 'usecount': '9'},
+    {'program': 'DFHPGM22', 'status': 'DISABLED', 'usecount': '10'},
+    {'program': 'MYPROG', 'status': 'ENABLED', 'usecount': '100'},
+    {'program': 'MYPROG2', 'status': 'ENABLED'},
+]
+
+
+def names(f):
+    return [r['program'] for r in select(optimize(parse(f, PATH)), RECORDS)]
+
+
+@pytest.mark.parametrize('f,expected', [
+    (leaf('PROGRAM', 'MYPROG'), ['MYPROG']),
+    (leaf('PROGRAM', 'DFH*'), ['DFHPGM1', 'DFHPGM22']),
+    (leaf('PROGRAM', 'DFHPGM+'), ['DFHPGM1']),
+    (leaf('PROGRAM', 'MY+++*'), ['MYPROG', 'MYPROG2']),
+    (leaf('PROGRAM', 'MYPROG', 'IS'), ['MYPROG']),
+    (leaf('PROGRAM', 'MYPROG', '!='), ['DFHPGM1', 'DFHPGM22', 'MYPROG2']),
+    (leaf('PROGRAM', 'DFH*', 'NE'), ['MYPROG', 'MYPROG2']),
+    (leaf('USECOUNT', '10', '<'), ['DFHPGM1']),
+    (leaf('USECOUNT', '10', 'LE'), ['DFHPGM1', 'DFHPGM22']),
+    (leaf('USECOUNT', '10', '>'), ['MYPROG']),
+    (leaf('USECOUNT', '9', '>='), ['DFHPGM1', 'DFHPGM22', 'MYPROG']),
+    (leaf('USECOUNT', '10.0'), ['DFHPGM22']),
+    (leaf('PROGRAM', 'M', '>'), ['MYPROG', 'MYPROG2']),
+    (leaf('PROGRAM', ['MYPROG', 'DFH*'], 'IN'), ['DFHPGM1', 'DFHPGM22', 'MYPROG']),
+    ({'and': [leaf('STATUS', 'ENABLED'), {'or': [
+        leaf('USECOUNT', '50', 'GT'), leaf('PROGRAM', 'DFH*')
+    ]}]}, ['DFHPGM1', 'MYPROG']),
+    ({'or': [leaf('STATUS', 'DISABLED'), leaf('PROGRAM', 'MYPROG2')]},
+     ['DFHPGM22', 'MYPROG2']),
+])
+def test_select(f, expected):
+    assert names(f) == expected
+
+
+def test_select_basic_filter():
+    selected = select(parse_basic({'STATUS': 'ENABLED', 'program': 'MY*'}), RECORDS)
+
+    assert [r['program'] for r in selected] == ['MYPROG', 'MYPROG2']
+
+
+def test_select_large_columns():
+    records = [
+        {'name': 'P{0}'.format(i), 'status': 'ENABLED' if i % 3 else 'DISABLED',
+         'usecount': str(i)}
+        for i in range(50000)
+    ]
+    f = {'and': [leaf('STATUS', 'ENABLED'), leaf('USECOUNT', '100', 'GE'),
+                 leaf('NAME', 'P1*')]}
+
+    selected = select(optimize(parse(f, PATH)), records)
+
+    assert selected == [
+        r for r in records
+        if r['status'] == 'ENABLED' and int(r['usecount']) >= 100 and
+        r['name'].startswith('P1')
+    ]
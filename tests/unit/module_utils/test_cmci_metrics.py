@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_metrics import (
+    DURATION, SIZE, append_metrics, format_sample
+)
+
+
+def test_format_sample_escapes_labels():
+    assert format_sample(DURATION, {'phase': 'parse', 'context': 'a"b\\c'}, 0.5, 1700000000) == \
+        'cmci_request_duration_seconds{context="a\\"b\\\\c",phase="parse"} 0.5 1700000000.000'
+
+
+def test_append_metrics_keeps_families_together(tmp_path):
+    path = str(tmp_path / 'cmci.prom')
+
+    append_metrics(path, [
+        (DURATION, {'phase': 'total'}, 1.5, 1700000000),
+        (SIZE, {'body': 'received'}, 100, 1700000000)
+    ])
+    append_metrics(path, [
+        (DURATION, {'phase': 'total'}, 2, 1700000060),
+        (SIZE, {'body': 'received'}, 200, 1700000060)
+    ])
+
+    with open(path) as f:
+        assert f.read() == (
+            '# TYPE cmci_request_duration_seconds gauge\n'
+            '# HELP cmci_request_duration_seconds Duration of a phase of a CMCI request.\n'
+            'cmci_request_duration_seconds{phase="total"} 1.5 1700000000.000\n'
+            'cmci_request_duration_seconds{phase="total"} 2.0 1700000060.000\n'
+            '# TYPE cmci_request_size_bytes gauge\n'
+            '# HELP cmci_request_size_bytes Size of a CMCI request or response body.\n'
+            'cmci_request_size_bytes{body="received"} 100.0 1700000000.000\n'
+            'cmci_request_size_bytes{body="received"} 200.0 1700000060.000\n'
+            '# EOF\n'
+        )
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_records import (
+    RecordFileWriter, read_record_file
+)
+
+import gzip
+import hashlib
+import os
+import pytest
+
+RECORDS = [{'program': 'PROG1', 'status': 'ENABLED'}, {'program': 'PROG2', 'status': 'DISABLED'}]
+
+
+@pytest.mark.parametrize('compression', ['none', 'gzip'])
+def test_record_file_round_trip(tmp_path, compression):
+    dest = str(tmp_path / 'records.jsonl')
+    writer = RecordFileWriter(dest, compression)
+    writer.write_all(RECORDS)
+    details = writer.commit()
+
+    with open(dest, 'rb') as f:
+        content = f.read()
+    assert details == {
+        'dest': dest,
+        'size': len(content),
+        'checksum': hashlib.sha256(content).hexdigest()
+    }
+    assert writer.count == 2
+    assert list(read_record_file(dest)) == RECORDS
+    assert os.listdir(str(tmp_path)) == ['records.jsonl']
+
+
+def test_record_file_is_json_lines(tmp_path):
+    dest = str(tmp_path / 'records.jsonl.gz')
+    writer = RecordFileWriter(dest, 'gzip')
+    writer.write_all(RECORDS)
+    writer.commit()
+
+    with gzip.open(dest, 'rt') as f:
+        assert f.read() == (
+            '{"program": "PROG1", "status": "ENABLED"}\n'
+            '{"program": "PROG2", "status": "DISABLED"}\n'
+        )
+
+
+def test_record_file_discard_keeps_existing(tmp_path):
+    dest = tmp_path / 'records.jsonl'
+    dest.write_text('existing\n')
+
+    writer = RecordFileWriter(str(dest))
+    writer.write_all(RECORDS)
+    writer.discard()
+
+    assert dest.read_text() == 'existing\n'
+    assert os.listdir(str(tmp_path)) == ['records.jsonl']
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _cmci_retry
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_retry import (
+    CircuitBreaker, CircuitBreakerOpen, RetryPolicy
+)
+
+import os
+import pytest
+import time
+
+
+@pytest.fixture
+def breaker_dir(tmp_path, monkeypatch):
+    directory = str(tmp_path / 'breaker')
+    monkeypatch.setattr(_cmci_retry, 'breaker_directory', lambda: directory)
+    return directory
+
+
+def test_retry_delay_backs_off_exponentially():
+    policy = RetryPolicy(retries=5, delay=0.5, max_delay=3, jitter=False)
+
+    assert policy.attempts == 6
+    assert [policy.delay(attempt) for attempt in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+
+def test_retry_delay_jitter():
+    policy = RetryPolicy(retries=3, delay=2, max_delay=30)
+
+    delays = [policy.delay(3) for i in range(100)]
+    assert all(0 <= delay <= 8 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_conditions():
+    policy = RetryPolicy(http_statuses=[503], cpsm_responses=['busy'])
+
+    assert policy.retries_http_status(503)
+    assert not policy.retries_http_status(500)
+    assert policy.retries_cpsm_response('BUSY')
+    assert not policy.retries_cpsm_response('NODATA')
+    assert not policy.retries_cpsm_response(None)
+
+
+def test_circuit_breaker_opens_after_threshold(breaker_dir, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    breaker = CircuitBreaker('https', 'example.com', 12345, 2, 60)
+
+    breaker.record_failure()
+    breaker.check()
+    breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpen) as exc_info:
+        breaker.check()
+    assert str(exc_info.value) == \
+        'CMCI requests to https://example.com:12345 are suspended for 60 more seconds after 2 consecutive failures'
+
+    # Shared by every breaker for the same server
+    with pytest.raises(CircuitBreakerOpen):
+        CircuitBreaker('https', 'example.com', 12345, 2, 60).check()
+    CircuitBreaker('https', 'example.com', 54321, 2, 60).check()
+
+    # Half open once the timeout passes, and open again on another failure
+    now[0] += 61
+    breaker.check()
+    breaker.record_failure()
+    with pytest.raises(CircuitBreakerOpen):
+        breaker.check()
+
+
+def open_breaker(monkeypatch, now):
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    breaker = CircuitBreaker('https', 'example.com', 12345, 1, 60)
+    breaker.record_failure()
+    now[0] += 61
+    return breaker
+
+
+def test_circuit_breaker_half_open_single_trial(breaker_dir, monkeypatch):
+    now = [1000.0]
+    breaker = open_breaker(monkeypatch, now)
+    other = CircuitBreaker('https', 'example.com', 12345, 1, 60)
+
+    breaker.check()
+    with pytest.raises(CircuitBreakerOpen) as exc_info:
+        other.check()
+    assert str(exc_info.value) == \
+        'CMCI requests to https://example.com:12345 are suspended while another request checks whether it has ' \
+        'recovered after 1 consecutive failures'
+
+    breaker.record_success()
+    other.check()
+
+
+def test_circuit_breaker_release_trial(breaker_dir, monkeypatch):
+    now = [1000.0]
+    breaker = open_breaker(monkeypatch, now)
+    other = CircuitBreaker('https', 'example.com', 12345, 1, 60)
+
+    breaker.check()
+    breaker.release()
+
+    # Still half open, so the next request is the trial
+    other.check()
+    with pytest.raises(CircuitBreakerOpen):
+        breaker.check()
+
+
+def test_circuit_breaker_abandoned_trial(breaker_dir, monkeypatch):
+    now = [1000.0]
+    breaker = open_breaker(monkeypatch, now)
+    breaker.check()
+
+    # The task sending the trial was killed
+    other = CircuitBreaker('https', 'example.com', 12345, 1, 60)
+    trial, = [name for name in os.listdir(breaker_dir) if name.endswith('.trial')]
+    os.utime(os.path.join(breaker_dir, trial), (now[0] - 61, now[0] - 61))
+
+    other.check()
+
+
+def test_circuit_breaker_closes_on_success(breaker_dir):
+    breaker = CircuitBreaker('https', 'example.com', 12345, 2, 60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    breaker.check()
+
+
+def test_circuit_breaker_disabled(breaker_dir):
+    breaker = CircuitBreaker('https', 'example.com', 12345, 0, 60)
+    for i in range(5):
+        breaker.record_failure()
+
+    breaker.check()
+    assert not os.path.exists(breaker_dir)
+
+
+def test_circuit_breaker_ignores_shared_state(breaker_dir):
+    breaker = CircuitBreaker('https', 'example.com', 12345, 1, 60)
+    breaker.record_failure()
+    os.chmod(breaker_dir, 0o777)
+
+    breaker.check()
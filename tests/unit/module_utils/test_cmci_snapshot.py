@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_snapshot import (
+    SnapshotError, diff, read_snapshot, record_digest, record_key, write_snapshot
+)
+
+import os
+import pytest
+import time
+
+
+def program(name, status='ENABLED'):
+    return {'_keydata': name.encode().hex().upper(), 'program': name, 'status': status}
+
+
+def test_digest_ignores_attribute_order():
+    assert record_digest({'a': '1', 'b': '2'}) == record_digest({'b': '2', 'a': '1'})
+    assert record_digest({'a': '1', 'b': '2'}) != record_digest({'a': '1', 'b': '3'})
+
+
+def test_key_includes_target():
+    record = dict(program('PROG1'), _context='PLEX1', _scope='SCOPE1', eyu_cicsname='REGION1')
+
+    assert record_key(record, 'digest') == 'PLEX1/SCOPE1/REGION1/50524F4731'
+    assert record_key(program('PROG1'), 'digest') == '///50524F4731'
+    assert record_key({'program': 'PROG1'}, 'digest') == 'digest'
+
+
+def test_diff():
+    old = [program('PROG1'), program('PROG2'), program('PROG3')]
+    dummy, snapshot = diff({}, old)
+    new = [program('PROG1'), program('PROG2', 'DISABLED'), program('PROG4')]
+
+    delta, index = diff(snapshot, new)
+
+    assert delta == {
+        'added': [program('PROG4')],
+        'changed': [program('PROG2', 'DISABLED')],
+        'removed': [record_key(program('PROG3'), None)]
+    }
+    assert list(index) == [record_key(r, None) for r in new]
+
+
+def test_diff_several_regions():
+    records = [
+        dict(program('PROG1'), eyu_cicsname='REGION1'),
+        dict(program('PROG1', 'DISABLED'), eyu_cicsname='REGION2')
+    ]
+    dummy, snapshot = diff({}, records)
+
+    delta, index = diff(snapshot, records)
+
+    assert delta == {'added': [], 'changed': [], 'removed': []}
+    assert len(index) == 2
+
+
+def test_diff_first_snapshot():
+    records = [program('PROG1'), program('PROG2')]
+
+    delta, index = diff({}, records)
+
+    assert delta == {'added': records, 'changed': [], 'removed': []}
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / 'programs.snapshot')
+    assert read_snapshot(path) is None
+
+    dummy, index = diff({}, [program('PROG1')])
+    write_snapshot(path, index)
+
+    assert read_snapshot(path) == index
+    assert os.listdir(str(tmp_path)) == ['programs.snapshot']
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / 'programs.jsonl'
+    path.write_text('{"program": "PROG1"}\n{"program": "PROG2"}\n')
+
+    with pytest.raises(SnapshotError):
+        read_snapshot(str(path))
+
+
+def test_diff_is_linear():
+    def run(n):
+        records = [program('PROG{0}'.format(i)) for i in range(n)]
+        dummy, snapshot = diff({}, records)
+        records[0] = program('PROG0', 'DISABLED')
+        start = time.perf_counter()
+        delta, dummy = diff(snapshot, records)
+        return delta, time.perf_counter() - start
+
+    delta, small = run(5000)
+    assert len(delta['changed']) == 1
+    dummy, large = run(50000)
+
+    # Ten times the records, allowing generously for timing noise
+    assert large < max(small, 0.01) * 40
@@ -10,12 +10,15 @@ from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper imp
     IDCAMS_create_stdout,
     IDCAMS_delete_not_found,
     IDCAMS_delete,
+    IDCAMS_reset_run_name,
+    IDCAMS_reset_stdout,
     IDCAMS_run_cmd,
     IEFBR14_get_run_name,
     LISTDS_data_set,
     LISTDS_data_set_doesnt_exist,
     LISTDS_member_doesnt_exist,
-    LISTDS_run_name
+    LISTDS_run_name,
+    LISTSDS_member_data_set
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement import DatasetDefinition
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmdResponse
@@ -491,6 +494,82 @@ def test__run_listds_with_no_zoau_response():
         assert False
 
 
+def test__run_listds_batch():
+    vsam = "ANSIBIT.CICS.TESTS.A294D11B.DFHGCD"
+    missing = "ANSIBIT.CICS.TESTS.A294D11B.DFHLCD"
+    base_ds_name = "ANSIBIT.CICS.TESTS.A294D11B"
+    member = "{0}(MEMB)".format(base_ds_name)
+    rc = 8
+    stdout = LISTDS_data_set(vsam, "VSAM") + LISTDS_data_set_doesnt_exist(missing) + \
+        LISTSDS_member_data_set(base_ds_name, "MEMB")
+    stderr = ""
+    data_set_utils._execute_listds = MagicMock(return_value=MVSCmdResponse(rc, stdout, stderr))
+
+    result_executions, states = data_set_utils._run_listds_batch([vsam, missing, member])
+
+    data_set_utils._execute_listds.assert_called_once_with(
+        cmd=" LISTDS '{0}'\n LISTDS '{1}'\n LISTDS '{2}'".format(vsam, missing, member)
+    )
+    assert result_executions == [_execution(name=LISTDS_run_name(1), rc=rc, stdout=stdout, stderr=stderr)]
+    assert states == {
+        vsam: dict(exists=True, data_set_organization="VSAM", volumes=[]),
+        missing: dict(exists=False, data_set_organization="NONE", volumes=[]),
+        member: dict(exists=True, data_set_organization="Partitioned", volumes=["P2P117"]),
+    }
+
+
+def test__run_listds_batch_member_not_exists():
+    base_ds_name = "ANSIBIT.CICS.TESTS.A294D11B"
+    member = "{0}(MEMB)".format(base_ds_name)
+    rc = 4
+    stdout = LISTDS_data_set(base_ds_name, "PO") + LISTDS_member_doesnt_exist(base_ds_name, "MEMB")
+    data_set_utils._execute_listds = MagicMock(return_value=MVSCmdResponse(rc, stdout, ""))
+
+    result_executions, states = data_set_utils._run_listds_batch([base_ds_name, member])
+
+    assert len(result_executions) == 1
+    assert states[base_ds_name]["exists"] is True
+    assert states[base_ds_name]["data_set_organization"] == "Partitioned"
+    assert states[member]["exists"] is False
+    assert states[member]["data_set_organization"] == "NONE"
+
+
+def test__run_listds_batch_bad_rc():
+    vsam = "ANSIBIT.CICS.TESTS.A365D7A.DFHGCD"
+    unknown = "ANSIBIT.CICS.TESTS.A365D7A.DFHLCD"
+    rc = 12
+    stdout = LISTDS_data_set(vsam, "VSAM") + """
+        READY
+          LISTDS '{0}'
+         {0}
+         NOT AUTHORIZED
+    """.format(unknown)
+    data_set_utils._execute_listds = MagicMock(return_value=MVSCmdResponse(rc, stdout, ""))
+
+    try:
+        data_set_utils._run_listds_batch([vsam, unknown])
+    except MVSExecutionException as e:
+        assert e.message == "RC 12 running LISTDS Command for {0}".format(unknown)
+        assert len(e.executions) == 1
+    else:
+        assert False
+
+
+def test__run_listds_batch_output_not_recognised():
+    location = "ANSIBIT.CICS.TESTS.A365D7A.DFHGCD"
+    rc = 0
+    stdout = LISTDS_data_set(location, "VSAM")
+    data_set_utils._execute_listds = MagicMock(return_value=MVSCmdResponse(rc, stdout, ""))
+
+    try:
+        data_set_utils._run_listds_batch([location, "LOCATION.NOT.IN.STDOUT"])
+    except MVSExecutionException as e:
+        assert e.message == "LISTDS Command output not recognised"
+        assert len(e.executions) == data_set_utils.MVS_CMD_RETRY_ATTEMPTS
+    else:
+        assert False
+
+
 @pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
 def test__run_iefbr14():
     rc = 0
@@ -657,3 +736,72 @@ def test__read_data_set_content_bad_rc():
         assert e.executions == expected_executions
     else:
         assert False
+
+
+def test__get_idcams_define_attributes():
+    dataset = {
+        "name": "TEST.DATA.SET",
+        "unit": "cyl",
+        "primary": 5,
+        "secondary": 1,
+        "volumes": ["vol001", "vol002"],
+        "CLUSTER": {
+            "RECORDSIZE": "70 2041",
+            "INDEXED": None,
+            "KEYS": "52 0",
+            "REUSE": None
+        },
+        "DATA": {
+            "CONTROLINTERVALSIZE": "2048"
+        },
+    }
+    assert data_set_utils._get_idcams_define_attributes(dataset) == {
+        "reuse": True,
+        "keylen": 52,
+        "rkp": 0,
+        "avglrecl": 70,
+        "maxlrecl": 2041,
+        "cisize": 2048,
+        "space_type": "CYLINDER",
+        "space_pri": 5,
+        "space_sec": 1,
+        "volumes": ["VOL001", "VOL002"],
+    }
+
+
+def test__get_idcams_define_attributes_megabytes_not_compared():
+    dataset = {
+        "name": "TEST.DATA.SET",
+        "unit": "m",
+        "primary": 5,
+        "secondary": 1,
+        "CLUSTER": {"INDEXED": None},
+        "DATA": {},
+    }
+    assert data_set_utils._get_idcams_define_attributes(dataset) == {"reuse": False}
+
+
+def test__run_idcams_reset():
+    data_set_name = "TEST.DATA.SET"
+    data_set_utils._execute_idcams_reset = MagicMock(
+        return_value=MVSCmdResponse(rc=4, stdout=IDCAMS_reset_stdout(data_set_name), stderr="")
+    )
+
+    executions = data_set_utils._run_idcams_reset(data_set_name)
+
+    assert executions == [
+        _execution(name=IDCAMS_reset_run_name(1), rc=4, stdout=IDCAMS_reset_stdout(data_set_name), stderr=""),
+    ]
+
+
+def test__run_idcams_reset_bad_rc():
+    data_set_name = "TEST.DATA.SET"
+    data_set_utils._execute_idcams_reset = MagicMock(
+        return_value=MVSCmdResponse(rc=12, stdout=IDCAMS_reset_stdout(data_set_name), stderr="")
+    )
+
+    with pytest.raises(MVSExecutionException) as e:
+        data_set_utils._run_idcams_reset(data_set_name)
+
+    assert e.value.message == "RC 12 when resetting data set"
+    assert len(e.value.executions) == 1
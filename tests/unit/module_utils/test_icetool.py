@@ -6,7 +6,14 @@
 from __future__ import absolute_import, division, print_function
 
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import MVSExecutionException, _execution
-from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import ICETOOL_name, ICETOOL_stderr, ICETOOL_stdout
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import (
+    ICETOOL_first_record_name,
+    ICETOOL_name,
+    ICETOOL_stderr,
+    ICETOOL_stdout,
+    LISTCAT_name,
+    LISTCAT_stdout
+)
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmdResponse
 __metaclass__ = type
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _icetool as icetool
@@ -97,3 +104,105 @@ def test__run_icetool_with_no_zoau_response():
         assert e.executions == expected_executions
     else:
         assert False
+
+
+def test__get_catalog_statistics():
+    statistics = icetool._get_catalog_statistics(LISTCAT_stdout(NAME, 52, 106496))
+    assert statistics == {"rec_total": 52, "hi_u_rba": 106496}
+
+
+def test__get_catalog_statistics_with_invalid_stdout():
+    assert icetool._get_catalog_statistics("Some invalid STDOUT") is None
+
+
+def test__get_catalog_attributes():
+    attributes = icetool._get_catalog_attributes(
+        LISTCAT_stdout(NAME, 52, keylen=40, avglrecl=2232, maxlrecl=2400, cisize=2560, reuse=True))
+    assert attributes == {
+        "reuse": True,
+        "keylen": 40,
+        "rkp": 0,
+        "avglrecl": 2232,
+        "maxlrecl": 2400,
+        "cisize": 2560,
+        "space_type": "TRACK",
+        "space_pri": 30,
+        "space_sec": 5,
+        "volumes": ["VOL001"],
+    }
+
+
+def test__get_catalog_attributes_noreuse():
+    assert icetool._get_catalog_attributes(LISTCAT_stdout(NAME, 52))["reuse"] is False
+
+
+def test__get_catalog_attributes_with_invalid_stdout():
+    assert icetool._get_catalog_attributes("Some invalid STDOUT") is None
+
+
+def test__run_has_records_vsam_from_catalog():
+    icetool._execute_listcat = MagicMock(return_value=MVSCmdResponse(rc=0, stdout=LISTCAT_stdout(NAME, 52), stderr=""))
+    icetool._execute_icetool = MagicMock()
+
+    executions, has_records = icetool._run_has_records(NAME, "VSAM")
+
+    assert has_records is True
+    assert executions == [
+        _execution(name=LISTCAT_name(1), rc=0, stdout=LISTCAT_stdout(NAME, 52), stderr=""),
+    ]
+    icetool._execute_icetool.assert_not_called()
+
+
+def test__run_has_records_vsam_empty_catalog_reads_first_record():
+    icetool._execute_listcat = MagicMock(return_value=MVSCmdResponse(rc=0, stdout=LISTCAT_stdout(NAME, 0), stderr=""))
+    icetool._execute_icetool = MagicMock(return_value=MVSCmdResponse(rc=0, stdout=ICETOOL_stdout(1), stderr=ICETOOL_stderr()))
+
+    executions, has_records = icetool._run_has_records(NAME, "VSAM")
+
+    assert has_records is True
+    assert executions == [
+        _execution(name=LISTCAT_name(1), rc=0, stdout=LISTCAT_stdout(NAME, 0), stderr=""),
+        _execution(name=ICETOOL_first_record_name(1), rc=0, stdout=ICETOOL_stdout(1), stderr=ICETOOL_stderr()),
+    ]
+    icetool._execute_icetool.assert_called_once_with(NAME, True)
+
+
+def test__run_has_records_vsam_with_listcat_stdout():
+    icetool._execute_listcat = MagicMock()
+    icetool._execute_icetool = MagicMock()
+
+    executions, has_records = icetool._run_has_records(NAME, "VSAM", LISTCAT_stdout(NAME, 52))
+
+    assert has_records is True
+    assert executions == []
+    icetool._execute_listcat.assert_not_called()
+
+
+def test__run_has_records_sequential_skips_catalog():
+    icetool._execute_listcat = MagicMock()
+    icetool._execute_icetool = MagicMock(return_value=MVSCmdResponse(rc=0, stdout=ICETOOL_stdout(0), stderr=ICETOOL_stderr()))
+
+    executions, has_records = icetool._run_has_records(NAME, "Sequential")
+
+    assert has_records is False
+    assert executions == [
+        _execution(name=ICETOOL_first_record_name(1), rc=0, stdout=ICETOOL_stdout(0), stderr=ICETOOL_stderr()),
+    ]
+    icetool._execute_listcat.assert_not_called()
+
+
+def test__run_has_records_falls_back_to_full_count():
+    icetool._execute_listcat = MagicMock(return_value=MVSCmdResponse(rc=4, stdout="IDC3012I ENTRY {0} NOT FOUND".format(NAME), stderr=""))
+    icetool._execute_icetool = MagicMock(side_effect=[
+        MVSCmdResponse(rc=16, stdout="", stderr=ICETOOL_stderr()),
+        MVSCmdResponse(rc=0, stdout=ICETOOL_stdout(52), stderr=ICETOOL_stderr()),
+    ])
+
+    executions, has_records = icetool._run_has_records(NAME, "VSAM")
+
+    assert has_records is True
+    assert [execution["name"] for execution in executions] == [
+        LISTCAT_name(1),
+        ICETOOL_first_record_name(1),
+        ICETOOL_name(1),
+    ]
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import (
+    PYTHON_LANGUAGE_FEATURES_MESSAGE,
+    IDCAMS_create_already_exists_stdout,
+    IDCAMS_create_stdout,
+    IDCAMS_delete,
+    IDCAMS_delete_not_found
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmdResponse
+__metaclass__ = type
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _region_data_sets as region_data_sets_utils
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._region_data_sets import DEFINE, DELETE
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import MVSExecutionException, _execution
+import pytest
+import sys
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+
+GCD = "ANSI.TEST.DFHGCD"
+LCD = "ANSI.TEST.DFHLCD"
+
+
+def _run_name(run):
+    return "IDCAMS - Region data sets - Run {0}".format(run)
+
+
+def _data_set(name):
+    return dict(
+        name=name,
+        unit="m",
+        primary=5,
+        secondary=1,
+        volumes=None,
+        sdfhload="CICSTS.IN56.SDFHLOAD"
+    )
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_get_define_cmd_uses_data_set_builder():
+    define_cmd = region_data_sets_utils._get_define_cmd("dfhgcd", _data_set(GCD))
+    assert "DEFINE CLUSTER (NAME(ANSI.TEST.DFHGCD)" in define_cmd
+    assert "MEGABYTES(5 1)" in define_cmd
+    assert "DATA (NAME(ANSI.TEST.DFHGCD.DATA)" in define_cmd
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_get_idcams_function_results():
+    stdout = IDCAMS_delete(GCD) + IDCAMS_create_already_exists_stdout(LCD)
+    results = region_data_sets_utils._get_idcams_function_results(stdout)
+
+    assert [condition_code for condition_code, output in results] == [0, 12]
+    assert "DELETE {0}".format(GCD) in results[0][1]
+    assert LCD not in results[0][1]
+    assert "NOT DEFINED BECAUSE DUPLICATE NAME" in results[1][1]
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_run_idcams_commands_one_step():
+    commands = [
+        (DELETE, GCD, region_data_sets_utils._get_delete_cmd(GCD)),
+        (DEFINE, GCD, region_data_sets_utils._get_define_cmd("dfhgcd", _data_set(GCD))),
+        (DELETE, LCD, region_data_sets_utils._get_delete_cmd(LCD)),
+        (DEFINE, LCD, region_data_sets_utils._get_define_cmd("dfhlcd", _data_set(LCD))),
+    ]
+    stdout = IDCAMS_delete(GCD) + IDCAMS_create_stdout(GCD) + \
+        IDCAMS_delete_not_found(LCD) + IDCAMS_create_stdout(LCD)
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(rc=8, stdout=stdout, stderr="")
+    )
+
+    executions = region_data_sets_utils._run_idcams_commands(commands)
+
+    region_data_sets_utils._execute_idcams.assert_called_once_with(
+        cmd="".join(command for verb, name, command in commands)
+    )
+    assert executions == [
+        _execution(name=_run_name(1), rc=8, stdout=stdout, stderr="")
+    ]
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_run_idcams_commands_reports_each_failure():
+    commands = [
+        (DELETE, GCD, region_data_sets_utils._get_delete_cmd(GCD)),
+        (DEFINE, GCD, region_data_sets_utils._get_define_cmd("dfhgcd", _data_set(GCD))),
+        (DELETE, LCD, region_data_sets_utils._get_delete_cmd(LCD)),
+    ]
+    stdout = IDCAMS_delete_not_found(GCD).replace("NOT FOUND", "IN USE") + \
+        IDCAMS_create_stdout(GCD) + \
+        IDCAMS_create_stdout(LCD).replace("CONDITION CODE WAS 0", "CONDITION CODE WAS 8")
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(rc=8, stdout=stdout, stderr="")
+    )
+
+    with pytest.raises(MVSExecutionException) as e:
+        region_data_sets_utils._run_idcams_commands(commands)
+
+    assert e.value.message == \
+        "RC 8 when deleting data set ANSI.TEST.DFHGCD. RC 8 when deleting data set ANSI.TEST.DFHLCD"
+    assert len(e.value.executions) == 1
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_run_idcams_commands_reports_commands_not_run():
+    commands = [
+        (DELETE, GCD, region_data_sets_utils._get_delete_cmd(GCD)),
+        (DEFINE, GCD, region_data_sets_utils._get_define_cmd("dfhgcd", _data_set(GCD))),
+        (DELETE, LCD, region_data_sets_utils._get_delete_cmd(LCD)),
+    ]
+    stdout = IDCAMS_delete(GCD) + \
+        IDCAMS_create_stdout(GCD).replace("CONDITION CODE WAS 0", "CONDITION CODE WAS 16")
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(rc=16, stdout=stdout, stderr="")
+    )
+
+    with pytest.raises(MVSExecutionException) as e:
+        region_data_sets_utils._run_idcams_commands(commands)
+
+    assert e.value.message == \
+        "RC 16 when creating data set ANSI.TEST.DFHGCD. RC 16 from IDCAMS before running DELETE ANSI.TEST.DFHLCD"
+    # The commands that ran aren't run again
+    region_data_sets_utils._execute_idcams.assert_called_once()
+    assert len(e.value.executions) == 1
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_run_idcams_commands_retries_without_output():
+    commands = [
+        (DELETE, GCD, region_data_sets_utils._get_delete_cmd(GCD)),
+    ]
+    region_data_sets_utils._execute_idcams = MagicMock(side_effect=[
+        MVSCmdResponse(rc=0, stdout="", stderr=""),
+        MVSCmdResponse(rc=0, stdout=IDCAMS_delete(GCD), stderr=""),
+    ])
+
+    executions = region_data_sets_utils._run_idcams_commands(commands)
+
+    assert executions == [
+        _execution(name=_run_name(1), rc=0, stdout="", stderr=""),
+        _execution(name=_run_name(2), rc=0, stdout=IDCAMS_delete(GCD), stderr=""),
+    ]
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE)
+def test_run_idcams_commands_output_not_recognised():
+    commands = [
+        (DELETE, GCD, region_data_sets_utils._get_delete_cmd(GCD)),
+        (DELETE, LCD, region_data_sets_utils._get_delete_cmd(LCD)),
+    ]
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(rc=0, stdout="", stderr="")
+    )
+
+    with pytest.raises(MVSExecutionException) as e:
+        region_data_sets_utils._run_idcams_commands(commands)
+
+    assert e.value.message == "IDCAMS Command output not recognised"
+    assert len(e.value.executions) == region_data_sets_utils.MVS_CMD_RETRY_ATTEMPTS
@@ -7,9 +7,10 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _data_set,
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import _execution
 from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import (
     PYTHON_LANGUAGE_FEATURES_MESSAGE,
-    ICETOOL_name,
     ICETOOL_stderr,
     ICETOOL_stdout,
+    LISTCAT_name,
+    LISTCAT_stdout,
     IDCAMS_delete_run_name,
     IDCAMS_delete,
     IDCAMS_create_run_name,
@@ -179,6 +180,9 @@ def test_delete_an_existing_temp_and_replace():
             MVSCmdResponse(0, NAME, ""),
         ]
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 52), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=(
             MVSCmdResponse(
@@ -199,10 +203,10 @@ def test_delete_an_existing_temp_and_replace():
                 stderr="",
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
                 rc=0,
-                stdout=ICETOOL_stdout(52),
-                stderr=ICETOOL_stderr()
+                stdout=LISTCAT_stdout(NAME, 52),
+                stderr="",
             ),
             _execution(
                 name=IDCAMS_delete_run_name(1, NAME),
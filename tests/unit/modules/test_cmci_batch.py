@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_batch
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
+    HOST, PORT, CONTEXT, SCOPE, AnsibleExitJson, cmci_module, CMCITestHelper, encode_html_parameter,
+    set_module_args
+)
+from ansible.module_utils.urls import Request
+from unittest.mock import Mock
+
+import pytest
+import threading
+import time
+
+
+def test_batch_mixed_operations(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [{'program': 'PROG1', 'status': 'DISABLED'}]
+    cmci_module.stub_records('PUT', 'cicsprogram', records, scope=SCOPE,
+                             parameters=encode_html_parameter([('CRITERIA', "(program='PROG1')")]))
+    cmci_module.stub_records('GET', 'cicsprogram', records, scope=SCOPE,
+                             parameters=encode_html_parameter([('CRITERIA', "(program='PROG2')")]))
+    cmci_module.stub_records('POST', 'cicsdefinitionprogram', [{'name': 'PROG3'}])
+
+    base = 'https://example.com:12345/CICSSystemManagement/'
+    cmci_module.expect({
+        'changed': True,
+        'operations': [
+            operation_result(
+                base + 'cicsprogram/CICSEX56/IYCWEMW2?CRITERIA=%28program%3D%27PROG1%27%29',
+                'PUT', records, changed=True,
+                body='<request><update><attributes status="DISABLED"></attributes></update></request>'
+            ),
+            operation_result(
+                base + 'cicsprogram/CICSEX56/IYCWEMW2?CRITERIA=%28program%3D%27PROG2%27%29',
+                'GET', records
+            ),
+            operation_result(
+                base + 'cicsdefinitionprogram/CICSEX56/',
+                'POST', [{'name': 'PROG3'}], changed=True,
+                body='<request><create><parameter name="CSD"></parameter>'
+                     '<attributes name="PROG3" csdgroup="GRP"></attributes></create></request>'
+            )
+        ]
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'operations': [
+            {
+                'operation': 'update',
+                'scope': SCOPE,
+                'resources': {'filter': {'program': 'PROG1'}},
+                'attributes': {'status': 'DISABLED'}
+            },
+            {
+                'operation': 'get',
+                'scope': SCOPE,
+                'resources': {'filter': {'program': 'PROG2'}}
+            },
+            {
+                'operation': 'create',
+                'type': 'cicsdefinitionprogram',
+                'create_parameters': [{'name': 'CSD'}],
+                'attributes': {'name': 'PROG3', 'csdgroup': 'GRP'}
+            }
+        ]
+    })
+
+
+def test_batch_action(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [{'name': 'BUNDLE1'}]
+    cmci_module.stub_records('PUT', 'cicsdefinitionbundle', records)
+
+    cmci_module.expect({
+        'changed': True,
+        'operations': [
+            operation_result(
+                'https://example.com:12345/CICSSystemManagement/cicsdefinitionbundle/CICSEX56/'
+                '?CRITERIA=%28name%3D%27BUNDLE1%27%29&PARAMETER=CSDGROUP%28GRP%29',
+                'PUT', records, changed=True,
+                body='<request><action name="CSDINSTALL"></action></request>'
+            )
+        ]
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsdefinitionbundle',
+        'operations': [
+            {
+                'operation': 'action',
+                'action_name': 'CSDINSTALL',
+                'resources': {
+                    'filter': {'name': 'BUNDLE1'},
+                    'get_parameters': [{'name': 'CSDGROUP', 'value': 'GRP'}]
+                }
+            }
+        ]
+    })
+
+
+def test_batch_partial_failure(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [{'program': 'PROG1'}]
+    cmci_module.stub_records('GET', 'cicsprogram', records,
+                             parameters=encode_html_parameter([('CRITERIA', "(program='PROG1')")]))
+    cmci_module.stub_nodata('GET', 'cicsprogram',
+                            parameters=encode_html_parameter([('CRITERIA', "(program='NOPE')")]))
+
+    base = 'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/'
+    nodata = operation_result(base + '?CRITERIA=%28program%3D%27NOPE%27%29', 'GET', None,
+                              cpsm_response='NODATA', cpsm_response_code=1027)
+    nodata.update({
+        'failed': True,
+        'msg': 'CMCI request failed with response "NODATA" reason "1027"'
+    })
+    cmci_module.expect({
+        'changed': False,
+        'failed': True,
+        'msg': '1 of 2 CMCI operations failed',
+        'operations': [
+            operation_result(base + '?CRITERIA=%28program%3D%27PROG1%27%29', 'GET', records),
+            nodata
+        ]
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'operations': [
+            {'operation': 'get', 'resources': {'filter': {'program': 'PROG1'}}},
+            {'operation': 'get', 'resources': {'filter': {'program': 'NOPE'}}}
+        ]
+    })
+
+
+def test_batch_fail_on_nodata_false(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_nodata('GET', 'cicsprogram')
+
+    cmci_module.expect({
+        'changed': False,
+        'operations': [
+            operation_result('https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/',
+                             'GET', None, cpsm_response='NODATA', cpsm_response_code=1027)
+        ]
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'operations': [{'operation': 'get', 'fail_on_nodata': False}]
+    })
+
+
+def test_batch_invalid_operation_context(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', [])
+
+    cmci_module.expect({
+        'changed': False,
+        'failed': True,
+        'msg': '2 of 2 CMCI operations failed',
+        'operations': [
+            {
+                'changed': False,
+                'failed': True,
+                'msg': 'Parameter "context" with value "^&bad" was not valid. Expected a CPSM context name.  CPSM '
+                       'context names are max 8 characters. Valid characters are A-Z a-z 0-9 $ @ #.'
+            },
+            {
+                'changed': False,
+                'failed': True,
+                'msg': 'Parameter "action_name" is required'
+            }
+        ]
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'operations': [
+            {'operation': 'get', 'context': '^&bad'},
+            {'operation': 'action'}
+        ]
+    })
+
+
+def test_batch_missing_type(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', [])
+
+    cmci_module.expect({
+        'changed': False,
+        'failed': True,
+        'msg': '1 of 1 CMCI operations failed',
+        'operations': [
+            {'changed': False, 'failed': True, 'msg': 'Parameter "type" is required'}
+        ]
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': '',
+        'operations': [{'operation': 'get'}]
+    })
+
+
+def test_batch_invalid_concurrency(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'changed': False,
+        'failed': True,
+        'msg': 'Parameter "concurrency" with value "0" was not valid.  Expected a number greater than 0.'
+    })
+
+    cmci_module.run(cmci_batch, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'concurrency': 0,
+        'operations': [{'operation': 'get'}]
+    })
+
+
+def test_batch_concurrency_is_bounded(cmci_module):  # type: (CMCITestHelper) -> None
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def open(method, url, *args, **kwargs):
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.02)
+        with lock:
+            state['active'] -= 1
+        return cmci_module.open(method, url)
+
+    cmci_module.stub_delete('cicsprogram', 1)
+    Request.open = Mock(side_effect=open)
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'concurrency': 3,
+        'operations': [
+            {'operation': 'delete', 'resources': {'filter': {'program': 'P{0}'.format(i)}}}
+            for i in range(12)
+        ]
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_batch.main()
+
+    assert len(exc_info.value.args[0]['operations']) == 12
+    assert Request.open.call_count == 12
+    assert state['peak'] == 3
+
+
+def operation_result(url, method, records, changed=False, body=None,
+                     cpsm_response='OK', cpsm_response_code=1024):
+    result = {
+        'changed': changed,
+        'failed': False,
+        'connect_version': '0560',
+        'cpsm_reason': '',
+        'cpsm_reason_code': 0,
+        'cpsm_response': cpsm_response,
+        'cpsm_response_code': cpsm_response_code,
+        'http_status': 'OK',
+        'http_status_code': 200,
+        'record_count': 0,
+        'request': {
+            'url': url,
+            'method': method,
+            'body': body
+        }
+    }
+    if records is not None:
+        result.update({
+            'records': records,
+            'record_count': len(records)
+        })
+    return result
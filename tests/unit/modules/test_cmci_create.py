@@ -7,10 +7,19 @@ from collections import OrderedDict
 
 __metaclass__ = type
 
+from ansible.module_utils.urls import Request
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _cmci_retry
 from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_create
 from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
-    HOST, PORT, CONTEXT, od, body_matcher, cmci_module, CMCITestHelper
+    HOST, PORT, CONTEXT, od, body_matcher, cmci_module, AnsibleExitJson, AnsibleFailJson, CMCITestHelper,
+    encode_html_parameter, set_module_args
 )
+from unittest.mock import Mock
+from urllib.error import URLError
+
+import pytest
+import socket
+import time
 
 
 def test_csd_create(cmci_module):  # type: (cmci_module) -> None
@@ -117,6 +126,295 @@ def test_bas_create(cmci_module):  # type: (CMCITestHelper) -> None
     ))
 
 
+BASE_URL = 'https://example.com:12345/CICSSystemManagement/' \
+    'cicsdefinitionprogram/CICSEX56/IYCWEMW2'
+EXISTING_PARAMETERS = encode_html_parameter([
+    ('CRITERIA', "(NAME='PROGA') OR (NAME='PROGB') OR (NAME='PROGC')"),
+    ('PARAMETER', 'CSDGROUP(MYGRP)')
+])
+
+
+def ensure_config(**kwargs):
+    config = dict(
+        cmci_host=HOST,
+        cmci_port=PORT,
+        context=CONTEXT,
+        scope='IYCWEMW2',
+        type='cicsdefinitionprogram',
+        attributes={'csdgroup': 'MYGRP'},
+        definitions=[{'name': 'PROGA'}, {'name': 'progb'}, {'name': 'PROGC'}],
+        create_parameters=[{'name': 'CSD'}],
+        ensure='present'
+    )
+    config.update(kwargs)
+    return dict((k, v) for k, v in config.items() if v is not None)
+
+
+def ensure_result(changed, created, present, records, **kwargs):
+    expected = {
+        'changed': changed,
+        'connect_version': '0560',
+        'cpsm_reason': '',
+        'cpsm_reason_code': 0,
+        'cpsm_response': 'OK',
+        'cpsm_response_code': 1024,
+        'http_status': 'OK',
+        'http_status_code': 200,
+        'created': created,
+        'present': present,
+        'record_count': len(records),
+        'records': records,
+        'request': {
+            'url': BASE_URL + EXISTING_PARAMETERS,
+            'method': 'GET',
+            'body': None
+        },
+    }
+    expected.update(kwargs)
+    return expected
+
+
+def posted_bodies():
+    return sorted(
+        call.kwargs['data'] for call in Request.open.call_args_list
+        if call.args[0] == 'POST'
+    )
+
+
+def test_ensure_present_creates_missing(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.stub_records(
+        'GET', 'cicsdefinitionprogram',
+        [{'name': 'PROGA', 'csdgroup': 'MYGRP'}],
+        scope='IYCWEMW2', parameters=EXISTING_PARAMETERS
+    )
+    created = {'name': 'NEW', 'csdgroup': 'MYGRP'}
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+
+    cmci_module.expect(ensure_result(True, 2, 1, [created, created]))
+
+    cmci_module.run(cmci_create, ensure_config())
+
+    assert posted_bodies() == [
+        '<request><create><parameter name="CSD"></parameter>'
+        '<attributes csdgroup="MYGRP" name="PROGC"></attributes>'
+        '</create></request>',
+        '<request><create><parameter name="CSD"></parameter>'
+        '<attributes csdgroup="MYGRP" name="progb"></attributes>'
+        '</create></request>',
+    ]
+
+
+def test_ensure_present_all_exist(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.stub_records(
+        'GET', 'cicsdefinitionprogram',
+        [{'name': n, 'csdgroup': 'MYGRP'} for n in ('PROGA', 'PROGB', 'PROGC')],
+        scope='IYCWEMW2', parameters=EXISTING_PARAMETERS
+    )
+
+    cmci_module.expect(ensure_result(False, 0, 3, [], record_count=0))
+
+    cmci_module.run(cmci_create, ensure_config())
+
+    assert posted_bodies() == []
+
+
+def test_ensure_present_none_exist(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.stub_nodata(
+        'GET', 'cicsdefinitionprogram', scope='IYCWEMW2',
+        parameters=EXISTING_PARAMETERS
+    )
+    created = {'name': 'NEW', 'csdgroup': 'MYGRP'}
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+
+    cmci_module.expect(ensure_result(True, 3, 0, [created] * 3))
+
+    cmci_module.run(cmci_create, ensure_config())
+
+    assert len(posted_bodies()) == 3
+
+
+def test_definitions_without_ensure(cmci_module):
+    # type: (CMCITestHelper) -> None
+    created = {'name': 'NEW', 'csdgroup': 'MYGRP'}
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+
+    expected = ensure_result(True, 2, 0, [created] * 2)
+    del expected['present']
+    expected['request'] = {
+        'url': BASE_URL,
+        'method': 'POST',
+        'body': '<request><create><parameter name="CSD"></parameter>'
+                '<attributes csdgroup="MYGRP"></attributes>'
+                '</create></request>'
+    }
+    cmci_module.expect(expected)
+
+    cmci_module.run(cmci_create, ensure_config(
+        ensure=None, definitions=[{'name': 'PROGA'}, {'name': 'PROGB'}]
+    ))
+
+    assert len(posted_bodies()) == 2
+
+
+def test_ensure_present_needs_names(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'changed': False,
+        'failed': True,
+        'msg': 'Every definition needs a "name" attribute when "ensure" is '
+               '"present"'
+    })
+
+    cmci_module.run(cmci_create, ensure_config(
+        definitions=[{'name': 'PROGA'}, {'description': 'no name'}]
+    ))
+
+
+def test_duplicate_definitions_created_once(cmci_module):
+    # type: (CMCITestHelper) -> None
+    created = {'name': 'NEW', 'csdgroup': 'MYGRP'}
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+
+    expected = ensure_result(True, 2, 0, [created] * 2)
+    del expected['present']
+    expected['request']['url'] = BASE_URL
+    expected['request']['method'] = 'POST'
+    expected['request']['body'] = '<request><create><parameter name="CSD"></parameter>' \
+        '<attributes csdgroup="MYGRP"></attributes></create></request>'
+    cmci_module.expect(expected)
+
+    cmci_module.run(cmci_create, ensure_config(
+        ensure=None,
+        definitions=[{'name': 'PROGA'}, {'name': 'PROGB'}, {'name': 'proga'}]
+    ))
+
+    assert posted_bodies() == [
+        '<request><create><parameter name="CSD"></parameter>'
+        '<attributes csdgroup="MYGRP" name="PROGA"></attributes>'
+        '</create></request>',
+        '<request><create><parameter name="CSD"></parameter>'
+        '<attributes csdgroup="MYGRP" name="PROGB"></attributes>'
+        '</create></request>',
+    ]
+
+
+def test_ensure_present_filters_names_in_chunks(cmci_module):
+    # type: (CMCITestHelper) -> None
+    names = ['PROG{0:03d}'.format(i) for i in range(60)]
+    for chunk in (names[:50], names[50:]):
+        cmci_module.stub_records(
+            'GET', 'cicsdefinitionprogram',
+            [{'name': name, 'csdgroup': 'MYGRP'} for name in chunk],
+            scope='IYCWEMW2',
+            parameters=encode_html_parameter([
+                ('CRITERIA', ' OR '.join("(NAME='{0}')".format(name) for name in chunk))
+            ])
+        )
+
+    set_module_args(ensure_config(
+        type='CICSDEFINITIONPROGRAM',
+        attributes=None,
+        create_parameters=None,
+        definitions=[{'name': name} for name in names]
+    ))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_create.main()
+
+    result = exc_info.value.args[0]
+    assert result['present'] == 60
+    assert result['created'] == 0
+    # One request for each 50 names, rather than every definition in scope
+    assert [call.args[0] for call in Request.open.call_args_list] == ['GET', 'GET']
+
+
+def test_create_failure_reports_definitions_created(cmci_module):
+    # type: (CMCITestHelper) -> None
+    created = {'name': 'NEW', 'csdgroup': 'MYGRP'}
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+    cmci_module.stub_non_ok_records(
+        'POST', 'cicsdefinitionprogram', [{'action': 'CREATE', 'eibfn_alt': 'CREATE'}],
+        scope='IYCWEMW2'
+    )
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+
+    set_module_args(ensure_config(
+        type='CICSDEFINITIONPROGRAM',
+        ensure=None,
+        concurrency=1,
+        definitions=[{'name': 'PROG{0}'.format(i)} for i in range(5)]
+    ))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_create.main()
+
+    result = exc_info.value.args[0]
+    assert result['msg'] == 'CMCI request failed with response "TABLEERROR" reason "DATAERROR"'
+    # Every create that was sent has finished, and all but the failure count
+    assert result['created'] == len(posted_bodies()) - 1
+    assert result['records'] == [created] * result['created']
+    assert result['created'] >= 1
+
+
+@pytest.fixture
+def no_sleep(monkeypatch, tmp_path):
+    monkeypatch.setattr(time, 'sleep', lambda delay: None)
+    monkeypatch.setattr(_cmci_retry, 'breaker_directory', lambda: str(tmp_path / 'breaker'))
+
+
+def stub_connection_errors(cmci_module, errors):  # type: (CMCITestHelper, list) -> None
+    created = {'name': 'NEW', 'csdgroup': 'MYGRP'}
+    cmci_module.stub_records(
+        'POST', 'cicsdefinitionprogram', [created], scope='IYCWEMW2'
+    )
+
+    def open(method, url, *args, **kwargs):
+        if errors:
+            raise errors.pop(0)
+        return cmci_module.open(method, url)
+
+    Request.open = Mock(side_effect=open)
+
+
+def test_create_not_retried_after_request_sent(cmci_module, no_sleep):
+    # type: (CMCITestHelper, None) -> None
+    stub_connection_errors(cmci_module, [URLError(socket.timeout('timed out'))])
+
+    set_module_args(ensure_config(type='CICSDEFINITIONPROGRAM', ensure=None, definitions=None, retries=2))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_create.main()
+
+    assert exc_info.value.args[0]['msg'] == 'Error performing CMCI request: timed out'
+    assert 'retry_history' not in exc_info.value.args[0]
+    assert Request.open.call_count == 1
+
+
+def test_create_retried_when_connection_refused(cmci_module, no_sleep):
+    # type: (CMCITestHelper, None) -> None
+    stub_connection_errors(cmci_module, [URLError(ConnectionRefusedError(111, 'Connection refused'))])
+
+    set_module_args(ensure_config(type='CICSDEFINITIONPROGRAM', ensure=None, definitions=None, retries=2))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_create.main()
+
+    result = exc_info.value.args[0]
+    assert [r['reason'] for r in result['retry_history']] == ['Connection error: [Errno 111] Connection refused']
+    assert Request.open.call_count == 2
+
+
 def result(url, record, body):
     return {
         'changed': True,
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.doc_fragments.cmci import ModuleDocFragment
+from ansible_collections.ibm.ibm_zos_cics.plugins.modules import (
+    cmci_action, cmci_batch, cmci_create, cmci_delete, cmci_get, cmci_update, cmci_wait
+)
+
+import pytest
+import yaml
+
+MODULES = [
+    (cmci_action, cmci_action.AnsibleCMCIInstallModule),
+    (cmci_batch, cmci_batch.AnsibleCMCIBatchModule),
+    (cmci_create, cmci_create.AnsibleCMCICreateModule),
+    (cmci_delete, cmci_delete.AnsibleCMCIDeleteModule),
+    (cmci_get, cmci_get.AnsibleCMCIGetModule),
+    (cmci_update, cmci_update.AnsibleCMCIUpdateModule),
+    (cmci_wait, cmci_wait.AnsibleCMCIWaitModule),
+]
+
+
+class UniqueKeyLoader(yaml.SafeLoader):
+    # yaml.safe_load keeps the last of two keys with the same name, which
+    # hides an option pasted into another
+    def construct_mapping(self, node, deep=False):
+        keys = set()
+        for key_node, value_node in node.value:
+            key = self.construct_object(key_node, deep=deep)
+            if key in keys:
+                raise yaml.constructor.ConstructorError(
+                    None, None, 'duplicate key {0}'.format(key), key_node.start_mark
+                )
+            keys.add(key)
+        return super(UniqueKeyLoader, self).construct_mapping(node, deep)
+
+
+def documented_options(module):  # type: (object) -> dict
+    documentation = yaml.load(module.DOCUMENTATION, Loader=UniqueKeyLoader)
+    options = {}
+    for fragment in documentation.get('extends_documentation_fragment', []):
+        name = fragment.rsplit('.', 1)[1]
+        options.update(yaml.load(getattr(ModuleDocFragment, name), Loader=UniqueKeyLoader)['options'])
+    options.update(documentation.get('options') or {})
+    return options
+
+
+def argument_spec(module_class):  # type: (type) -> dict
+    # The argument spec doesn't depend on the module's parameters, so it's
+    # read without running the module
+    return module_class.init_argument_spec(module_class.__new__(module_class))
+
+
+@pytest.mark.parametrize('module, module_class', MODULES, ids=[m.__name__.rsplit('.', 1)[1] for m, c in MODULES])
+def test_options_match_argument_spec(module, module_class):
+    options = documented_options(module)
+    spec = argument_spec(module_class)
+
+    assert sorted(options) == sorted(spec)
+    for name, option in options.items():
+        assert option.get('type', 'str') == spec[name].get('type', 'str'), name
+        assert 'description' in option, name
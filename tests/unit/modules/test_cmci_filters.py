@@ -208,13 +208,13 @@ def test_complex_filter_and_or(cmci_module):  # type: (CMCITestHelper) -> None
 def test_complex_filter_and_and(cmci_module):  # type: (CMCITestHelper) -> None
     records = [{'name': 'bat', 'dsname': 'STEWF.BLOP.BLIP'}]
     cmci_module.stub_records('GET', 'cicslocalfile', records, scope=SCOPE,
-                             parameters='?CRITERIA=%28FOO%3D%27BAR%27%29%20AND%20%28BAT%3D%3D%27BAZ%27%29%20AND%20%28'
-                                        '%28BING%3D%271%27%29%20AND%20%28BING%3D%272%27%29%29')
+                             parameters='?CRITERIA=%28FOO%3D%27BAR%27%29%20AND%20%28BAT%3D%3D%27BAZ%27%29%20AND%20'
+                                        '%28BING%3D%271%27%29%20AND%20%28BONG%3D%272%27%29')
 
     cmci_module.expect(result(
         'https://example.com:12345/CICSSystemManagement/'
-        'cicslocalfile/CICSEX56/IYCWEMW2?CRITERIA=%28FOO%3D%27BAR%27%29%20AND%20%28BAT%3D%3D%27BAZ%27%29%20AND%20%28'
-        '%28BING%3D%271%27%29%20AND%20%28BING%3D%272%27%29%29',
+        'cicslocalfile/CICSEX56/IYCWEMW2?CRITERIA=%28FOO%3D%27BAR%27%29%20AND%20%28BAT%3D%3D%27BAZ%27%29%20AND%20'
+        '%28BING%3D%271%27%29%20AND%20%28BONG%3D%272%27%29',
         records=records
     ))
 
@@ -238,7 +238,7 @@ def test_complex_filter_and_and(cmci_module):  # type: (CMCITestHelper) -> None
                         'attribute': 'BING',
                         'value': '1'
                     }, {
-                        'attribute': 'BING',
+                        'attribute': 'BONG',
                         'value': '2'
                     }]
                 }]
@@ -250,13 +250,13 @@ def test_complex_filter_and_and(cmci_module):  # type: (CMCITestHelper) -> None
 def test_complex_filter_or_or(cmci_module):  # type: (CMCITestHelper) -> None
     records = [{'name': 'bat', 'dsname': 'STEWF.BLOP.BLIP'}]
     cmci_module.stub_records('GET', 'cicslocalfile', records, scope=SCOPE,
-                             parameters='?CRITERIA=%28FOO%3E%3D%27BAR%27%29%20OR%20%28%28BING%3D%3D%271%27%29%20OR%20'
-                                        '%28BING%3D%272%27%29%29')
+                             parameters='?CRITERIA=%28FOO%3E%3D%27BAR%27%29%20OR%20%28BING%3D%3D%271%27%29%20OR%20'
+                                        '%28BING%3D%272%27%29')
 
     cmci_module.expect(result(
         'https://example.com:12345/CICSSystemManagement/'
-        'cicslocalfile/CICSEX56/IYCWEMW2?CRITERIA=%28FOO%3E%3D%27BAR%27%29%20OR%20%28%28BING%3D%3D%271%27%29%20OR%20'
-        '%28BING%3D%272%27%29%29',
+        'cicslocalfile/CICSEX56/IYCWEMW2?CRITERIA=%28FOO%3E%3D%27BAR%27%29%20OR%20%28BING%3D%3D%271%27%29%20OR%20'
+        '%28BING%3D%272%27%29',
         records=records
     ))
 
@@ -894,7 +894,7 @@ def test_operator_choice_root(cmci_module):
     # type: (CMCITestHelper) -> None
     cmci_module.expect({
         'msg': 'value of operator must be one of: <, <=, =, >, >=, ¬=, ==, !=, '
-               'EQ, NE, LT, LE, GE, GT, IS, got: banana found in resources -> '
+               'EQ, NE, LT, LE, GE, GT, IS, IN, got: banana found in resources -> '
                'complex_filter',
         'failed': True
     })
@@ -919,7 +919,7 @@ def test_operator_choice_and(cmci_module):
     # type: (CMCITestHelper) -> None
     cmci_module.expect({
         'msg': 'value of operator must be one of: <, <=, =, >, >=, ¬=, ==, !=, '
-               'EQ, NE, LT, LE, GE, GT, IS, got: banana found in resources -> '
+               'EQ, NE, LT, LE, GE, GT, IS, IN, got: banana found in resources -> '
                'complex_filter -> and',
         'failed': True,
         'changed': False
@@ -947,7 +947,7 @@ def test_operator_choice_or(cmci_module):
     # type: (CMCITestHelper) -> None
     cmci_module.expect({
         'msg': 'value of operator must be one of: <, <=, =, >, >=, ¬=, ==, !=, '
-               'EQ, NE, LT, LE, GE, GT, IS, got: banana found in resources -> '
+               'EQ, NE, LT, LE, GE, GT, IS, IN, got: banana found in resources -> '
                'complex_filter -> or',
         'failed': True,
         'changed': False
@@ -1291,6 +1291,165 @@ def test_sanitise_complex_filter_value(cmci_module):  # type: (CMCITestHelper) -
     })
 
 
+def test_complex_filter_in(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [{'name': 'bat', 'dsname': 'STEWF.BLOP.BLIP'}]
+
+    encoded_criteria = encode_html_parameter(
+        [("CRITERIA", "(FOO='BAR') AND ((NAME='A') OR (NAME='B*'))")]
+    )
+
+    cmci_module.stub_records('GET', 'cicslocalfile', records, scope=SCOPE,
+                             parameters=encoded_criteria)
+
+    cmci_module.expect(result(
+        'https://example.com:12345/CICSSystemManagement/'
+        'cicslocalfile/CICSEX56/IYCWEMW2' + encoded_criteria,
+        records=records
+    ))
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': 'IYCWEMW2',
+        'type': 'cicslocalfile',
+        'resources': {
+            'complex_filter': {
+                'and': [{
+                    'attribute': 'FOO',
+                    'value': 'BAR'
+                }, {
+                    'attribute': 'NAME',
+                    'operator': 'IN',
+                    'value': ['A', 'B*', 'A']
+                }, {
+                    'attribute': 'FOO',
+                    'value': 'BAR'
+                }]
+            }
+        }
+    })
+
+
+def test_complex_filter_in_root(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [{'name': 'bat', 'dsname': 'STEWF.BLOP.BLIP'}]
+
+    encoded_criteria = encode_html_parameter(
+        [("CRITERIA", "(NAME='A') OR (NAME='B')")]
+    )
+
+    cmci_module.stub_records('GET', 'cicslocalfile', records, scope=SCOPE,
+                             parameters=encoded_criteria)
+
+    cmci_module.expect(result(
+        'https://example.com:12345/CICSSystemManagement/'
+        'cicslocalfile/CICSEX56/IYCWEMW2' + encoded_criteria,
+        records=records
+    ))
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': 'IYCWEMW2',
+        'type': 'cicslocalfile',
+        'resources': {
+            'complex_filter': {
+                'attribute': 'NAME',
+                'operator': 'IN',
+                'value': ['A', 'B']
+            }
+        }
+    })
+
+
+def test_complex_filter_number_value_root(cmci_module):
+    # type: (CMCITestHelper) -> None
+    records = [{'name': 'bat', 'dsname': 'STEWF.BLOP.BLIP'}]
+    cmci_module.stub_records('GET', 'cicslocalfile', records, scope=SCOPE,
+                             parameters='?CRITERIA=FOO%3E%2712%27')
+
+    cmci_module.expect(result(
+        'https://example.com:12345/CICSSystemManagement/'
+        'cicslocalfile/CICSEX56/IYCWEMW2?CRITERIA=FOO%3E%2712%27',
+        records=records
+    ))
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': 'IYCWEMW2',
+        'type': 'cicslocalfile',
+        'resources': {
+            'complex_filter': {
+                'attribute': 'FOO',
+                'operator': '>',
+                'value': 12
+            }
+        }
+    })
+
+
+def test_complex_filter_in_not_list(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'msg': 'value must be a list of str for operator IN, was: BAR found '
+               'in resources -> complex_filter -> or',
+        'failed': True,
+        'changed': False
+    })
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': 'IYCWEMW2',
+        'type': 'cicslocalfile',
+        'resources': {
+            'complex_filter': {
+                'or': [{
+                    'attribute': 'FOO',
+                    'operator': 'IN',
+                    'value': 'BAR'
+                }]
+            }
+        }
+    })
+
+
+def test_complex_filter_contradiction(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'msg': "complex_filter can never match, it requires both FOO='BAR' "
+               "and FOO=='BAZ'",
+        'failed': True,
+        'changed': False
+    })
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': 'IYCWEMW2',
+        'type': 'cicslocalfile',
+        'resources': {
+            'complex_filter': {
+                'and': [{
+                    'attribute': 'FOO',
+                    'value': 'BAR'
+                }, {
+                    'and': [{
+                        'attribute': 'FOO',
+                        'operator': 'IS',
+                        'value': 'BAZ'
+                    }]
+                }]
+            }
+        }
+    })
+
+
 def result(url, records, http_status='OK', http_status_code=200):
     return {
         'changed': False,
@@ -7,15 +7,25 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils.cmci import CONTENT_TYPE
-from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_get
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._cmci_records import read_record_file
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _cmci_retry
+from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_get, cmci_update
 from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
-    HOST, PORT, CONTEXT, SCOPE, AnsibleFailJson,
-    set_module_args, exit_json, fail_json, cmci_module, CMCITestHelper, encode_html_parameter
+    HOST, PORT, CONTEXT, SCOPE, AnsibleExitJson, AnsibleFailJson,
+    set_module_args, exit_json, fail_json, cmci_module, CMCITestHelper, encode_html_parameter,
+    create_cmci_response, create_records_response, create_nodata_response, create_delete_response, od
 )
 from ansible.module_utils import basic
+from ansible.module_utils.urls import Request
 
+
+import gzip
+import hashlib
+import os
 import pytest
 import sys
+import time
+import xmltodict
 
 
 def test_401_fails(cmci_module):  # type: (cmci_module) -> None
@@ -906,6 +916,708 @@ def test_invalid_cmci_type(cmci_module):  # type: (CMCITestHelper) -> None
     })
 
 
+@pytest.mark.parametrize('page_concurrency', [1, 3])
+def test_get_paged_from_result_cache(cmci_module, page_concurrency):  # type: (CMCITestHelper, int) -> None
+    records = paged_records(5)
+    stub_page(cmci_module, 1, records[0:2])
+    stub_page(cmci_module, 3, records[2:4])
+    stub_page(cmci_module, 5, records[4:5])
+    stub_discard(cmci_module)
+    stub_summary(cmci_module, 5)
+
+    cmci_module.expect(result(
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/?SUMMONLY&NODISCARD',
+        records
+    ))
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'page_size': 2,
+        'page_concurrency': page_concurrency
+    })
+
+    requests = [(c.args[0], c.args[1]) for c in Request.open.call_args_list]
+    assert requests[0][1].endswith('?SUMMONLY&NODISCARD')
+    assert sorted(url for method, url in requests[1:4]) == [
+        'https://example.com:12345/CICSSystemManagement/CICSResultCache/E0B3E4A1D4B2C8F0/1/2?NODISCARD',
+        'https://example.com:12345/CICSSystemManagement/CICSResultCache/E0B3E4A1D4B2C8F0/3/2?NODISCARD',
+        'https://example.com:12345/CICSSystemManagement/CICSResultCache/E0B3E4A1D4B2C8F0/5/1?NODISCARD'
+    ]
+    assert requests[4] == (
+        'DELETE', 'https://example.com:12345/CICSSystemManagement/CICSResultCache/E0B3E4A1D4B2C8F0'
+    )
+
+
+def test_get_paged_page_failure_discards_cache(cmci_module):  # type: (CMCITestHelper) -> None
+    records = paged_records(3)
+    stub_page(cmci_module, 1, records[0:2])
+    cmci_module.stub_request(
+        'GET',
+        'https://example.com:12345/CICSSystemManagement/CICSResultCache/E0B3E4A1D4B2C8F0/3/1?NODISCARD',
+        text=xmltodict.unparse(create_nodata_response()),
+        headers={CONTENT_TYPE: 'application/xml'},
+        status_code=200,
+        reason='OK'
+    )
+    stub_discard(cmci_module)
+    stub_summary(cmci_module, 3)
+
+    expected = result(
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/?SUMMONLY&NODISCARD',
+        None,
+        failed=True,
+        msg='CMCI request failed with response "NODATA" reason "1027"'
+    )
+    expected['record_count'] = 3
+    cmci_module.expect(expected)
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'page_size': 2
+    })
+
+    assert Request.open.call_args_list[-1].args[0] == 'DELETE'
+
+
+def test_get_paged_record_count_exclusive(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'msg': 'parameters are mutually exclusive: record_count|page_size',
+        'changed': False,
+        'failed': True
+    })
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'record_count': 10,
+        'page_size': 2
+    })
+
+
+def test_get_paged_invalid_page_size(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'msg': 'Parameter "page_size" with value "0" was not valid.  Expected a number greater than 0.',
+        'changed': False,
+        'failed': True
+    })
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'page_size': 0
+    })
+
+
+def test_get_cached(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    records = [{'program': 'PROG1', 'status': 'ENABLED'}]
+    cmci_module.stub_records('GET', 'cicsprogram', records)
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'cache_ttl': 60,
+        'cache_dir': str(tmp_path)
+    }
+
+    expected = result('https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/', records)
+    expected['cache'] = {'hits': 0, 'misses': 1}
+    cmci_module.expect(expected)
+    cmci_module.run(cmci_get, config)
+
+    expected['cache'] = {'hits': 1, 'misses': 0}
+    cmci_module.expect(expected)
+    cmci_module.run(cmci_get, config)
+
+    assert Request.open.call_count == 1
+
+
+def test_get_failure_not_cached(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    cmci_module.stub_cmci('GET', 'cicsprogram', response_dict=create_cmci_response(
+        ('resultsummary', od(
+            ('@api_response1', '1043'),
+            ('@api_response2', '0'),
+            ('@api_response1_alt', 'BUSY'),
+            ('@api_response2_alt', ''),
+            ('@recordcount', '0')
+        ))
+    ))
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'cache_ttl': 60,
+        'cache_dir': str(tmp_path)
+    }
+
+    for dummy in range(2):
+        with pytest.raises(AnsibleFailJson) as exc_info:
+            set_module_args(config)
+            cmci_get.main()
+        assert exc_info.value.args[0]['cache'] == {'hits': 0, 'misses': 1}
+
+    assert os.listdir(str(tmp_path)) == []
+    assert Request.open.call_count == 2
+
+
+def test_get_cache_invalidated_by_update(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    records = [{'program': 'PROG1', 'status': 'ENABLED'}]
+    cmci_module.stub_records('PUT', 'cicsprogram', records)
+    cmci_module.stub_records('GET', 'cicsprogram', records)
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'cache_ttl': 60,
+        'cache_dir': str(tmp_path)
+    }
+
+    with pytest.raises(AnsibleExitJson):
+        set_module_args(config)
+        cmci_get.main()
+    assert len(os.listdir(str(tmp_path))) == 1
+
+    with pytest.raises(AnsibleExitJson):
+        set_module_args({
+            'cmci_host': HOST,
+            'cmci_port': PORT,
+            'context': CONTEXT,
+            'type': 'CICSProgram',
+            'attributes': {'status': 'DISABLED'},
+            'cache_dir': str(tmp_path)
+        })
+        cmci_update.main()
+    assert os.listdir(str(tmp_path)) == []
+
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        set_module_args(config)
+        cmci_get.main()
+    assert exc_info.value.args[0]['cache'] == {'hits': 0, 'misses': 1}
+    assert Request.open.call_count == 3
+
+
+def test_get_invalid_cache_ttl(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'msg': 'Parameter "cache_ttl" with value "-1" was not valid.  Expected a number greater than or equal to 0.',
+        'changed': False,
+        'failed': True
+    })
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'cache_ttl': -1
+    })
+
+
+def test_get_projection(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', [
+        {'program': 'PROG1', 'status': 'ENABLED', 'language': 'COBOL'},
+        {'program': 'PROG2', 'language': 'PLI'}
+    ])
+
+    cmci_module.expect(result(
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/',
+        [{'program': 'PROG1', 'status': 'ENABLED'}, {'program': 'PROG2'}]
+    ))
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'projection': ['PROGRAM', 'status']
+    })
+
+
+@pytest.mark.parametrize('compression', ['none', 'gzip'])
+def test_get_dest(cmci_module, tmp_path, compression):  # type: (CMCITestHelper, object, str) -> None
+    records = [{'program': 'PROG1', 'status': 'ENABLED'}, {'program': 'PROG2', 'status': 'DISABLED'}]
+    cmci_module.stub_records('GET', 'cicsprogram', records)
+    dest = str(tmp_path / 'programs.jsonl')
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'dest': dest,
+        'dest_compression': compression
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    with open(dest, 'rb') as f:
+        content = f.read()
+    result = exc_info.value.args[0]
+    assert 'records' not in result
+    assert result['record_count'] == 2
+    assert result['dest'] == dest
+    assert result['size'] == len(content)
+    assert result['checksum'] == hashlib.sha256(content).hexdigest()
+    assert list(read_record_file(dest)) == records
+
+
+def test_get_dest_paged(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    records = paged_records(3)
+    stub_page(cmci_module, 1, records[0:2])
+    stub_page(cmci_module, 3, records[2:3])
+    stub_discard(cmci_module)
+    stub_summary(cmci_module, 3)
+    dest = str(tmp_path / 'programs.jsonl')
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'page_size': 2,
+        'page_concurrency': 2,
+        'dest': dest
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    assert exc_info.value.args[0]['record_count'] == 3
+    assert list(read_record_file(dest)) == records
+
+
+def test_get_dest_failure_leaves_no_file(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    cmci_module.stub_nodata('GET', 'cicsprogram')
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'dest': str(tmp_path / 'programs.jsonl')
+    })
+    with pytest.raises(AnsibleFailJson):
+        cmci_get.main()
+
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_get_gzip_response(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [{'program': 'PROG{0}'.format(i), 'status': 'ENABLED'} for i in range(100)]
+    body = xmltodict.unparse(create_records_response('cicsprogram', records)).encode()
+    compressed = gzip.compress(body)
+    cmci_module.stub_request(
+        'GET',
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/',
+        text=compressed,
+        headers={CONTENT_TYPE: 'application/xml', 'content-encoding': 'gzip'},
+        status_code=200,
+        reason='OK'
+    )
+
+    expected = result('https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/', records)
+    expected['response_size'] = {
+        'content_encoding': 'gzip',
+        'received': len(compressed),
+        'uncompressed': len(body)
+    }
+    cmci_module.expect(expected)
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram'
+    })
+
+    kwargs = Request.open.call_args.kwargs
+    assert kwargs['headers'] == {'Accept-Encoding': 'gzip, deflate'}
+    assert kwargs['decompress'] is False
+
+
+def test_get_timings(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    records = [{'program': 'PROG1', 'status': 'ENABLED'}]
+    cmci_module.stub_records('GET', 'cicsprogram', records)
+    metrics_file = str(tmp_path / 'cmci.prom')
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'timings': True,
+        'metrics_file': metrics_file
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    result = exc_info.value.args[0]
+    assert result['records'] == records
+    timings, = result['timings']
+    assert timings['method'] == 'GET'
+    assert timings['url'] == 'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/'
+    assert list(timings['seconds']) == ['dns', 'request', 'transfer', 'parse', 'total']
+    assert all(value >= 0 for value in timings['seconds'].values())
+    assert timings['bytes']['sent'] == 0
+    assert timings['bytes']['received'] == timings['bytes']['uncompressed'] > 0
+
+    with open(metrics_file) as f:
+        lines = f.read().splitlines()
+    assert lines[-1] == '# EOF'
+    assert len([line for line in lines if line.startswith('cmci_request_duration_seconds{')]) == 5
+    assert any(
+        line.startswith('cmci_request_size_bytes{body="received",context="CICSEX56",host="example.com",'
+                        'method="GET",port="12345",type="cicsprogram"} ' + str(timings['bytes']['received']) + '.0 ')
+        for line in lines
+    )
+
+
+def test_get_no_timings_by_default(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', [{'program': 'PROG1'}])
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram'
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    assert 'timings' not in exc_info.value.args[0]
+
+
+@pytest.fixture
+def no_sleep(monkeypatch, tmp_path):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+    monkeypatch.setattr(_cmci_retry, 'breaker_directory', lambda: str(tmp_path / 'breaker'))
+    return sleeps
+
+
+def stub_unavailable(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_request(
+        'GET',
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/',
+        text='Service Unavailable',
+        headers={CONTENT_TYPE: 'text/html'},
+        status_code=503,
+        reason='Service Unavailable'
+    )
+
+
+def test_get_retries_http_status(cmci_module, no_sleep):  # type: (CMCITestHelper, list) -> None
+    records = [{'program': 'PROG1', 'status': 'ENABLED'}]
+    stub_unavailable(cmci_module)
+    stub_unavailable(cmci_module)
+    cmci_module.stub_records('GET', 'cicsprogram', records)
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'retries': 2,
+        'retry_delay': 0.5,
+        'retry_jitter': False
+    })
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    result = exc_info.value.args[0]
+    assert result['records'] == records
+    assert [(r['attempt'], r['reason'], r['delay']) for r in result['retry_history']] == [
+        (1, 'HTTP status 503', 0.5),
+        (2, 'HTTP status 503', 1.0)
+    ]
+    assert no_sleep == [0.5, 1.0]
+    assert Request.open.call_count == 3
+
+
+def test_get_retries_cpsm_response(cmci_module, no_sleep):  # type: (CMCITestHelper, list) -> None
+    cmci_module.stub_cmci('GET', 'cicsprogram', response_dict=create_cmci_response(
+        ('resultsummary', od(
+            ('@api_response1', '1043'),
+            ('@api_response2', '0'),
+            ('@api_response1_alt', 'BUSY'),
+            ('@api_response2_alt', ''),
+            ('@recordcount', '0')
+        ))
+    ))
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'retries': 1
+    })
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_get.main()
+
+    assert exc_info.value.args[0]['msg'] == 'CMCI request failed with response "BUSY" reason "1043"'
+    history = exc_info.value.args[0]['retry_history']
+    assert [(r['attempt'], r['reason']) for r in history] == [(1, 'CPSM response BUSY')]
+    assert 0 <= history[0]['delay'] <= 1
+    assert Request.open.call_count == 2
+
+
+def test_get_does_not_retry_by_default(cmci_module, no_sleep):  # type: (CMCITestHelper, list) -> None
+    stub_unavailable(cmci_module)
+
+    cmci_module.expect({
+        'msg': 'CMCI request returned non-OK status: Service Unavailable',
+        'changed': False,
+        'failed': True,
+        'http_status': 'Service Unavailable',
+        'http_status_code': 503,
+        'request': {
+            'url': 'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/',
+            'method': 'GET',
+            'body': None
+        }
+    })
+
+    cmci_module.run(cmci_get, {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram'
+    })
+
+    assert no_sleep == []
+
+
+def test_get_circuit_breaker(cmci_module, no_sleep):  # type: (CMCITestHelper, list) -> None
+    stub_unavailable(cmci_module)
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'retries': 5,
+        'circuit_breaker_threshold': 2
+    }
+
+    set_module_args(config)
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_get.main()
+    assert exc_info.value.args[0]['msg'].startswith(
+        'CMCI requests to https://example.com:12345 are suspended for 60 more seconds after 2 consecutive failures'
+    )
+    assert Request.open.call_count == 2
+
+    # Later tasks fail without sending a request
+    set_module_args(config)
+    with pytest.raises(AnsibleFailJson):
+        cmci_get.main()
+    assert Request.open.call_count == 2
+
+
+def fan_out_config(**kwargs):
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'type': 'cicsprogram'
+    }
+    config.update(kwargs)
+    return config
+
+
+def fan_out_target(context, scope, record_count=None, msg=None):
+    target = {
+        'context': context,
+        'scope': scope,
+        'url': 'https://example.com:12345/CICSSystemManagement/cicsprogram/{0}/{1}'
+               .format(context, scope or ''),
+        'failed': msg is not None
+    }
+    if record_count is not None:
+        target.update({
+            'cpsm_response': 'OK',
+            'cpsm_response_code': 1024,
+            'cpsm_reason': '',
+            'cpsm_reason_code': 0,
+            'record_count': record_count
+        })
+    if msg is not None:
+        target['msg'] = msg
+    return target
+
+
+def test_get_fan_out(cmci_module):  # type: (CMCITestHelper) -> None
+    for context in ('PLEX1', 'PLEX2'):
+        for scope in ('SCOPE1', 'SCOPE2'):
+            cmci_module.stub_records('GET', 'cicsprogram', [
+                {'program': 'PROG1', 'region': context + scope}
+            ], context=context, scope=scope)
+
+    set_module_args(fan_out_config(
+        contexts=['PLEX1', 'PLEX2'], scopes=['SCOPE1', 'SCOPE2'], target_concurrency=4
+    ))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    result = exc_info.value.args[0]
+    targets = [(c, s) for c in ('PLEX1', 'PLEX2') for s in ('SCOPE1', 'SCOPE2')]
+    assert result['records'] == [
+        {'program': 'PROG1', 'region': c + s, '_context': c, '_scope': s}
+        for c, s in targets
+    ]
+    assert result['record_count'] == 4
+    assert result['targets'] == [fan_out_target(c, s, 1) for c, s in targets]
+    assert result['request']['url'] == \
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/PLEX1/SCOPE1'
+    assert Request.open.call_count == 4
+
+
+def test_get_fan_out_contexts_with_scope(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', [{'program': 'PROG1'}], context='PLEX1', scope=SCOPE)
+    cmci_module.stub_records('GET', 'cicsprogram', [{'program': 'PROG2'}], context='PLEX2', scope=SCOPE)
+
+    set_module_args(fan_out_config(contexts=['PLEX1', 'PLEX2'], scope=SCOPE))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    assert exc_info.value.args[0]['records'] == [
+        {'program': 'PROG1', '_context': 'PLEX1', '_scope': SCOPE},
+        {'program': 'PROG2', '_context': 'PLEX2', '_scope': SCOPE}
+    ]
+
+
+def test_get_fan_out_partial_failure(cmci_module):  # type: (CMCITestHelper) -> None
+    cmci_module.stub_records('GET', 'cicsprogram', [{'program': 'PROG1'}], context=CONTEXT, scope='SCOPE1')
+    cmci_module.stub_request(
+        'GET',
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/{0}/SCOPE2'.format(CONTEXT),
+        text='Internal Server Error',
+        headers={CONTENT_TYPE: 'text/html'},
+        status_code=500,
+        reason='Internal Server Error'
+    )
+    cmci_module.stub_nodata('GET', 'cicsprogram', context=CONTEXT, scope='SCOPE3')
+
+    set_module_args(fan_out_config(context=CONTEXT, scopes=['SCOPE1', 'SCOPE2', 'SCOPE3']))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_get.main()
+
+    result = exc_info.value.args[0]
+    assert result['msg'] == '2 of 3 CMCI queries failed'
+    assert result['records'] == [{'program': 'PROG1', '_context': CONTEXT, '_scope': 'SCOPE1'}]
+    assert result['targets'][0] == fan_out_target(CONTEXT, 'SCOPE1', 1)
+    assert result['targets'][1] == fan_out_target(
+        CONTEXT, 'SCOPE2', msg='CMCI request returned non-OK status: Internal Server Error'
+    )
+    assert result['targets'][2]['failed'] is True
+    assert result['targets'][2]['cpsm_response'] == 'NODATA'
+    assert result['targets'][2]['msg'].startswith('CMCI request failed with response "NODATA"')
+
+
+@pytest.mark.parametrize('config,msg', [
+    (fan_out_config(context=CONTEXT, contexts=[CONTEXT]),
+     'parameters are mutually exclusive: context|contexts'),
+    (fan_out_config(context=CONTEXT, scope=SCOPE, scopes=[SCOPE]),
+     'parameters are mutually exclusive: scope|scopes'),
+    (fan_out_config(scope=SCOPE),
+     'one of the following is required: context, contexts'),
+    (fan_out_config(contexts=[]),
+     'Parameter "contexts" must not be empty'),
+    (fan_out_config(contexts=['PLEX 1']),
+     'Parameter "contexts" with value "PLEX 1" was not valid. Expected a CPSM context name.  CPSM context '
+     'names are max 8 characters. Valid characters are A-Z a-z 0-9 $ @ #.'),
+    (fan_out_config(contexts=[CONTEXT], page_size=10),
+     'parameters are mutually exclusive: contexts|scopes|page_size'),
+    (fan_out_config(contexts=[CONTEXT], target_concurrency=0),
+     'Parameter "target_concurrency" with value "0" was not valid.  Expected a number greater than 0.'),
+])
+def test_get_fan_out_invalid(cmci_module, config, msg):  # type: (CMCITestHelper, dict, str) -> None
+    set_module_args(config)
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_get.main()
+
+    assert exc_info.value.args[0]['msg'] == msg
+
+
+def test_get_since_snapshot(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    def keyed(name, status='ENABLED'):
+        return {'_keydata': name, 'program': name, 'status': status}
+
+    snapshot = str(tmp_path / 'programs.snapshot')
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'projection': ['program', 'status'],
+        'since_snapshot': snapshot
+    }
+
+    # Stubs of the same request answer in turn
+    cmci_module.stub_records('GET', 'cicsprogram', [keyed('PROG1'), keyed('PROG2')])
+    cmci_module.stub_records('GET', 'cicsprogram', [keyed('PROG2', 'DISABLED'), keyed('PROG3')])
+    set_module_args(dict(config))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    result = exc_info.value.args[0]
+    assert 'records' not in result
+    assert result['record_count'] == 2
+    assert result['delta'] == {'added': [keyed('PROG1'), keyed('PROG2')], 'changed': [], 'removed': []}
+
+    set_module_args(dict(config))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_get.main()
+
+    assert exc_info.value.args[0]['delta'] == {
+        'added': [keyed('PROG3')],
+        'changed': [keyed('PROG2', 'DISABLED')],
+        'removed': ['///PROG1']
+    }
+
+
+def test_get_since_snapshot_unchanged_on_failure(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    snapshot = tmp_path / 'programs.snapshot'
+    snapshot.write_text('{"version":1,"records":{"//PROG1":"0"}}')
+    cmci_module.stub_nodata('GET', 'cicsprogram')
+
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'since_snapshot': str(snapshot)
+    })
+    with pytest.raises(AnsibleFailJson):
+        cmci_get.main()
+
+    assert snapshot.read_text() == '{"version":1,"records":{"//PROG1":"0"}}'
+
+
+def test_get_since_snapshot_with_dest(cmci_module, tmp_path):  # type: (CMCITestHelper, object) -> None
+    set_module_args({
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'type': 'cicsprogram',
+        'dest': str(tmp_path / 'programs.jsonl'),
+        'since_snapshot': str(tmp_path / 'programs.snapshot')
+    })
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_get.main()
+
+    assert exc_info.value.args[0]['msg'] == 'parameters are mutually exclusive: dest|since_snapshot'
+
+
 def result(url, records, http_status='OK', http_status_code=200, cpsm_response='OK', cpsm_response_code=1024, failed=False, msg=None):
     result_dict = {
         'changed': False,
@@ -935,3 +1647,45 @@ def result(url, records, http_status='OK', http_status_code=200, cpsm_response='
             'msg': msg
         })
     return result_dict
+
+
+def stub_summary(cmci_module, record_count, cache_token='E0B3E4A1D4B2C8F0'):
+    # type: (CMCITestHelper, int, str) -> None
+    cmci_module.stub_cmci('GET', 'cicsprogram', parameters='?SUMMONLY&NODISCARD', response_dict=create_cmci_response(
+        ('resultsummary', od(
+            ('@api_response1', '1024'),
+            ('@api_response2', '0'),
+            ('@api_response1_alt', 'OK'),
+            ('@api_response2_alt', ''),
+            ('@recordcount', str(record_count)),
+            ('@cachetoken', cache_token)
+        ))
+    ))
+
+
+def stub_page(cmci_module, index, records, cache_token='E0B3E4A1D4B2C8F0'):
+    # type: (CMCITestHelper, int, list, str) -> None
+    cmci_module.stub_request(
+        'GET',
+        'https://example.com:12345/CICSSystemManagement/CICSResultCache/{0}/{1}/{2}?NODISCARD'
+        .format(cache_token, index, len(records)),
+        text=xmltodict.unparse(create_records_response('cicsprogram', records)),
+        headers={CONTENT_TYPE: 'application/xml'},
+        status_code=200,
+        reason='OK'
+    )
+
+
+def stub_discard(cmci_module, cache_token='E0B3E4A1D4B2C8F0'):  # type: (CMCITestHelper, str) -> None
+    cmci_module.stub_request(
+        'DELETE',
+        'https://example.com:12345/CICSSystemManagement/CICSResultCache/{0}'.format(cache_token),
+        text=xmltodict.unparse(create_delete_response(0)),
+        headers={CONTENT_TYPE: 'application/xml'},
+        status_code=500,
+        reason='Internal Server Error'
+    )
+
+
+def paged_records(count):
+    return [{'program': 'PROG{0}'.format(i), 'status': 'ENABLED'} for i in range(count)]
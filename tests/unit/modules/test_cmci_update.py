@@ -6,11 +6,17 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ansible.module_utils.urls import Request
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _cmci_retry
 from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_update
 from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
-    HOST, PORT, CONTEXT, SCOPE, od, body_matcher, cmci_module, CMCITestHelper
+    HOST, PORT, CONTEXT, SCOPE, od, body_matcher, cmci_module, AnsibleExitJson, AnsibleFailJson,
+    CMCITestHelper, encode_html_parameter, set_module_args
 )
 
+import pytest
+import time
+
 
 def test_csd_update(cmci_module):  # type: (cmci_module) -> None
     record = dict(
@@ -173,6 +179,273 @@ def test_resource_update(cmci_module):  # type: (CMCITestHelper) -> None
     })
 
 
+BASE_URL = 'https://example.com:12345/CICSSystemManagement/' \
+    'cicsdefinitionprogram/CICSEX56/IYCWEMW2'
+CSDGROUP = [('PARAMETER', 'CSDGROUP(GRP)')]
+
+
+def skip_unchanged_config(**kwargs):
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': SCOPE,
+        'type': 'cicsdefinitionprogram',
+        'update_parameters': [{'name': 'CSD'}],
+        'attributes': {
+            'description': 'new',
+            'status': 'ENABLED'
+        },
+        'skip_unchanged': True,
+        'resources': {
+            'get_parameters': [{'name': 'CSDGROUP', 'value': 'GRP'}]
+        }
+    }
+    config.update(kwargs)
+    return config
+
+
+def test_skip_unchanged_no_changes(cmci_module):  # type: (CMCITestHelper) -> None
+    records = [
+        {'name': 'PROGA', 'description': 'new', 'status': 'ENABLED'},
+        {'name': 'PROGB', 'description': 'new', 'status': 'ENABLED'},
+    ]
+    cmci_module.stub_records(
+        'GET', 'cicsdefinitionprogram', records, scope=SCOPE,
+        parameters=encode_html_parameter(CSDGROUP)
+    )
+
+    cmci_module.expect({
+        'changed': False,
+        'connect_version': '0560',
+        'cpsm_reason': '',
+        'cpsm_reason_code': 0,
+        'cpsm_response': 'OK',
+        'cpsm_response_code': 1024,
+        'http_status': 'OK',
+        'http_status_code': 200,
+        'request': {
+            'url': BASE_URL + encode_html_parameter(CSDGROUP),
+            'method': 'GET',
+            'body': None
+        },
+        'records': [],
+        'record_count': 0,
+        'updates': []
+    })
+
+    cmci_module.run(cmci_update, skip_unchanged_config())
+
+
+def test_skip_unchanged_updates_differences(cmci_module):
+    # type: (CMCITestHelper) -> None
+    records = [
+        {'name': 'PROGA', 'description': 'old', 'status': 'ENABLED'},
+        {'name': 'PROGB', 'description': 'old', 'status': 'DISABLED'},
+        {'name': 'PROGC', 'description': 'new', 'status': 'ENABLED'},
+        {'name': 'PROGD', 'description': 'older', 'status': 'ENABLED'},
+    ]
+    cmci_module.stub_records(
+        'GET', 'cicsdefinitionprogram', records, scope=SCOPE,
+        parameters=encode_html_parameter(
+            [('CRITERIA', "NAME='PROG*'")] + CSDGROUP
+        )
+    )
+
+    description_only = encode_html_parameter([(
+        'CRITERIA',
+        "(NAME='PROG*') AND (NOT(description=='new')) AND "
+        "(status=='ENABLED')"
+    )] + CSDGROUP)
+    updated_a = {'name': 'PROGA', 'description': 'new', 'status': 'ENABLED'}
+    updated_d = {'name': 'PROGD', 'description': 'new', 'status': 'ENABLED'}
+    cmci_module.stub_records(
+        'PUT', 'cicsdefinitionprogram', [updated_a, updated_d], scope=SCOPE,
+        parameters=description_only
+    )
+
+    both = encode_html_parameter([(
+        'CRITERIA',
+        "(NAME='PROG*') AND (NOT(description=='new')) AND "
+        "(NOT(status=='ENABLED'))"
+    )] + CSDGROUP)
+    updated_b = {'name': 'PROGB', 'description': 'new', 'status': 'ENABLED'}
+    cmci_module.stub_records(
+        'PUT', 'cicsdefinitionprogram', [updated_b], scope=SCOPE,
+        parameters=both
+    )
+
+    cmci_module.expect({
+        'changed': True,
+        'connect_version': '0560',
+        'cpsm_reason': '',
+        'cpsm_reason_code': 0,
+        'cpsm_response': 'OK',
+        'cpsm_response_code': 1024,
+        'http_status': 'OK',
+        'http_status_code': 200,
+        'request': {
+            'url': BASE_URL + encode_html_parameter(
+                [('CRITERIA', "NAME='PROG*'")] + CSDGROUP
+            ),
+            'method': 'GET',
+            'body': None
+        },
+        'records': [updated_a, updated_d, updated_b],
+        'record_count': 3,
+        'updates': [{
+            'attributes': ['description'],
+            'record_count': 2,
+            'request': {
+                'url': BASE_URL + description_only,
+                'method': 'PUT',
+                'body': '<request><update>'
+                        '<parameter name="CSD"></parameter>'
+                        '<attributes description="new"></attributes>'
+                        '</update></request>'
+            }
+        }, {
+            'attributes': ['description', 'status'],
+            'record_count': 1,
+            'request': {
+                'url': BASE_URL + both,
+                'method': 'PUT',
+                'body': '<request><update>'
+                        '<parameter name="CSD"></parameter>'
+                        '<attributes description="new" status="ENABLED">'
+                        '</attributes>'
+                        '</update></request>'
+            }
+        }]
+    })
+
+    cmci_module.run(cmci_update, skip_unchanged_config(resources={
+        'complex_filter': {'attribute': 'NAME', 'value': 'PROG*'},
+        'get_parameters': [{'name': 'CSDGROUP', 'value': 'GRP'}]
+    }))
+
+
+def test_skip_unchanged_normalises_values(cmci_module):
+    # type: (CMCITestHelper) -> None
+    records = [
+        {'name': 'PROGA', 'status': 'ENABLED', 'priority': '10'},
+        {'name': 'PROGB', 'status': 'DISABLED', 'priority': '10'},
+    ]
+    cmci_module.stub_records(
+        'GET', 'cicsdefinitionprogram', records, scope=SCOPE,
+        parameters=encode_html_parameter(CSDGROUP)
+    )
+
+    # The filter uses the values as CMCI returned them
+    status_only = encode_html_parameter([(
+        'CRITERIA',
+        "(NOT(status=='ENABLED')) AND (priority=='10')"
+    )] + CSDGROUP)
+    updated_b = {'name': 'PROGB', 'status': 'ENABLED', 'priority': '10'}
+    cmci_module.stub_records(
+        'PUT', 'cicsdefinitionprogram', [updated_b], scope=SCOPE,
+        parameters=status_only
+    )
+
+    cmci_module.expect({
+        'changed': True,
+        'connect_version': '0560',
+        'cpsm_reason': '',
+        'cpsm_reason_code': 0,
+        'cpsm_response': 'OK',
+        'cpsm_response_code': 1024,
+        'http_status': 'OK',
+        'http_status_code': 200,
+        'request': {
+            'url': BASE_URL + encode_html_parameter(CSDGROUP),
+            'method': 'GET',
+            'body': None
+        },
+        'records': [updated_b],
+        'record_count': 1,
+        'updates': [{
+            'attributes': ['status'],
+            'record_count': 1,
+            'request': {
+                'url': BASE_URL + status_only,
+                'method': 'PUT',
+                'body': '<request><update>'
+                        '<parameter name="CSD"></parameter>'
+                        '<attributes status="enabled"></attributes>'
+                        '</update></request>'
+            }
+        }]
+    })
+
+    cmci_module.run(cmci_update, skip_unchanged_config(
+        attributes={'status': 'enabled', 'priority': ' 0010'}
+    ))
+
+
+def test_skip_unchanged_filters_every_form_of_a_value(cmci_module):
+    # type: (CMCITestHelper) -> None
+    records = [
+        {'name': 'PROGA', 'status': 'ENABLED', 'priority': '0100'},
+        {'name': 'PROGB', 'status': 'DISABLED', 'priority': '100'},
+        {'name': 'PROGC', 'status': 'ENABLED', 'priority': '50'},
+        {'name': 'PROGD', 'status': 'ENABLED', 'priority': '100'},
+    ]
+    cmci_module.stub_records(
+        'GET', 'cicsdefinitionprogram', records, scope=SCOPE,
+        parameters=encode_html_parameter(CSDGROUP)
+    )
+
+    # PROGA and PROGD already have the priority, in different forms, so
+    # neither is selected by the update of PROGC
+    status_only = encode_html_parameter([(
+        'CRITERIA',
+        "(NOT(status=='ENABLED')) AND "
+        "((priority=='0100') OR (priority=='100'))"
+    )] + CSDGROUP)
+    updated_b = {'name': 'PROGB', 'status': 'ENABLED', 'priority': '100'}
+    cmci_module.stub_records(
+        'PUT', 'cicsdefinitionprogram', [updated_b], scope=SCOPE,
+        parameters=status_only
+    )
+    priority_only = encode_html_parameter([(
+        'CRITERIA',
+        "(status=='ENABLED') AND (NOT(priority=='0100')) AND "
+        "(NOT(priority=='100'))"
+    )] + CSDGROUP)
+    updated_c = {'name': 'PROGC', 'status': 'ENABLED', 'priority': '100'}
+    cmci_module.stub_records(
+        'PUT', 'cicsdefinitionprogram', [updated_c], scope=SCOPE,
+        parameters=priority_only
+    )
+
+    set_module_args(skip_unchanged_config(
+        attributes={'status': 'ENABLED', 'priority': '100'}
+    ))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_update.main()
+
+    result = exc_info.value.args[0]
+    assert [(u['attributes'], u['record_count'], u['request']['url']) for u in result['updates']] == [
+        (['status'], 1, BASE_URL + status_only),
+        (['priority'], 1, BASE_URL + priority_only)
+    ]
+    assert result['records'] == [updated_b, updated_c]
+
+
+def test_skip_unchanged_invalid_attribute(cmci_module):
+    # type: (CMCITestHelper) -> None
+    cmci_module.expect({
+        'changed': False,
+        'failed': True,
+        'msg': 'Attribute with value bad_name was not valid. Valid characters '
+               'are A-Z a-z 0-9.'
+    })
+
+    cmci_module.run(cmci_update, skip_unchanged_config(
+        attributes={'bad_name': 'x'}
+    ))
+
+
 def result(url, record, body):
     return {
         'changed': True,
@@ -191,3 +464,67 @@ def result(url, record, body):
         'records': [record],
         'record_count': 1
     }
+
+
+@pytest.fixture
+def no_sleep(monkeypatch, tmp_path):
+    monkeypatch.setattr(time, 'sleep', lambda delay: None)
+    monkeypatch.setattr(_cmci_retry, 'breaker_directory', lambda: str(tmp_path / 'breaker'))
+
+
+def stub_put_status(cmci_module, status_code, reason):
+    # type: (CMCITestHelper, int, str) -> None
+    cmci_module.stub_request(
+        'PUT',
+        BASE_URL + '?CRITERIA=%28NAME%3D%27DUMMY%27%29',
+        text=reason,
+        headers={'content-type': 'text/html'},
+        status_code=status_code,
+        reason=reason
+    )
+
+
+def update_config(**kwargs):
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': SCOPE,
+        'type': 'cicsdefinitionprogram',
+        'attributes': {'description': 'new description'},
+        'resources': {'filter': {'NAME': 'DUMMY'}}
+    }
+    config.update(kwargs)
+    return config
+
+
+def test_update_not_retried_on_gateway_timeout(cmci_module, no_sleep):
+    # type: (CMCITestHelper, None) -> None
+    stub_put_status(cmci_module, 504, 'Gateway Timeout')
+
+    set_module_args(update_config(retries=2))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_update.main()
+
+    assert exc_info.value.args[0]['http_status_code'] == 504
+    assert 'retry_history' not in exc_info.value.args[0]
+    assert Request.open.call_count == 1
+
+
+def test_update_retried_when_unavailable(cmci_module, no_sleep):
+    # type: (CMCITestHelper, None) -> None
+    record = {'name': 'DUMMY', 'description': 'new description'}
+    stub_put_status(cmci_module, 503, 'Service Unavailable')
+    cmci_module.stub_records(
+        'PUT', 'cicsdefinitionprogram', [record], scope=SCOPE,
+        parameters='?CRITERIA=%28NAME%3D%27DUMMY%27%29'
+    )
+
+    set_module_args(update_config(retries=2))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_update.main()
+
+    result = exc_info.value.args[0]
+    assert result['records'] == [record]
+    assert [r['reason'] for r in result['retry_history']] == ['HTTP status 503']
+    assert Request.open.call_count == 2
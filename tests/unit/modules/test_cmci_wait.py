@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_cics.plugins.modules import cmci_wait
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.cmci_helper import (
+    HOST, PORT, CONTEXT, SCOPE, AnsibleExitJson, AnsibleFailJson, cmci_module, CMCITestHelper,
+    create_cmci_response, encode_html_parameter, od, set_module_args
+)
+from ansible.module_utils.urls import Request
+
+import pytest
+import time
+
+CRITERIA = encode_html_parameter([('CRITERIA', "((program='PROG1')) AND (NOT(STATUS='ENABLED'))")])
+COUNT = encode_html_parameter([('CRITERIA', "(program='PROG1')")]) + '&SUMMONLY'
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+    return sleeps
+
+
+def wait_config(**kwargs):
+    config = {
+        'cmci_host': HOST,
+        'cmci_port': PORT,
+        'context': CONTEXT,
+        'scope': SCOPE,
+        'type': 'cicsprogram',
+        'resources': {
+            'filter': {
+                'program': 'PROG1'
+            }
+        },
+        'condition': {
+            'attribute': 'STATUS',
+            'value': 'ENABLED'
+        }
+    }
+    config.update(kwargs)
+    return config
+
+
+def stub_polls(cmci_module, not_ready):  # type: (CMCITestHelper, int) -> None
+    for i in range(not_ready):
+        cmci_module.stub_records('GET', 'cicsprogram', [{'program': 'PROG1', 'status': 'DISABLED'}],
+                                 scope=SCOPE, parameters=CRITERIA)
+    cmci_module.stub_nodata('GET', 'cicsprogram', scope=SCOPE, parameters=CRITERIA)
+    stub_count(cmci_module, 1)
+
+
+def stub_count(cmci_module, record_count):  # type: (CMCITestHelper, int) -> None
+    cmci_module.stub_cmci('GET', 'cicsprogram', scope=SCOPE, parameters=COUNT, response_dict=create_cmci_response(
+        ('resultsummary', od(
+            ('@api_response1', '1024' if record_count else '1027'),
+            ('@api_response2', '0'),
+            ('@api_response1_alt', 'OK' if record_count else 'NODATA'),
+            ('@api_response2_alt', ''),
+            ('@recordcount', str(record_count))
+        ))
+    ))
+
+
+def test_wait_already_met(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    stub_polls(cmci_module, 0)
+
+    set_module_args(wait_config())
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['changed'] is False
+    assert result['polls'] == 1
+    assert result['records'] == []
+    assert result['record_count'] == 0
+    assert result['request']['url'] == \
+        'https://example.com:12345/CICSSystemManagement/cicsprogram/CICSEX56/IYCWEMW2' + CRITERIA
+    assert sleeps == []
+
+
+def test_wait_backs_off(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    stub_polls(cmci_module, 5)
+
+    set_module_args(wait_config(poll_delay=0.5, poll_max_delay=3))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['polls'] == 6
+    assert result['records'] == []
+    # The last poll is followed by a count
+    assert Request.open.call_count == 7
+    assert sleeps == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_wait_many_polls(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    # The delay stays at poll_max_delay however many polls there are
+    stub_polls(cmci_module, 1100)
+
+    set_module_args(wait_config(poll_delay=0.5, poll_max_delay=3))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_wait.main()
+
+    assert exc_info.value.args[0]['polls'] == 1101
+    assert len(sleeps) == 1100
+    assert sleeps[-1] == 3.0
+
+
+def test_wait_times_out(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    stub_polls(cmci_module, 1)
+
+    set_module_args(wait_config(wait_timeout=0))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['msg'] == 'Timed out after 0 seconds waiting for 1 resources to meet the condition'
+    assert result['records'] == [{'program': 'PROG1', 'status': 'DISABLED'}]
+    assert result['polls'] == 1
+    assert sleeps == []
+
+
+def test_wait_for_resources_to_exist(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    # Until the program is installed, nothing matches the filter either
+    cmci_module.stub_nodata('GET', 'cicsprogram', scope=SCOPE, parameters=CRITERIA)
+    stub_count(cmci_module, 0)
+    stub_count(cmci_module, 0)
+    stub_count(cmci_module, 1)
+
+    set_module_args(wait_config())
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['polls'] == 3
+    assert result['records'] == []
+    assert sleeps == [0.5, 1.0]
+
+
+def test_wait_times_out_without_resources(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    cmci_module.stub_nodata('GET', 'cicsprogram', scope=SCOPE, parameters=CRITERIA)
+    stub_count(cmci_module, 0)
+
+    set_module_args(wait_config(wait_timeout=0))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['msg'] == 'Timed out after 0 seconds waiting for at least 1 resources to match, found 0'
+    assert result['records'] == []
+    assert result['polls'] == 1
+
+
+def test_wait_min_count_zero_without_resources(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    cmci_module.stub_nodata('GET', 'cicsprogram', scope=SCOPE, parameters=CRITERIA)
+
+    set_module_args(wait_config(min_count=0))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['polls'] == 1
+    assert result['cpsm_response'] == 'NODATA'
+    # No count is made
+    assert Request.open.call_count == 1
+
+
+def test_wait_complex_condition_without_resources(cmci_module, sleeps):  # type: (CMCITestHelper, list) -> None
+    criteria = encode_html_parameter([
+        ('CRITERIA', "NOT((ENABLESTATUS='ENABLED') OR (ENABLESTATUS='DISABLED'))")
+    ])
+    cmci_module.stub_nodata('GET', 'cicsbundle', parameters=criteria)
+    cmci_module.stub_records('GET', 'cicsbundle', [{'name': 'BUND1'}], parameters='?SUMMONLY')
+
+    set_module_args(wait_config(
+        type='cicsbundle',
+        scope=None,
+        resources=None,
+        condition={'attribute': 'ENABLESTATUS', 'operator': 'IN', 'value': ['ENABLED', 'DISABLED']}
+    ))
+    with pytest.raises(AnsibleExitJson) as exc_info:
+        cmci_wait.main()
+
+    result = exc_info.value.args[0]
+    assert result['polls'] == 1
+    assert result['request']['url'] == \
+        'https://example.com:12345/CICSSystemManagement/cicsbundle/CICSEX56/' + criteria
+
+
+def test_wait_invalid_poll_delay(cmci_module):  # type: (CMCITestHelper) -> None
+    set_module_args(wait_config(poll_delay=-1))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_wait.main()
+
+    assert exc_info.value.args[0]['msg'] == \
+        'Parameter "poll_delay" with value "-1.0" was not valid.  Expected a number greater than 0.'
+
+
+def test_wait_zero_poll_delay(cmci_module):  # type: (CMCITestHelper) -> None
+    set_module_args(wait_config(poll_delay=0))
+    with pytest.raises(AnsibleFailJson) as exc_info:
+        cmci_wait.main()
+
+    assert exc_info.value.args[0]['msg'] == \
+        'Parameter "poll_delay" with value "0.0" was not valid.  Expected a number greater than 0.'
@@ -12,9 +12,11 @@ from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper imp
     CSDUP_name,
     CSDUP_stderr,
     CSDUP_initialize_stdout,
-    ICETOOL_name,
+    ICETOOL_first_record_name,
     ICETOOL_stderr,
     ICETOOL_stdout,
+    LISTCAT_name,
+    LISTCAT_stdout,
     IDCAMS_delete_run_name,
     IDCAMS_delete,
     IDCAMS_create_run_name,
@@ -206,6 +208,9 @@ def test_do_nothing_to_an_existing_csd():
             MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), "")
         ]
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 0), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -229,7 +234,13 @@ def test_do_nothing_to_an_existing_csd():
                 stderr="",
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
+                rc=0,
+                stdout=LISTCAT_stdout(NAME, 0),
+                stderr="",
+            ),
+            _execution(
+                name=ICETOOL_first_record_name(1),
                 rc=0,
                 stdout=ICETOOL_stdout(0),
                 stderr=ICETOOL_stderr()
@@ -318,6 +329,9 @@ def test_warm_start_a_existing_csd():
             ""
         )
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 52), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -335,10 +349,10 @@ def test_warm_start_a_existing_csd():
                 stdout=LISTDS_data_set(NAME, "VSAM"),
                 stderr=""),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
                 rc=0,
-                stdout=ICETOOL_stdout(52),
-                stderr=ICETOOL_stderr(),
+                stdout=LISTCAT_stdout(NAME, 52),
+                stderr="",
             ),
             _execution(
                 name=LISTDS_run_name(1),
@@ -375,6 +389,9 @@ def test_error_warm_start_a_unused_csd():
             ""
         )
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 0), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -392,10 +409,17 @@ def test_error_warm_start_a_unused_csd():
                 stdout=LISTDS_data_set(NAME, "VSAM"),
                 stderr=""),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
+                rc=0,
+                stdout=LISTCAT_stdout(NAME, 0),
+                stderr="",
+            ),
+            _execution(
+                name=ICETOOL_first_record_name(1),
                 rc=0,
                 stdout=ICETOOL_stdout(0),
-                stderr=ICETOOL_stderr()),
+                stderr=ICETOOL_stderr()
+            ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
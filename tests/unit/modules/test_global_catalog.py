@@ -8,9 +8,11 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _global_ca
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import _execution
 from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import (
     PYTHON_LANGUAGE_FEATURES_MESSAGE,
-    ICETOOL_name,
+    ICETOOL_first_record_name,
     ICETOOL_stderr,
     ICETOOL_stdout,
+    LISTCAT_name,
+    LISTCAT_stdout,
     IDCAMS_create_stdout,
     IDCAMS_delete_run_name,
     IDCAMS_delete,
@@ -158,6 +160,9 @@ def test_delete_an_existing_global_catalog():
             MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(NAME), ""),
         ]
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 0), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -276,6 +281,9 @@ def test_warm_start_a_global_catalog():
     global_catalog_utils._execute_dfhrmutl = MagicMock(
         return_value=MVSCmdResponse(rc=0, stdout=RMUTL_stdout("AUTOASIS", "UNKNOWN"), stderr=RMUTL_stderr(NAME))
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 52), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -299,10 +307,10 @@ def test_warm_start_a_global_catalog():
                 stderr=RMUTL_stderr(NAME)
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
                 rc=0,
-                stdout=ICETOOL_stdout(52),
-                stderr=ICETOOL_stderr()
+                stdout=LISTCAT_stdout(NAME, 52),
+                stderr="",
             ),
             _execution(
                 name=RMUTL_update_run_name(1),
@@ -357,6 +365,9 @@ def test_error_warm_start_a_unused_global_catalog():
     global_catalog_utils._execute_dfhrmutl = MagicMock(
         return_value=MVSCmdResponse(rc=0, stdout=RMUTL_stdout("AUTOINIT", "UNKNOWN"), stderr=RMUTL_stderr(NAME))
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 0), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -381,10 +392,17 @@ def test_error_warm_start_a_unused_global_catalog():
                 stderr=RMUTL_stderr(NAME)
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
+                rc=0,
+                stdout=LISTCAT_stdout(NAME, 0),
+                stderr="",
+            ),
+            _execution(
+                name=ICETOOL_first_record_name(1),
                 rc=0,
                 stdout=ICETOOL_stdout(0),
-                stderr=ICETOOL_stderr()),
+                stderr=ICETOOL_stderr()
+            ),
             _execution(
                 name=RMUTL_update_run_name(1),
                 rc=0,
@@ -11,9 +11,11 @@ from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper imp
     PYTHON_LANGUAGE_FEATURES_MESSAGE,
     CCUTL_name,
     CCUTL_stderr,
-    ICETOOL_name,
+    ICETOOL_first_record_name,
     ICETOOL_stderr,
     ICETOOL_stdout,
+    LISTCAT_name,
+    LISTCAT_stdout,
     IDCAMS_delete_run_name,
     IDCAMS_delete,
     IDCAMS_create_run_name,
@@ -141,6 +143,9 @@ def test_delete_an_existing_local_catalog():
             MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(NAME), ""),
         ]
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 0), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -208,6 +213,9 @@ def test_delete_an_existing_local_catalog_and_replace():
             MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), ""),
         ]
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 52), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=(
             MVSCmdResponse(
@@ -231,10 +239,10 @@ def test_delete_an_existing_local_catalog_and_replace():
                 stderr="",
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
                 rc=0,
-                stdout=ICETOOL_stdout(52),
-                stderr=ICETOOL_stderr()
+                stdout=LISTCAT_stdout(NAME, 52),
+                stderr="",
             ),
             _execution(
                 name=IDCAMS_delete_run_name(1, NAME),
@@ -336,6 +344,9 @@ def test_warm_start_a_local_catalog():
             ""
         )
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 52), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -353,10 +364,10 @@ def test_warm_start_a_local_catalog():
                 stdout=LISTDS_data_set(NAME, "VSAM"),
                 stderr=""),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
                 rc=0,
-                stdout=ICETOOL_stdout(52),
-                stderr=ICETOOL_stderr(),
+                stdout=LISTCAT_stdout(NAME, 52),
+                stderr="",
             ),
             _execution(
                 name=LISTDS_run_name(1),
@@ -392,6 +403,9 @@ def test_error_warm_start_a_unused_local_catalog():
             ""
         )
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 0), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=MVSCmdResponse(
             rc=0,
@@ -410,7 +424,13 @@ def test_error_warm_start_a_unused_local_catalog():
                 stderr=""
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
+                rc=0,
+                stdout=LISTCAT_stdout(NAME, 0),
+                stderr="",
+            ),
+            _execution(
+                name=ICETOOL_first_record_name(1),
                 rc=0,
                 stdout=ICETOOL_stdout(0),
                 stderr=ICETOOL_stderr()
@@ -7,12 +7,18 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _data_set,
 from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import _execution
 from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import (
     PYTHON_LANGUAGE_FEATURES_MESSAGE,
-    ICETOOL_name,
+    ICETOOL_first_record_name,
     ICETOOL_stderr,
     ICETOOL_stdout,
+    LISTCAT_name,
+    LISTCAT_stdout,
     IDCAMS_delete_run_name,
     IDCAMS_delete,
+    IDCAMS_delete_not_found,
     IDCAMS_create_run_name,
+    IDCAMS_create_already_exists_stdout,
+    IDCAMS_reset_run_name,
+    IDCAMS_reset_stdout,
     LISTDS_data_set_doesnt_exist,
     LISTDS_data_set,
     LISTDS_run_name,
@@ -183,6 +189,9 @@ def test_delete_an_existing_lrq_and_replace():
             MVSCmdResponse(0, NAME, ""),
         ]
     )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, LISTCAT_stdout(NAME, 52), "")
+    )
     icetool._execute_icetool = MagicMock(
         return_value=(
             MVSCmdResponse(
@@ -203,9 +212,185 @@ def test_delete_an_existing_lrq_and_replace():
                 stderr="",
             ),
             _execution(
-                name=ICETOOL_name(1),
+                name=LISTCAT_name(1),
                 rc=0,
-                stdout=ICETOOL_stdout(52),
+                stdout=LISTCAT_stdout(NAME, 52),
+                stderr="",
+            ),
+            _execution(
+                name=IDCAMS_delete_run_name(1, NAME),
+                rc=0,
+                stdout=IDCAMS_delete(NAME),
+                stderr="",
+            ),
+            _execution(
+                name=LISTDS_run_name(1),
+                rc=8,
+                stdout=LISTDS_data_set_doesnt_exist(NAME),
+                stderr="",
+            ),
+            _execution(
+                name=IDCAMS_create_run_name(1, NAME),
+                rc=0,
+                stdout=NAME,
+                stderr="",
+            ),
+            _execution(
+                name=LISTDS_run_name(1),
+                rc=0,
+                stdout=LISTDS_data_set(NAME, "VSAM"),
+                stderr="",
+            ),
+        ],
+        start_state=dict(
+            exists=True,
+            data_set_organization="VSAM"
+        ),
+        end_state=dict(
+            exists=True,
+            data_set_organization="VSAM"
+        ),
+        changed=True,
+        failed=False,
+        msg="",
+    )
+    assert lrq_module.result == expected_result
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_reset_an_existing_lrq_in_place():
+    lrq_module = initialise_module(state="initial")
+    lrq_stdout = LISTCAT_stdout(NAME, 52, keylen=40, avglrecl=2232, maxlrecl=2400, cisize=2560, reuse=True)
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), "")
+    )
+    data_set_utils._execute_idcams = MagicMock()
+    data_set_utils._execute_idcams_reset = MagicMock(
+        return_value=MVSCmdResponse(0, IDCAMS_reset_stdout(NAME), "")
+    )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, lrq_stdout, "")
+    )
+    icetool._execute_icetool = MagicMock(
+        return_value=MVSCmdResponse(
+            rc=0,
+            stdout=ICETOOL_stdout(0),
+            stderr=ICETOOL_stderr()
+        )
+    )
+
+    lrq_module.main()
+    expected_result = dict(
+        executions=[
+            _execution(
+                name=LISTDS_run_name(1),
+                rc=0,
+                stdout=LISTDS_data_set(NAME, "VSAM"),
+                stderr="",
+            ),
+            _execution(
+                name=LISTCAT_name(1),
+                rc=0,
+                stdout=lrq_stdout,
+                stderr="",
+            ),
+            _execution(
+                name=IDCAMS_reset_run_name(1),
+                rc=0,
+                stdout=IDCAMS_reset_stdout(NAME),
+                stderr="",
+            ),
+            _execution(
+                name=ICETOOL_first_record_name(1),
+                rc=0,
+                stdout=ICETOOL_stdout(0),
+                stderr=ICETOOL_stderr()
+            ),
+            _execution(
+                name=LISTDS_run_name(1),
+                rc=0,
+                stdout=LISTDS_data_set(NAME, "VSAM"),
+                stderr="",
+            ),
+        ],
+        start_state=dict(
+            exists=True,
+            data_set_organization="VSAM"
+        ),
+        end_state=dict(
+            exists=True,
+            data_set_organization="VSAM"
+        ),
+        changed=True,
+        failed=False,
+        msg="",
+    )
+    assert lrq_module.result == expected_result
+    data_set_utils._execute_idcams.assert_not_called()
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_reset_an_existing_lrq_not_emptied_is_replaced():
+    lrq_module = initialise_module(state="initial")
+    lrq_stdout = LISTCAT_stdout(NAME, 52, keylen=40, avglrecl=2232, maxlrecl=2400, cisize=2560, reuse=True)
+
+    data_set_utils._execute_listds = MagicMock(
+        side_effect=[
+            MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), ""),
+            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(NAME), ""),
+            MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), ""),
+        ]
+    )
+    data_set_utils._execute_idcams = MagicMock(
+        side_effect=[
+            MVSCmdResponse(0, IDCAMS_delete(NAME), ""),
+            MVSCmdResponse(0, NAME, ""),
+        ]
+    )
+    data_set_utils._execute_idcams_reset = MagicMock(
+        return_value=MVSCmdResponse(4, IDCAMS_reset_stdout(NAME), "")
+    )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, lrq_stdout, "")
+    )
+    icetool._execute_icetool = MagicMock(
+        return_value=MVSCmdResponse(
+            rc=0,
+            stdout=ICETOOL_stdout(1),
+            stderr=ICETOOL_stderr()
+        )
+    )
+
+    lrq_module.main()
+    expected_result = dict(
+        executions=[
+            _execution(
+                name=LISTDS_run_name(1),
+                rc=0,
+                stdout=LISTDS_data_set(NAME, "VSAM"),
+                stderr="",
+            ),
+            _execution(
+                name=LISTCAT_name(1),
+                rc=0,
+                stdout=lrq_stdout,
+                stderr="",
+            ),
+            _execution(
+                name=IDCAMS_reset_run_name(1),
+                rc=4,
+                stdout=IDCAMS_reset_stdout(NAME),
+                stderr="",
+            ),
+            _execution(
+                name=ICETOOL_first_record_name(1),
+                rc=0,
+                stdout=ICETOOL_stdout(1),
                 stderr=ICETOOL_stderr()
             ),
             _execution(
@@ -368,3 +553,164 @@ def test_warm_success_lrq():
         msg="",
     )
     assert lrq_module.result == expected_result
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_create_an_intial_local_request_queue_with_known_state():
+    set_module_args(dict(
+        default_arg_parms,
+        state="initial",
+        known_state=dict(exists=False, data_set_organization="NONE")
+    ))
+    _data_set._check_zoau_version = MagicMock(return_value=None)
+    lrq_module = local_request_queue.AnsibleLocalRequestQueueModule()
+    lrq_module._module.fail_json = MagicMock(return_value=None)
+    lrq_module._module.exit_json = MagicMock(return_value=None)
+
+    data_set_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(0, NAME, ""))
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), "")
+    )
+
+    lrq_module.main()
+    expected_result = dict(
+        executions=[
+            _execution(
+                name=IDCAMS_create_run_name(1, NAME),
+                rc=0,
+                stdout=NAME,
+                stderr="",
+            ),
+            _execution(
+                name=LISTDS_run_name(1),
+                rc=0,
+                stdout=LISTDS_data_set(NAME, "VSAM"),
+                stderr="",
+            ),
+        ],
+        start_state=dict(
+            exists=False,
+            data_set_organization="NONE"
+        ),
+        end_state=dict(
+            exists=True,
+            data_set_organization="VSAM"
+        ),
+        changed=True,
+        failed=False,
+        msg="",
+    )
+    assert lrq_module.get_result() == expected_result
+    data_set_utils._execute_listds.assert_called_once()
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_warm_lrq_ignores_known_state():
+    # The data set was deleted outside the modules after the known state was recorded
+    set_module_args(dict(
+        default_arg_parms,
+        state="warm",
+        known_state=dict(exists=True, data_set_organization="VSAM")
+    ))
+    _data_set._check_zoau_version = MagicMock(return_value=None)
+    lrq_module = local_request_queue.AnsibleLocalRequestQueueModule()
+    lrq_module._module.fail_json = MagicMock(return_value=None)
+    lrq_module._module.exit_json = MagicMock(return_value=None)
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(NAME), "")
+    )
+
+    lrq_module.main()
+    lrq_module._module.fail_json.assert_called_once()
+    result = lrq_module._module.fail_json.call_args[1]
+    assert result["failed"] is True
+    assert result["msg"] == "Data set {0} does not exist.".format(NAME)
+    assert result["start_state"] == dict(exists=False, data_set_organization="NONE")
+    # The LISTDS before the task, and the one at the end that the mocked
+    # fail_json doesn't stop
+    assert data_set_utils._execute_listds.call_count == 2
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_create_lrq_with_out_of_date_known_state():
+    # The data set was created outside the modules after the known state was recorded
+    set_module_args(dict(
+        default_arg_parms,
+        state="initial",
+        known_state=dict(exists=False, data_set_organization="NONE")
+    ))
+    _data_set._check_zoau_version = MagicMock(return_value=None)
+    lrq_module = local_request_queue.AnsibleLocalRequestQueueModule()
+    lrq_module._module.fail_json = MagicMock(return_value=None)
+    lrq_module._module.exit_json = MagicMock(return_value=None)
+    lrq_stdout = LISTCAT_stdout(NAME, 52, keylen=40, avglrecl=2232, maxlrecl=2400, cisize=2560, reuse=True)
+
+    data_set_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(12, IDCAMS_create_already_exists_stdout(NAME), "")
+    )
+    data_set_utils._execute_idcams_reset = MagicMock(
+        return_value=MVSCmdResponse(0, IDCAMS_reset_stdout(NAME), "")
+    )
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, LISTDS_data_set(NAME, "VSAM"), "")
+    )
+    icetool._execute_listcat = MagicMock(
+        return_value=MVSCmdResponse(0, lrq_stdout, "")
+    )
+    icetool._execute_icetool = MagicMock(
+        return_value=MVSCmdResponse(0, ICETOOL_stdout(0), ICETOOL_stderr())
+    )
+
+    lrq_module.main()
+    result = lrq_module.get_result()
+    assert result["failed"] is False
+    assert result["changed"] is True
+    assert result["start_state"] == dict(exists=True, data_set_organization="VSAM")
+    assert result["end_state"] == dict(exists=True, data_set_organization="VSAM")
+    # The LISTDS that checked the known state after the define found the data
+    # set, the one before the second attempt, and the one at the end
+    assert data_set_utils._execute_listds.call_count == 3
+    data_set_utils._execute_idcams.assert_called_once()
+    data_set_utils._execute_idcams_reset.assert_called_once()
+    lrq_module._module.fail_json.assert_not_called()
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_remove_lrq_with_out_of_date_known_state():
+    # The data set was deleted outside the modules after the known state was recorded
+    set_module_args(dict(
+        default_arg_parms,
+        state="absent",
+        known_state=dict(exists=True, data_set_organization="VSAM")
+    ))
+    _data_set._check_zoau_version = MagicMock(return_value=None)
+    lrq_module = local_request_queue.AnsibleLocalRequestQueueModule()
+    lrq_module._module.fail_json = MagicMock(return_value=None)
+    lrq_module._module.exit_json = MagicMock(return_value=None)
+
+    data_set_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(8, IDCAMS_delete_not_found(NAME), "")
+    )
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(NAME), "")
+    )
+
+    lrq_module.main()
+    result = lrq_module.get_result()
+    assert result["failed"] is False
+    assert result["changed"] is False
+    assert result["start_state"] == dict(exists=False, data_set_organization="NONE")
+    assert result["end_state"] == dict(exists=False, data_set_organization="NONE")
+    assert data_set_utils._execute_listds.call_count == 3
+    data_set_utils._execute_idcams.assert_called_once()
+    lrq_module._module.fail_json.assert_not_called()
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+
+# (c) Copyright IBM Corp. 2024
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+from __future__ import absolute_import, division, print_function
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _data_set_utils as data_set_utils
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _csd as csd_utils
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _global_catalog as global_catalog_utils
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _icetool as icetool
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _local_catalog as local_catalog_utils
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils import _region_data_sets as region_data_sets_utils
+from ansible_collections.ibm.ibm_zos_cics.plugins.module_utils._response import _execution
+from ansible_collections.ibm.ibm_zos_cics.tests.unit.helpers.data_set_helper import (
+    PYTHON_LANGUAGE_FEATURES_MESSAGE,
+    CCUTL_name,
+    CCUTL_stderr,
+    CSDUP_initialize_stdout,
+    CSDUP_name,
+    CSDUP_stderr,
+    ICETOOL_first_record_name,
+    ICETOOL_stderr,
+    ICETOOL_stdout,
+    IDCAMS_create_stdout,
+    IDCAMS_delete,
+    IEFBR14_create_stderr,
+    LISTCAT_name,
+    LISTCAT_stdout,
+    LISTDS_data_set_doesnt_exist,
+    LISTDS_data_set,
+    LISTDS_run_name,
+    RMUTL_get_run_name,
+    RMUTL_stderr,
+    RMUTL_stdout,
+    RMUTL_update_run_name,
+    set_module_args
+)
+from ansible_collections.ibm.ibm_zos_cics.plugins.modules import region_data_sets
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmdResponse
+import pytest
+import sys
+
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+
+__metaclass__ = type
+
+VSAM = ["dfhgcd", "dfhlcd", "dfhcsd", "dfhintra", "dfhlrq", "dfhtemp"]
+SEQUENTIAL = ["dfhauxt", "dfhbuxt", "dfhdmpa", "dfhdmpb"]
+NAMES = dict((key, "TEST.REGIONS.{0}".format(key.upper())) for key in VSAM + SEQUENTIAL)
+IDCAMS_run_name = "IDCAMS - Region data sets - Run 1"
+IEFBR14_run_name = "IEFBR14 - Region data sets - Run 1"
+
+default_arg_parms = {
+    "region_data_sets": dict((key, {"dsn": name}) for key, name in NAMES.items()),
+    "cics_data_sets": {
+        "sdfhload": "TEST.CICS.INSTALL.SDFHLOAD"
+    },
+    "state": "initial",
+}
+
+
+class AnsibleFailJson(Exception):
+    pass
+
+
+def initialise_module(**kwargs):
+    initial_args = dict(default_arg_parms)
+    initial_args.update(kwargs)
+    set_module_args(initial_args)
+    # Mock the ZOAU API check
+    region_data_sets._check_zoau_version = MagicMock(return_value=None)
+    region_module = region_data_sets.AnsibleRegionDataSetsModule()
+    # Stop at the first failure, as fail_json does, so nothing runs after it
+    region_module._module.fail_json = MagicMock(side_effect=AnsibleFailJson)
+    region_module._module.exit_json = MagicMock(return_value=None)
+    return region_module
+
+
+def listds(keys, existing=()):
+    # The output of one LISTDS step for every data set in keys
+    return "".join(
+        LISTDS_data_set(NAMES[key], "VSAM" if key in VSAM else "PS")
+        if key in existing else LISTDS_data_set_doesnt_exist(NAMES[key])
+        for key in keys
+    )
+
+
+def state(key, exists):
+    if not exists:
+        return dict(exists=False, data_set_organization="NONE")
+    return dict(exists=True, data_set_organization="VSAM" if key in VSAM else "Sequential")
+
+
+def idcams_cmd():
+    return region_data_sets_utils._execute_idcams.call_args.kwargs["cmd"]
+
+
+def mock_rmutl(auto_start, next_start):
+    global_catalog_utils._execute_dfhrmutl = MagicMock(
+        return_value=MVSCmdResponse(
+            rc=0,
+            stdout=RMUTL_stdout(auto_start, next_start),
+            stderr=RMUTL_stderr(NAMES["dfhgcd"])
+        )
+    )
+
+
+def mock_records(rec_total):
+    # Every existing data set has rec_total records in its catalog entry,
+    # and ICETOOL finds no records in any of them
+    icetool._execute_listcat = MagicMock(
+        side_effect=lambda location: MVSCmdResponse(0, LISTCAT_stdout(location, rec_total), "")
+    )
+    icetool._execute_icetool = MagicMock(
+        return_value=MVSCmdResponse(rc=0, stdout=ICETOOL_stdout(0), stderr=ICETOOL_stderr())
+    )
+
+
+def mock_initialise():
+    local_catalog_utils._execute_dfhccutl = MagicMock(
+        return_value=MVSCmdResponse(rc=0, stdout="", stderr=CCUTL_stderr(NAMES["dfhlcd"]))
+    )
+    csd_utils._execute_dfhcsdup = MagicMock(
+        return_value=MVSCmdResponse(
+            rc=0,
+            stdout=CSDUP_initialize_stdout(NAMES["dfhcsd"]),
+            stderr=CSDUP_stderr(NAMES["dfhcsd"])
+        )
+    )
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_create_initial_region_data_sets():
+    region_module = initialise_module()
+    keys = VSAM + SEQUENTIAL
+
+    data_set_utils._execute_listds = MagicMock(
+        side_effect=[
+            MVSCmdResponse(8, listds(keys), ""),
+            MVSCmdResponse(0, listds(keys, existing=keys), ""),
+        ]
+    )
+    idcams_stdout = "".join(IDCAMS_create_stdout(NAMES[key]) for key in VSAM)
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(0, idcams_stdout, "")
+    )
+    iefbr14_stderr = "".join(IEFBR14_create_stderr(NAMES[key], key) for key in SEQUENTIAL)
+    region_data_sets_utils._execute_iefbr14_data_sets = MagicMock(
+        return_value=MVSCmdResponse(0, "", iefbr14_stderr)
+    )
+    mock_initialise()
+    mock_rmutl("AUTOINIT", "UNKNOWN")
+
+    region_module.main()
+
+    # Every VSAM data set is defined in one IDCAMS step, and every
+    # sequential one allocated in one IEFBR14 step
+    region_data_sets_utils._execute_idcams.assert_called_once()
+    assert idcams_cmd().count("DEFINE CLUSTER") == len(VSAM)
+    assert "DELETE" not in idcams_cmd()
+    region_data_sets_utils._execute_iefbr14_data_sets.assert_called_once()
+    definitions = region_data_sets_utils._execute_iefbr14_data_sets.call_args.args[0]
+    assert [ddname for ddname, definition in definitions] == SEQUENTIAL
+    global_catalog_utils._execute_dfhrmutl.assert_called_once_with(
+        NAMES["dfhgcd"], "TEST.CICS.INSTALL.SDFHLOAD", "SET_AUTO_START=AUTOINIT"
+    )
+
+    result = region_module.get_result()
+    assert result["executions"] == [
+        _execution(name=LISTDS_run_name(1), rc=8, stdout=listds(keys), stderr=""),
+        _execution(name=IDCAMS_run_name, rc=0, stdout=idcams_stdout, stderr=""),
+        _execution(name=IEFBR14_run_name, rc=0, stdout="", stderr=iefbr14_stderr),
+        _execution(name=CCUTL_name(), rc=0, stdout="", stderr=CCUTL_stderr(NAMES["dfhlcd"])),
+        _execution(
+            name=CSDUP_name(),
+            rc=0,
+            stdout=CSDUP_initialize_stdout(NAMES["dfhcsd"]),
+            stderr=CSDUP_stderr(NAMES["dfhcsd"])
+        ),
+        _execution(
+            name=RMUTL_update_run_name(1),
+            rc=0,
+            stdout=RMUTL_stdout("AUTOINIT", "UNKNOWN"),
+            stderr=RMUTL_stderr(NAMES["dfhgcd"])
+        ),
+        _execution(name=LISTDS_run_name(1), rc=0, stdout=listds(keys, existing=keys), stderr=""),
+    ]
+    assert result["data_sets"] == dict(
+        (key, dict(name=NAMES[key], start_state=state(key, False), end_state=state(key, True)))
+        for key in keys
+    )
+    assert result["changed"] is True
+    assert result["failed"] is False
+    assert result["msg"] == ""
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_initial_keeps_existing_global_catalog_set_to_autoinit():
+    keys = ["dfhgcd", "dfhlcd", "dfhcsd"]
+    region_module = initialise_module(data_sets=keys)
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, listds(keys, existing=keys), "")
+    )
+    idcams_stdout = IDCAMS_delete(NAMES["dfhlcd"]) + IDCAMS_create_stdout(NAMES["dfhlcd"]) + \
+        IDCAMS_delete(NAMES["dfhcsd"]) + IDCAMS_create_stdout(NAMES["dfhcsd"])
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(0, idcams_stdout, "")
+    )
+    region_data_sets_utils._execute_iefbr14_data_sets = MagicMock()
+    mock_records(52)
+    mock_initialise()
+    mock_rmutl("AUTOINIT", "UNKNOWN")
+
+    region_module.main()
+
+    # The global catalog is only read, and the others replaced in one step
+    global_catalog_utils._execute_dfhrmutl.assert_called_once_with(
+        NAMES["dfhgcd"], "TEST.CICS.INSTALL.SDFHLOAD", ""
+    )
+    region_data_sets_utils._execute_idcams.assert_called_once()
+    assert NAMES["dfhgcd"] not in idcams_cmd()
+    assert idcams_cmd().count("DELETE") == 2
+    region_data_sets_utils._execute_iefbr14_data_sets.assert_not_called()
+
+    result = region_module.get_result()
+    assert [execution["name"] for execution in result["executions"]] == [
+        LISTDS_run_name(1),
+        RMUTL_get_run_name(1),
+        LISTCAT_name(1),
+        LISTCAT_name(1),
+        IDCAMS_run_name,
+        CCUTL_name(),
+        CSDUP_name(),
+        LISTDS_run_name(1),
+    ]
+    assert result["changed"] is True
+    assert result["failed"] is False
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_initial_keeps_existing_empty_data_sets():
+    keys = VSAM + SEQUENTIAL
+    region_module = initialise_module()
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, listds(keys, existing=keys), "")
+    )
+    region_data_sets_utils._execute_idcams = MagicMock()
+    region_data_sets_utils._execute_iefbr14_data_sets = MagicMock()
+    mock_records(0)
+    mock_initialise()
+    mock_rmutl("AUTOINIT", "UNKNOWN")
+
+    region_module.main()
+
+    # Nothing is deleted, defined or allocated
+    region_data_sets_utils._execute_idcams.assert_not_called()
+    region_data_sets_utils._execute_iefbr14_data_sets.assert_not_called()
+
+    result = region_module.get_result()
+    probes = [LISTCAT_name(1), ICETOOL_first_record_name(1)] * (len(VSAM) - 1) + \
+        [ICETOOL_first_record_name(1)] * len(SEQUENTIAL)
+    assert [execution["name"] for execution in result["executions"]] == [
+        LISTDS_run_name(1),
+        RMUTL_get_run_name(1),
+    ] + probes + [
+        CCUTL_name(),
+        CSDUP_name(),
+        LISTDS_run_name(1),
+    ]
+    assert result["changed"] is False
+    assert result["failed"] is False
+    for key in keys:
+        assert result["data_sets"][key]["start_state"] == state(key, True)
+        assert result["data_sets"][key]["end_state"] == state(key, True)
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_initial_sets_existing_global_catalog_to_autoinit():
+    region_module = initialise_module(data_sets=["dfhgcd"])
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, listds(["dfhgcd"], existing=["dfhgcd"]), "")
+    )
+    region_data_sets_utils._execute_idcams = MagicMock()
+    mock_rmutl("AUTOASIS", "WARM")
+
+    region_module.main()
+
+    region_data_sets_utils._execute_idcams.assert_not_called()
+    assert global_catalog_utils._execute_dfhrmutl.call_args_list[1].args == (
+        NAMES["dfhgcd"], "TEST.CICS.INSTALL.SDFHLOAD", "SET_AUTO_START=AUTOINIT"
+    )
+    result = region_module.get_result()
+    assert [execution["name"] for execution in result["executions"]] == [
+        LISTDS_run_name(1),
+        RMUTL_get_run_name(1),
+        RMUTL_update_run_name(1),
+        LISTDS_run_name(1),
+    ]
+    assert result["changed"] is True
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_initial_global_catalog_emergency_restart():
+    keys = ["dfhgcd", "dfhlcd"]
+    region_module = initialise_module(data_sets=keys)
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, listds(keys, existing=keys), "")
+    )
+    region_data_sets_utils._execute_idcams = MagicMock()
+    mock_rmutl("AUTOASIS", "EMERGENCY")
+
+    with pytest.raises(AnsibleFailJson):
+        region_module.main()
+
+    # Nothing is deleted or defined, and the catalog is left as it was
+    region_data_sets_utils._execute_idcams.assert_not_called()
+    global_catalog_utils._execute_dfhrmutl.assert_called_once()
+    result = region_module.get_result()
+    assert result["msg"] == "Next start type is EMERGENCY. Potential data loss prevented."
+    assert result["failed"] is True
+    assert result["changed"] is False
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_delete_existing_region_data_sets():
+    keys = VSAM + SEQUENTIAL
+    existing = ["dfhgcd", "dfhcsd", "dfhauxt"]
+    region_module = initialise_module(state="absent")
+
+    data_set_utils._execute_listds = MagicMock(
+        side_effect=[
+            MVSCmdResponse(8, listds(keys, existing=existing), ""),
+            MVSCmdResponse(8, listds(keys), ""),
+        ]
+    )
+    idcams_stdout = "".join(IDCAMS_delete(NAMES[key]) for key in existing)
+    region_data_sets_utils._execute_idcams = MagicMock(
+        return_value=MVSCmdResponse(0, idcams_stdout, "")
+    )
+
+    region_module.main()
+
+    # Only the data sets that exist are deleted, sequential ones included
+    region_data_sets_utils._execute_idcams.assert_called_once_with(
+        cmd="".join(region_data_sets_utils._get_delete_cmd(NAMES[key]) for key in existing)
+    )
+    result = region_module.get_result()
+    assert [execution["name"] for execution in result["executions"]] == [
+        LISTDS_run_name(1),
+        IDCAMS_run_name,
+        LISTDS_run_name(1),
+    ]
+    assert result["data_sets"] == dict(
+        (key, dict(name=NAMES[key], start_state=state(key, key in existing), end_state=state(key, False)))
+        for key in keys
+    )
+    assert result["changed"] is True
+    assert result["failed"] is False
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_delete_non_existent_region_data_sets():
+    keys = VSAM + SEQUENTIAL
+    region_module = initialise_module(state="absent")
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(8, listds(keys), "")
+    )
+    region_data_sets_utils._execute_idcams = MagicMock()
+
+    region_module.main()
+
+    region_data_sets_utils._execute_idcams.assert_not_called()
+    result = region_module.get_result()
+    assert [execution["name"] for execution in result["executions"]] == [
+        LISTDS_run_name(1),
+        LISTDS_run_name(1),
+    ]
+    assert result["changed"] is False
+    assert result["failed"] is False
+
+
+@pytest.mark.skipif(
+    sys.version_info.major < 3, reason=PYTHON_LANGUAGE_FEATURES_MESSAGE
+)
+def test_wrong_data_set_organization():
+    keys = ["dfhlcd", "dfhauxt"]
+    region_module = initialise_module(data_sets=keys)
+
+    data_set_utils._execute_listds = MagicMock(
+        return_value=MVSCmdResponse(0, LISTDS_data_set(NAMES["dfhlcd"], "PS") + listds(["dfhauxt"]), "")
+    )
+    region_data_sets_utils._execute_idcams = MagicMock()
+
+    with pytest.raises(AnsibleFailJson):
+        region_module.main()
+
+    region_data_sets_utils._execute_idcams.assert_not_called()
+    result = region_module.get_result()
+    assert result["msg"] == "Data set TEST.REGIONS.DFHLCD is not in expected format VSAM."
+    assert result["failed"] is True
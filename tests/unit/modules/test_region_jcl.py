@@ -1443,10 +1443,8 @@ def test_initial_state_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
+            MVSCmdResponse(4, LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
         ]
     )
 
@@ -1462,16 +1460,10 @@ def test_initial_state_member():
     region_jcl_module.main()
     expected_result = dict(
         executions=[
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
@@ -1483,13 +1475,7 @@ def test_initial_state_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -1518,8 +1504,7 @@ def test_initial_state_member_base_not_exisitng():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
         ]
     )
 
@@ -1528,13 +1513,7 @@ def test_initial_state_member_base_not_exisitng():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=8,
-                stdout=LISTDS_data_set_doesnt_exist(BASE_DS),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             )
         ],
@@ -1565,12 +1544,9 @@ def test_initial_state_pre_existing_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(4, LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
         ]
     )
     _data_set_utils._execute_idcams = MagicMock(
@@ -1592,13 +1568,7 @@ def test_initial_state_pre_existing_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
@@ -1607,16 +1577,10 @@ def test_initial_state_pre_existing_member():
                 stdout=IDCAMS_delete(MEMBER_DS_NAME),
                 stderr=""
             ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
@@ -1628,13 +1592,7 @@ def test_initial_state_pre_existing_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -1663,10 +1621,8 @@ def test_warm_state_match_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
         ]
     )
     _data_set_utils._execute_command = MagicMock(return_value=(0, get_sample_generated_JCL(), ""))
@@ -1677,13 +1633,7 @@ def test_warm_state_match_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
@@ -1695,13 +1645,7 @@ def test_warm_state_match_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -1730,23 +1674,16 @@ def test_warm_state_not_existing_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(4, LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
         ]
     )
 
     expected_result = dict(
         executions=[
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -1778,8 +1715,7 @@ def test_warm_state_not_existing_member_and_base():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
         ]
     )
 
@@ -1788,13 +1724,7 @@ def test_warm_state_not_existing_member_and_base():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=8,
-                stdout=LISTDS_data_set_doesnt_exist(BASE_DS),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -1826,8 +1756,7 @@ def test_warm_state_non_match_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), "")
         ]
     )
     _data_set_utils._execute_command = MagicMock(return_value=(0, "NON MATHCING JCL", ""))
@@ -1837,13 +1766,7 @@ def test_warm_state_non_match_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
@@ -1881,10 +1804,8 @@ def test_absent_state_pre_existing_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(0, LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(4, LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
         ]
     )
     _data_set_utils._execute_idcams = MagicMock(
@@ -1897,13 +1818,7 @@ def test_absent_state_pre_existing_member():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTSDS_member_data_set(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
@@ -1912,16 +1827,10 @@ def test_absent_state_pre_existing_member():
                 stdout=IDCAMS_delete(MEMBER_DS_NAME),
                 stderr=""
             ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -1950,38 +1859,24 @@ def test_absent_state_not_existing_member():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(0, LISTDS_data_set(BASE_DS, "PO"), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(4, LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(4, LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
         ]
     )
 
     region_jcl_module.main()
     expected_result = dict(
         executions=[
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
-                stderr="",
-            ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=0,
-                stdout=LISTDS_data_set(BASE_DS, "PO"),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set(BASE_DS, "PO") + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -2010,10 +1905,8 @@ def test_absent_state_not_existing_member_and_base():
 
     _data_set_utils._execute_listds = MagicMock(
         side_effect=[
-            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
-            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS), ""),
-            MVSCmdResponse(4, LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
+            MVSCmdResponse(8, LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME), ""),
         ]
     )
 
@@ -2023,25 +1916,13 @@ def test_absent_state_not_existing_member_and_base():
             _execution(
                 name=LISTDS_run_name(1),
                 rc=8,
-                stdout=LISTDS_data_set_doesnt_exist(BASE_DS),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
             _execution(
                 name=LISTDS_run_name(1),
                 rc=8,
-                stdout=LISTDS_data_set_doesnt_exist(BASE_DS),
-                stderr="",
-            ),
-            _execution(
-                name=LISTDS_run_name(1),
-                rc=4,
-                stdout=LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
+                stdout=LISTDS_data_set_doesnt_exist(BASE_DS) + LISTDS_member_doesnt_exist(BASE_DS, MEMBER_NAME),
                 stderr="",
             ),
         ],
@@ -6,7 +6,9 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils import _module_action_plugin
 from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils._module_action_plugin import (
+    _DataSetStateCache,
     _check_library_override,
     _check_region_override,
     _remove_region_data_set_args,
@@ -19,6 +21,12 @@ from ansible_collections.ibm.ibm_zos_cics.plugins.plugin_utils._module_action_pl
     _check_template,
     _set_top_libraries_key
 )
+import pytest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
 
 
 def test__check_region_override():
@@ -235,3 +243,90 @@ def test__set_top_libraries_key_with_existing_libraries_key_not_top_libraries_ke
     assert len(list(args_without_top_libs.keys())) == 2
     assert "top_data_sets" in list(args_without_top_libs["dfhrpl"].keys())
     assert args_without_top_libs["dfhrpl"]["data_sets"] == "data.set.path"
+
+
+def _task(play_id="play-1", delegate_to=None):
+    task = MagicMock(delegate_to=delegate_to)
+    task.get_play.return_value = MagicMock(_uuid=play_id)
+    return task
+
+
+@pytest.fixture
+def local_tmp(tmp_path, monkeypatch):
+    monkeypatch.setattr(_module_action_plugin.C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    return tmp_path
+
+
+def _host(host, enabled=True):
+    return {"inventory_hostname": host, "ibm_zos_cics_data_set_state_cache": enabled}
+
+
+def test__data_set_state_cache_round_trip(local_tmp):
+    cache = _DataSetStateCache(_task(), _host("zos1"))
+    assert cache.get("data.set.path") is None
+
+    cache.update({"data.set.path": {
+        "failed": False,
+        "end_state": {"exists": True, "data_set_organization": "VSAM", "autostart_override": "AUTOINIT"},
+    }})
+
+    cache = _DataSetStateCache(_task(), _host("zos1"))
+    assert cache.get("DATA.SET.PATH") == {"exists": True, "data_set_organization": "VSAM"}
+
+
+def test__data_set_state_cache_is_per_play_and_host(local_tmp):
+    cache = _DataSetStateCache(_task(), _host("zos1"))
+    cache.update({"DATA.SET.PATH": {"end_state": {"exists": True, "data_set_organization": "VSAM"}}})
+
+    assert _DataSetStateCache(_task(play_id="play-2"), _host("zos1")).get("DATA.SET.PATH") is None
+    assert _DataSetStateCache(_task(), _host("zos2")).get("DATA.SET.PATH") is None
+    assert _DataSetStateCache(_task(delegate_to="zos1"), _host("zos2")).get("DATA.SET.PATH") == \
+        {"exists": True, "data_set_organization": "VSAM"}
+
+
+def test__data_set_state_cache_forgets_failures(local_tmp):
+    cache = _DataSetStateCache(_task(), _host("zos1"))
+    cache.update({"DATA.SET.PATH": {"end_state": {"exists": True, "data_set_organization": "VSAM"}}})
+
+    cache = _DataSetStateCache(_task(), _host("zos1"))
+    cache.update({"DATA.SET.PATH": {
+        "failed": True,
+        "end_state": {"exists": True, "data_set_organization": "VSAM"},
+    }})
+
+    assert _DataSetStateCache(_task(), _host("zos1")).get("DATA.SET.PATH") is None
+
+
+def test__data_set_state_cache_is_disabled_by_default(local_tmp):
+    cache = _DataSetStateCache(_task(), {"inventory_hostname": "zos1"})
+    cache.update({"DATA.SET.PATH": {"end_state": {"exists": True, "data_set_organization": "VSAM"}}})
+
+    assert list(local_tmp.iterdir()) == []
+    assert _DataSetStateCache(_task(), {"inventory_hostname": "zos1"}).get("DATA.SET.PATH") is None
+
+
+def test__data_set_state_cache_disabled_task_forgets_entry(local_tmp):
+    _DataSetStateCache(_task(), _host("zos1")).update({
+        "DATA.SET.PATH": {"end_state": {"exists": True, "data_set_organization": "VSAM"}}
+    })
+
+    _DataSetStateCache(_task(), _host("zos1", enabled="false")).update({
+        "DATA.SET.PATH": {"end_state": {"exists": False, "data_set_organization": "NONE"}}
+    })
+
+    assert _DataSetStateCache(_task(), _host("zos1")).get("DATA.SET.PATH") is None
+
+
+def test__data_set_state_cache_keeps_other_workers_entries(local_tmp):
+    # Two workers that loaded the cache before either updated it
+    first = _DataSetStateCache(_task(), _host("zos1"))
+    second = _DataSetStateCache(_task(), _host("zos1"))
+    assert first.get("FIRST.DATA.SET") is None
+    assert second.get("SECOND.DATA.SET") is None
+
+    first.update({"FIRST.DATA.SET": {"end_state": {"exists": True, "data_set_organization": "VSAM"}}})
+    second.update({"SECOND.DATA.SET": {"end_state": {"exists": True, "data_set_organization": "Sequential"}}})
+
+    cache = _DataSetStateCache(_task(), _host("zos1"))
+    assert cache.get("FIRST.DATA.SET") == {"exists": True, "data_set_organization": "VSAM"}
+    assert cache.get("SECOND.DATA.SET") == {"exists": True, "data_set_organization": "Sequential"}